@@ -1,7 +1,7 @@
 # app_service.py
 from pathlib import Path
 # typing 모듈에서 Tuple을 임포트합니다.
-from typing import Dict, Any, Optional, List, Callable, Union, Tuple
+from typing import Dict, Any, Optional, List, Callable, Union, Tuple, Awaitable
 import os
 import json
 import csv
@@ -24,18 +24,26 @@ try:
         load_chunks_from_file,
         create_new_metadata, save_metadata, load_metadata,
         update_metadata_for_chunk_completion, update_metadata_for_chunk_failure, # 추가
-        _hash_config_for_metadata,
-        save_merged_chunks_to_file
+        _hash_config_for_metadata, metadata_has_content_hashes,
+        save_merged_chunks_to_file, language_pair_for_metadata
     )
     from ..core.config.config_manager import ConfigManager
     from infrastructure.gemini_client import GeminiClient, GeminiAllApiKeysExhaustedException, GeminiInvalidRequestException
+    from infrastructure.latency_tracker import request_time_budget
     from domain.translation_service import TranslationService
+    from domain.content_safety_isolator import collect_blocked_spans
     from domain.glossary_service import SimpleGlossaryService
-    from ..utils.chunk_service import ChunkService
+    from ..utils.chunk_service import ChunkService, chunk_content_hashes, compute_chunk_hash
     from ..core.exceptions import BtgServiceException, BtgConfigException, BtgFileHandlerException, BtgApiClientException, BtgTranslationException, BtgBusinessLogicException
-    from ..core.dtos import TranslationJobProgressDTO, GlossaryExtractionProgressDTO
+    from ..core.dtos import TranslationJobProgressDTO, GlossaryExtractionProgressDTO, BatchTranslationProgressDTO
     from ..utils.post_processing_service import PostProcessingService
-    from ..utils.quality_check_service import QualityCheckService
+    from ..utils.output_assembler import OutputAssembler
+    from ..utils.source_filter import SourceFilter, filter_source_for_metadata
+    from ..utils.quality_check_service import QualityCheckService, find_cheap_quality_issue
+    from ..utils.epub_processor import EpubDedupReport
+    from ..utils.output_validation import OUTPUT_ISSUE_TYPES, OutputValidationReport, validate_translation_output
+    from .translation_job_queue import TranslationJob, TranslationJobQueue, SharedChunkRateLimiter
+    from .translation_watcher import TranslationWatcher
 except ImportError:
     # Fallback imports
     from infrastructure.file_handler import (
@@ -44,18 +52,26 @@ except ImportError:
         load_chunks_from_file,
         create_new_metadata, save_metadata, load_metadata,
         update_metadata_for_chunk_completion, update_metadata_for_chunk_failure, # 추가
-        _hash_config_for_metadata,
-        save_merged_chunks_to_file
+        _hash_config_for_metadata, metadata_has_content_hashes,
+        save_merged_chunks_to_file, language_pair_for_metadata
     )
     from core.config.config_manager import ConfigManager
     from infrastructure.gemini_client import GeminiClient, GeminiAllApiKeysExhaustedException, GeminiInvalidRequestException
+    from infrastructure.latency_tracker import request_time_budget
     from domain.translation_service import TranslationService
+    from domain.content_safety_isolator import collect_blocked_spans
     from domain.glossary_service import SimpleGlossaryService
-    from utils.chunk_service import ChunkService
+    from utils.chunk_service import ChunkService, chunk_content_hashes, compute_chunk_hash
     from core.exceptions import BtgServiceException, BtgConfigException, BtgFileHandlerException, BtgApiClientException, BtgTranslationException, BtgBusinessLogicException
-    from core.dtos import TranslationJobProgressDTO, GlossaryExtractionProgressDTO
+    from core.dtos import TranslationJobProgressDTO, GlossaryExtractionProgressDTO, BatchTranslationProgressDTO
     from utils.post_processing_service import PostProcessingService
-    from utils.quality_check_service import QualityCheckService
+    from utils.output_assembler import OutputAssembler
+    from utils.source_filter import SourceFilter, filter_source_for_metadata
+    from utils.quality_check_service import QualityCheckService, find_cheap_quality_issue
+    from utils.epub_processor import EpubDedupReport
+    from utils.output_validation import OUTPUT_ISSUE_TYPES, OutputValidationReport, validate_translation_output
+    from app.translation_job_queue import TranslationJob, TranslationJobQueue, SharedChunkRateLimiter
+    from app.translation_watcher import TranslationWatcher
 
 logger = setup_logger(__name__)
 
@@ -185,6 +201,9 @@ class AppService:
                 if auth_credentials_for_gemini_client is None:
                     logger.warning("API 키가 설정되지 않음")
 
+            # 새 클라이언트가 키 상태 파일을 다시 읽기 전에 이전 클라이언트의 카운터를 기록
+            self._close_gemini_client()
+
             should_initialize_client = False
             if auth_credentials_for_gemini_client:
                 if isinstance(auth_credentials_for_gemini_client, str) and auth_credentials_for_gemini_client.strip():
@@ -203,13 +222,22 @@ class AppService:
                     project_to_pass_to_client = gcp_project_from_config if gcp_project_from_config and gcp_project_from_config.strip() else None
                     rpm_value = self.config.get("requests_per_minute")
                     api_timeout_value = self.config.get("api_timeout", 500.0)
-                    logger.info(f"GeminiClient 초기화: project={project_to_pass_to_client}, RPM={rpm_value}, Timeout={api_timeout_value}s")
+                    adaptive_factor = (self.config.get("adaptive_timeout_factor", 3.0)
+                                       if self.config.get("adaptive_timeout_enabled", True) else None)
+                    hedge_quantile = (self.config.get("hedge_latency_quantile", 0.95)
+                                      if self.config.get("hedged_requests_enabled", False) else None)
+                    logger.info(f"GeminiClient 초기화: project={project_to_pass_to_client}, RPM={rpm_value}, Timeout={api_timeout_value}s, 적응형 데드라인 배수={adaptive_factor}")
                     self.gemini_client = GeminiClient(
                         auth_credentials=auth_credentials_for_gemini_client,
                         project=project_to_pass_to_client,
                         location=gcp_location,
                         requests_per_minute=rpm_value,
-                        api_timeout=api_timeout_value
+                        api_timeout=api_timeout_value,
+                        adaptive_timeout_factor=adaptive_factor,
+                        adaptive_timeout_min=self.config.get("adaptive_timeout_min_seconds", 60.0),
+                        hedge_quantile=hedge_quantile,
+                        hedge_budget_ratio=self.config.get("hedge_budget_ratio", 0.05),
+                        key_health_path=self._key_health_store_path()
                     )
                 except GeminiInvalidRequestException as e_inv:
                     logger.error(f"GeminiClient 초기화 실패: {e_inv}")
@@ -243,6 +271,23 @@ class AppService:
             logger.error(f"설정 로드 중 심각한 오류 발생: {e}", exc_info=True)
             raise BtgConfigException(f"설정 로드 오류: {e}", original_exception=e) from e
 
+    def _key_health_store_path(self) -> Optional[Path]:
+        """API 키 상태 파일 경로 (상대 경로는 설정 파일 폴더 기준, 빈 값이면 None = 메모리에서만 관리)"""
+        path_value = self.config.get("key_health_store_path")
+        return self.config_manager.resolve_relative_path(path_value) if path_value else None
+
+    def _close_gemini_client(self) -> None:
+        if self.gemini_client is None:
+            return
+        try:
+            self.gemini_client.close()
+        except Exception as e:
+            logger.warning(f"Gemini 클라이언트 종료 처리 중 오류 (무시): {e}")
+
+    def shutdown(self) -> None:
+        """애플리케이션 종료 시 호출. API 키 상태 파일에 남은 카운터를 기록합니다."""
+        self._close_gemini_client()
+
     def save_app_config(self, config_data: Dict[str, Any]) -> bool:
         logger.info("애플리케이션 설정 저장 중...")
         try:
@@ -518,6 +563,44 @@ class AppService:
         await self.cancel_glossary_event.wait()
         logger.info("⏱️ 용어집 취소 신호가 감지되었습니다.")
         raise asyncio.CancelledError("GLOSSARY_CANCELLED")
+    def _resolve_glossary_path_for_input(self, input_file_path: Union[str, Path]) -> Optional[str]:
+        """입력 파일에 대응하는 용어집 경로를 찾습니다. (자동 발견 → 설정 경로 → None)"""
+        input_p = Path(input_file_path)
+        glossary_suffix = self.config.get("glossary_output_json_filename_suffix", "_simple_glossary.json")
+        assumed_glossary_path = input_p.parent / f"{input_p.stem}{glossary_suffix}"
+
+        if assumed_glossary_path.exists():
+            logger.info(f"용어집 '{assumed_glossary_path.name}' 자동 발견 및 사용")
+            return str(assumed_glossary_path)
+
+        manual_path = self.config.get("glossary_json_path")
+        if manual_path and Path(manual_path).exists():
+            logger.info(f"설정된 용어집 사용: '{manual_path}'")
+            return manual_path
+
+        logger.info(f"용어집을 찾을 수 없어 용어집 없이 진행")
+        return None
+
+    def _create_translation_service_for_file(self, input_file_path: Union[str, Path]) -> Optional[TranslationService]:
+        """
+        작업 큐용 파일별 번역 서비스를 생성합니다.
+
+        여러 파일이 동시에 번역되므로 공유 서비스의 용어집을 바꿔 끼우는 대신,
+        같은 GeminiClient를 공유하는 서비스 인스턴스를 파일마다 만듭니다.
+        (서비스가 TranslationService가 아닌 경우 기존 인스턴스를 그대로 사용)
+        """
+        if not self.gemini_client or not isinstance(self.translation_service, TranslationService):
+            return self.translation_service
+        try:
+            job_config = dict(self.config)
+            job_config['glossary_json_path'] = self._resolve_glossary_path_for_input(input_file_path)
+            job_service = TranslationService(self.gemini_client, job_config)
+            job_service._load_glossary_data()
+            return job_service
+        except Exception as e:
+            logger.error(f"파일별 번역 서비스 생성 실패 (기본 서비스 사용): {e}", exc_info=True)
+            return self.translation_service
+
     # _translate_and_save_chunk() 동기 메서드 제거됨
     # 비동기 버전 _translate_and_save_chunk_async()를 사용하세요
 
@@ -553,22 +636,7 @@ class AppService:
         
         # === 용어집 동적 로딩 로직 ===
         try:
-            input_p = Path(input_file_path)
-            glossary_suffix = self.config.get("glossary_output_json_filename_suffix", "_simple_glossary.json")
-            assumed_glossary_path = input_p.parent / f"{input_p.stem}{glossary_suffix}"
-            
-            glossary_to_use = None
-            if assumed_glossary_path.exists():
-                glossary_to_use = str(assumed_glossary_path)
-                logger.info(f"용어집 '{assumed_glossary_path.name}' 자동 발견 및 사용")
-            else:
-                manual_path = self.config.get("glossary_json_path")
-                if manual_path and Path(manual_path).exists():
-                    glossary_to_use = manual_path
-                    logger.info(f"설정된 용어집 사용: '{manual_path}'")
-                else:
-                    logger.info(f"용어집을 찾을 수 없어 용어집 없이 진행")
-            
+            glossary_to_use = self._resolve_glossary_path_for_input(input_file_path)
             if self.translation_service:
                 self.config['glossary_json_path'] = glossary_to_use
                 self.translation_service.config = self.config
@@ -659,7 +727,114 @@ class AppService:
             
             self.current_translation_task = None
             logger.info("🧹 Promise.race 종료 및 정리 완료")
-    
+
+    async def start_batch_translation_async(
+        self,
+        file_pairs: List[Tuple[Union[str, Path], Union[str, Path]]],
+        max_concurrent_files: Optional[int] = None,
+        progress_callback: Optional[Callable[[BatchTranslationProgressDTO], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+        file_progress_callback: Optional[Callable[[TranslationJob, TranslationJobProgressDTO], None]] = None
+    ) -> List[TranslationJob]:
+        """
+        여러 파일을 하나의 작업 큐로 번역합니다. (단일 이벤트 루프)
+
+        모든 파일의 청크가 하나의 세마포어/RPM 제한기를 공유하므로 파일 경계에서
+        처리량이 비지 않습니다. 파일별 메타데이터와 이어하기 동작은 단일 파일
+        번역과 동일하며, 취소는 start_translation_async와 같은 Promise.race 패턴을 따릅니다.
+
+        :param file_pairs: (입력 파일, 출력 파일) 목록
+        :param max_concurrent_files: 동시에 진행할 파일 수 (None이면 설정값 max_concurrent_files)
+        :param progress_callback: 전체 작업 큐 진행률 콜백
+        :param status_callback: 상태 변경 콜백 (메시지에 파일명 접두사 포함)
+        :param file_progress_callback: 파일별 진행률 콜백 (작업, 파일 진행 DTO)
+        :return: 상태가 기록된 TranslationJob 목록
+        :raises BtgServiceException: 이미 번역 중인 경우
+        """
+        if self.current_translation_task and not self.current_translation_task.done():
+            raise BtgServiceException("번역이 이미 실행 중입니다. 먼저 현재 작업을 완료하거나 취소하세요.")
+
+        if max_concurrent_files is None:
+            max_concurrent_files = self.config.get("max_concurrent_files", 2)
+
+        jobs = [TranslationJob(Path(in_p), Path(out_p)) for in_p, out_p in file_pairs]
+        job_queue = TranslationJobQueue(
+            self,
+            jobs,
+            max_concurrent_files=max_concurrent_files,
+            progress_callback=progress_callback,
+            status_callback=status_callback,
+            file_progress_callback=file_progress_callback
+        )
+
+        # 작업 큐 전체 합계 카운터 초기화
+        self.processed_chunks_count = 0
+        self.successful_chunks_count = 0
+        self.failed_chunks_count = 0
+        self.cancel_event.clear()
+
+        queue_task = asyncio.create_task(job_queue.run(), name="translation_job_queue")
+        cancel_watch_task = asyncio.create_task(self._wait_for_cancel(), name="cancel_watcher")
+        self.current_translation_task = queue_task
+
+        try:
+            done, _ = await asyncio.wait(
+                [queue_task, cancel_watch_task],
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            if cancel_watch_task in done:
+                logger.warning("❌ 취소 승리! 작업 큐 Task 취소 중...")
+                queue_task.cancel()
+                try:
+                    await queue_task
+                except asyncio.CancelledError:
+                    logger.info("✅ 작업 큐 Task 취소 완료")
+                if status_callback:
+                    status_callback("중단됨")
+                raise asyncio.CancelledError("사용자에 의해 취소됨")
+
+            cancel_watch_task.cancel()
+            return await queue_task
+        finally:
+            for task in [queue_task, cancel_watch_task]:
+                if not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+            self.current_translation_task = None
+
+    async def watch_translation_async(
+        self,
+        watch_paths: List[Union[str, Path]],
+        output_file_path: Optional[Union[str, Path]] = None,
+        poll_interval: Optional[float] = None,
+        stop_event: Optional[asyncio.Event] = None,
+        max_cycles: Optional[int] = None,
+        progress_callback: Optional[Callable[[BatchTranslationProgressDTO], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        감시 모드: 입력 파일/디렉토리의 변경을 감지하여 바뀐 구간만 번역하고
+        최종 출력 파일을 증분 갱신합니다. (TranslationWatcher 참고)
+
+        :param watch_paths: 감시할 파일 또는 디렉토리 목록
+        :param output_file_path: 단일 파일 감시 시 출력 경로 (None이면 입력파일_translated)
+        :param poll_interval: 확인 주기(초). None이면 설정값 watch_poll_interval
+        :param stop_event: 설정되면 감시를 종료하는 이벤트
+        :param max_cycles: 최대 폴링 횟수 (None이면 무제한)
+        """
+        watcher = TranslationWatcher(
+            self,
+            watch_paths,
+            poll_interval=poll_interval,
+            output_file=output_file_path,
+            progress_callback=progress_callback,
+            status_callback=status_callback
+        )
+        await watcher.run(stop_event=stop_event, max_cycles=max_cycles)
+
     async def cancel_translation_async(self) -> None:
         """
         비동기 번역 취소 (즉시 반응, Promise.race 패턴)
@@ -694,30 +869,35 @@ class AppService:
         progress_callback: Optional[Callable[[TranslationJobProgressDTO], None]] = None,
         status_callback: Optional[Callable[[str], None]] = None,
         tqdm_file_stream: Optional[Any] = None,
-        retranslate_failed_only: bool = False
+        retranslate_failed_only: bool = False,
+        job: Optional[TranslationJob] = None
     ) -> None:
         """
         비동기 번역 메인 로직
-        
+
         - Lock 제거 (asyncio 단일 스레드)
         - 상태는 Task 객체로 관리
         - ThreadPoolExecutor 제거 (asyncio.gather 사용)
+        - job: 작업 큐에서 호출된 경우 파일별 카운터/번역 서비스/공유 제한기를 담은 작업
         """
+        input_file_path_obj = Path(input_file_path)
+        final_output_file_path_obj = Path(output_file_path)
+
+        if job is None:
+            # 단일 파일 번역: 전체 카운터를 이 작업 기준으로 초기화 (Lock 불필요)
+            job = TranslationJob(input_file_path_obj, final_output_file_path_obj)
+            self.processed_chunks_count = 0
+            self.successful_chunks_count = 0
+            self.failed_chunks_count = 0
+        translation_service = job.translation_service or self.translation_service
+
         # 서비스 검증
-        if not self.translation_service or not self.chunk_service:
+        if not translation_service or not self.chunk_service:
             logger.error("번역 서비스 실패: 서비스가 초기화되지 않았습니다.")
             if status_callback:
                 status_callback("오류: 서비스 초기화 실패")
             raise BtgServiceException("번역 서비스가 초기화되지 않았습니다. 설정을 확인하세요.")
-        
-        # 상태 초기화 (Lock 불필요)
-        self.processed_chunks_count = 0
-        self.successful_chunks_count = 0
-        self.failed_chunks_count = 0
-        
-        input_file_path_obj = Path(input_file_path)
-        final_output_file_path_obj = Path(output_file_path)
-        
+
         translation_mode = self.config.get("translation_mode", "standard")
         logger.info(f"비동기 번역 시작 (모드: {translation_mode}): {input_file_path} → {output_file_path}")
 
@@ -725,7 +905,7 @@ class AppService:
         if translation_mode == "epub" or input_file_path_obj.suffix.lower() == ".epub":
             if status_callback:
                 status_callback("EPUB 번역 중...")
-            await self.translation_service.translate_epub(input_file_path, output_file_path)
+            await translation_service.translate_epub(input_file_path, output_file_path)
             
             # 메타데이터 영속화 (애플리케이션 레이어 처리)
             epub_meta = {
@@ -733,18 +913,24 @@ class AppService:
                 "status": "completed",
                 "last_updated": time.time()
             }
+            completion_message = "EPUB 번역 완료"
+            dedup_report = translation_service.last_epub_dedup_report
+            if isinstance(dedup_report, EpubDedupReport) and dedup_report.total_nodes:
+                # 챕터 간 반복 텍스트 노드 재사용 비율을 작업 요약에 기록
+                epub_meta["dedup"] = dedup_report.to_dict()
+                completion_message += f" (반복 텍스트 재사용 {dedup_report.dedup_ratio:.1%})"
             save_metadata(input_file_path_obj, epub_meta)
             
             if status_callback:
-                status_callback("EPUB 번역 완료!")
+                status_callback(f"{completion_message}!")
             if progress_callback:
                 progress_callback(TranslationJobProgressDTO(
                     total_chunks=1, processed_chunks=1, successful_chunks=1, failed_chunks=0,
-                    current_status_message="EPUB 번역 완료"
+                    current_status_message=completion_message
                 ))
             return
 
-        # 🚀 무결성 모드 특수 처리 (전체 텍스트를 한 번에 넘기되 내부적으로 청킹)
+        # 🚀 무결성 모드 특수 처리 (원문을 줄 스트림으로 읽어 내부적으로 청킹)
         if translation_mode == "integrity":
             if status_callback:
                 status_callback("무결성 번역 시작 (줄 단위 검증)...")
@@ -781,15 +967,14 @@ class AppService:
                     if progress_callback:
                         progress_callback(dto)
 
-                file_content = read_text_file(input_file_path_obj)
-                translated_text = await self.translation_service.translate_text_integrity(
-                    file_content,
-                    output_path_for_progress=final_output_file_path_obj,
+                # 원문 전체를 메모리에 올리지 않고 줄 스트림으로 읽어 번역 결과를 바로 출력 파일에 씀
+                await translation_service.translate_file_integrity(
+                    input_file_path_obj,
+                    final_output_file_path_obj,
                     progress_callback=integrity_progress_handler,
                     status_callback=status_callback,
                     tqdm_file_stream=tqdm_file_stream
                 )
-                write_text_file(final_output_file_path_obj, translated_text)
                 
                 # 📍 완결 후 최종 상태 갱신
                 loaded_metadata["status"] = "completed"
@@ -812,6 +997,8 @@ class AppService:
         metadata_file_path = get_metadata_file_path(input_file_path_obj)
         loaded_metadata: Dict[str, Any] = {}
         resume_translation = False
+        rebuild_final_output = False  # 콘텐츠 해시 재사용 시 번역할 청크가 없어도 최종 파일 재조립
+        previous_output_state: Optional[Dict[str, Any]] = None  # 최종 파일 증분 조립 상태 (OutputAssembler)
         total_chunks = 0
         
         try:
@@ -841,10 +1028,28 @@ class AppService:
                     status_callback(f"오류: 파일 읽기 실패 - {file_read_err}")
                 raise
             
-            # 청크 분할
+            # 번역 전 원문 필터 (광고/보일러플레이트 줄 제거 또는 마스킹, 기본 비활성)
+            source_filter = SourceFilter.from_config(self.config)
+            source_filter_result = source_filter.apply(file_content)
+            file_content = source_filter_result.text
+            job.source_filter_result = source_filter_result if source_filter_result.masked_lines else None
+            source_filter_record = source_filter.describe(source_filter_result) if source_filter.enabled else None
+            previous_filter_record = loaded_metadata.get("source_filter") or {}
+            same_source_filter = previous_filter_record.get("fingerprint") == (
+                source_filter_record["fingerprint"] if source_filter_record else None
+            )
+            
+            # 설정 해시 확인 (이어하기 가능 여부 판단)
+            current_config_hash = _hash_config_for_metadata(self.config)
+            previous_config_hash = loaded_metadata.get("config_hash")
+            # 필터 설정이 바뀌면 원문(청크 경계)이 달라지므로 콘텐츠 해시 재사용 경로로 처리
+            same_config = bool(previous_config_hash) and previous_config_hash == current_config_hash and same_source_filter
+            
+            # 청크 분할 (콘텐츠 해시 재사용으로 경계가 달라진 작업은 저장된 경계를 그대로 재현)
             all_chunks = self.chunk_service.create_chunks_from_file_content(
                 file_content,
-                self.config.get("chunk_size", 6000)
+                self.config.get("chunk_size", 6000),
+                chunk_offsets=loaded_metadata.get("chunk_offsets") if same_config else None
             )
             total_chunks = len(all_chunks)
             logger.info(f"파일이 {total_chunks}개 청크로 분할됨")
@@ -853,38 +1058,35 @@ class AppService:
             # input.txt → input_translated_chunked.txt
             chunked_output_file_path = input_file_path_obj.parent / f"{input_file_path_obj.stem}_translated_chunked.txt"
             
-            # 설정 해시 확인 (이어하기 가능 여부 판단)
-            current_config_hash = _hash_config_for_metadata(self.config)
-            previous_config_hash = loaded_metadata.get("config_hash")
-            
-            if previous_config_hash and previous_config_hash == current_config_hash:
-                # 청크 수 변경 감지
-                if loaded_metadata.get("total_chunks") != total_chunks:
-                    logger.warning(f"입력 파일의 청크 수가 변경되었습니다 ({loaded_metadata.get('total_chunks')} -> {total_chunks}). 메타데이터를 새로 생성합니다.")
-                    resume_translation = False
-                    loaded_metadata = create_new_metadata(input_file_path_obj, total_chunks, self.config)
-                    loaded_metadata["status"] = "in_progress"
-                    loaded_metadata["last_updated"] = time.time()
-                    save_metadata(metadata_file_path, loaded_metadata)
-                    logger.info("청크 수 변경으로 새 메타데이터 저장 완료")
-                    
-                    # 출력 파일 초기화
-                    delete_file(final_output_file_path_obj)
-                    final_output_file_path_obj.touch()
-                    # 청크 백업 파일도 초기화
-                    delete_file(chunked_output_file_path)
-                    chunked_output_file_path.touch()
-                    logger.info(f"출력 파일 및 청크 백업 파일 초기화 완료: {final_output_file_path_obj}")
-                else:
-                    resume_translation = True
-                    # 이어하기 시 메타데이터 상태 업데이트
-                    loaded_metadata["status"] = "in_progress"
-                    loaded_metadata["last_updated"] = time.time()
-                    save_metadata(metadata_file_path, loaded_metadata)
-                    logger.info("이전 번역을 계속 진행합니다 (설정 동일)")
+            if same_config and loaded_metadata.get("total_chunks") == total_chunks \
+                    and self._completed_chunks_match_source(loaded_metadata, all_chunks):
+                resume_translation = True
+                previous_output_state = loaded_metadata.get("output_assembly")
+                # 이어하기 시 메타데이터 상태 업데이트
+                loaded_metadata["status"] = "in_progress"
+                loaded_metadata["last_updated"] = time.time()
+                save_metadata(metadata_file_path, loaded_metadata)
+                logger.info("이전 번역을 계속 진행합니다 (설정 동일)")
+            elif metadata_has_content_hashes(loaded_metadata):
+                # 청크 크기 변경 또는 원문 수정 → 내용이 같은 청크는 번역 재사용, 바뀐 구간만 번역
+                logger.info("청크 구성 또는 원문이 이전 작업과 다릅니다. 콘텐츠 해시가 같은 청크의 번역을 재사용합니다.")
+                previous_output_state = loaded_metadata.get("output_assembly")
+                loaded_metadata, all_chunks = self._rebuild_metadata_from_content_hashes(
+                    input_file_path_obj,
+                    file_content,
+                    loaded_metadata,
+                    chunked_output_file_path,
+                    default_chunks=all_chunks
+                )
+                total_chunks = len(all_chunks)
+                resume_translation = True
+                # 최종 출력은 첫 번째로 달라진 조각부터만 다시 작성됨 (OutputAssembler)
+                rebuild_final_output = True
             else:
-                # config_hash 없거나 불일치 → 새로 시작
-                if not previous_config_hash:
+                if same_config:
+                    logger.warning(f"입력 파일의 청크 수가 변경되었습니다 ({loaded_metadata.get('total_chunks')} -> {total_chunks}). 메타데이터를 새로 생성합니다.")
+                elif not previous_config_hash:
+                    # config_hash 없음 → 새로 시작
                     logger.info("설정 해시 없음 (오래된 메타데이터) → 새로운 번역을 시작합니다")
                 else:
                     logger.info("새로운 번역을 시작합니다 (설정 변경)")
@@ -902,8 +1104,16 @@ class AppService:
                 delete_file(chunked_output_file_path)
                 chunked_output_file_path.touch()
                 logger.info(f"출력 파일 및 청크 백업 파일 초기화 완료: {final_output_file_path_obj}")
+            # 원문 필터 설정/통계 기록 (검토 탭·단일 청크 재번역이 같은 원문을 재현하는 데 사용)
+            if source_filter_record is not None:
+                loaded_metadata["source_filter"] = source_filter_record
+                save_metadata(metadata_file_path, loaded_metadata)
+            elif loaded_metadata.pop("source_filter", None) is not None:
+                save_metadata(metadata_file_path, loaded_metadata)
+            job.total_chunks = total_chunks
             
             # 이어하기 시나리오에서, 혹시 마지막에 불완전한 청크가 있다면 정리
+            existing_chunks: Dict[int, str] = {}
             try:
                 if chunked_output_file_path.exists():
                     existing_chunks = load_chunks_from_file(chunked_output_file_path)
@@ -919,9 +1129,11 @@ class AppService:
                 failed_chunks = loaded_metadata.get("failed_chunks", {})
                 
                 # 🔧 이어하기 시 이미 완료된 청크 수로 초기화
-                self.processed_chunks_count = len(translated_chunks)
-                self.successful_chunks_count = len(translated_chunks)
-                logger.info(f"이어하기: processed_chunks_count 초기화 → {self.processed_chunks_count}")
+                job.processed_chunks = len(translated_chunks)
+                job.successful_chunks = len(translated_chunks)
+                self.processed_chunks_count += job.processed_chunks
+                self.successful_chunks_count += job.successful_chunks
+                logger.info(f"이어하기: processed_chunks_count 초기화 → {job.processed_chunks}")
                 
                 if retranslate_failed_only:
                     # 실패한 청크만 재번역 (안전한 딕셔너리 체크)
@@ -945,7 +1157,7 @@ class AppService:
                 chunks_to_process = list(enumerate(all_chunks))
                 logger.info(f"새로 번역: {len(chunks_to_process)}개 번역 대상")
             
-            if not chunks_to_process and total_chunks > 0:
+            if not chunks_to_process and total_chunks > 0 and not rebuild_final_output:
                 logger.info("번역할 새로운 청크가 없습니다 (모든 청크가 이미 번역됨)")
                 if status_callback:
                     status_callback("완료: 모든 청크 이미 번역됨")
@@ -963,6 +1175,25 @@ class AppService:
                 save_metadata(metadata_file_path, loaded_metadata)
                 logger.info("번역 시작: 메타데이터 상태를 'in_progress'로 업데이트")
             
+            # 📖 스트리밍 출력: 0번부터 연속으로 완료된 구간을 번역 도중 최종 파일에 바로 덧붙임
+            # (이전 조립 결과와 같은 앞부분은 유지, 다시 번역할 청크는 새 결과를 기다림)
+            if not self.config.get("enable_post_processing", True):
+                logger.info("후처리가 설정에서 비활성화되었습니다. 인덱스 마커만 제거하여 저장합니다.")
+            indices_to_process = {idx for idx, _ in chunks_to_process}
+            job.output_assembler = OutputAssembler(
+                final_output_file_path_obj,
+                self.post_processing_service,
+                self.config,
+                previous_state=previous_output_state
+            )
+            # 이어하기로 이미 번역된 청크가 많으면 정리가 프로세스 풀에서 실행되므로 이벤트 루프 밖에서 조립
+            streamed_prefix = await asyncio.to_thread(
+                job.output_assembler.open,
+                {idx: text for idx, text in existing_chunks.items() if idx not in indices_to_process}
+            )
+            if streamed_prefix:
+                logger.info(f"📖 스트리밍 출력 시작: 앞쪽 {streamed_prefix}개 청크가 최종 파일에 반영됨")
+            
             # 청크 병렬 처리 (청크 백업 파일에 저장)
             await self._translate_chunks_async(
                 chunks_to_process,
@@ -971,7 +1202,8 @@ class AppService:
                 metadata_file_path,
                 input_file_path_obj,
                 progress_callback,
-                tqdm_file_stream
+                tqdm_file_stream,
+                job=job
             )
             
             logger.info("모든 청크 처리 완료. 결과 병합 및 최종 저장 시작...")
@@ -987,33 +1219,12 @@ class AppService:
             except Exception as e:
                 logger.error(f"청크 파일 '{chunked_output_file_path}' 로드 및 정렬 중 오류: {e}. 최종 저장이 불안정할 수 있습니다.", exc_info=True)
             
+            output_assembly_state: Optional[Dict[str, Any]] = None
             try:
-                # ✅ 후처리 실행 (설정에서 활성화된 경우)
-                if self.config.get("enable_post_processing", True):
-                    logger.info("번역 완료 후 후처리를 시작합니다 (비동기 스레드 위임)...")
-                    try:
-                        # 1. 별도 스레드에서 가공 및 마커 제거까지 한 번에 수행 (이벤트 루프 차단 방지)
-                        final_text = await asyncio.to_thread(
-                            self.post_processing_service.post_process_and_clean_chunks,
-                            final_merged_chunks,
-                            self.config
-                        )
-                        
-                        # 2. 최종 결과물만 단 한 번 저장
-                        await asyncio.to_thread(write_text_file, final_output_file_path_obj, final_text)
-                        logger.info(f"후처리 및 최종 파일 저장 완료 (단일 I/O): {final_output_file_path_obj}")
-                            
-                    except Exception as post_proc_e:
-                        logger.error(f"후처리 중 오류 발생: {post_proc_e}. 기본 병합 저장을 시도합니다.", exc_info=True)
-                        # 후처리 실패 시 원본 병합 결과를 최종 출력 파일에 저장 (인덱스 제거 시도)
-                        await asyncio.to_thread(save_merged_chunks_to_file, final_output_file_path_obj, final_merged_chunks)
-                        await asyncio.to_thread(self.post_processing_service.remove_chunk_indexes_from_final_file, final_output_file_path_obj)
-                else:
-                    logger.info("후처리가 설정에서 비활성화되었습니다. 기본 병합 저장을 진행합니다.")
-                    # 후처리가 비활성화된 경우에도 인덱스는 제거하여 저장
-                    await asyncio.to_thread(save_merged_chunks_to_file, final_output_file_path_obj, final_merged_chunks)
-                    await asyncio.to_thread(self.post_processing_service.remove_chunk_indexes_from_final_file, final_output_file_path_obj)
-                    logger.info(f"후처리 없이 최종 결과 저장 완료: {final_output_file_path_obj}")
+                # ✅ 스트리밍으로 반영되지 못한 나머지(실패로 비어 있는 청크 이후 구간)만 덧붙임
+                # 모든 청크가 순서대로 반영되었다면 추가 쓰기 없음
+                output_assembly_state = await asyncio.to_thread(job.output_assembler.finish, final_merged_chunks)
+                logger.info(f"최종 파일 저장 완료: {final_output_file_path_obj}")
                 
                 # 청크 백업 파일(이어하기용)은 이미 chunked_output_file_path에 존재함
                 logger.info(f"✅ 번역 완료! 최종 파일: {final_output_file_path_obj}, 백업: {chunked_output_file_path}")
@@ -1033,6 +1244,8 @@ class AppService:
                 current_metadata = load_metadata(metadata_file_path)
                 current_metadata["status"] = "completed"
                 current_metadata["last_updated"] = time.time()
+                if output_assembly_state:
+                    current_metadata["output_assembly"] = output_assembly_state
                 save_metadata(metadata_file_path, current_metadata)
                 logger.info(f"메타데이터 최종 업데이트 완료: {len(current_metadata.get('translated_chunks', {}))}개 청크 정보 보존")
             except Exception as meta_save_err:
@@ -1049,6 +1262,140 @@ class AppService:
             if status_callback:
                 status_callback(f"오류: {e}")
             raise
+        finally:
+            if job.output_assembler is not None:
+                job.output_assembler.close()
+                job.output_assembler = None
+
+    def _record_chunk_quality(self, input_file_path: Union[str, Path], chunk_index: int, source_length: int, translated_length: int) -> Optional[Dict[str, Any]]:
+        """완료된 청크를 온라인 품질 추적기에 반영하고, 길이 이상이 보이면 바로 경고합니다 (이상치 정보 반환)."""
+        try:
+            issue = self.quality_check_service.record_chunk_completion(
+                input_file_path, chunk_index, source_length, translated_length,
+                language_pair=language_pair_for_metadata(self.config)
+            )
+        except Exception as e:
+            logger.debug(f"청크 #{chunk_index} 품질 추적 갱신 실패: {e}")
+            return None
+        if issue:
+            label = "누락" if issue["issue_type"] == "omission" else "환각"
+            logger.warning(
+                f"  ⚠️ 청크 #{chunk_index} {label} 의심: 번역 {issue['translated_length']}자 "
+                f"(예상 {issue['expected_length']:.0f}자, z={issue['z_score']})"
+            )
+        return issue
+
+    def _validate_chunk_output(self, chunk_index: int, chunk_text: str, translated_text: str) -> Optional[OutputValidationReport]:
+        """번역 출력 검증 (미번역 원문 잔존/반복 루프). 문제가 보이면 바로 경고합니다."""
+        try:
+            report = validate_translation_output(
+                chunk_text, translated_text, self.config.get("target_translation_language") or "ko"
+            )
+        except Exception as e:
+            logger.debug(f"청크 #{chunk_index} 출력 검증 실패: {e}")
+            return None
+        if "untranslated_residue" in report.issues:
+            logger.warning(
+                f"  ⚠️ 청크 #{chunk_index} 미번역 원문 잔존 의심: 잔존 문자 {report.residue_ratio:.1%}, "
+                f"최장 구간 {report.longest_residue_run}자"
+            )
+        if "repetition_loop" in report.issues:
+            detail = (f"{report.loop.period}자 단위 {report.loop.repeats:.1f}회 반복" if report.loop is not None
+                      else f"같은 줄 {report.repeated_line_run}회 연속")
+            logger.warning(f"  ⚠️ 청크 #{chunk_index} 반복 루프 의심: {detail}")
+        return report
+
+    @staticmethod
+    def _output_issues_metadata(report: Optional[OutputValidationReport]) -> Optional[Dict[str, Any]]:
+        """메타데이터 청크 기록에 남길 출력 검증 요약 (문제가 없으면 None)"""
+        return report.to_metadata() if report is not None and report.issues else None
+
+    def _completed_chunks_match_source(self, metadata: Dict[str, Any], chunks: List[str]) -> bool:
+        """
+        완료된 청크에 기록된 콘텐츠 해시가 현재 원문 청크와 모두 일치하는지 확인합니다.
+        해시가 없는 오래된 항목은 일치하는 것으로 간주합니다 (기존 인덱스 기반 동작 유지).
+        """
+        translated_chunks = metadata.get("translated_chunks", {})
+        if not isinstance(translated_chunks, dict):
+            return True
+        for idx_str, info in translated_chunks.items():
+            if not isinstance(info, dict) or not info.get("source_hash"):
+                continue
+            try:
+                idx = int(idx_str)
+            except (TypeError, ValueError):
+                return False
+            if idx >= len(chunks) or compute_chunk_hash(chunks[idx]) != info["source_hash"]:
+                logger.info(f"청크 #{idx}의 원문이 이전 작업과 다릅니다 (콘텐츠 해시 불일치)")
+                return False
+        return True
+
+    def _rebuild_metadata_from_content_hashes(
+        self,
+        input_file_path: Path,
+        file_content: str,
+        previous_metadata: Dict[str, Any],
+        chunked_output_file_path: Path,
+        default_chunks: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        콘텐츠 해시로 이전 번역을 재사용하여 메타데이터와 청크 백업을 다시 구성합니다.
+
+        1. 이전 메타데이터의 완료 청크(해시) + 청크 백업 파일의 번역을 해시 → 번역으로 모읍니다.
+        2. 새 원문을 이전 청크 경계를 보존하며 분할합니다 (ChunkService.split_text_with_anchors).
+        3. 해시가 같은 청크는 번역을 새 인덱스로 옮기고, 나머지는 미번역으로 남깁니다.
+
+        경계가 기본 분할과 다르면 chunk_offsets를 메타데이터에 저장하여
+        검토 탭/단일 청크 재번역이 같은 청크 구성을 사용하도록 합니다.
+        """
+        previous_translations: Dict[int, str] = {}
+        try:
+            if chunked_output_file_path.exists():
+                previous_translations = load_chunks_from_file(chunked_output_file_path)
+        except Exception as load_e:
+            logger.warning(f"이전 청크 백업 로드 실패 (재사용 없이 진행): {load_e}")
+
+        reusable: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        anchors: Dict[str, List[Tuple[int, str]]] = {}
+        for idx_str, info in previous_metadata.get("translated_chunks", {}).items():
+            if not isinstance(info, dict) or not info.get("source_hash") or not info.get("source_anchor_hash"):
+                continue
+            try:
+                translated_text = previous_translations.get(int(idx_str))
+            except (TypeError, ValueError):
+                continue
+            if translated_text is None or info["source_hash"] in reusable:
+                continue
+            reusable[info["source_hash"]] = (translated_text, info)
+            anchors.setdefault(info["source_anchor_hash"], []).append(
+                (int(info.get("source_length", 0)), info["source_hash"])
+            )
+
+        chunk_size = self.config.get("chunk_size", 6000)
+        all_chunks = self.chunk_service.split_text_with_anchors(file_content, chunk_size, anchors)
+
+        metadata = create_new_metadata(input_file_path, len(all_chunks), self.config)
+        if default_chunks is None or all_chunks != default_chunks:
+            metadata["chunk_offsets"] = self.chunk_service.chunk_end_offsets(all_chunks)
+
+        reused_translations: Dict[int, str] = {}
+        for idx, chunk in enumerate(all_chunks):
+            hit = reusable.get(compute_chunk_hash(chunk))
+            if hit:
+                translated_text, info = hit
+                reused_translations[idx] = translated_text
+                metadata["translated_chunks"][str(idx)] = dict(info)
+
+        save_merged_chunks_to_file(chunked_output_file_path, reused_translations)
+        metadata["status"] = "in_progress"
+        metadata["last_updated"] = time.time()
+        save_metadata(input_file_path, metadata)
+
+        logger.info(
+            f"♻️ 콘텐츠 해시 재사용: {len(reused_translations)}/{len(all_chunks)}개 청크 재사용, "
+            f"{len(all_chunks) - len(reused_translations)}개 청크 번역 필요"
+        )
+        return metadata, all_chunks
 
     async def _translate_chunks_async(
         self,
@@ -1058,16 +1405,20 @@ class AppService:
         metadata_file_path: Path,
         input_file_path: Path,
         progress_callback: Optional[Callable[[TranslationJobProgressDTO], None]] = None,
-        tqdm_file_stream: Optional[Any] = None
+        tqdm_file_stream: Optional[Any] = None,
+        job: Optional[TranslationJob] = None
     ) -> None:
         """
         청크들을 비동기로 병렬 처리
         
         - 세마포어로 동시 실행 수 제한 (max_workers 적용)
-        - RPM 속도 제한 적용
+        - RPM 속도 제한 적용 (작업 큐에서는 모든 파일이 같은 제한기를 공유)
         - Task.cancel()로 즉시 취소 가능
         - tqdm 진행률 표시 지원
         """
+        if job is None:
+            job = TranslationJob(input_file_path, output_file)
+
         if not chunks:
             logger.info("처리할 청크가 없습니다")
             return
@@ -1077,12 +1428,11 @@ class AppService:
         
         logger.info(f"비동기 청크 병렬 처리 시작: {len(chunks)} 청크 (동시 작업: {max_workers}, RPM: {rpm})")
         
-        # 세마포어: 동시 실행 수 제한
-        semaphore = asyncio.Semaphore(max_workers)
-        
-        # RPM 속도 제한
-        request_interval = 60.0 / rpm if rpm > 0 else 0
-        last_request_time = 0
+        # 세마포어 + RPM 제한기 (작업 큐에서 전달된 공유 제한기가 있으면 사용)
+        limiter = job.chunk_limiter or SharedChunkRateLimiter(
+            max_workers, rpm,
+            prioritize_low_index=self.config.get("prioritize_low_index_chunks", True)
+        )
         
         # tqdm 진행률 표시 (비동기 환경에서도 사용 가능)
         pbar = None
@@ -1105,38 +1455,30 @@ class AppService:
         
         async def rate_limited_translate(chunk_index: int, chunk_text: str) -> bool:
             """RPM 제한을 고려한 번역 함수"""
-            nonlocal last_request_time
-            
             # ✅ 취소 신호 확인 (세마포어 진입 전에 즉시 반응)
             if self.cancel_event.is_set():
                 logger.info(f"청크 {chunk_index + 1} 취소 신호 감지하여 건너뜀")
                 raise asyncio.CancelledError("취소 신호 감지")
             
-            # 세마포어로 동시 실행 제한
-            async with semaphore:
+            # 세마포어로 동시 실행 제한 (우선순위 모드에서는 인덱스가 작은 청크부터)
+            async with limiter.slot(chunk_index):
                 # ✅ 세마포어 진입 후 다시 취소 신호 확인 (대기 중 신호 받을 수 있음)
                 if self.cancel_event.is_set():
                     logger.info(f"청크 {chunk_index + 1} 세마포어 대기 중 취소 신호 감지")
                     raise asyncio.CancelledError("취소 신호 감지")
                 
-                # RPM 속도 제한 적용
-                current_time = asyncio.get_event_loop().time()
-                elapsed = current_time - last_request_time
-                if elapsed < request_interval:
-                    # ✅ asyncio.sleep도 취소에 반응하도록 설정
-                    try:
-                        await asyncio.sleep(request_interval - elapsed)
-                    except asyncio.CancelledError:
-                        logger.info(f"청크 {chunk_index + 1} RPM 대기 중 취소됨")
-                        raise
+                # RPM 속도 제한 적용 (✅ asyncio.sleep도 취소에 반응)
+                try:
+                    await limiter.wait_for_slot()
+                except asyncio.CancelledError:
+                    logger.info(f"청크 {chunk_index + 1} RPM 대기 중 취소됨")
+                    raise
                 
                 # ✅ RPM 지연 후 취소 신호 재확인
                 if self.cancel_event.is_set():
                     logger.info(f"청크 {chunk_index + 1} RPM 지연 후 취소 신호 감지")
                     raise asyncio.CancelledError("취소 신호 감지")
                 
-                last_request_time = asyncio.get_event_loop().time()
-                
                 return await self._translate_and_save_chunk_async(
                     chunk_index,
                     chunk_text,
@@ -1144,9 +1486,41 @@ class AppService:
                     total_chunks,
                     metadata_file_path,
                     input_file_path,
-                    progress_callback
+                    progress_callback,
+                    job=job,
+                    quality_retry=queue_quality_retry if quality_gate_enabled else None
                 )
         
+        # 🔁 인라인 품질 게이트: 의심 청크를 같은 작업 안에서 강제 분할 재번역 (예산 내)
+        quality_gate_enabled = bool(self.config.get("inline_quality_gate_enabled", True))
+        retry_budget = max(0, int(self.config.get("inline_quality_retry_budget", 10) or 0))
+        retry_tasks: List[asyncio.Task] = []
+        
+        async def retranslate_request_gate() -> None:
+            """재번역 서브 청크 요청마다 RPM 슬롯을 하나씩 차감"""
+            await limiter.wait_for_slot()
+            if self.cancel_event.is_set():
+                raise asyncio.CancelledError("취소 신호 감지")
+
+        async def rate_limited_retranslate(chunk_index: int, chunk_text: str, translated_text: str, issue: str) -> bool:
+            """첫 번역 대기 청크보다 낮은 우선순위로 슬롯을 받아 재번역 (RPM은 서브 청크 요청마다 차감)"""
+            async with limiter.slot(total_chunks + chunk_index):
+                if self.cancel_event.is_set():
+                    raise asyncio.CancelledError("취소 신호 감지")
+                return await self._retranslate_suspect_chunk_async(
+                    chunk_index, chunk_text, translated_text, issue, output_file, input_file_path, job,
+                    request_gate=retranslate_request_gate
+                )
+        
+        def queue_quality_retry(chunk_index: int, chunk_text: str, translated_text: str, issue: str) -> bool:
+            """재번역을 예약하면 True (예산 소진 시 False → 현재 번역을 그대로 사용)"""
+            if len(retry_tasks) >= retry_budget:
+                logger.warning(f"  ⚠️ 청크 {chunk_index + 1} 품질 의심({issue})이지만 자동 재번역 예산({retry_budget}) 소진 - 검토 탭에서 확인하세요")
+                return False
+            logger.info(f"  🔎 청크 {chunk_index + 1} 품질 의심({issue}) → 자동 재번역 예약 ({len(retry_tasks) + 1}/{retry_budget})")
+            retry_tasks.append(asyncio.create_task(rate_limited_retranslate(chunk_index, chunk_text, translated_text, issue)))
+            return True
+        
         # Task 리스트 생성
         tasks = []
         for chunk_index, chunk_text in chunks:
@@ -1170,7 +1544,18 @@ class AppService:
                     results.append(e)
                     if pbar:
                         pbar.update(1)
+            
+            # 첫 번역이 모두 끝난 뒤 남은 재번역 대기 (재번역은 다시 예약하지 않으므로 목록이 늘지 않음)
+            if retry_tasks:
+                retry_results = await asyncio.gather(*retry_tasks, return_exceptions=True)
+                adopted = sum(1 for result in retry_results if result is True)
+                job.extra["inline_quality_retries"] = {"queued": len(retry_tasks), "adopted": adopted}
+                logger.info(f"🔁 인라인 품질 재번역 완료: 예약 {len(retry_tasks)}개, 채택 {adopted}개")
         finally:
+            # 취소 등으로 빠져나갈 때 남은 재번역 정리
+            for retry_task in retry_tasks:
+                if not retry_task.done():
+                    retry_task.cancel()
             # tqdm 종료
             if pbar:
                 try:
@@ -1193,6 +1578,115 @@ class AppService:
         
         logger.info(f"청크 병렬 처리 완료: 성공 {success_count}, 실패 {error_count}")
 
+    def _store_chunk_result(
+        self,
+        job: TranslationJob,
+        output_file: Path,
+        chunk_index: int,
+        content: Optional[str],
+        stream: bool = True,
+        chunk_label: str = ""
+    ) -> None:
+        """청크 백업 파일에 저장하고 스트리밍 출력에 전달 (None = 출력에서 건너뜀, stream=False면 백업만)"""
+        if content is not None and job.source_filter_result is not None:
+            # mask 모드: 번역에서 제외한 원문 줄을 제자리에 복원
+            content = job.source_filter_result.restore(content)
+        if content is not None:
+            save_chunk_with_index_to_file(output_file, chunk_index, content)
+        if stream and job.output_assembler is not None:
+            try:
+                job.output_assembler.add_chunk(chunk_index, content)
+            except Exception as stream_e:
+                logger.warning(f"  ⚠️ {chunk_label or f'청크 {chunk_index + 1}'} 스트리밍 출력 갱신 실패 (작업 종료 시 재조립): {stream_e}")
+
+    def _inline_quality_issue(
+        self,
+        input_file_path: Union[str, Path],
+        chunk_index: int,
+        chunk_text: str,
+        translated_text: str,
+        output_report: Optional[OutputValidationReport] = None
+    ) -> Optional[str]:
+        """
+        번역 직후 품질 검사: 값싼 검사(빈 번역/부분 실패 표시/극단적 길이 비율/미번역 잔존/반복 루프) 후
+        진행 중인 길이 비율 모델(QualityCheckTracker)에 기록하여 누락/환각 의심 여부를 반환합니다.
+        """
+        cheap_issue = find_cheap_quality_issue(
+            chunk_text, translated_text, self.config.get("target_translation_language") or "ko", output_report=output_report
+        )
+        issue = self._record_chunk_quality(input_file_path, chunk_index, len(chunk_text), len(translated_text))
+        return cheap_issue or (issue["issue_type"] if issue else None)
+
+    async def _retranslate_suspect_chunk_async(
+        self,
+        chunk_index: int,
+        chunk_text: str,
+        translated_text: str,
+        issue: str,
+        output_file: Path,
+        input_file_path: Path,
+        job: TranslationJob,
+        request_gate: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> bool:
+        """
+        인라인 품질 검사에서 의심된 청크를 강제 분할로 다시 번역합니다.
+        분할 재번역은 서브 청크마다 API를 호출하므로 request_gate(RPM 제한기)를 요청마다 거칩니다.
+        새 번역이 값싼 검사를 통과하고 길이 모델과의 차이(|z|)가 줄었을 때만 채택하며
+        (미번역 잔존/반복 루프로 의심된 청크는 값싼 검사 통과만으로 채택),
+        어느 쪽이든 보류했던 스트리밍 출력을 이어갑니다.
+        """
+        translation_service = job.translation_service or self.translation_service
+        chosen = translated_text
+        adopted = False
+        try:
+            with request_time_budget(self.config.get("chunk_time_budget_seconds", 1800.0)), \
+                    collect_blocked_spans() as retranslated_blocked_spans:
+                retranslated = await translation_service.translate_text_force_split_async(
+                    chunk_text,
+                    self.config.get("max_content_safety_split_attempts", 3),
+                    self.config.get("min_content_safety_chunk_size", 100),
+                    split_level=1,
+                    request_gate=request_gate
+                )
+            retranslated_report = self._validate_chunk_output(chunk_index, chunk_text, retranslated)
+            if find_cheap_quality_issue(
+                chunk_text, retranslated, self.config.get("target_translation_language") or "ko", output_report=retranslated_report
+            ) is None:
+                old_z = self.quality_check_service.z_score(input_file_path, len(chunk_text), len(translated_text))
+                new_z = self.quality_check_service.z_score(input_file_path, len(chunk_text), len(retranslated))
+                adopted = (issue in OUTPUT_ISSUE_TYPES or old_z is None or new_z is None
+                           or abs(new_z) < abs(old_z))
+            if adopted:
+                chosen = retranslated
+                update_metadata_for_chunk_completion(
+                    input_file_path,
+                    chunk_index,
+                    source_length=len(chunk_text),
+                    translated_length=len(retranslated),
+                    output_issues=self._output_issues_metadata(retranslated_report),
+                    blocked_spans=[span.to_metadata() for span in retranslated_blocked_spans] or None,
+                    **chunk_content_hashes(chunk_text)
+                )
+                self._record_chunk_quality(input_file_path, chunk_index, len(chunk_text), len(retranslated))
+                logger.info(f"  🔁 청크 {chunk_index + 1} 자동 재번역 채택 ({issue}: {len(translated_text)}자 → {len(retranslated)}자)")
+            else:
+                logger.info(f"  ↩️ 청크 {chunk_index + 1} 자동 재번역 결과가 더 낫지 않아 기존 번역 유지 ({issue})")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"  ⚠️ 청크 {chunk_index + 1} 자동 재번역 실패, 기존 번역 유지: {e}")
+        finally:
+            # 재번역을 채택했으면 백업에도 덧붙이고(마지막 기록이 우선), 보류한 스트리밍 출력에 전달
+            if adopted:
+                self._store_chunk_result(job, output_file, chunk_index, chosen)
+            elif job.output_assembler is not None:
+                content = job.source_filter_result.restore(chosen) if job.source_filter_result is not None else chosen
+                try:
+                    job.output_assembler.add_chunk(chunk_index, content)
+                except Exception as stream_e:
+                    logger.warning(f"  ⚠️ 청크 {chunk_index + 1} 스트리밍 출력 갱신 실패 (작업 종료 시 재조립): {stream_e}")
+        return adopted
+
     async def _translate_and_save_chunk_async(
         self,
         chunk_index: int,
@@ -1201,7 +1695,9 @@ class AppService:
         total_chunks: int,
         metadata_file_path: Path,
         input_file_path: Path,
-        progress_callback: Optional[Callable[[TranslationJobProgressDTO], None]] = None
+        progress_callback: Optional[Callable[[TranslationJobProgressDTO], None]] = None,
+        job: Optional[TranslationJob] = None,
+        quality_retry: Optional[Callable[[int, str, str, str], bool]] = None
     ) -> bool:
         """
         비동기 청크 처리 (동기 버전과 동일한 로깅 구조)
@@ -1210,7 +1706,13 @@ class AppService:
         - 비동기 번역 호출
         - 파일 쓰기는 순차 처리
         - 타임아웃 처리 포함
+        - 진행률은 파일별 작업(job) 카운터 기준, self 카운터는 전체 합계
+        - quality_retry가 주어지면 번역 직후 품질 검사를 하고, 의심 청크는 재번역 예약 후
+          스트리밍 출력을 재번역 결과가 나올 때까지 보류 (백업 파일에는 바로 저장)
         """
+        if job is None:
+            job = TranslationJob(input_file_path, output_file)
+        translation_service = job.translation_service or self.translation_service
         current_chunk_info_msg = f"청크 {chunk_index + 1}/{total_chunks}"
         
         # 청크 분석 (로깅 최적화: 통계는 DEBUG 레벨에서만 상세 출력)
@@ -1231,11 +1733,18 @@ class AppService:
         last_error = ""
         success = False
         translated_chunk = ""
+        quality_recorded = False
+        output_report: Optional[OutputValidationReport] = None
+        blocked_spans: List[Any] = []  # 콘텐츠 안전 격리로 남은 최소 차단 구간
+        
+        def save_chunk_result(content: Optional[str], stream: bool = True) -> None:
+            self._store_chunk_result(job, output_file, chunk_index, content, stream=stream, chunk_label=current_chunk_info_msg)
         
         try:
             # 빈 청크 체크
             if not chunk_text.strip():
                 logger.warning(f"  ⚠️ {current_chunk_info_msg} 빈 청크 (건너뜀)")
+                save_chunk_result(None)
                 return False
             
             # 번역 설정 로드
@@ -1248,10 +1757,13 @@ class AppService:
             translation_start_time = time.time()
             
             # 비동기 번역 호출 (timeout은 GeminiClient의 http_options에 의해 자동 적용)
+            # 재시도·콘텐츠 안전 분할까지 포함해 청크 하나가 쓰는 전체 시간 예산
             try:
-                translated_chunk = await self.translation_service.translate_chunk_async(
-                    chunk_text
-                )
+                with request_time_budget(self.config.get("chunk_time_budget_seconds", 1800.0)), \
+                        collect_blocked_spans() as blocked_spans:
+                    translated_chunk = await translation_service.translate_chunk_async(
+                        chunk_text
+                    )
                 success = True
                 
                 translation_time = time.time() - translation_start_time
@@ -1273,8 +1785,20 @@ class AppService:
                 logger.warning(f"  ⚠️ {current_chunk_info_msg} 취소됨")
                 raise
             
+            # 출력 검증 결과는 메타데이터에 기록 (미번역 잔존/반복 루프)
+            if success:
+                output_report = self._validate_chunk_output(chunk_index, chunk_text, translated_chunk)
+            
+            # 인라인 품질 검사 (의심 청크는 같은 작업 안에서 낮은 우선순위로 재번역 예약)
+            retry_queued = False
+            if success and quality_retry is not None:
+                quality_recorded = True
+                quality_issue = self._inline_quality_issue(input_file_path, chunk_index, chunk_text, translated_chunk, output_report)
+                if quality_issue:
+                    retry_queued = quality_retry(chunk_index, chunk_text, translated_chunk, quality_issue)
+            
             # 파일 저장 (Lock 불필요, asyncio 단일 스레드)
-            save_chunk_with_index_to_file(output_file, chunk_index, translated_chunk)
+            save_chunk_result(translated_chunk, stream=not retry_queued)
             
             if success:
                 ratio = len(translated_chunk) / len(chunk_text) if len(chunk_text) > 0 else 0.0
@@ -1286,7 +1810,7 @@ class AppService:
             error_type = "콘텐츠 검열" if "콘텐츠 안전 문제" in str(e_trans) else "번역 서비스"
             logger.error(f"  ❌ {current_chunk_info_msg} 실패: {error_type} - {e_trans} ({processing_time:.2f}초)")
             
-            save_chunk_with_index_to_file(output_file, chunk_index, f"[번역 실패: {e_trans}]\n\n--- 원문 내용 ---\n{chunk_text}")
+            save_chunk_result(f"[번역 실패: {e_trans}]\n\n--- 원문 내용 ---\n{chunk_text}")
             last_error = str(e_trans)
             success = False
             
@@ -1300,7 +1824,7 @@ class AppService:
                 error_detail = " [인증 오류]"
             logger.error(f"  ❌ {current_chunk_info_msg} API 오류{error_detail}: {e_api} ({processing_time:.2f}초)")
             
-            save_chunk_with_index_to_file(output_file, chunk_index, f"[API 오류로 번역 실패: {e_api}]\n\n--- 원문 내용 ---\n{chunk_text}")
+            save_chunk_result(f"[API 오류로 번역 실패: {e_api}]\n\n--- 원문 내용 ---\n{chunk_text}")
             last_error = str(e_api)
             success = False
             
@@ -1313,11 +1837,7 @@ class AppService:
             logger.error(f"  ❌ {current_chunk_info_msg} 예상치 못한 오류: {type(e_gen).__name__} - {e_gen} ({processing_time:.2f}초)", exc_info=True)
             
             try:
-                save_chunk_with_index_to_file(
-                    output_file,
-                    chunk_index,
-                    f"[알 수 없는 오류로 번역 실패: {e_gen}]\n\n--- 원문 내용 ---\n{chunk_text}"
-                )
+                save_chunk_result(f"[알 수 없는 오류로 번역 실패: {e_gen}]\n\n--- 원문 내용 ---\n{chunk_text}")
             except Exception as save_err:
                 logger.error(f"  ❌ 실패 청크 저장 중 오류: {save_err}")
             
@@ -1327,8 +1847,10 @@ class AppService:
         finally:
             total_time = time.time() - start_time
             # 상태 업데이트 (Lock 불필요, asyncio 단일 스레드)
+            job.processed_chunks += 1
             self.processed_chunks_count += 1
             if success:
+                job.successful_chunks += 1
                 self.successful_chunks_count += 1
                 # ✅ 메타데이터 업데이트: translated_chunks에 완료된 청크 기록
                 try:
@@ -1336,15 +1858,21 @@ class AppService:
                         input_file_path,
                         chunk_index,
                         source_length=len(chunk_text),
-                        translated_length=len(translated_chunk)
+                        translated_length=len(translated_chunk),
+                        output_issues=self._output_issues_metadata(output_report),
+                        blocked_spans=[span.to_metadata() for span in blocked_spans] or None,
+                        **chunk_content_hashes(chunk_text)
                     )
                     if metadata_updated:
                         logger.debug(f"  💾 {current_chunk_info_msg} 메타데이터 업데이트 완료")
+                        if not quality_recorded:
+                            self._record_chunk_quality(input_file_path, chunk_index, len(chunk_text), len(translated_chunk))
                     else:
                         logger.warning(f"  ⚠️ {current_chunk_info_msg} 메타데이터 업데이트 실패")
                 except Exception as meta_e:
                     logger.error(f"  ❌ {current_chunk_info_msg} 메타데이터 업데이트 중 오류: {meta_e}")
             else:
+                job.failed_chunks += 1
                 self.failed_chunks_count += 1
                 # ❌ 실패한 청크 정보 기록
                 if last_error:
@@ -1355,13 +1883,13 @@ class AppService:
                         logger.error(f"  ❌ {current_chunk_info_msg} 실패 정보 메타데이터 기록 중 오류: {meta_fail_e}")
             
             # 진행률 계산 및 통합 로깅 (2개 로그 → 1개)
-            progress_percentage = (self.processed_chunks_count / total_chunks) * 100
-            success_rate = (self.successful_chunks_count / self.processed_chunks_count) * 100 if self.processed_chunks_count > 0 else 0
+            progress_percentage = (job.processed_chunks / total_chunks) * 100
+            success_rate = (job.successful_chunks / job.processed_chunks) * 100 if job.processed_chunks > 0 else 0
             
             # 매 10% 또는 마지막 청크에서만 상세 로그 출력 (로그 빈도 최적화)
-            should_log_progress = (self.processed_chunks_count % max(1, total_chunks // 10) == 0) or (self.processed_chunks_count == total_chunks)
+            should_log_progress = (job.processed_chunks % max(1, total_chunks // 10) == 0) or (job.processed_chunks == total_chunks)
             if should_log_progress:
-                logger.info(f"  📈 진행률: {progress_percentage:.0f}% ({self.processed_chunks_count}/{total_chunks}) | 성공률: {success_rate:.0f}% (✅{self.successful_chunks_count} ❌{self.failed_chunks_count})")
+                logger.info(f"  📈 진행률: {progress_percentage:.0f}% ({job.processed_chunks}/{total_chunks}) | 성공률: {success_rate:.0f}% (✅{job.successful_chunks} ❌{job.failed_chunks})")
             
             # 진행률 콜백
             if progress_callback:
@@ -1374,9 +1902,9 @@ class AppService:
                 
                 progress_dto = TranslationJobProgressDTO(
                     total_chunks=total_chunks,
-                    processed_chunks=self.processed_chunks_count,
-                    successful_chunks=self.successful_chunks_count,
-                    failed_chunks=self.failed_chunks_count,
+                    processed_chunks=job.processed_chunks,
+                    successful_chunks=job.successful_chunks,
+                    failed_chunks=job.failed_chunks,
                     current_status_message=status_msg_for_dto,
                     current_chunk_processing=chunk_index + 1,
                     last_error_message=last_error
@@ -1432,9 +1960,13 @@ class AppService:
 
         try:
             # 1. 원문 로드
-            content = read_text_file(input_file)
+            metadata = load_metadata(input_file)
+            filter_result = filter_source_for_metadata(read_text_file(input_file), metadata)
+            content = filter_result.text
             chunk_size = self.config.get("chunk_size", 6000)
-            chunks_list = self.chunk_service.create_chunks_from_file_content(content, chunk_size)
+            chunks_list = self.chunk_service.create_chunks_from_file_content(
+                content, chunk_size, chunk_offsets=metadata.get("chunk_offsets")
+            )
             
             if chunk_idx >= len(chunks_list):
                 return False, f"잘못된 청크 인덱스: {chunk_idx}"
@@ -1447,9 +1979,11 @@ class AppService:
             max_split = self.config.get("max_content_safety_split_attempts", 3)
             min_size = self.config.get("min_content_safety_chunk_size", 100)
             
-            translated_text = await self.translation_service.translate_text_force_split_async(
-                source_text, max_split, min_size, split_level=split_level
-            )
+            with collect_blocked_spans() as blocked_spans:
+                translated_text = await self.translation_service.translate_text_force_split_async(
+                    source_text, max_split, min_size, split_level=split_level
+                )
+            translated_text = filter_result.restore(translated_text)
 
             # 3. 결과 저장 및 메타데이터 갱신
             # (기존 logic 재사용을 위해 동기 래퍼 호출 가능하나, 여기서는 직접 처리 권장)
@@ -1462,8 +1996,12 @@ class AppService:
                 input_file,
                 chunk_idx,
                 source_length=len(source_text),
-                translated_length=len(translated_text)
+                translated_length=len(translated_text),
+                output_issues=self._output_issues_metadata(self._validate_chunk_output(chunk_idx, source_text, translated_text)),
+                blocked_spans=[span.to_metadata() for span in blocked_spans] or None,
+                **chunk_content_hashes(source_text)
             )
+            self._record_chunk_quality(input_file, chunk_idx, len(source_text), len(translated_text))
             
             return True, translated_text
 
@@ -1511,8 +2049,13 @@ class AppService:
                 logger.error(error_msg)
                 return False, error_msg
             
+            metadata = load_metadata(input_file_path_obj)
+            filter_result = filter_source_for_metadata(file_content, metadata)
+            file_content = filter_result.text
             chunk_size = self.config.get('chunk_size', 6000)
-            all_chunks = self.chunk_service.create_chunks_from_file_content(file_content, chunk_size)
+            all_chunks = self.chunk_service.create_chunks_from_file_content(
+                file_content, chunk_size, chunk_offsets=metadata.get("chunk_offsets")
+            )
             
             if chunk_index >= len(all_chunks):
                 error_msg = f"청크 #{chunk_index}가 범위를 벗어났습니다 (총 {len(all_chunks)}개)."
@@ -1548,18 +2091,21 @@ class AppService:
             start_time = time.time()
             
             # asyncio.run()을 사용하여 비동기 메서드 호출
+            blocked_spans = []
             if use_content_safety_retry:
-                translated_text = asyncio.run(
-                    self.translation_service.translate_text_with_content_safety_retry_async(
-                        chunk_text, max_split_attempts, min_chunk_size
+                with collect_blocked_spans() as blocked_spans:
+                    translated_text = asyncio.run(
+                        self.translation_service.translate_text_with_content_safety_retry_async(
+                            chunk_text, max_split_attempts, min_chunk_size
+                        )
                     )
-                )
             else:
                 translated_text = asyncio.run(
                     self.translation_service.translate_text_async(chunk_text)
                 )
             
             translation_time = time.time() - start_time
+            translated_text = filter_result.restore(translated_text) if translated_text else translated_text
             
             if not translated_text:
                 error_msg = "번역 결과가 비어있습니다."
@@ -1585,8 +2131,12 @@ class AppService:
                 input_file_path_obj,
                 chunk_index,
                 source_length=len(chunk_text),
-                translated_length=len(translated_text)
+                translated_length=len(translated_text),
+                output_issues=self._output_issues_metadata(self._validate_chunk_output(chunk_index, chunk_text, translated_text)),
+                blocked_spans=[span.to_metadata() for span in blocked_spans] or None,
+                **chunk_content_hashes(chunk_text)
             )
+            self._record_chunk_quality(input_file_path_obj, chunk_index, len(chunk_text), len(translated_text))
             
             logger.info(f"청크 #{chunk_index} 재번역 완료 ({translation_time:.2f}초, {len(translated_text)}자)")
             
@@ -0,0 +1,259 @@
+# translation_job_queue.py
+"""
+다중 파일 번역 작업 큐
+
+여러 입력 파일을 하나의 이벤트 루프에서 처리합니다. 각 파일은 기존과 동일하게
+자체 메타데이터/청크 백업 파일로 이어하기를 지원하며, 모든 파일의 청크는 하나의
+세마포어(max_workers)와 RPM 제한기를 공유하므로 파일 경계에서 API 처리량이
+비지 않습니다 (파일 A의 마지막 청크를 기다리는 동안 파일 B의 청크가 진행).
+"""
+import asyncio
+import heapq
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+try:
+    from infrastructure.logger_config import setup_logger
+except ImportError:
+    from infrastructure.logger_config import setup_logger
+
+try:
+    from ..core.dtos import BatchTranslationProgressDTO, TranslationJobProgressDTO
+except ImportError:
+    from core.dtos import BatchTranslationProgressDTO, TranslationJobProgressDTO
+
+logger = setup_logger(__name__)
+
+
+class PrioritySemaphore:
+    """
+    대기 중인 요청 중 우선순위 값이 가장 작은 것부터 슬롯을 주는 세마포어
+    (같은 우선순위는 도착 순서대로)
+    """
+
+    def __init__(self, value: int):
+        self._value = max(1, int(value))
+        self._waiters: List[Tuple[float, int, asyncio.Future]] = []
+        self._seq = 0
+
+    async def acquire(self, priority: float = 0) -> None:
+        if self._value > 0 and not any(not fut.done() for _, _, fut in self._waiters):
+            self._value -= 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, self._seq, fut))
+        self._seq += 1
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # 슬롯을 받은 직후 취소되었다면 다음 대기자에게 넘김
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(True)
+                return
+        self._value += 1
+
+
+class SharedChunkRateLimiter:
+    """
+    여러 번역 작업이 공유하는 동시 실행/RPM 제한기
+
+    - semaphore: 동시에 API를 호출하는 청크 수 제한 (max_workers)
+    - slot(priority): prioritize_low_index가 켜져 있으면 대기 중인 청크 중 인덱스가
+      가장 작은 청크부터 실행 (스트리밍 출력의 연속 구간이 빨리 늘어나도록)
+    - wait_for_slot(): 요청 간격(60/RPM초)을 슬롯 예약 방식으로 보장
+    """
+
+    def __init__(self, max_workers: int, requests_per_minute: Optional[float], prioritize_low_index: bool = False):
+        self.semaphore = asyncio.Semaphore(max(1, int(max_workers or 1)))
+        self.priority_semaphore = PrioritySemaphore(max_workers or 1) if prioritize_low_index else None
+        rpm = requests_per_minute or 0
+        self.request_interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._next_slot_time = 0.0
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def slot(self, priority: float = 0) -> AsyncIterator[None]:
+        """동시 실행 슬롯 (priority가 작을수록 먼저 실행, 우선순위 모드가 아니면 도착 순)"""
+        if self.priority_semaphore is None:
+            async with self.semaphore:
+                yield
+            return
+        await self.priority_semaphore.acquire(priority)
+        try:
+            yield
+        finally:
+            self.priority_semaphore.release()
+
+    async def wait_for_slot(self) -> None:
+        """다음 요청 슬롯까지 대기합니다. (취소 시 CancelledError 전파)"""
+        if self.request_interval <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot_time = max(now, self._next_slot_time)
+            self._next_slot_time = slot_time + self.request_interval
+        delay = slot_time - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+@dataclass
+class TranslationJob:
+    """
+    작업 큐의 파일 단위 작업 상태
+
+    청크 카운터는 파일별로 유지되며, 진행률 DTO와 로그는 이 값을 기준으로 합니다.
+    """
+    input_file_path: Path
+    output_file_path: Path
+    status: str = "pending"  # pending, running, completed, failed, cancelled
+    total_chunks: int = 0
+    processed_chunks: int = 0
+    successful_chunks: int = 0
+    failed_chunks: int = 0
+    error_message: Optional[str] = None
+    # 파일별 용어집이 적용된 번역 서비스 (None이면 AppService 기본 서비스 사용)
+    translation_service: Optional[Any] = None
+    # 파일 간에 공유되는 동시성/RPM 제한기 (None이면 호출마다 새로 생성)
+    chunk_limiter: Optional[SharedChunkRateLimiter] = None
+    # 번역 중 최종 출력 파일을 순서대로 채우는 스트리밍 조립기 (utils.output_assembler.OutputAssembler)
+    output_assembler: Optional[Any] = None
+    # mask 모드 원문 필터 결과 (utils.source_filter.SourceFilterResult, 마스크가 없으면 None)
+    source_filter_result: Optional[Any] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class TranslationJobQueue:
+    """
+    여러 TranslationJob을 하나의 이벤트 루프에서 실행하는 작업 큐
+
+    - max_concurrent_files: 동시에 청킹/번역을 진행하는 파일 수
+    - 모든 파일의 청크는 하나의 SharedChunkRateLimiter를 공유합니다.
+    - 한 파일의 실패는 다른 파일의 진행을 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        app_service: Any,
+        jobs: List[TranslationJob],
+        max_concurrent_files: int = 2,
+        progress_callback: Optional[Callable[[BatchTranslationProgressDTO], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+        file_progress_callback: Optional[Callable[[TranslationJob, TranslationJobProgressDTO], None]] = None,
+    ):
+        self.app_service = app_service
+        self.jobs = jobs
+        self.max_concurrent_files = max(1, int(max_concurrent_files or 1))
+        self.progress_callback = progress_callback
+        self.status_callback = status_callback
+        self.file_progress_callback = file_progress_callback
+
+        config = app_service.config
+        self.chunk_limiter = SharedChunkRateLimiter(
+            config.get("max_workers", 4),
+            config.get("requests_per_minute", 60),
+            prioritize_low_index=config.get("prioritize_low_index_chunks", True)
+        )
+
+    def build_progress_dto(self, message: str, current_file: Optional[str] = None) -> BatchTranslationProgressDTO:
+        """모든 작업의 카운터를 합산한 진행률 DTO 생성"""
+        return BatchTranslationProgressDTO(
+            total_files=len(self.jobs),
+            completed_files=sum(1 for j in self.jobs if j.status == "completed"),
+            failed_files=sum(1 for j in self.jobs if j.status == "failed"),
+            active_files=sum(1 for j in self.jobs if j.status == "running"),
+            total_chunks=sum(j.total_chunks for j in self.jobs),
+            processed_chunks=sum(j.processed_chunks for j in self.jobs),
+            successful_chunks=sum(j.successful_chunks for j in self.jobs),
+            failed_chunks=sum(j.failed_chunks for j in self.jobs),
+            current_status_message=message,
+            current_file=current_file
+        )
+
+    def _emit_progress(self, message: str, current_file: Optional[str] = None) -> None:
+        if self.progress_callback:
+            try:
+                self.progress_callback(self.build_progress_dto(message, current_file))
+            except Exception as cb_e:
+                logger.warning(f"작업 큐 진행률 콜백 오류 (무시): {cb_e}")
+
+    async def run(self) -> List[TranslationJob]:
+        """모든 작업을 실행하고 작업 목록(상태 포함)을 반환합니다."""
+        logger.info(f"📚 작업 큐 시작: {len(self.jobs)}개 파일 (동시 파일: {self.max_concurrent_files})")
+        file_semaphore = asyncio.Semaphore(self.max_concurrent_files)
+
+        for job in self.jobs:
+            job.chunk_limiter = self.chunk_limiter
+
+        async def run_job(job: TranslationJob) -> None:
+            async with file_semaphore:
+                await self._run_single_job(job)
+
+        tasks = [
+            asyncio.create_task(run_job(job), name=f"translation_job_{i}")
+            for i, job in enumerate(self.jobs)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            for t in tasks:
+                if not t.done():
+                    t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for job in self.jobs:
+                if job.status in ("pending", "running"):
+                    job.status = "cancelled"
+            raise
+
+        completed = sum(1 for j in self.jobs if j.status == "completed")
+        failed = sum(1 for j in self.jobs if j.status == "failed")
+        summary = f"작업 큐 완료: 성공 {completed}개, 실패 {failed}개 (총 {len(self.jobs)}개 파일)"
+        logger.info(f"📚 {summary}")
+        self._emit_progress(summary)
+        return self.jobs
+
+    async def _run_single_job(self, job: TranslationJob) -> None:
+        file_name = job.input_file_path.name
+        job.status = "running"
+        job.translation_service = self.app_service._create_translation_service_for_file(job.input_file_path)
+        self._emit_progress(f"'{file_name}' 번역 시작", file_name)
+
+        def on_file_progress(dto: TranslationJobProgressDTO) -> None:
+            job.total_chunks = dto.total_chunks
+            if self.file_progress_callback:
+                self.file_progress_callback(job, dto)
+            self._emit_progress(f"[{file_name}] {dto.current_status_message}", file_name)
+
+        def on_file_status(message: str) -> None:
+            if self.status_callback:
+                self.status_callback(f"[{file_name}] {message}")
+
+        try:
+            await self.app_service._do_translation_async(
+                job.input_file_path,
+                job.output_file_path,
+                on_file_progress,
+                on_file_status,
+                None,  # 파일별 tqdm 대신 작업 큐 전체 진행률을 표시
+                job=job
+            )
+            job.status = "completed"
+            self._emit_progress(f"'{file_name}' 번역 완료", file_name)
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error_message = str(e)
+            logger.error(f"❌ 작업 큐: '{file_name}' 번역 실패: {e}")
+            self._emit_progress(f"'{file_name}' 번역 실패: {e}", file_name)
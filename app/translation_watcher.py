@@ -0,0 +1,171 @@
+# translation_watcher.py
+"""
+감시(watch) 모드: 입력 파일/디렉토리를 주기적으로 확인하여 변경된 파일만 다시 번역합니다.
+
+연재 중인 원문처럼 파일 끝에 새 내용이 계속 추가되는 경우를 위한 모드입니다.
+- 변경 감지는 파일 크기/수정 시각(mtime)으로 하고, 쓰기가 끝났는지 확인하기 위해
+  같은 값이 두 번 연속 관측된 뒤에 처리합니다.
+- 실제로 무엇을 번역할지는 메타데이터의 청크 콘텐츠 해시가 결정합니다.
+  (내용이 같은 청크는 재사용, 추가/수정된 구간만 번역)
+- 최종 출력은 OutputAssembler가 첫 번째로 달라진 조각부터만 다시 씁니다.
+- 변경된 파일들은 작업 큐(start_batch_translation_async)로 함께 처리되어
+  동시성/RPM 제한을 공유합니다.
+"""
+import asyncio
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    from infrastructure.logger_config import setup_logger
+except ImportError:
+    from infrastructure.logger_config import setup_logger
+
+logger = setup_logger(__name__)
+
+# 번역 과정에서 생성되는 파일 (감시 대상에서 제외)
+GENERATED_FILE_SUFFIXES = ("_translated", "_translated_chunked", "_metadata", "_glossary")
+
+FileSignature = Tuple[int, int]  # (mtime_ns, size)
+
+
+def default_output_path_for(input_file: Path) -> Path:
+    """CLI와 동일한 기본 출력 경로 규칙: input.txt → input_translated.txt"""
+    return input_file.parent / f"{input_file.stem}_translated{input_file.suffix}"
+
+
+def is_generated_file(path: Path) -> bool:
+    """번역 결과/백업/메타데이터/용어집 파일인지 확인합니다."""
+    stem = path.stem
+    return any(stem.endswith(suffix) for suffix in GENERATED_FILE_SUFFIXES)
+
+
+class TranslationWatcher:
+    """
+    입력 경로를 폴링하며 변경된 파일을 AppService로 다시 번역하는 감시기
+
+    - watch_paths: 파일 또는 디렉토리 (디렉토리는 file_pattern에 맞는 파일을 감시)
+    - output_file: 단일 파일 감시 시 출력 경로 (None이면 파일별 기본 경로)
+    - 첫 확인에서는 모든 파일을 처리합니다. 이미 완료된 파일은 API 호출 없이 끝납니다.
+    """
+
+    def __init__(
+        self,
+        app_service: Any,
+        watch_paths: Sequence[Union[str, Path]],
+        poll_interval: Optional[float] = None,
+        output_file: Optional[Union[str, Path]] = None,
+        file_pattern: str = "*.txt",
+        progress_callback: Optional[Callable[[Any], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None
+    ):
+        self.app_service = app_service
+        self.watch_paths = [Path(p) for p in watch_paths]
+        if poll_interval is None:
+            poll_interval = app_service.config.get("watch_poll_interval", 5.0)
+        self.poll_interval = max(0.0, float(poll_interval))
+        self.output_file = Path(output_file) if output_file else None
+        self.file_pattern = file_pattern
+        self.progress_callback = progress_callback
+        self.status_callback = status_callback
+
+        # 마지막 폴링에서 관측한 시그니처 / 마지막으로 번역을 마친 시그니처
+        self._observed: Dict[Path, FileSignature] = {}
+        self._processed: Dict[Path, FileSignature] = {}
+        self.cycles = 0
+
+    def _collect_files(self) -> List[Path]:
+        files: List[Path] = []
+        for path in self.watch_paths:
+            if path.is_dir():
+                files.extend(p for p in sorted(path.glob(self.file_pattern)) if p.is_file() and not is_generated_file(p))
+            elif path.is_file():
+                files.append(path)
+        # 출력 파일이 입력 디렉토리 안에 있는 경우 자기 자신을 다시 번역하지 않도록 제외
+        if self.output_file is not None:
+            files = [f for f in files if f.resolve() != self.output_file.resolve()]
+        return files
+
+    def output_path_for(self, input_file: Path) -> Path:
+        if self.output_file is not None and len(self.watch_paths) == 1 and self.watch_paths[0].is_file():
+            return self.output_file
+        return default_output_path_for(input_file)
+
+    def scan(self) -> List[Path]:
+        """
+        한 번 폴링하여 번역이 필요한 파일 목록을 반환합니다.
+        직전 폴링과 시그니처가 같고(쓰기 완료), 마지막 처리 이후 변경된 파일만 포함됩니다.
+        """
+        ready: List[Path] = []
+        current: Dict[Path, FileSignature] = {}
+        for file_path in self._collect_files():
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            current[file_path] = signature
+            settled = self._observed.get(file_path) == signature
+            if settled and self._processed.get(file_path) != signature:
+                ready.append(file_path)
+        for removed in set(self._processed) - set(current):
+            logger.info(f"👀 감시 대상 파일이 사라졌습니다: {removed}")
+            del self._processed[removed]
+        self._observed = current
+        return ready
+
+    async def process(self, files: List[Path]) -> List[Any]:
+        """변경된 파일을 작업 큐로 번역하고 처리한 시그니처를 기록합니다."""
+        signatures = {f: self._observed[f] for f in files}
+        file_pairs = [(f, self.output_path_for(f)) for f in files]
+        names = ", ".join(f.name for f in files)
+        logger.info(f"👀 변경 감지: {len(files)}개 파일 ({names})")
+        if self.status_callback:
+            self.status_callback(f"변경 감지: {names}")
+
+        jobs = await self.app_service.start_batch_translation_async(
+            file_pairs,
+            progress_callback=self.progress_callback,
+            status_callback=self.status_callback
+        )
+        for job in jobs:
+            # 실패한 파일도 같은 내용으로 반복 호출하지 않도록 기록 (다음 변경 시 다시 시도)
+            self._processed[job.input_file_path] = signatures[job.input_file_path]
+            if job.status == "completed":
+                logger.info(f"👀 갱신 완료: {job.input_file_path.name} → {job.output_file_path}")
+            else:
+                logger.warning(f"👀 갱신 실패: {job.input_file_path.name} ({job.status}) {job.error_message or ''}")
+        return jobs
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None, max_cycles: Optional[int] = None) -> None:
+        """
+        stop_event가 설정되거나 max_cycles만큼 폴링할 때까지 감시합니다.
+        취소(CancelledError)는 그대로 전파됩니다.
+        """
+        targets = ", ".join(str(p) for p in self.watch_paths)
+        logger.info(f"👀 감시 모드 시작: {targets} (확인 주기: {self.poll_interval}초)")
+        if self.status_callback:
+            self.status_callback(f"감시 중: {targets}")
+
+        while stop_event is None or not stop_event.is_set():
+            ready = self.scan()
+            if ready:
+                try:
+                    await self.process(ready)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"👀 감시 모드 번역 중 오류 (계속 감시): {e}", exc_info=True)
+                    for f in ready:
+                        self._processed[f] = self._observed.get(f, (0, 0))
+            self.cycles += 1
+            if max_cycles is not None and self.cycles >= max_cycles:
+                break
+            if stop_event is not None:
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(self.poll_interval)
+
+        logger.info("👀 감시 모드 종료")
@@ -119,9 +119,38 @@ class ConfigManager:
             "max_content_safety_split_attempts": 5,
             "min_content_safety_chunk_size": 100,
             "content_safety_split_by_sentences": True,
+            # 차단 시 이진 탐색으로 최소 차단 구간(문장)만 격리 (False면 기존 재귀 분할)
+            "content_safety_isolation": True,
+            # 텍스트 번역을 스트리밍으로 받으며 반복 루프/예상 길이 초과/안전 차단이 보이면 즉시 중단하고 분할 재시도
+            "stream_early_abort_enabled": True,
+            # 스트리밍 출력이 원문 길이의 이 배수를 넘으면 중단 (짧은 원문은 2000자까지 허용)
+            "stream_abort_max_length_ratio": 4.0,
+            # 무결성/EPUB 모드: 빈 줄·구분선·숫자/구두점만 있는 단위는 API로 보내지 않고 원문 유지
+            "integrity_skip_non_translatable": True,
+            # 무결성/EPUB 모드 전송 형식: "json"(id/text 객체 배열) 또는 "compact"(⟦n⟧ 줄 표식, 토큰 절약)
+            "integrity_wire_format": "json",
             "max_workers": 1,
             "chunk_size": 10000,
             "enable_post_processing": True,
+            # 청크 수가 이 값 이상이면 후처리를 프로세스 풀에서 병렬 실행 (0이면 사용 안 함)
+            "post_processing_parallel_min_chunks": 2000,
+            "post_processing_workers": None,  # None이면 CPU 코어 수
+            # 대기 중인 청크 중 인덱스가 작은 청크부터 실행 (스트리밍 출력의 앞부분이 빨리 채워지도록)
+            "prioritize_low_index_chunks": True,
+            # 번역 직후 품질 검사: 누락/환각 의심 청크를 같은 작업 안에서 낮은 우선순위로 강제 분할 재번역
+            "inline_quality_gate_enabled": True,
+            "inline_quality_retry_budget": 10,  # 작업(파일)당 자동 재번역 최대 청크 수 (0이면 재번역 안 함)
+            # 번역 전 원문 필터 (광고/사이트 홍보 줄을 번역 요청에서 제외, 표준 모드 전용)
+            "source_filter_enabled": False,
+            "source_filter_mode": "remove",  # "remove" 또는 "mask" (마스크 토큰으로 보내고 번역 후 원래 줄 복원)
+            "source_filter_custom_patterns": [],  # 추가 정규식 (줄 단위 검사)
+            "source_filter_disabled_rules": [],  # 끌 기본 규칙 이름 (예: "url_only_line")
+            "source_filter_max_line_length": 200,  # 이 길이를 넘는 줄은 본문으로 보고 검사하지 않음
+
+            # 다중 파일 작업 큐 설정 (여러 파일의 청크가 하나의 동시성/RPM 제한을 공유)
+            "max_concurrent_files": 2,
+            # 감시 모드(--watch) 입력 파일 확인 주기 (초)
+            "watch_poll_interval": 5.0,
 
             # 경량화된 용어집 관련 기본 설정
             "glossary_json_path": None, # 용어집 파일 경로
@@ -177,6 +206,20 @@ class ConfigManager:
 
             # API 설정
             "api_timeout": 1000.0, # API 호출 타임아웃 (초)
+            # 관측된 응답 시간 분포(모델 × 입력 크기별 p99 × 배수)로 요청별 데드라인 설정, 상한은 api_timeout
+            "adaptive_timeout_enabled": True,
+            "adaptive_timeout_factor": 3.0,
+            "adaptive_timeout_min_seconds": 60.0,
+            # 청크 하나(재시도·콘텐츠 안전 분할 포함)에 쓸 전체 시간 예산 (초, 0이면 무제한)
+            "chunk_time_budget_seconds": 1800.0,
+            # 다중 API 키: 응답이 관측 분포의 이 분위를 넘기면 다른 키로 같은 요청을 한 번 더 보내고 먼저 온 결과 채택
+            "hedged_requests_enabled": False,
+            "hedge_latency_quantile": 0.95,
+            # 헤지 요청 한도 (전체 요청 대비 비율, RPM 한도에도 포함)
+            "hedge_budget_ratio": 0.05,
+            # API 키별 서킷 브레이커 상태/일일 요청 수 저장 파일 (실행 간 유지, 빈 값이면 메모리에서만 관리)
+            # 상대 경로는 설정 파일이 있는 폴더 기준
+            "key_health_store_path": "key_health.json",
         }
 
     def load_config(self, use_default_if_missing: bool = True) -> Dict[str, Any]:
@@ -247,6 +290,21 @@ class ConfigManager:
             else:
                 raise
 
+    def resolve_relative_path(self, path_value: Union[str, Path]) -> Path:
+        """
+        설정에 적힌 경로를 해석합니다. 상대 경로는 현재 작업 폴더가 아니라 설정 파일이 있는 폴더 기준입니다.
+
+        Args:
+            path_value (Union[str, Path]): 설정 값에 적힌 경로.
+
+        Returns:
+            Path: 해석된 경로.
+        """
+        path = Path(path_value).expanduser()
+        if path.is_absolute():
+            return path
+        return self.config_file_path.resolve().parent / path
+
     def save_config(self, config_data: Dict[str, Any]) -> bool:
         """
         주어진 설정 데이터를 JSON 파일 (config.json)에 저장합니다.
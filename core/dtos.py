@@ -41,6 +41,23 @@ class TranslationJobProgressDTO:
     current_chunk_processing: Optional[int] = None # 수정: 필드 추가
     last_error_message: Optional[str] = None 
 
+@dataclass
+class BatchTranslationProgressDTO:
+    """
+    다중 파일 작업 큐 전체의 진행 상황을 나타내는 DTO입니다.
+    청크 수치는 큐에 포함된 모든 파일의 합계입니다.
+    """
+    total_files: int
+    completed_files: int
+    failed_files: int
+    active_files: int
+    total_chunks: int
+    processed_chunks: int
+    successful_chunks: int
+    failed_chunks: int
+    current_status_message: str
+    current_file: Optional[str] = None
+
 
 # --- 고유명사 추출 작업 상태 DTO ---
 # LorebookExtractionProgressDTO로 대체됨
@@ -53,6 +53,12 @@ class BtgTranslationException(BtgBusinessLogicException):
     """번역 로직 수행 중 발생하는 특정 오류에 대한 예외입니다."""
     pass
 
+class BtgGenerationAbortedException(BtgTranslationException):
+    """스트리밍 번역 출력이 반복 루프/예상 길이 초과로 판정되어 생성을 조기 중단한 경우의 예외입니다 (분할 재시도 대상)."""
+    def __init__(self, message: str, reason: str, original_exception: Exception = None):
+        super().__init__(message, original_exception)
+        self.reason = reason
+
 class BtgChunkingException(BtgBusinessLogicException):
     """텍스트 청킹(분할) 로직 중 발생하는 오류에 대한 예외입니다."""
     pass
@@ -0,0 +1,211 @@
+# content_safety_isolator.py
+"""
+콘텐츠 안전 차단 구간 최소 격리 (델타 디버깅 방식 이진 탐색)
+
+기존 재귀 분할은 차단된 청크를 여러 조각으로 나눠 모두 다시 번역하고, 실패한 조각을 다시 팬아웃합니다.
+이 격리기는 차단된 구간을 반으로 나눠 각 절반을 번역해 보고, 차단된 절반만 다시 나눕니다.
+10,000자 청크에 차단 문장이 하나면 추가 호출은 단계마다 2회, 총 O(log n)회입니다.
+
+- 성공한 하위 구간 번역은 SpanTranslationCache(콘텐츠 해시 키)에 남아
+  검토 탭에서 같은 청크를 다시 번역할 때 재사용됩니다.
+- 더 나눌 수 없는 최소 차단 구간(한 문장)은 BlockedSpan으로 보고되고,
+  출력에는 원문과 함께 수동 번역 필요 표시가 남습니다.
+  collect_blocked_spans() 블록 안에서 격리하면 그 블록이 차단 구간을 받아
+  청크 메타데이터("blocked_spans")에 기록할 수 있습니다 (동시에 번역 중인 청크끼리 섞이지 않음).
+"""
+import asyncio
+import contextvars
+import hashlib
+import json
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+try:
+    from infrastructure.logger_config import setup_logger
+    from utils.sentence_segmenter import find_balanced_cut
+except ImportError:
+    from infrastructure.logging.logger_config import setup_logger # type: ignore
+    from utils.sentence_segmenter import find_balanced_cut # type: ignore
+
+logger = setup_logger(__name__)
+
+BLOCKED_SPAN_MARKER = "[콘텐츠 안전 차단 - 수동 번역 필요: {text}]"
+DEFAULT_SPAN_CACHE_ENTRIES = 2000
+
+
+# collect_blocked_spans() 블록의 수집 목록 (contextvar라 블록 안에서 만든 Task에도 전달됨)
+_blocked_span_sink: contextvars.ContextVar[Optional[List["BlockedSpan"]]] = contextvars.ContextVar(
+    "btg_blocked_span_sink", default=None
+)
+
+
+def is_content_safety_error(error: Exception) -> bool:
+    """TranslationService가 콘텐츠 안전 차단을 알리는 예외인지 확인합니다."""
+    return "콘텐츠 안전 문제" in str(error)
+
+
+def find_bisect_offset(text: str) -> Optional[int]:
+    """
+    text를 두 구간으로 나눌 위치를 반환합니다 (나눌 수 없으면 None).
+    문장 분할기 구간 경계 중 줄바꿈 경계를 우선 사용하고, 한 줄이면 문장 경계를 사용하며,
+    중앙에 가장 가까운 위치를 고릅니다 (utils.sentence_segmenter.find_balanced_cut).
+    """
+    return find_balanced_cut(text)
+
+
+@dataclass
+class BlockedSpan:
+    """더 나눌 수 없는 콘텐츠 안전 차단 구간 (start/end는 격리를 시작한 청크 기준 오프셋)"""
+    start: int
+    end: int
+    text: str
+
+    def to_metadata(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@contextmanager
+def collect_blocked_spans() -> Iterator[List[BlockedSpan]]:
+    """블록 안에서 격리된 최소 차단 구간을 모으는 목록을 돌려줍니다 (청크 하나의 번역을 감쌀 때 사용)."""
+    spans: List[BlockedSpan] = []
+    token = _blocked_span_sink.set(spans)
+    try:
+        yield spans
+    finally:
+        _blocked_span_sink.reset(token)
+
+
+@dataclass
+class IsolationReport:
+    """한 번의 격리 작업 결과"""
+    blocked_spans: List[BlockedSpan] = field(default_factory=list)
+    api_calls: int = 0
+    cache_hits: int = 0
+
+
+class SpanTranslationCache:
+    """
+    성공한 하위 구간 번역 캐시 (LRU)
+
+    키는 원문 콘텐츠 해시 + 번역 결과에 영향을 주는 설정(모델, 목표 언어, 용어집, 프롬프트)의 해시입니다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SPAN_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def context_key(config: Dict[str, Any]) -> str:
+        context = {
+            "model_name": config.get("model_name"),
+            "target_language": config.get("target_translation_language"),
+            "glossary_json_path": config.get("glossary_json_path"),
+            "prompts": config.get("prompts"),
+            "prefill_system_instruction": config.get("prefill_system_instruction")
+                if config.get("enable_prefill_translation") else None,
+        }
+        return hashlib.sha1(json.dumps(context, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _key(context: str, text: str) -> str:
+        return hashlib.sha1(f"{context}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, context: str, text: str) -> Optional[str]:
+        key = self._key(context, text)
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, context: str, text: str, translated: str) -> None:
+        key = self._key(context, text)
+        self._entries[key] = translated
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ContentSafetyIsolator:
+    """
+    차단된 텍스트에서 최소 차단 구간을 이진 탐색으로 격리하며 나머지를 번역합니다.
+
+    Args:
+        translate_func: 구간 하나를 번역하는 코루틴 (차단 시 예외 발생)
+        cache: 성공한 구간 번역 캐시
+        cache_context: SpanTranslationCache.context_key() 값
+        max_parallel: 동시에 요청할 최대 구간 수
+        stop_check: 중단 요청 확인 콜백
+    """
+
+    def __init__(
+        self,
+        translate_func: Callable[[str], Awaitable[str]],
+        cache: SpanTranslationCache,
+        cache_context: str,
+        max_parallel: int = 3,
+        stop_check: Optional[Callable[[], bool]] = None
+    ):
+        self.translate_func = translate_func
+        self.cache = cache
+        self.cache_context = cache_context
+        self.semaphore = asyncio.Semaphore(max(1, max_parallel))
+        self.stop_check = stop_check
+        self.report = IsolationReport()
+
+    async def isolate(self, text: str) -> str:
+        """이미 차단이 확인된 text를 나눠 번역합니다. 최소 차단 구간은 표시 문자열로 대체됩니다."""
+        result = await self._split_and_translate(text, 0)
+        sink = _blocked_span_sink.get()
+        if sink is not None:
+            sink.extend(self.report.blocked_spans)
+        for span in self.report.blocked_spans:
+            logger.warning(f"🛡️ 콘텐츠 안전 차단 구간 격리: [{span.start}:{span.end}] \"{span.text[:80]}\"")
+        logger.info(
+            f"🔍 차단 구간 격리 완료: 차단 {len(self.report.blocked_spans)}개, "
+            f"추가 API 호출 {self.report.api_calls}회, 캐시 재사용 {self.report.cache_hits}회"
+        )
+        return result
+
+    async def _split_and_translate(self, text: str, offset: int) -> str:
+        split_at = find_bisect_offset(text)
+        if split_at is None:
+            stripped = text.strip()
+            start = offset + (len(text) - len(text.lstrip()))
+            self.report.blocked_spans.append(BlockedSpan(start=start, end=start + len(stripped), text=stripped))
+            return BLOCKED_SPAN_MARKER.format(text=stripped)
+
+        left, right = text[:split_at], text[split_at:]
+        left_result, right_result = await asyncio.gather(
+            self._resolve(left, offset),
+            self._resolve(right, offset + split_at)
+        )
+        separator = left[len(left.rstrip()):] or " "
+        return left_result.rstrip() + separator + right_result.lstrip()
+
+    async def _resolve(self, text: str, offset: int) -> str:
+        """캐시 → 번역 → (차단 시) 다시 나누기"""
+        cached = self.cache.get(self.cache_context, text)
+        if cached is not None:
+            self.report.cache_hits += 1
+            return cached
+
+        async with self.semaphore:
+            if self.stop_check and self.stop_check():
+                raise asyncio.CancelledError("차단 구간 격리 중단 요청됨")
+            self.report.api_calls += 1
+            try:
+                translated = await self.translate_func(text)
+            except Exception as e:
+                if not is_content_safety_error(e):
+                    raise
+                translated = None
+
+        if translated is None:
+            return await self._split_and_translate(text, offset)
+        self.cache.put(self.cache_context, text, translated)
+        return translated
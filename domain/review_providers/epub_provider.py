@@ -2,19 +2,25 @@ import json
 import zipfile
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
 
-from core.dtos import TranslationUnit, EpubChapter, NodeType
-from infrastructure.file_handler import load_metadata
+from core.dtos import TranslationUnit
+from infrastructure.file_handler import load_metadata, read_json_file, write_json_file
 from domain.review_providers.base_provider import BaseReviewProvider
 from utils.epub_processor import EpubProcessor
+from utils.epub_assembler import EpubAssembler, Replacement, ZipEntryRef
 
 logger = logging.getLogger("epub_provider")
 
+# 검토 탭 EPUB 파싱 캐시 형식 버전 (노드 분할 규칙이 바뀌면 올림)
+EPUB_PARSE_CACHE_VERSION = 1
+
 class EpubReviewProvider(BaseReviewProvider):
     def __init__(self, app_service):
         super().__init__(app_service)
         self.processor = EpubProcessor()
+        # 같은 세션에서 반복되는 파싱 결과 (디스크 캐시 키 → (청크, 파일명))
+        self._parse_memo: Dict[str, Tuple[List[List[TranslationUnit]], List[str]]] = {}
 
     def load_metadata(self, file_path: str) -> Dict[str, Any]:
         meta = load_metadata(file_path)
@@ -24,28 +30,50 @@ class EpubReviewProvider(BaseReviewProvider):
             meta["translated_chunks"] = {str(i): {"status": "success"} for i in range(len(chunks))}
         return meta
 
-    def _get_all_epub_chunks(self, file_path: str) -> Tuple[List[List[TranslationUnit]], List[str]]:
+    def _temp_dir(self, file_path: str) -> Path:
+        p = Path(file_path)
+        return p.parent / f"{p.stem}_epub_temp"
+
+    def _get_all_epub_chunks(self, file_path: str, cache_dir: Optional[Path] = None) -> Tuple[List[List[TranslationUnit]], List[str]]:
         """
         EPUB의 모든 챕터를 순회하여 전역 청크 리스트와 각 청크가 속한 파일명을 반환합니다.
+
+        결과는 EPUB 경로/수정 시각/크기/청크 설정을 키로 cache_dir(기본: 해당 EPUB의 _epub_temp)에 저장되어,
+        검토 탭이 메타데이터/원문/번역문/최종 파일 생성에서 같은 책을 다시 열 때 ZIP 해제와 파싱을 건너뜁니다.
         """
-        chunks_all = []
-        chunk_files = []
-        
+        if not Path(file_path).exists():
+            return [], []
+
         max_chunk_size = self.app_service.config.get("chunk_size", 6000)
         max_items = self.app_service.config.get("integrity_max_items", 200)
+        stat = Path(file_path).stat()
+        cache_key = {
+            "version": EPUB_PARSE_CACHE_VERSION,
+            "path": str(Path(file_path).resolve()),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "chunk_size": max_chunk_size,
+            "max_items": max_items,
+        }
+        memo_key = json.dumps(cache_key, sort_keys=True)
+        if memo_key in self._parse_memo:
+            return self._parse_memo[memo_key]
 
-        if not Path(file_path).exists():
-            return [], []
+        cache_path = (cache_dir or self._temp_dir(file_path)) / f"parse_cache_{Path(file_path).stem}.json"
+        cached = self._read_parse_cache(cache_path, cache_key)
+        if cached is not None:
+            self._parse_memo[memo_key] = cached
+            return cached
 
+        chunks_all = []
+        chunk_files = []
         try:
             with zipfile.ZipFile(file_path, 'r') as zin:
                 for item in zin.infolist():
                     if item.filename.lower().endswith(('.xhtml', '.html', '.htm')):
                         content = zin.read(item.filename)
-                        chapter = self.processor.process_chapter(content, item.filename)
-                        translatable_nodes = [n for n in chapter.nodes if n.type == NodeType.TEXT]
-                        if translatable_nodes:
-                            units = [TranslationUnit(id=n.id, text=n.content or "") for n in translatable_nodes]
+                        units = self.processor.parse_chapter(content, item.filename).translation_units()
+                        if units:
                             chunks = self.chunk_service.split_nodes_into_chunks(units, max_chunk_size, max_items)
                             for c in chunks:
                                 chunks_all.append(c)
@@ -56,8 +84,40 @@ class EpubReviewProvider(BaseReviewProvider):
         except Exception as e:
             logger.error(f"EPUB 파일 읽기 중 예기치 못한 오류 발생 ({file_path}): {e}")
             return [], []
-                            
-        return chunks_all, chunk_files
+
+        result = (chunks_all, chunk_files)
+        self._parse_memo[memo_key] = result
+        self._write_parse_cache(cache_path, cache_key, chunks_all, chunk_files)
+        return result
+
+    def _read_parse_cache(self, cache_path: Path, cache_key: Dict[str, Any]) -> Optional[Tuple[List[List[TranslationUnit]], List[str]]]:
+        if not cache_path.exists():
+            return None
+        try:
+            data = read_json_file(cache_path)
+            if data.get("key") != cache_key:
+                return None
+            chunks = [[TranslationUnit(id=unit_id, text=text) for unit_id, text in entry["units"]] for entry in data["chunks"]]
+            files = [entry["file"] for entry in data["chunks"]]
+            logger.debug(f"EPUB 파싱 캐시 사용: {cache_path.name} ({len(chunks)}개 청크)")
+            return chunks, files
+        except Exception as e:
+            logger.debug(f"EPUB 파싱 캐시 읽기 실패, 다시 파싱합니다 ({cache_path}): {e}")
+            return None
+
+    def _write_parse_cache(self, cache_path: Path, cache_key: Dict[str, Any],
+                           chunks: List[List[TranslationUnit]], chunk_files: List[str]) -> None:
+        data = {
+            "key": cache_key,
+            "chunks": [
+                {"file": file_name, "units": [[u.id, u.text] for u in chunk]}
+                for chunk, file_name in zip(chunks, chunk_files)
+            ],
+        }
+        try:
+            write_json_file(cache_path, data, indent=None)
+        except Exception as e:
+            logger.warning(f"EPUB 파싱 캐시 저장 실패 (무시됨): {e}")
 
     def load_source_chunks(self, file_path: str) -> Dict[int, str]:
         chunks, _ = self._get_all_epub_chunks(file_path)
@@ -75,7 +135,7 @@ class EpubReviewProvider(BaseReviewProvider):
         
         # 원본 및 번역본 구조 로드
         chunks_src, _ = self._get_all_epub_chunks(file_path)
-        chunks_trans, _ = self._get_all_epub_chunks(str(translated_path))
+        chunks_trans, _ = self._get_all_epub_chunks(str(translated_path), cache_dir=self._temp_dir(file_path))
         
         # 원본 구조와 번역본 구조 매핑
         for i in range(min(len(chunks_src), len(chunks_trans))):
@@ -155,6 +215,32 @@ class EpubReviewProvider(BaseReviewProvider):
         with open(buffer_path, 'w', encoding='utf-8') as f:
             json.dump(edited, f, ensure_ascii=False)
 
+    def _unchanged_chapter_files(
+        self,
+        file_path: str,
+        translated_path: Path,
+        chunks_src: List[List[TranslationUnit]],
+        files_src: List[str],
+        current_all_chunks: Dict[int, str]
+    ) -> Set[str]:
+        """현재 청크 텍스트가 번역본 EPUB의 청크와 모두 같은 챕터 파일 (번역본에서 그대로 복사 가능)"""
+        if not translated_path.exists():
+            return set()
+        chunks_trans, files_trans = self._get_all_epub_chunks(str(translated_path), cache_dir=self._temp_dir(file_path))
+        if files_trans != files_src:
+            return set()
+
+        unchanged = set(files_src)
+        for i, file_name in enumerate(files_src):
+            current = current_all_chunks.get(i)
+            if current is None or current != "\n".join(u.text for u in chunks_trans[i]):
+                unchanged.discard(file_name)
+        try:
+            with zipfile.ZipFile(translated_path, 'r') as ztrans:
+                return unchanged & set(ztrans.namelist())
+        except zipfile.BadZipFile:
+            return set()
+
     def generate_final_file(self, file_path: str, current_all_chunks: Dict[int, str]) -> str:
         p = Path(file_path)
         final_path = p.parent / f"{p.stem}_edited{p.suffix}"
@@ -174,40 +260,39 @@ class EpubReviewProvider(BaseReviewProvider):
                         node_translation_map[unit.id] = trans_lines[j]
                     else:
                         node_translation_map[unit.id] = unit.text # fallback
-                        
-        # 원본 EPUB을 열어 재조립
+
+        # 번역본 EPUB과 청크 텍스트가 모두 같은 챕터는 번역본에서 그대로 복사 (수정된 챕터만 다시 파싱/재조립)
+        translated_path = p.parent / f"{p.stem}_translated{p.suffix}"
+        reusable_files = self._unchanged_chapter_files(file_path, translated_path, chunks_src, files_src, current_all_chunks)
+        if reusable_files:
+            logger.info(f"최종 EPUB 생성: 변경 없는 챕터 {len(reusable_files)}개는 번역본에서 복사합니다.")
+
+        # 원본에서 달라지는 항목만 모아 조립기에 넘김 (나머지는 압축된 그대로 복사)
+        replacements: Dict[str, Replacement] = {
+            name: ZipEntryRef(translated_path, name) for name in reusable_files
+        }
         with zipfile.ZipFile(file_path, 'r') as zin:
-            with zipfile.ZipFile(final_path, 'w') as zout:
-                if 'mimetype' in zin.namelist():
-                    zout.writestr('mimetype', zin.read('mimetype'), compress_type=zipfile.ZIP_STORED)
-                
-                for item in zin.infolist():
-                    if item.filename == 'mimetype':
-                        continue
-                        
-                    content = zin.read(item.filename)
-                    if item.filename.lower().endswith(('.xhtml', '.html', '.htm')):
-                        chapter = self.processor.process_chapter(content, item.filename)
-                        
-                        # 텍스트 노드가 하나라도 있으면 재조립 수행
-                        translatable_nodes = [n for n in chapter.nodes if n.type == NodeType.TEXT]
-                        if translatable_nodes:
-                            html = self.processor.reconstruct_chapter(chapter, node_translation_map)
-                            zout.writestr(item.filename, html.encode('utf-8'), compress_type=zipfile.ZIP_DEFLATED)
-                        else:
-                            zout.writestr(item.filename, content, compress_type=zipfile.ZIP_DEFLATED)
-                    else:
-                        if item.filename.lower().endswith('.opf'):
-                            try:
-                                import re
-                                opf_text = content.decode('utf-8')
-                                opf_text = re.sub(r'page-progression-direction\s*=\s*["\']rtl["\']', 'page-progression-direction="ltr"', opf_text, flags=re.IGNORECASE)
-                                zout.writestr(item, opf_text.encode('utf-8'), compress_type=zipfile.ZIP_DEFLATED)
-                            except Exception as e_opf:
-                                logger.error(f"OPF 방향 수정 중 오류: {e_opf}")
-                                zout.writestr(item, content, compress_type=zipfile.ZIP_DEFLATED)
-                        else:
-                            zout.writestr(item, content, compress_type=zipfile.ZIP_DEFLATED)
+            for item in zin.infolist():
+                if item.filename == 'mimetype' or item.filename in reusable_files:
+                    continue
+
+                lower_name = item.filename.lower()
+                if lower_name.endswith(('.xhtml', '.html', '.htm')):
+                    arena = self.processor.parse_chapter(zin.read(item.filename), item.filename)
+                    
+                    # 텍스트 노드가 하나라도 있으면 재조립 수행
+                    if arena.text_indices():
+                        replacements[item.filename] = self.processor.reconstruct_arena(arena, node_translation_map)
+                elif lower_name.endswith('.opf'):
+                    try:
+                        import re
+                        content = zin.read(item.filename)
+                        opf_text = re.sub(r'page-progression-direction\s*=\s*["\']rtl["\']', 'page-progression-direction="ltr"', content.decode('utf-8'), flags=re.IGNORECASE)
+                        replacements[item.filename] = opf_text.encode('utf-8')
+                    except Exception as e_opf:
+                        logger.error(f"OPF 방향 수정 중 오류: {e_opf}")
+
+        EpubAssembler(file_path).assemble(final_path, replacements)
                         
         # 병합 성공 시 버퍼 삭제
         buffer_path = p.parent / f"{p.stem}_epub_temp" / "edited_chunks.json"
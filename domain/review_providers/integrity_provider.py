@@ -1,10 +1,11 @@
 import json
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 from core.dtos import TranslationUnit
 from infrastructure.file_handler import load_metadata, read_text_file
 from domain.review_providers.base_provider import BaseReviewProvider
+from utils.line_store import LineStore, load_line_store
 
 class IntegrityReviewProvider(BaseReviewProvider):
     def _resolve_paths(self, file_path: str) -> tuple[Path, Path, Path]:
@@ -23,13 +24,12 @@ class IntegrityReviewProvider(BaseReviewProvider):
     def load_metadata(self, file_path: str) -> Dict[str, Any]:
         return load_metadata(file_path)
 
-    def _get_chunked_units(self, file_path: str) -> List[List[TranslationUnit]]:
-        content = read_text_file(file_path)
-        if not content:
-            return []
-        lines = content.splitlines()
-        units = [TranslationUnit(id=str(i), text=line) for i, line in enumerate(lines)]
-        
+    def _get_chunked_lines(self, file_path: str) -> Tuple[LineStore, List[Tuple[int, int]]]:
+        """원문 줄 저장소와 청크별 (시작 줄, 끝 줄) 범위. 줄 번호가 곧 무결성 단위 id입니다."""
+        store = load_line_store(file_path)
+        if not store.text:
+            return store, []
+
         config = getattr(self.app_service, "config", {}) or {}
         max_chunk_size = config.get("chunk_size", 6000) if isinstance(config, dict) else 6000
         max_items = config.get("integrity_max_items", 200) if isinstance(config, dict) else 200
@@ -38,28 +38,28 @@ class IntegrityReviewProvider(BaseReviewProvider):
         if not isinstance(max_items, int):
             max_items = 200
 
-        return self.chunk_service.split_nodes_into_chunks(units, max_chunk_size, max_items)
+        return store, store.chunk_ranges(max_chunk_size, max_items)
 
     def load_source_chunks(self, file_path: str) -> Dict[int, str]:
         source_path, _, _ = self._resolve_paths(file_path)
-        chunks = self._get_chunked_units(str(source_path))
-        return {i: "\n".join(u.text for u in chunk) for i, chunk in enumerate(chunks)}
+        store, ranges = self._get_chunked_lines(str(source_path))
+        return {i: "\n".join(store.lines(start, stop)) for i, (start, stop) in enumerate(ranges)}
 
     def load_translated_chunks(self, file_path: str) -> Dict[int, str]:
         source_path, translated_path, temp_dir = self._resolve_paths(file_path)
-        chunks = self._get_chunked_units(str(source_path))
+        _, ranges = self._get_chunked_lines(str(source_path))
         translated_chunks_map = {}
 
         # 📍 Primary: 임시 JSON 디렉터리(chunk_{i}.json)가 존재하는 경우 단위 ID 기반 로딩 (부분 완료 청크도 로드)
         if temp_dir.exists():
-            for i, chunk in enumerate(chunks):
+            for i, (start, stop) in enumerate(ranges):
                 chunk_file = temp_dir / f"chunk_{i}.json"
                 if chunk_file.exists():
                     try:
                         with open(chunk_file, "r", encoding="utf-8") as f:
                             chunk_data = json.load(f)
                         if isinstance(chunk_data, dict):
-                            chunk_lines = [chunk_data.get(u.id, "") for u in chunk]
+                            chunk_lines = [chunk_data.get(str(line_no), "") for line_no in range(start, stop)]
                             translated_chunks_map[i] = "\n".join(chunk_lines)
                     except Exception:
                         pass
@@ -77,12 +77,8 @@ class IntegrityReviewProvider(BaseReviewProvider):
             
         translated_lines = translated_content.splitlines()
         
-        line_idx = 0
-        for i, chunk in enumerate(chunks):
-            chunk_length = len(chunk)
-            chunk_trans_lines = translated_lines[line_idx : line_idx + chunk_length]
-            translated_chunks_map[i] = "\n".join(chunk_trans_lines)
-            line_idx += chunk_length
+        for i, (start, stop) in enumerate(ranges):
+            translated_chunks_map[i] = "\n".join(translated_lines[start:stop])
             
         return translated_chunks_map
 
@@ -123,23 +119,23 @@ class IntegrityReviewProvider(BaseReviewProvider):
 
     def save_translated_chunk(self, file_path: str, chunk_id: int, new_text: str, current_all_chunks: Dict[int, str]) -> None:
         source_path, translated_path, temp_dir = self._resolve_paths(file_path)
-        chunks = self._get_chunked_units(str(source_path))
+        _, ranges = self._get_chunked_lines(str(source_path))
         
         # 1. 임시 JSON 디렉터리 동기화 (chunk_{chunk_id}.json)
-        if chunk_id < len(chunks):
-            target_chunk = chunks[chunk_id]
+        if chunk_id < len(ranges):
+            start, stop = ranges[chunk_id]
             lines = new_text.splitlines()
             chunk_data = {}
-            num_units = len(target_chunk)
+            num_units = stop - start
             if num_units > 0:
                 if len(lines) <= num_units:
-                    for idx, unit in enumerate(target_chunk):
-                        chunk_data[unit.id] = lines[idx] if idx < len(lines) else ""
+                    for idx in range(num_units):
+                        chunk_data[str(start + idx)] = lines[idx] if idx < len(lines) else ""
                 else:
                     # 개행 문자로 인해 라인 수가 더 많은 경우: 마지막 단위에 나머지 개행 라인 보존
                     for idx in range(num_units - 1):
-                        chunk_data[target_chunk[idx].id] = lines[idx]
-                    chunk_data[target_chunk[-1].id] = "\n".join(lines[num_units - 1:])
+                        chunk_data[str(start + idx)] = lines[idx]
+                    chunk_data[str(stop - 1)] = "\n".join(lines[num_units - 1:])
             
             temp_dir.mkdir(parents=True, exist_ok=True)
             chunk_file = temp_dir / f"chunk_{chunk_id}.json"
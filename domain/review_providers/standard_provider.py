@@ -1,8 +1,10 @@
 from pathlib import Path
 from typing import Dict, Any
 
-from infrastructure.file_handler import load_metadata, load_chunks_from_file, read_text_file, save_merged_chunks_to_file, write_text_file
+from infrastructure.file_handler import load_metadata, load_chunks_from_file, read_text_file, save_merged_chunks_to_file
 from domain.review_providers.base_provider import BaseReviewProvider
+from utils.output_assembler import OutputAssembler
+from utils.source_filter import filter_source_for_metadata
 
 class StandardReviewProvider(BaseReviewProvider):
     def load_metadata(self, file_path: str) -> Dict[str, Any]:
@@ -13,7 +15,12 @@ class StandardReviewProvider(BaseReviewProvider):
         if not content:
             return {}
         chunk_size = self.app_service.config.get("chunk_size", 6000)
-        chunks_list = self.chunk_service.create_chunks_from_file_content(content, chunk_size)
+        metadata = load_metadata(file_path)
+        # 번역 전 원문 필터가 적용된 작업은 같은 필터로 청크 기준 원문을 재현
+        content = filter_source_for_metadata(content, metadata).text
+        # 콘텐츠 해시 재사용으로 경계가 달라진 작업은 메타데이터의 청크 경계를 사용
+        chunk_offsets = metadata.get("chunk_offsets")
+        chunks_list = self.chunk_service.create_chunks_from_file_content(content, chunk_size, chunk_offsets=chunk_offsets)
         return {i: chunk for i, chunk in enumerate(chunks_list)}
 
     def load_translated_chunks(self, file_path: str) -> Dict[int, str]:
@@ -45,17 +52,13 @@ class StandardReviewProvider(BaseReviewProvider):
         # 1. Update the chunked file just in case
         save_merged_chunks_to_file(chunked_path, current_all_chunks)
         
-        # 2. Generate final text
-        enable_post_processing = self.app_service.config.get("enable_post_processing", True)
-        if enable_post_processing:
-            final_content = self.app_service.post_processing_service.post_process_and_clean_chunks(
-                current_all_chunks, self.app_service.config
-            )
-        else:
-            sorted_indices = sorted(current_all_chunks.keys())
-            final_content = "\n\n".join([current_all_chunks[i] for i in sorted_indices])
-            
-        # 3. Write to final file
-        write_text_file(final_output_path, final_content)
+        # 2. Generate final text and write to final file
+        # 번역 작업의 최종 출력과 같은 조립기로 청크를 정리하는 즉시 조각 단위로 기록
+        # (병합된 전체 텍스트를 메모리에 만들지 않음, 청크가 많으면 후처리는 프로세스 풀에서 실행)
+        OutputAssembler(
+            final_output_path,
+            post_processing_service=self.app_service.post_processing_service,
+            config=self.app_service.config,
+        ).assemble(current_all_chunks)
         
         return str(final_output_path)
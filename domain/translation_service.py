@@ -5,7 +5,7 @@ import re
 import csv
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union, Callable
+from typing import Dict, Any, Optional, List, Union, Callable, Iterable, Awaitable
 import os
 import copy # Moved here
 
@@ -16,12 +16,18 @@ try:
         GeminiRateLimitException,
         GeminiApiException,
         GeminiInvalidRequestException,
-        GeminiAllApiKeysExhaustedException 
+        GeminiAllApiKeysExhaustedException,
+        GeminiStreamAbortedException
     )
-    from infrastructure.file_handler import read_json_file
+    from infrastructure.file_handler import read_json_file, iter_text_file_lines
     from infrastructure.logger_config import setup_logger
-    from core.exceptions import BtgTranslationException, BtgApiClientException
-    from utils.chunk_service import ChunkService
+    from core.exceptions import BtgTranslationException, BtgApiClientException, BtgGenerationAbortedException
+    from utils.chunk_service import ChunkService, partition_translatable_units
+    from utils.line_store import LineStore, iter_chunk_ranges, iter_line_chunks
+    from utils.integrity_wire_format import (
+        WIRE_FORMAT_COMPACT, COMPACT_FORMAT_INSTRUCTION, COMPACT_PROMPT_SUFFIX,
+        encode_compact_units, parse_compact_response, salvage_json_objects
+    )
     from utils.lang_utils import normalize_language_code # Added
     from google.genai import types as genai_types
     from core.dtos import (
@@ -33,7 +39,10 @@ try:
         NodeType,
         TranslationJobProgressDTO
     )
-    from utils.epub_processor import EpubProcessor
+    from utils.epub_processor import EpubProcessor, EpubDedupReport, TextNodeIndex
+    from utils.epub_assembler import EpubAssembler
+    from utils.output_validation import StreamingOutputGuard
+    from domain.content_safety_isolator import ContentSafetyIsolator, SpanTranslationCache
 except ImportError:
     from infrastructure.gemini_client import (  # type: ignore
         GeminiClient,
@@ -41,18 +50,36 @@ except ImportError:
         GeminiRateLimitException,
         GeminiApiException,
         GeminiInvalidRequestException,
-        GeminiAllApiKeysExhaustedException 
+        GeminiAllApiKeysExhaustedException,
+        GeminiStreamAbortedException
     )
-    from infrastructure.file_handler import read_json_file  # type: ignore
+    from infrastructure.file_handler import read_json_file, iter_text_file_lines  # type: ignore
     from infrastructure.logger_config import setup_logger  # type: ignore
-    from core.exceptions import BtgTranslationException, BtgApiClientException  # type: ignore
-    from utils.chunk_service import ChunkService  # type: ignore
+    from core.exceptions import BtgTranslationException, BtgApiClientException, BtgGenerationAbortedException  # type: ignore
+    from utils.chunk_service import ChunkService, partition_translatable_units  # type: ignore
+    from utils.line_store import LineStore, iter_chunk_ranges, iter_line_chunks  # type: ignore
+    from utils.integrity_wire_format import (  # type: ignore
+        WIRE_FORMAT_COMPACT, COMPACT_FORMAT_INSTRUCTION, COMPACT_PROMPT_SUFFIX,
+        encode_compact_units, parse_compact_response, salvage_json_objects
+    )
     from utils.lang_utils import normalize_language_code # type: ignore
     from core.dtos import GlossaryEntryDTO # type: ignore
     from google.genai import types as genai_types # Fallback import
+    from domain.content_safety_isolator import ContentSafetyIsolator, SpanTranslationCache # type: ignore
+    from utils.output_validation import StreamingOutputGuard # type: ignore
 
 logger = setup_logger(__name__)
 
+# 재귀 분할 번역이 일부 구간을 포기했을 때 번역문에 남기는 표시의 접두어 (품질 검사에서 부분 실패로 판정)
+TRANSLATION_FAILURE_MARKER_PREFIX = "[번역 오류로 인한 실패"
+SUB_CHUNK_FAILURE_MARKER_PREFIX = "[서브 청크 "
+UNSPLITTABLE_FAILURE_MARKER_PREFIX = "[분할 불가능한 오류 발생 콘텐츠"
+PARTIAL_FAILURE_MARKER_PREFIXES = (
+    TRANSLATION_FAILURE_MARKER_PREFIX,
+    SUB_CHUNK_FAILURE_MARKER_PREFIX,
+    UNSPLITTABLE_FAILURE_MARKER_PREFIX,
+)
+
 def _format_glossary_for_prompt( # 함수명 변경
     glossary_entries: List[GlossaryEntryDTO], # DTO는 GlossaryEntryDTO (경량화된 버전)
     max_entries: int,
@@ -127,6 +154,10 @@ class TranslationService:
         self.chunk_service = ChunkService()
         self.glossary_entries_for_injection: List[GlossaryEntryDTO] = [] # Renamed and type changed
         self.stop_check_callback: Optional[Callable[[], bool]] = None  # 중단 요청 확인용 콜백
+        # 콘텐츠 안전 재시도에서 성공한 하위 구간 번역 (검토 탭 재번역 시 재사용)
+        self.span_translation_cache = SpanTranslationCache()
+        # 마지막 EPUB 번역의 텍스트 노드 중복 제거 결과 (작업 요약용)
+        self.last_epub_dedup_report: Optional[EpubDedupReport] = None
 
         if self.config.get("enable_dynamic_glossary_injection", False): # Key changed
             self._load_glossary_data() # 함수명 변경
@@ -366,6 +397,9 @@ class TranslationService:
         """
         비동기 텍스트 번역 메서드 (translate_text의 비동기 버전)
         
+        stream_early_abort_enabled(기본 True)면 응답을 스트리밍으로 받으며 StreamingOutputGuard로 검사해,
+        반복 루프나 예상 길이 초과가 보이면 생성을 즉시 중단합니다.
+        
         Args:
             text_chunk: 번역할 텍스트
             stream: 스트리밍 여부
@@ -375,6 +409,7 @@ class TranslationService:
             
         Raises:
             asyncio.CancelledError: 작업이 취소된 경우
+            BtgGenerationAbortedException: 출력 이상으로 스트림을 조기 중단한 경우
             BtgTranslationException: 번역 실패
         """
         if not text_chunk.strip():
@@ -459,6 +494,19 @@ class TranslationService:
                 genai_types.Content(role="user", parts=[genai_types.Part.from_text(text=user_prompt_str)])
             ]
 
+        # 스트림마다 독립된 감시기 (헤지 요청 스트림은 factory로 새로 만듦)
+        stream_guards: List[StreamingOutputGuard] = []
+
+        def new_stream_monitor() -> Callable[[str], Optional[str]]:
+            guard = StreamingOutputGuard(
+                text_chunk, max_length_ratio=self.config.get("stream_abort_max_length_ratio", 4.0)
+            )
+            stream_guards.append(guard)
+            return guard.feed
+
+        early_abort = self.config.get("stream_early_abort_enabled", True)
+        stream_monitor = new_stream_monitor() if early_abort else None
+
         try:
             translated_text_from_api = await self.gemini_client.generate_text_async(
                 prompt=api_prompt_for_gemini_client,
@@ -470,7 +518,9 @@ class TranslationService:
                 },
                 thinking_budget=self.config.get("thinking_budget", None),
                 system_instruction_text=api_system_instruction,
-                stream=stream
+                stream=stream or early_abort,
+                stream_monitor=stream_monitor,
+                stream_monitor_factory=new_stream_monitor if early_abort else None
             )
 
             if translated_text_from_api is None:
@@ -486,6 +536,13 @@ class TranslationService:
             raise
         except GeminiContentSafetyException as e_safety:
             raise BtgTranslationException(f"콘텐츠 안전 문제로 번역할 수 없습니다. ({e_safety})", original_exception=e_safety) from e_safety
+        except GeminiStreamAbortedException as e_abort:
+            detail = next((guard.detail for guard in stream_guards if guard.detail), "")
+            logger.warning(f"✂️ 스트리밍 번역 조기 중단 ({e_abort.reason}): {detail}")
+            raise BtgGenerationAbortedException(
+                f"출력 이상으로 생성을 조기 중단했습니다 ({e_abort.reason}: {detail})",
+                reason=e_abort.reason, original_exception=e_abort
+            ) from e_abort
         except GeminiAllApiKeysExhaustedException as e_keys:
             raise BtgApiClientException(f"모든 API 키를 사용했으나 요청에 실패했습니다. ({e_keys})", original_exception=e_keys) from e_keys
         except GeminiRateLimitException as e_rate:
@@ -516,29 +573,70 @@ class TranslationService:
         """
         try:
             return await self.translate_text_async(text_chunk)
+        except BtgGenerationAbortedException as e:
+            # 반복 루프/길이 초과는 같은 요청을 다시 보내도 되풀이되기 쉬우므로 바로 분할 재시도
+            logger.warning(f"출력 이상으로 중단된 청크를 분할 재시도합니다: {e.reason}")
+            return await self._translate_with_recursive_splitting_async(
+                text_chunk, max_split_attempts, min_chunk_size, current_attempt=1
+            )
         except BtgTranslationException as e:
             if not ("콘텐츠 안전 문제" in str(e)):
                 raise e
             
+            if self.config.get("content_safety_isolation", True):
+                logger.warning(f"콘텐츠 안전 문제 감지. 차단 구간 이진 탐색 격리 시작: {str(e)}")
+                return await self.isolate_content_safety_block_async(text_chunk)
+
             logger.warning(f"콘텐츠 안전 문제 감지. 비동기 청크 분할 재시도 시작: {str(e)}")
             return await self._translate_with_recursive_splitting_async(
                 text_chunk, max_split_attempts, min_chunk_size, current_attempt=1
             )
 
+    async def isolate_content_safety_block_async(self, text_chunk: str) -> str:
+        """
+        차단된 청크에서 최소 차단 구간만 격리하고 나머지를 번역합니다.
+        최소 차단 구간은 호출 측의 collect_blocked_spans() 블록으로 전달됩니다 (청크 메타데이터 기록용).
+        """
+        isolator = ContentSafetyIsolator(
+            self.translate_text_async,
+            self.span_translation_cache,
+            SpanTranslationCache.context_key(self.config),
+            max_parallel=self.config.get("max_workers", 3) if self.config else 3,
+            stop_check=self.stop_check_callback
+        )
+        return await isolator.isolate(text_chunk)
+
+    async def _translate_span_cached(
+        self, text: str, request_gate: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> str:
+        """분할 재시도용 하위 구간 번역 (성공 결과를 콘텐츠 해시로 캐시, 실제 API 호출 전에만 request_gate 대기)"""
+        context = SpanTranslationCache.context_key(self.config)
+        cached = self.span_translation_cache.get(context, text)
+        if cached is not None:
+            return cached
+        if request_gate is not None:
+            await request_gate()
+        translated = await self.translate_text_async(text)
+        self.span_translation_cache.put(context, text, translated)
+        return translated
+
     async def translate_text_force_split_async(
         self, 
         text_chunk: str, 
         max_split_attempts: int = 3,
         min_chunk_size: int = 100,
-        split_level: int = 1
+        split_level: int = 1,
+        request_gate: Optional[Callable[[], Awaitable[None]]] = None
     ) -> str:
         """
         강제 분할 번역: Depth 0(전체) 시도를 생략하고 바로 지정된 레벨의 분할부터 시작합니다.
         주로 누락 의심 청크나 실패 청크의 재번역에 사용됩니다.
+        request_gate가 있으면 서브 청크 API 요청마다 먼저 대기합니다 (예: 공유 RPM 제한기의 wait_for_slot).
         """
         logger.info(f"⚡ 강제 분할 번역 시작 (Level {split_level} 진입): {len(text_chunk)} 글자")
         return await self._translate_with_recursive_splitting_async(
-            text_chunk, max_split_attempts, min_chunk_size, current_attempt=1, split_level=split_level
+            text_chunk, max_split_attempts, min_chunk_size, current_attempt=1, split_level=split_level,
+            request_gate=request_gate
         )
 
     async def _translate_with_recursive_splitting_async(
@@ -547,15 +645,16 @@ class TranslationService:
         max_split_attempts: int,
         min_chunk_size: int,
         current_attempt: int = 1,
-        split_level: int = 1
+        split_level: int = 1,
+        request_gate: Optional[Callable[[], Awaitable[None]]] = None
     ) -> str:
         if current_attempt > max_split_attempts:
             logger.error(f"최대 분할 시도 횟수({max_split_attempts})에 도달. 번역 실패.")
-            return f"[번역 오류로 인한 실패: 최대 분할 시도 초과]"
+            return f"{TRANSLATION_FAILURE_MARKER_PREFIX}: 최대 분할 시도 초과]"
 
         if len(text_chunk.strip()) <= min_chunk_size:
             logger.warning(f"최소 청크 크기에 도달했지만 여전히 오류 발생: {text_chunk[:50]}...")
-            return f"[번역 오류로 인한 실패: {text_chunk[:30]}...]"
+            return f"{TRANSLATION_FAILURE_MARKER_PREFIX}: {text_chunk[:30]}...]"
 
         logger.info(f"📊 청크 분할 시도 #{current_attempt} (깊이: {current_attempt-1})")
         logger.info(f"   📏 원본 크기: {len(text_chunk)} 글자")
@@ -583,7 +682,7 @@ class TranslationService:
         
         if len(sub_chunks) <= 1:
             logger.error("청크 분할 실패. 번역 포기.")
-            return f"[분할 불가능한 오류 발생 콘텐츠: {text_chunk[:30]}...]"
+            return f"{UNSPLITTABLE_FAILURE_MARKER_PREFIX}: {text_chunk[:30]}...]"
         
         logger.info(f"   🔄 {len(sub_chunks)}개 서브 청크를 병렬 처리합니다 (비동기).")
         
@@ -609,7 +708,7 @@ class TranslationService:
                     if self.stop_check_callback and self.stop_check_callback():
                         raise asyncio.CancelledError(f"서브 청크 {idx+1} 번역 중단 요청됨 (API 호출 직전)")
                     
-                    translated = await self.translate_text_async(sub_chunk)
+                    translated = await self._translate_span_cached(sub_chunk, request_gate)
                     logger.info(f"   ✅ 서브 청크 {idx+1}/{len(sub_chunks)} 번역 완료")
                     return (idx, translated)
                     
@@ -617,19 +716,21 @@ class TranslationService:
                     logger.info(f"   🛑 서브 청크 {idx+1} 취소됨")
                     raise
                 except BtgTranslationException as e_sub:
-                    if "콘텐츠 안전 문제" in str(e_sub) and current_attempt < max_split_attempts:
-                        logger.warning(f"   🛡️ 서브 청크 {idx+1} 콘텐츠 안전 오류. 재귀 분할 시도.")
+                    splittable = "콘텐츠 안전 문제" in str(e_sub) or isinstance(e_sub, BtgGenerationAbortedException)
+                    if splittable and current_attempt < max_split_attempts:
+                        logger.warning(f"   🛡️ 서브 청크 {idx+1} 콘텐츠 안전 오류/출력 이상. 재귀 분할 시도.")
                         recursive_result = await self._translate_with_recursive_splitting_async(
-                            sub_chunk, max_split_attempts, min_chunk_size, current_attempt + 1
+                            sub_chunk, max_split_attempts, min_chunk_size, current_attempt + 1,
+                            request_gate=request_gate
                         )
                         return (idx, recursive_result)
                     else:
-                        error_marker = f"[서브 청크 {idx+1} 번역 실패: {str(e_sub)[:50]}]"
+                        error_marker = f"{SUB_CHUNK_FAILURE_MARKER_PREFIX}{idx+1} 번역 실패: {str(e_sub)[:50]}]"
                         logger.error(f"   ❌ 서브 청크 {idx+1} 번역 실패: {str(e_sub)[:100]}")
                         return (idx, error_marker)
                 except Exception as e_general:
                     logger.error(f"   ❌ 서브 청크 {idx+1} 예상치 못한 오류: {e_general}")
-                    return (idx, f"[서브 청크 {idx+1} 번역 오류]")
+                    return (idx, f"{SUB_CHUNK_FAILURE_MARKER_PREFIX}{idx+1} 번역 오류]")
         
         # 작업 생성 (순차적으로 취소 확인하며 생성)
         tasks = []
@@ -685,28 +786,113 @@ class TranslationService:
         Returns:
             번역된 텍스트
         """
-        import json
-        import shutil
-
         if not text.strip():
             logger.debug("translate_text_integrity: 입력 텍스트가 비어 있음.")
             return ""
 
-        # 1. 전처리 (Parsing)
-        lines = text.splitlines()
-        units = []
-        for i, line in enumerate(lines):
-            # 빈 줄도 컨텍스트 보존을 위해 포함 (단, 번역 대상에서는 제외하거나 마킹 가능)
-            units.append(TranslationUnit(id=str(i), text=line))
+        store = LineStore.from_text(text)
+        result_lines: List[str] = []
+        await self._run_integrity_pipeline(
+            store.iter_lines,
+            result_lines.append,
+            output_path_for_progress=output_path_for_progress,
+            progress_callback=progress_callback,
+            status_callback=status_callback,
+            tqdm_file_stream=tqdm_file_stream
+        )
+
+        if output_path_for_progress:
+            with open(output_path_for_progress, "w", encoding="utf-8") as f:
+                f.write("\n".join(result_lines))
+
+        return "\n".join(result_lines)
+
+    async def translate_file_integrity(
+        self,
+        input_path: Union[str, Path],
+        output_path: Union[str, Path],
+        progress_callback: Optional[Callable[[TranslationJobProgressDTO], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+        tqdm_file_stream: Optional[Any] = None
+    ) -> int:
+        """
+        무결성 번역 (스트리밍): 원문 파일을 mmap 기반 줄 스트림으로 읽어 청크를 지연 생성하고,
+        번역된 줄을 출력 파일에 바로 씁니다. 원문/단위 목록/번역 맵 전체를 메모리에 두지 않으므로
+        최대 메모리는 파일 크기가 아니라 처리 중인 청크 크기에 비례합니다.
+
+        출력은 '<출력 파일>.part'에 쓴 뒤 완료 시 교체하므로, 중단되면 기존 출력 파일이 유지됩니다.
+
+        Returns:
+            출력한 줄 수
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        partial_path = output_path.with_name(output_path.name + ".part")
+        written_lines = 0
+
+        try:
+            with open(partial_path, "w", encoding="utf-8") as out:
+                def emit_line(line: str) -> None:
+                    nonlocal written_lines
+                    if written_lines:
+                        out.write("\n")
+                    out.write(line)
+                    written_lines += 1
+
+                has_content = await self._run_integrity_pipeline(
+                    lambda: iter_text_file_lines(input_path),
+                    emit_line,
+                    output_path_for_progress=output_path,
+                    progress_callback=progress_callback,
+                    status_callback=status_callback,
+                    tqdm_file_stream=tqdm_file_stream
+                )
+            if not has_content:
+                logger.debug("translate_file_integrity: 입력 파일이 비어 있음.")
+            os.replace(partial_path, output_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        return written_lines
+
+    async def _run_integrity_pipeline(
+        self,
+        line_source: Callable[[], Iterable[str]],
+        emit_line: Callable[[str], None],
+        output_path_for_progress: Optional[Union[str, Path]] = None,
+        progress_callback: Optional[Callable[[TranslationJobProgressDTO], None]] = None,
+        status_callback: Optional[Callable[[str], None]] = None,
+        tqdm_file_stream: Optional[Any] = None
+    ) -> bool:
+        """
+        무결성 번역 공통 처리. line_source()가 반환하는 줄을 청크로 지연 분할하여 번역하고,
+        각 청크가 끝날 때마다 번역된 줄(번역이 없으면 원문)을 순서대로 emit_line에 넘깁니다.
+
+        줄 번호는 정수로 다루며 TranslationUnit은 API로 보내는 청크에 대해서만 만듭니다.
+        전체 청크 수는 줄 스트림을 한 번 더 읽어 줄 길이만으로 계산합니다.
+        내용이 없는 입력이면 아무 줄도 넘기지 않고 False를 반환합니다.
+        """
+        import json
 
-        # 2. 청크 분할
         max_chunk_size = self.config.get("chunk_size", 6000)
         max_items = self.config.get("integrity_max_items", 200) # 무결성 모드 기본값 200
-        chunks = self.chunk_service.split_nodes_into_chunks(units, max_chunk_size, max_items)
-        total_chunks = len(chunks)
 
-        translated_map: Dict[str, str] = {}
-        
+        # 1. 청크 수 계산 (줄 길이만 사용, 빈 줄도 컨텍스트 보존을 위해 포함)
+        has_content = False
+
+        def line_lengths():
+            nonlocal has_content
+            for line in line_source():
+                if not has_content and line.strip():
+                    has_content = True
+                yield len(line)
+
+        total_chunks = sum(1 for _ in iter_chunk_ranges(line_lengths(), max_chunk_size, max_items))
+        if not has_content:
+            return False
+        logger.info(f"무결성 번역: {total_chunks}개 청크 (최대 {max_chunk_size}자 / {max_items}개 항목)")
+
         temp_dir = None
         translated_chunk_indices = set()
         
@@ -752,7 +938,8 @@ class TranslationService:
                 logger.debug(f"tqdm 초기화 실패: {pbar_e}")
 
         try:
-            for i, chunk in enumerate(chunks):
+            # 2. 청크 분할 (지연 생성)
+            for i, (first_line, chunk_lines) in enumerate(iter_line_chunks(line_source(), max_chunk_size, max_items)):
                 # 📍 중단 체크
                 if self.stop_check_callback and self.stop_check_callback():
                     raise asyncio.CancelledError(f"무결성 번역 중단 요청됨 (청크 {i+1} 시작 전)")
@@ -761,31 +948,35 @@ class TranslationService:
                 if status_callback:
                     status_callback(status_msg)
 
-                logger.info(f"📦 무결성 번역 청크 {i+1}/{total_chunks} 처리 중 (항목: {len(chunk)}개)")
+                logger.info(f"📦 무결성 번역 청크 {i+1}/{total_chunks} 처리 중 (항목: {len(chunk_lines)}개)")
                 
+                chunk_results: Optional[Dict[str, str]] = None
                 if i in translated_chunk_indices and temp_dir:
                     try:
                         chunk_file = temp_dir / f"chunk_{i}.json"
                         with open(chunk_file, 'r', encoding='utf-8') as f:
                             chunk_results = json.load(f)
-                        translated_map.update(chunk_results)
                         logger.info(f"  ⏭️ 이미 번역된 청크 건너뜀")
-                        if progress_callback:
-                            progress_callback(TranslationJobProgressDTO(
-                                total_chunks=total_chunks,
-                                processed_chunks=i + 1,
-                                successful_chunks=len(translated_chunk_indices),
-                                failed_chunks=0,
-                                current_status_message=f"무결성 번역 청크 {i+1}/{total_chunks} 건너뜀",
-                                current_chunk_processing=i + 1
-                            ))
-                        continue
                     except Exception as e:
                         logger.warning(f"  ⚠️ 저장된 청크 읽기 실패, 재번역 시도: {e}")
 
-                # 3. API 요청 및 검증 (재시도 포함)
+                if chunk_results is not None:
+                    for line_no, line in enumerate(chunk_lines, first_line):
+                        emit_line(chunk_results.get(str(line_no), line))
+                    if progress_callback:
+                        progress_callback(TranslationJobProgressDTO(
+                            total_chunks=total_chunks,
+                            processed_chunks=i + 1,
+                            successful_chunks=len(translated_chunk_indices),
+                            failed_chunks=0,
+                            current_status_message=f"무결성 번역 청크 {i+1}/{total_chunks} 건너뜀",
+                            current_chunk_processing=i + 1
+                        ))
+                    continue
+
+                # 3. API 요청 및 검증 (재시도 포함) - API 경계에서만 TranslationUnit 생성
+                chunk = [TranslationUnit(id=str(line_no), text=line) for line_no, line in enumerate(chunk_lines, first_line)]
                 chunk_results = await self._translate_integrity_chunk_with_retry(chunk)
-                translated_map.update(chunk_results)
                 
                 if temp_dir:
                     try:
@@ -796,6 +987,10 @@ class TranslationService:
                     except Exception as e:
                         logger.error(f"  ❌ 무결성 임시 청크 저장 실패: {e}")
 
+                # 4. 조립 - 번역이 없으면 원문 사용
+                for line_no, line in enumerate(chunk_lines, first_line):
+                    emit_line(chunk_results.get(str(line_no), line))
+
                 if pbar:
                     pbar.update(1)
 
@@ -812,20 +1007,10 @@ class TranslationService:
             if pbar:
                 pbar.close()
 
-        # 4. 조립
-        result_lines = []
-        for i in range(len(lines)):
-            # 번역이 없으면 원문 사용
-            result_lines.append(translated_map.get(str(i), lines[i]))
-            
-        if output_path_for_progress:
-            with open(output_path_for_progress, "w", encoding="utf-8") as f:
-                f.write("\n".join(result_lines))
-
         if temp_dir and temp_dir.exists():
             logger.info(f"무결성 검수 캐시 및 진행 상태 파일 보존: {temp_dir}")
 
-        return "\n".join(result_lines)
+        return True
 
     async def _translate_integrity_chunk_with_retry(
         self, 
@@ -834,6 +1019,33 @@ class TranslationService:
     ) -> Dict[str, str]:
         """
         무결성 청크 번역 (Binary Split 및 Targeted Retry 포함)
+
+        빈 줄, 구분선, 숫자/구두점만 있는 단위는 API로 보내지 않고 원문 그대로 결과에 넣습니다.
+        청크 구성과 id는 바뀌지 않으므로 임시 청크 파일/검토 화면과의 매핑이 유지됩니다.
+        """
+        if not chunk:
+            return {}
+
+        if self.config.get("integrity_skip_non_translatable", True):
+            remote_units, local_results = partition_translatable_units(chunk)
+            if local_results:
+                logger.debug(f"무결성 청크: {len(local_results)}/{len(chunk)}개 단위 로컬 처리 (번역 불필요)")
+                if not remote_units:
+                    return local_results
+                translated = await self._request_integrity_translation(remote_units, depth)
+                return {**local_results, **translated}
+        return await self._request_integrity_translation(chunk, depth)
+
+    async def _request_integrity_translation(
+        self,
+        chunk: List[TranslationUnit],
+        depth: int = 0
+    ) -> Dict[str, str]:
+        """
+        번역이 필요한 단위만 직렬화하여 요청합니다.
+
+        integrity_wire_format이 "compact"이면 JSON 배열 대신 ⟦n⟧ 줄 표식 형식으로 주고받습니다
+        (utils.integrity_wire_format 참고).
         """
         if not chunk:
             return {}
@@ -844,11 +1056,18 @@ class TranslationService:
 
         try:
             import json
-            chunk_json_str = json.dumps([unit.model_dump() for unit in chunk], ensure_ascii=False)
+            use_compact_format = self.config.get("integrity_wire_format", "json") == WIRE_FORMAT_COMPACT
+            if use_compact_format:
+                chunk_json_str = encode_compact_units(chunk)
+            else:
+                chunk_json_str = json.dumps([unit.model_dump() for unit in chunk], ensure_ascii=False)
 
-            # 1. 시스템 지침 준비 (사용자 시스템 지침 + JSON 강제 지침)
+            # 1. 시스템 지침 준비 (사용자 시스템 지침 + 형식 강제 지침)
             sys_instr_base = self.config.get("prefill_system_instruction", "") if self.config.get("enable_prefill_translation", False) else ""
-            json_instruction = "You are a professional translator. Respond ONLY with a valid JSON array of objects, each containing 'id' and 'translated_text' keys. Do NOT wrap in markdown code blocks."
+            if use_compact_format:
+                json_instruction = COMPACT_FORMAT_INSTRUCTION
+            else:
+                json_instruction = "You are a professional translator. Respond ONLY with a valid JSON array of objects, each containing 'id' and 'translated_text' keys. Do NOT wrap in markdown code blocks."
             sys_instr = f"{sys_instr_base}\n\n{json_instruction}".strip()
 
             # 2. 용어집 및 프롬프트 준비
@@ -869,7 +1088,10 @@ class TranslationService:
 
             api_prompt_for_gemini_client: List[genai_types.Content] = []
             
-            integrity_prompt_suffix = "\n\nTranslate each item in the following JSON array. Keep the 'id' exactly as given. Return ONLY a valid JSON array."
+            if use_compact_format:
+                integrity_prompt_suffix = COMPACT_PROMPT_SUFFIX
+            else:
+                integrity_prompt_suffix = "\n\nTranslate each item in the following JSON array. Keep the 'id' exactly as given. Return ONLY a valid JSON array."
 
             if self.config.get("enable_prefill_translation", False):
                 prefill_cached_history_raw = self.config.get("prefill_cached_history", [])
@@ -912,13 +1134,14 @@ class TranslationService:
                     genai_types.Content(role="user", parts=[genai_types.Part.from_text(text=user_prompt_str)])
                 ]
 
-            # 3. API 호출 (Structured Output 모드)
+            # 3. API 호출 (JSON 형식은 Structured Output 모드, 간결한 형식은 일반 텍스트)
             gen_config = {
                 "temperature": self.config.get("temperature", 0.3), # 유저 설정값 우선, 없으면 0.3
                 "top_p": self.config.get("top_p", 0.9),
-                "response_mime_type": "application/json",
                 "thinking_level": self.config.get("thinking_level", "high")
             }
+            if not use_compact_format:
+                gen_config["response_mime_type"] = "application/json"
 
             raw_response = await self.gemini_client.generate_text_async(
                 prompt=api_prompt_for_gemini_client,
@@ -929,23 +1152,35 @@ class TranslationService:
             )
 
             # 3. 응답 파싱 및 검증
-            if not raw_response or not isinstance(raw_response, list):
-                # JSON 파싱 실패 또는 빈 응답 -> Binary Split
-                logger.warning(f"무결성 번역 JSON 파싱 실패 (depth {depth}). Binary Split 시도.")
-                return await self._binary_split_integrity_retry(chunk, depth)
+            if use_compact_format:
+                # 줄 단위 복구: 일부만 온 응답도 완성된 줄은 사용하고 누락 id만 재요청
+                translated_map = parse_compact_response(raw_response if isinstance(raw_response, str) else "", chunk)
+                if not translated_map:
+                    logger.warning(f"무결성 번역 응답에서 줄 표식을 찾지 못함 (depth {depth}). Binary Split 시도.")
+                    return await self._binary_split_integrity_retry(chunk, depth)
+            else:
+                # 깨지거나 잘린 JSON도 온전한 객체는 살리고, 누락된 id만 Targeted Retry로 넘김
+                salvaged_items = salvage_json_objects(raw_response)
+                if not salvaged_items:
+                    # 살릴 객체가 없는 응답 -> Binary Split
+                    logger.warning(f"무결성 번역 JSON 파싱 실패 (depth {depth}). Binary Split 시도.")
+                    return await self._binary_split_integrity_retry(chunk, depth)
+                if not isinstance(raw_response, list):
+                    logger.info(f"무결성 번역 JSON 응답 손상: {len(salvaged_items)}/{len(chunk)}개 항목 복구 (depth {depth})")
+
+                translated_units = []
+                for item in salvaged_items:
+                    try:
+                        translated_units.append(TranslatedUnit(**item))
+                    except Exception:
+                        continue
+
+                translated_map = {
+                    u.id: (u.translated_text if u.translated_text else "")
+                    for u in translated_units
+                }
 
             # 4. 누락 검사 및 Targeted Retry
-            translated_units = []
-            for item in raw_response:
-                try:
-                    translated_units.append(TranslatedUnit(**item))
-                except Exception:
-                    continue
-            
-            translated_map = {
-                u.id: (u.translated_text if u.translated_text else "")
-                for u in translated_units
-            }
             requested_ids = {u.id for u in chunk}
             received_ids = set(translated_map.keys())
             missing_ids = requested_ids - received_ids
@@ -978,15 +1213,19 @@ class TranslationService:
         
         logger.info(f"🔄 Binary Split: {len(chunk)} -> {len(left_chunk)}, {len(right_chunk)}")
         
-        results = {}
-        results.update(await self._translate_integrity_chunk_with_retry(left_chunk, depth + 1))
-        results.update(await self._translate_integrity_chunk_with_retry(right_chunk, depth + 1))
-        return results
+        # 두 절반은 서로 독립적이므로 동시에 요청
+        left_results, right_results = await asyncio.gather(
+            self._translate_integrity_chunk_with_retry(left_chunk, depth + 1),
+            self._translate_integrity_chunk_with_retry(right_chunk, depth + 1)
+        )
+        return {**left_results, **right_results}
 
     async def translate_epub(self, epub_path: Union[str, Path], output_path: Union[str, Path]) -> None:
         """
         EPUB 번역 파이프라인: 구조를 유지하며 내용을 번역합니다.
         임시 디렉토리를 사용한 파일 기반 진행도 저장 및 재개(Resume)를 지원합니다.
+        여러 챕터에 반복되는 텍스트 노드는 TextNodeIndex로 한 번만 번역하며,
+        재사용 통계는 last_epub_dedup_report에 남습니다 (재개 시 이전 실행의 색인은 없음).
         """
         import zipfile
         import json
@@ -1015,88 +1254,93 @@ class TranslationService:
             temp_dir.mkdir(parents=True, exist_ok=True)
             
         translated_files = set(metadata.get("translated_files", []))
+        node_index = TextNodeIndex()
+        self.last_epub_dedup_report = node_index.report
 
         try:
+            # 출력 EPUB에서 원본과 달라지는 항목 (번역된 챕터는 임시 파일 경로, OPF는 바이트)
+            replacements: Dict[str, Union[bytes, Path]] = {}
             with zipfile.ZipFile(epub_path, 'r') as zin:
-                with zipfile.ZipFile(output_path, 'w') as zout:
-                    # 1. mimetype 보존 (EPUB 표준: 압축 없이 첫 번째 파일)
-                    if 'mimetype' in zin.namelist():
-                        zout.writestr('mimetype', zin.read('mimetype'), compress_type=zipfile.ZIP_STORED)
-
-                    # 2. 모든 파일 순회
-                    for item in zin.infolist():
-                        if item.filename == 'mimetype':
-                            continue
+                # 1. 모든 파일 순회 (번역만 수행, 출력 ZIP은 마지막에 한 번에 조립)
+                for item in zin.infolist():
+                    if item.filename == 'mimetype':
+                        continue
+                    
+                    # 중단 체크
+                    if self.stop_check_callback and self.stop_check_callback():
+                        raise asyncio.CancelledError("EPUB 번역 중단 요청됨")
                         
-                        # 중단 체크
-                        if self.stop_check_callback and self.stop_check_callback():
-                            raise asyncio.CancelledError("EPUB 번역 중단 요청됨")
-                            
-                        # 진행도 저장 체크
-                        temp_file_path = temp_dir / item.filename.replace("/", "_")
-                        if item.filename in translated_files and temp_file_path.exists():
-                            logger.info(f"  ⏭️ 이미 번역된 챕터 건너뜀: {item.filename}")
-                            with open(temp_file_path, "rb") as f:
-                                zout.writestr(item.filename, f.read(), compress_type=zipfile.ZIP_DEFLATED)
-                            continue
+                    # 진행도 저장 체크
+                    temp_file_path = temp_dir / item.filename.replace("/", "_")
+                    if item.filename in translated_files and temp_file_path.exists():
+                        logger.info(f"  ⏭️ 이미 번역된 챕터 건너뜀: {item.filename}")
+                        replacements[item.filename] = temp_file_path
+                        continue
 
+                    # HTML/XHTML 파일만 번역
+                    if item.filename.lower().endswith(('.xhtml', '.html', '.htm')):
                         content = zin.read(item.filename)
-                        
-                        # HTML/XHTML 파일만 번역
-                        if item.filename.lower().endswith(('.xhtml', '.html', '.htm')):
-                            logger.info(f"  📄 챕터 처리 중: {item.filename}")
-                            try:
-                                chapter = processor.process_chapter(content, item.filename)
-                                translatable_nodes = [n for n in chapter.nodes if n.type == NodeType.TEXT]
+                        logger.info(f"  📄 챕터 처리 중: {item.filename}")
+                        try:
+                            arena = processor.parse_chapter(content, item.filename)
+                            
+                            if arena.text_indices():
+                                # 무결성 모드와 동일한 로직으로 노드 리스트 번역
+                                # 번역 단위로 변환 (id와 text만 필요)
+                                units = arena.translation_units()
+                                # 책 전체에서 처음 나온 텍스트만 번역 요청 (반복되는 머리글/링크/꼬리말은 색인 재사용)
+                                pending_units = node_index.pending_units(
+                                    units, self.config.get("integrity_skip_non_translatable", True)
+                                )
                                 
-                                if translatable_nodes:
-                                    # 무결성 모드와 동일한 로직으로 노드 리스트 번역
-                                    # 번역 단위로 변환 (id와 text만 필요)
-                                    units = [TranslationUnit(id=n.id, text=n.content or "") for n in translatable_nodes]
-                                    
-                                    # 청크 분할 및 번역 요청
-                                    max_chunk_size = self.config.get("chunk_size", 6000)
-                                    max_items = self.config.get("integrity_max_items", 200)
-                                    chunks = self.chunk_service.split_nodes_into_chunks(units, max_chunk_size, max_items)
-                                    
-                                    translated_map: Dict[str, str] = {}
-                                    for i, chunk in enumerate(chunks):
-                                        logger.info(f"    📦 EPUB 노드 청크 {i+1}/{len(chunks)} 번역 중")
-                                        chunk_results = await self._translate_integrity_chunk_with_retry(chunk)
-                                        translated_map.update(chunk_results)
-                                    
-                                    # 번역된 내용으로 HTML 재조립
-                                    translated_html = processor.reconstruct_chapter(chapter, translated_map)
-                                    translated_bytes = translated_html.encode('utf-8')
+                                # 청크 분할 및 번역 요청
+                                max_chunk_size = self.config.get("chunk_size", 6000)
+                                max_items = self.config.get("integrity_max_items", 200)
+                                chunks = self.chunk_service.split_nodes_into_chunks(pending_units, max_chunk_size, max_items) if pending_units else []
+                                
+                                translated_map: Dict[str, str] = {}
+                                for i, chunk in enumerate(chunks):
+                                    logger.info(f"    📦 EPUB 노드 청크 {i+1}/{len(chunks)} 번역 중")
+                                    chunk_results = await self._translate_integrity_chunk_with_retry(chunk)
+                                    translated_map.update(chunk_results)
+                                translated_map = node_index.resolve(units, translated_map)
+                                
+                                # 번역문을 원문 XHTML의 텍스트 범위에만 끼워 넣어 재조립
+                                translated_bytes = processor.reconstruct_arena(arena, translated_map)
+                                
+                                # 임시 디렉토리에 저장 및 메타데이터 업데이트
+                                with open(temp_file_path, "wb") as f:
+                                    f.write(translated_bytes)
                                     
-                                    # 임시 디렉토리에 저장 및 메타데이터 업데이트
-                                    with open(temp_file_path, "wb") as f:
-                                        f.write(translated_bytes)
-                                        
-                                    translated_files.add(item.filename)
-                                    metadata["translated_files"] = list(translated_files)
-                                    with open(metadata_path, "w", encoding="utf-8") as f:
-                                        json.dump(metadata, f, ensure_ascii=False)
-                                        
-                                    zout.writestr(item.filename, translated_bytes, compress_type=zipfile.ZIP_DEFLATED)
-                                else:
-                                    zout.writestr(item.filename, content, compress_type=zipfile.ZIP_DEFLATED)
+                                translated_files.add(item.filename)
+                                metadata["translated_files"] = list(translated_files)
+                                with open(metadata_path, "w", encoding="utf-8") as f:
+                                    json.dump(metadata, f, ensure_ascii=False)
                                     
-                            except Exception as e_chapter:
-                                logger.error(f"챕터 {item.filename} 처리 중 오류 (원본 보존): {e_chapter}")
-                                zout.writestr(item.filename, content, compress_type=zipfile.ZIP_DEFLATED)
-                        else:
-                            # 이미지, CSS, 기타 리소스는 그대로 복사
-                            if item.filename.lower().endswith('.opf'):
-                                try:
-                                    opf_text = content.decode('utf-8')
-                                    opf_text = re.sub(r'page-progression-direction\s*=\s*["\']rtl["\']', 'page-progression-direction="ltr"', opf_text, flags=re.IGNORECASE)
-                                    zout.writestr(item, opf_text.encode('utf-8'), compress_type=zipfile.ZIP_DEFLATED)
-                                except Exception as e_opf:
-                                    logger.error(f"OPF 방향 수정 중 오류: {e_opf}")
-                                    zout.writestr(item, content, compress_type=zipfile.ZIP_DEFLATED)
-                            else:
-                                zout.writestr(item, content, compress_type=zipfile.ZIP_DEFLATED)
+                                replacements[item.filename] = temp_file_path
+                                
+                        except Exception as e_chapter:
+                            logger.error(f"챕터 {item.filename} 처리 중 오류 (원본 보존): {e_chapter}")
+                    elif item.filename.lower().endswith('.opf'):
+                        content = zin.read(item.filename)
+                        try:
+                            opf_text = content.decode('utf-8')
+                            opf_text = re.sub(r'page-progression-direction\s*=\s*["\']rtl["\']', 'page-progression-direction="ltr"', opf_text, flags=re.IGNORECASE)
+                            if opf_text != content.decode('utf-8'):
+                                replacements[item.filename] = opf_text.encode('utf-8')
+                        except Exception as e_opf:
+                            logger.error(f"OPF 방향 수정 중 오류: {e_opf}")
+                    # 이미지, CSS, 기타 리소스는 조립 시 압축된 그대로 복사
+
+            # 2. 출력 EPUB 조립 (mimetype 무압축 첫 항목, 바뀌지 않은 항목은 압축 데이터 그대로 복사)
+            EpubAssembler(epub_path).assemble(output_path, replacements)
+
+            report = node_index.report
+            if report.total_nodes:
+                logger.info(
+                    f"♻️ EPUB 텍스트 노드 중복 제거: 전체 {report.total_nodes}개 중 {report.translated_nodes}개만 번역 요청 "
+                    f"(로컬 처리 {report.local_nodes}개, 재사용 {report.reused_nodes}개, {report.dedup_ratio:.1%})"
+                )
 
             # 성공적으로 완료되면 임시 디렉토리 삭제
             shutil.rmtree(temp_dir, ignore_errors=True)
@@ -355,6 +355,8 @@ class BatchTranslatorWindow(QtWidgets.QMainWindow):
                 if not self.app_service.current_translation_task.done():
                     self.app_service.current_translation_task.cancel()
                     logger.info("창 종료: 진행 중 번역 Task.cancel() 호출")
+            if self.app_service:
+                self.app_service.shutdown()
         except Exception:
             # 종료 경로에서는 로깅만 남기고 무시
             logger.exception("창 종료 처리 중 오류")
@@ -23,6 +23,7 @@ from infrastructure.logger_config import setup_logger
 from utils.chunk_service import ChunkService
 from utils.quality_check_service import QualityCheckService
 from utils.post_processing_service import PostProcessingService
+from utils.source_filter import filter_source_for_metadata
 from domain.review_providers.factory import get_review_provider
 
 # 로깅 설정 (커스텀 로거 사용)
@@ -95,7 +96,9 @@ class ReviewTabQt(QtWidgets.QWidget):
         super().__init__(parent)
         self.app_service = app_service
         self.chunk_service = ChunkService()
-        self.quality_service = QualityCheckService()
+        # 번역 중 청크마다 갱신되는 AppService의 품질 추적기를 공유 (검토 로드 시 전체 재계산 방지)
+        shared_quality_service = getattr(app_service, "quality_check_service", None)
+        self.quality_service = shared_quality_service if isinstance(shared_quality_service, QualityCheckService) else QualityCheckService()
         self.post_processing_service = PostProcessingService()
         self._loop = asyncio.get_event_loop()
 
@@ -440,7 +443,10 @@ class ReviewTabQt(QtWidgets.QWidget):
         chunk_size = 6000
         if self.app_service and self.app_service.config:
             chunk_size = self.app_service.config.get("chunk_size", 6000)
-        chunks_list = self.chunk_service.create_chunks_from_file_content(content, chunk_size)
+        metadata = file_handler.load_metadata(file_path)
+        content = filter_source_for_metadata(content, metadata).text
+        chunk_offsets = metadata.get("chunk_offsets")
+        chunks_list = self.chunk_service.create_chunks_from_file_content(content, chunk_size, chunk_offsets=chunk_offsets)
         result = {i: chunk for i, chunk in enumerate(chunks_list)}
         self._source_cache[file_path] = result
         self._source_cache_info[file_path] = self._get_cache_key(file_path)
@@ -550,6 +556,7 @@ class ReviewTabQt(QtWidgets.QWidget):
             trans_len = "-"
             ratio = "-"
             z_score = "-"
+            status_tooltip = ""
 
             if idx_str in translated_chunks:
                 info = translated_chunks[idx_str]
@@ -586,9 +593,23 @@ class ReviewTabQt(QtWidgets.QWidget):
                     elif issue == "hallucination":
                         status = "⚠️ 환각"
                         status_type = 'warning_hallucination'
+                    elif issue == "untranslated_residue":
+                        status = "⚠️ 미번역"
+                        status_type = 'warning_omission'
+                    elif issue == "repetition_loop":
+                        status = "⚠️ 반복"
+                        status_type = 'warning_hallucination'
+                    elif issue == "content_safety_blocked":
+                        status = "🛡️ 차단"
+                        status_type = 'warning_omission'
                     else:
                         status = "✅"
                         status_type = 'success'
+                    blocked_spans = suspicious_map[i].get("blocked_spans") or []
+                    if blocked_spans:
+                        status_tooltip = "원문 그대로 남긴 구간 (콘텐츠 안전 차단):\n" + "\n".join(
+                            f"[{span.get('start')}-{span.get('end')}] {span.get('text', '')[:80]}" for span in blocked_spans
+                        )
                 else:
                     status = "✅"
                     status_type = 'success'
@@ -599,9 +620,12 @@ class ReviewTabQt(QtWidgets.QWidget):
             # 테마별 동적 색상 적용
             bg_color, fg_color = self._get_color_palette(status_type)
 
+            status_item = self._make_item(status)
+            if status_tooltip:
+                status_item.setToolTip(status_tooltip)
             row_items = [
                 self._make_item(str(i), sort_value=i),  # ID: 정수값 저장하여 숫자 정렬
-                self._make_item(status),
+                status_item,
                 self._make_item(src_len, True),
                 self._make_item(trans_len, True),
                 self._make_item(ratio, True),
@@ -1,11 +1,14 @@
 # file_handler.py
 import os
+import io
 import json
 import csv
+import codecs
 import hashlib
+import mmap
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Union, Tuple
+from typing import List, Dict, Any, Union, Tuple, Optional, Iterator
 import re
 import logging # logging 모듈 임포트
 
@@ -32,6 +35,82 @@ def read_text_file(file_path: Union[str, Path]) -> str:
         logger.error(f"파일 읽기 중 오류 발생 ({file_path}): {e}")
         raise
 
+# --- 대용량 원문 스트리밍 읽기 ---
+
+SOURCE_STREAM_BLOCK_SIZE = 1 << 20  # 1 MiB
+
+
+def iter_text_file_blocks(file_path: Union[str, Path], block_size: int = SOURCE_STREAM_BLOCK_SIZE) -> Iterator[str]:
+    """
+    텍스트 파일을 mmap으로 열어 block_size 바이트씩 점진적으로 디코딩한 문자열 블록을 반환합니다.
+
+    파일 전체를 한 번에 str로 만들지 않으므로 메모리 사용량은 블록 크기에 비례합니다.
+    UTF-8 BOM은 제거하고, 줄바꿈은 read_text_file(유니버설 뉴라인)과 같이 \r\n/\r → \n으로 정규화합니다.
+    블록 경계에서 잘린 멀티바이트 문자와 \r\n은 증분 디코더가 다음 블록과 이어서 처리합니다.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8-sig')(), translate=True)
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                # mmap을 지원하지 않는 파일 시스템/특수 파일: 일반 블록 읽기로 대체
+                logger.debug(f"mmap 사용 불가 ({file_path}): {e}. 블록 읽기로 대체합니다.")
+                buffer = None
+
+            if buffer is None:
+                while True:
+                    data = f.read(block_size)
+                    if not data:
+                        break
+                    text = decoder.decode(data)
+                    if text:
+                        yield text
+            else:
+                with buffer:
+                    view = memoryview(buffer)
+                    try:
+                        for offset in range(0, size, block_size):
+                            text = decoder.decode(view[offset:offset + block_size])
+                            if text:
+                                yield text
+                    finally:
+                        view.release()
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+    except FileNotFoundError:
+        logger.error(f"파일을 찾을 수 없습니다: {file_path}")
+        raise
+    except IOError as e:
+        logger.error(f"파일 읽기 중 오류 발생 ({file_path}): {e}")
+        raise
+
+
+# 유니버설 뉴라인 변환 후 str.splitlines가 줄 경계로 보는 문자 (모두 한 글자)
+_SPLITLINES_BREAKS = "\n\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+def iter_text_file_lines(file_path: Union[str, Path], keepends: bool = False,
+                         block_size: int = SOURCE_STREAM_BLOCK_SIZE) -> Iterator[str]:
+    """
+    텍스트 파일의 줄을 하나씩 반환합니다.
+    read_text_file(file_path).splitlines(keepends)와 같은 줄을 만들지만(BOM 제외) 파일 전체를 메모리에 올리지 않습니다.
+    """
+    pending = ""
+    for block in iter_text_file_blocks(file_path, block_size):
+        lines = (pending + block).splitlines(True)
+        # 줄바꿈으로 끝나지 않은 마지막 줄은 다음 블록과 이어 붙임
+        pending = lines.pop() if lines and lines[-1][-1] not in _SPLITLINES_BREAKS else ""
+        for line in lines:
+            yield line if keepends else line[:-1]
+    if pending:
+        yield pending
+
+
 # --- 일반 파일 처리 ---
 
 def write_text_file(file_path: Union[str, Path], content: str, mode: str = 'w') -> None:
@@ -287,6 +366,12 @@ def _hash_config_for_metadata(config: Dict[str, Any]) -> str:
     config_str = json.dumps(minimal_config, sort_keys=True, ensure_ascii=False)
     return hashlib.md5(config_str.encode('utf-8')).hexdigest()
 
+def language_pair_for_metadata(config: Dict[str, Any]) -> str:
+    """품질 검사 기준선을 나누는 언어쌍 키 (예: 'ja->ko', 자동 감지면 'auto->ko')"""
+    source = config.get("novel_language") or "auto"
+    target = config.get("target_translation_language") or "ko"
+    return f"{source}->{target}"
+
 def create_new_metadata(input_file_path: Union[str, Path], total_chunks: int, config: Dict[str, Any]) -> Dict[str, Any]:
     current_time = time.time()
     metadata = {
@@ -295,13 +380,31 @@ def create_new_metadata(input_file_path: Union[str, Path], total_chunks: int, co
         "translated_chunks": {},
         "failed_chunks": {},  # 실패한 청크 기록용
         "config_hash": _hash_config_for_metadata(config),
+        "language_pair": language_pair_for_metadata(config),
         "creation_time": current_time,
         "last_updated": current_time,
         "status": "initialized",
     }
     return metadata
 
-def update_metadata_for_chunk_completion(input_file_path: Union[str, Path], chunk_index: int, source_length: int = 0, translated_length: int = 0) -> bool:
+def update_metadata_for_chunk_completion(
+    input_file_path: Union[str, Path],
+    chunk_index: int,
+    source_length: int = 0,
+    translated_length: int = 0,
+    source_hash: Optional[str] = None,
+    source_anchor_hash: Optional[str] = None,
+    output_issues: Optional[Dict[str, Any]] = None,
+    blocked_spans: Optional[List[Dict[str, Any]]] = None
+) -> bool:
+    """
+    청크 완료 정보를 메타데이터에 기록합니다.
+    source_hash/source_anchor_hash가 주어지면 함께 저장하여, 청크 크기 변경이나
+    원문 수정 후에도 내용이 같은 청크의 번역을 재사용할 수 있게 합니다.
+    output_issues는 출력 검증(미번역 잔존/반복 루프)에서 문제가 발견된 경우의 요약으로, 품질 검사가 읽습니다.
+    blocked_spans는 콘텐츠 안전 격리로 번역하지 못한 최소 차단 구간({start, end, text}) 목록으로,
+    검토 탭에서 수동 번역 대상으로 표시됩니다.
+    """
     metadata_path = get_metadata_file_path(input_file_path)
     try:
         metadata = read_json_file(metadata_path)
@@ -326,12 +429,21 @@ def update_metadata_for_chunk_completion(input_file_path: Union[str, Path], chun
         # 하위 호환성을 위해 읽는 쪽에서는 타입 체크가 필요할 수 있습니다.
         ratio = round(translated_length / source_length, 4) if source_length > 0 else 0.0
         
-        metadata['translated_chunks'][str(chunk_index)] = {
+        chunk_record = {
             "time": time.time(),
             "source_length": source_length,
             "translated_length": translated_length,
             "ratio": ratio
         }
+        if source_hash:
+            chunk_record["source_hash"] = source_hash
+        if source_anchor_hash:
+            chunk_record["source_anchor_hash"] = source_anchor_hash
+        if output_issues:
+            chunk_record["output_issues"] = output_issues
+        if blocked_spans:
+            chunk_record["blocked_spans"] = blocked_spans
+        metadata['translated_chunks'][str(chunk_index)] = chunk_record
         metadata['last_updated'] = time.time()
 
         # 상태 업데이트
@@ -346,6 +458,13 @@ def update_metadata_for_chunk_completion(input_file_path: Union[str, Path], chun
         logger.error(f"메타데이터 청크 완료 업데이트 중 오류 ({metadata_path}): {e}", exc_info=True)
         return False
 
+def metadata_has_content_hashes(metadata: Dict[str, Any]) -> bool:
+    """완료된 청크 중 콘텐츠 해시가 기록된 항목이 있는지 (해시 기반 재사용 가능 여부)"""
+    translated = metadata.get("translated_chunks") if isinstance(metadata, dict) else None
+    if not isinstance(translated, dict):
+        return False
+    return any(isinstance(info, dict) and info.get("source_hash") for info in translated.values())
+
 def update_metadata_for_chunk_failure(input_file_path: Union[str, Path], chunk_index: int, error_message: str) -> bool:
     metadata_path = get_metadata_file_path(input_file_path)
     try:
@@ -6,8 +6,9 @@ import random
 import re
 import json
 import asyncio
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Iterable, Optional, Union, List
+from typing import Awaitable, Callable, Dict, Any, Iterable, Optional, Tuple, Union, List
 
 # Google 관련 imports
 from google import genai
@@ -24,6 +25,16 @@ try:
     from ..infrastructure.logger_config import setup_logger # Relative import if logger_config is in the same parent package
 except ImportError:
     from infrastructure.logger_config import setup_logger # Absolute for fallback or direct run
+
+try:
+    from .latency_tracker import LatencyTracker, remaining_request_budget
+except ImportError:
+    from infrastructure.latency_tracker import LatencyTracker, remaining_request_budget
+
+try:
+    from .key_health_store import CIRCUIT_CLOSED, KeyHealthStore
+except ImportError:
+    from infrastructure.key_health_store import CIRCUIT_CLOSED, KeyHealthStore
 logger = setup_logger(__name__)
 
 class GeminiApiException(Exception):
@@ -48,6 +59,17 @@ class GeminiAllApiKeysExhaustedException(GeminiApiException):
     """모든 API 키가 소진되거나 유효하지 않을 때 발생하는 예외"""
     pass
 
+class GeminiStreamAbortedException(GeminiApiException):
+    """스트리밍 응답을 출력 이상(반복 루프, 예상 길이 초과)으로 조기 중단한 경우의 예외 (같은 요청을 재시도하지 않음)"""
+    def __init__(self, message: str, reason: str, partial_length: int = 0):
+        super().__init__(message)
+        self.reason = reason
+        self.partial_length = partial_length
+
+class GeminiDeadlineExceededException(GeminiApiException):
+    """청크 시간 예산(request_time_budget)이 소진되어 더 이상 요청/재시도하지 않는 경우의 예외"""
+    pass
+
 # Vertex AI 공식 API 오류 기준 추가 예외 클래스들
 
 class BlockedPromptException(GeminiContentSafetyException):
@@ -98,6 +120,14 @@ class ContentFilterException(GeminiContentSafetyException):
 
 
 
+@dataclass
+class RequestAttempt:
+    """헤지 경쟁에 참여한 요청 하나 (원 요청 또는 헤지). 결과와 응답 시간은 이 키로 기록합니다."""
+    api_key: Optional[str]
+    started: float
+    is_hedge: bool = False
+
+
 class GeminiClient:
     _RATE_LIMIT_PATTERNS = [
         "rateLimitExceeded", "429", "Too Many Requests", "QUOTA_EXCEEDED",
@@ -119,10 +149,17 @@ class GeminiClient:
         "UNAUTHENTICATED", "PERMISSION_DENIED", "NOT_FOUND"
     ]
 
+    # 스트리밍 중 이 종료 사유가 보이면 콘텐츠 안전 차단으로 보고 바로 중단 (SDK 버전에 따라 없는 값이 있어 이름으로 비교)
+    _STREAM_SAFETY_FINISH_REASONS = frozenset({"SAFETY", "PROHIBITED_CONTENT", "BLOCKLIST", "SPII"})
+
     _VERTEX_AI_SCOPES = ['https://www.googleapis.com/auth/cloud-platform']
     _QUOTA_COOLDOWN_SECONDS = 100 # 100초
 
 
+    def close(self) -> None:
+        """종료 전 아직 저장하지 않은 키별 요청 카운터를 상태 파일에 기록"""
+        self.key_health.flush()
+
     def _get_api_key_identifier(self, api_key: str) -> str:
         """API 키의 안전한 식별자를 반환합니다."""
         if not self.api_keys_list or api_key not in self.api_keys_list:
@@ -164,7 +201,12 @@ class GeminiClient:
                  project: Optional[str] = None,
                  location: Optional[str] = None,
                  requests_per_minute: Optional[float] = None,
-                 api_timeout: float = 500.0):
+                 api_timeout: float = 500.0,
+                 adaptive_timeout_factor: Optional[float] = 3.0,
+                 adaptive_timeout_min: float = 60.0,
+                 hedge_quantile: Optional[float] = None,
+                 hedge_budget_ratio: float = 0.05,
+                 key_health_path: Optional[Union[str, Path]] = None):
         
         logger.debug(f"[GeminiClient.__init__] 시작. auth_credentials 타입: {type(auth_credentials)}, project: '{project}', location: '{location}'")
         
@@ -176,7 +218,8 @@ class GeminiClient:
         self.current_api_key: Optional[str] = None
         self.client_pool: Dict[str, genai.Client] = {}
         self._key_rotation_lock = asyncio.Lock()
-        self.key_quota_failure_times: Dict[str, float] = {}
+        # 키별 서킷 브레이커 (key_health_path가 있으면 실행 간 상태/일일 카운터 유지)
+        self.key_health = KeyHealthStore(key_health_path, base_cooldown=self._QUOTA_COOLDOWN_SECONDS)
         
         # Vertex AI related attributes
         self.vertex_credentials: Optional[Any] = None
@@ -188,6 +231,20 @@ class GeminiClient:
         # 기존 client_args={'timeout': ...} 방식은 작동하지 않음이 확인되었습니다.
         timeout_ms = int(api_timeout * 1000)
         self.http_options = genai_types.HttpOptions(timeout=timeout_ms)
+        self.api_timeout = api_timeout
+
+        # 관측된 응답 시간 분포 기반 요청별 데드라인 (factor가 없거나 0이면 고정 api_timeout만 사용)
+        self.latency_tracker: Optional[LatencyTracker] = (
+            LatencyTracker(factor=adaptive_timeout_factor, min_deadline=adaptive_timeout_min, max_deadline=api_timeout)
+            if adaptive_timeout_factor else None
+        )
+
+        # 헤지 요청: 관측 분포의 hedge_quantile 분위를 넘긴 요청을 다른 API 키로 한 번 더 보냄
+        # (전체 요청 대비 hedge_budget_ratio 이내, None이면 사용 안 함)
+        self.hedge_quantile = hedge_quantile
+        self.hedge_budget_ratio = hedge_budget_ratio
+        self._primary_request_count = 0
+        self._hedge_request_count = 0
         
         # RPM control
         self.requests_per_minute = requests_per_minute or 140.0
@@ -222,7 +279,11 @@ class GeminiClient:
             
             if successful_keys:
                 self.api_keys_list = successful_keys
-                self.current_api_key_index = 0
+                # 이전 실행에서 차단된 키는 쿨다운이 끝날 때까지 건너뜀
+                available_keys = [key for key in successful_keys if self.key_health.is_available(key)]
+                if len(available_keys) < len(successful_keys):
+                    logger.info(f"🔌 차단 상태인 API 키 {len(successful_keys) - len(available_keys)}개는 쿨다운이 끝날 때까지 건너뜁니다.")
+                self.current_api_key_index = successful_keys.index(available_keys[0]) if available_keys else 0
                 self.current_api_key = self.api_keys_list[self.current_api_key_index]
                 self.client = self.client_pool.get(self.current_api_key)
                 
@@ -429,6 +490,190 @@ class GeminiClient:
         return any(re.search(pattern, str(error_obj), re.IGNORECASE) for pattern in self._CONTENT_SAFETY_PATTERNS)
 
 
+    def _is_stream_safety_stop(self, chunk_response: Any) -> bool:
+        """스트림 조각의 프롬프트 차단 또는 안전 계열 종료 사유 (SAFETY 외 PROHIBITED_CONTENT/BLOCKLIST/SPII 포함)"""
+        if self._is_content_safety_error(response=chunk_response):
+            return True
+        for candidate in getattr(chunk_response, 'candidates', None) or []:
+            finish_reason = getattr(candidate, 'finish_reason', None)
+            if finish_reason is not None and getattr(finish_reason, 'name', str(finish_reason)) in self._STREAM_SAFETY_FINISH_REASONS:
+                return True
+        return False
+
+    async def _consume_stream(
+        self,
+        response_stream: Any,
+        stream_monitor: Optional[Callable[[str], Optional[str]]] = None
+    ) -> str:
+        """
+        스트리밍 응답을 조각 단위로 검사하며 모읍니다.
+        안전 차단 종료 사유가 보이거나 stream_monitor가 중단 사유를 반환하면 그 즉시 스트림을 닫고 예외를 올려,
+        남은 생성 시간(최대 api_timeout)을 기다리지 않게 합니다.
+        """
+        aggregated_parts: List[str] = []
+        total_length = 0
+        try:
+            async for chunk_response in response_stream:
+                text = chunk_response.text if hasattr(chunk_response, 'text') else None
+                if text:
+                    aggregated_parts.append(text)
+                    total_length += len(text)
+                if self._is_stream_safety_stop(chunk_response):
+                    raise GeminiContentSafetyException(f"콘텐츠 안전 문제로 스트림 응답 차단 ({total_length}자 수신 후 중단)")
+                if text and stream_monitor is not None:
+                    reason = stream_monitor(text)
+                    if reason:
+                        raise GeminiStreamAbortedException(
+                            f"출력 이상({reason})으로 스트림 조기 중단 ({total_length}자 수신)",
+                            reason=reason, partial_length=total_length
+                        )
+        finally:
+            # 중단/취소 시 연결을 바로 닫아 서버 측 생성도 끊음
+            aclose = getattr(response_stream, 'aclose', None)
+            if aclose is not None:
+                try:
+                    await aclose()
+                except Exception as close_e:
+                    logger.debug(f"스트림 종료 중 오류 (무시): {close_e}")
+        return "".join(aggregated_parts)
+
+    async def _generate_stream_text(self, client: Any, model: str, contents: Any, config: Any,
+                                    stream_monitor: Optional[Callable[[str], Optional[str]]] = None) -> str:
+        """스트리밍 요청 시작부터 마지막 조각까지를 하나의 코루틴으로 묶음 (데드라인/헤지를 한 번에 적용하기 위함)"""
+        response_stream = await client.aio.models.generate_content_stream(
+            model=model,
+            contents=contents,
+            config=config
+        )
+        return await self._consume_stream(response_stream, stream_monitor)
+
+    def _attempt_timeout(self, model: str, input_chars: int, retry_index: int) -> Optional[float]:
+        """
+        이번 시도의 데드라인(초).
+        관측 분포 기반 데드라인(재시도마다 2배), 고정 api_timeout, 남은 청크 시간 예산 중 가장 짧은 값.
+        """
+        timeout = self.api_timeout
+        if self.latency_tracker is not None:
+            adaptive = self.latency_tracker.deadline(model, input_chars)
+            if adaptive is not None:
+                timeout = min(timeout, adaptive * (2 ** retry_index))
+        remaining = remaining_request_budget()
+        if remaining is not None:
+            if remaining <= 0:
+                raise GeminiDeadlineExceededException("청크 시간 예산이 소진되어 요청을 중단합니다.")
+            timeout = min(timeout, remaining)
+        return timeout
+
+    def _hedge_delay(self, model: str, input_chars: int) -> Optional[float]:
+        """헤지 요청을 보낼 경과 시간 (헤지 미사용/키 1개/표본 부족이면 None)"""
+        if not self.hedge_quantile or self.latency_tracker is None or len(self.client_pool) < 2:
+            return None
+        return self.latency_tracker.quantile(model, input_chars, self.hedge_quantile)
+
+    def _pick_hedge_client(self) -> Optional[Tuple[str, Any]]:
+        """현재 키가 아니고 서킷이 정상(closed)인 다음 키의 클라이언트"""
+        total = len(self.api_keys_list)
+        for offset in range(1, total):
+            key = self.api_keys_list[(self.current_api_key_index + offset) % total]
+            if key == self.current_api_key:
+                continue
+            # 헤지는 정상(closed) 키로만 보냄 (확인 요청 중인 키는 제외)
+            if self.key_health.state(key) != CIRCUIT_CLOSED:
+                continue
+            client = self.client_pool.get(key)
+            if client is not None:
+                return key, client
+        return None
+
+    def _reserve_hedge(self) -> bool:
+        """헤지 예산(전체 요청 대비 hedge_budget_ratio) 안이면 한 건 예약"""
+        if self._hedge_request_count + 1 > self.hedge_budget_ratio * self._primary_request_count:
+            return False
+        self._hedge_request_count += 1
+        return True
+
+    async def _hedge_call(self, make_call: Callable[[Any, bool], Awaitable[Any]], attempt: RequestAttempt, client: Any) -> Any:
+        # 헤지 요청도 RPM 한도와 키별 일일 요청 수에 포함 (응답 시간은 RPM 대기 이후부터)
+        await self._apply_rpm_delay()
+        attempt.started = time.monotonic()
+        if attempt.api_key:
+            self.key_health.record_request(attempt.api_key)
+        return await make_call(client, True)
+
+    def _record_losing_attempt(self, task: asyncio.Future, attempt: RequestAttempt) -> None:
+        """채택되지 않은 요청이 할당량 소진으로 실패했으면 그 키의 서킷에 기록"""
+        if not task.done() or task.cancelled() or not attempt.api_key:
+            return
+        error = task.exception()
+        if error is not None and self._is_rate_limit_error(error) and self._is_quota_exhausted_error(error):
+            self.key_health.record_quota_failure(attempt.api_key)
+
+    async def _request_with_hedge(
+        self,
+        make_call: Callable[[Any, bool], Awaitable[Any]],
+        model: str,
+        input_chars: int,
+        timeout: Optional[float],
+        hedge_allowed: bool = True
+    ) -> Tuple[Any, RequestAttempt]:
+        """
+        요청 하나를 timeout 안에 실행하고 (결과, 채택된 요청)을 반환합니다.
+        관측 분포의 hedge_quantile 분위를 넘기도록 응답이 없으면 다른 키로 같은 요청을 한 번 더 보내고,
+        먼저 결과(성공 또는 콘텐츠 안전/조기 중단)를 낸 쪽을 채택하며 나머지는 취소합니다.
+        채택되지 않은 요청의 할당량 소진은 그 요청의 키에 기록합니다.
+        """
+        self._primary_request_count += 1
+        hedge_delay = self._hedge_delay(model, input_chars) if hedge_allowed else None
+        started = time.monotonic()
+        primary_attempt = RequestAttempt(self.current_api_key, started)
+        if primary_attempt.api_key:
+            self.key_health.record_request(primary_attempt.api_key)
+        primary = asyncio.ensure_future(make_call(self.client, False))
+        if hedge_delay is None or (timeout is not None and hedge_delay >= timeout):
+            return await asyncio.wait_for(primary, timeout=timeout), primary_attempt
+
+        attempts: Dict[asyncio.Future, RequestAttempt] = {primary: primary_attempt}
+        settled: Optional[asyncio.Future] = None
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+            if not done:
+                picked = self._pick_hedge_client()
+                if picked is not None and self._reserve_hedge():
+                    hedge_key, hedge_client = picked
+                    logger.info(f"⏱️ 응답이 {hedge_delay:.1f}초(p{self.hedge_quantile * 100:.0f})를 넘겨 "
+                                f"API {self._get_api_key_identifier(hedge_key)}로 헤지 요청 "
+                                f"(헤지 {self._hedge_request_count}/{self._primary_request_count}건)")
+                    hedge_attempt = RequestAttempt(hedge_key, time.monotonic(), is_hedge=True)
+                    hedge = asyncio.ensure_future(self._hedge_call(make_call, hedge_attempt, hedge_client))
+                    attempts[hedge] = hedge_attempt
+                    pending.add(hedge)
+            while pending:
+                remaining = None if timeout is None else timeout - (time.monotonic() - started)
+                if remaining is not None and remaining <= 0:
+                    raise asyncio.TimeoutError()
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise asyncio.TimeoutError()
+                for task in done:
+                    error = task.exception()
+                    if error is None or isinstance(error, (GeminiContentSafetyException, GeminiStreamAbortedException)):
+                        if task is not primary:
+                            logger.info("⏱️ 헤지 요청이 먼저 응답하여 원 요청을 취소합니다.")
+                        settled = task
+                        return task.result(), attempts[task]
+            # 모두 실패: 원 요청의 오류를 우선 전달
+            settled = primary
+            return primary.result(), primary_attempt
+        finally:
+            for task in attempts:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
+            for task, attempt in attempts.items():
+                if task is not settled:
+                    self._record_losing_attempt(task, attempt)
+
     def _is_invalid_request_error(self, error_obj: Any) -> bool:
     # Google API Core의 표준 예외들 사용
         from google.api_core import exceptions as gapi_exceptions
@@ -464,15 +709,17 @@ class GeminiClient:
                 return False
 
             original_index = self.current_api_key_index
+            cooling_down_keys = 0
             for i in range(len(self.api_keys_list)): # Iterate once through all available successful keys
                 self.current_api_key_index = (original_index + 1 + i) % len(self.api_keys_list)
                 next_key = self.api_keys_list[self.current_api_key_index]
 
-                # 키가 할당량 소진으로 쿨다운 중인지 확인
-                last_failure = self.key_quota_failure_times.get(next_key)
-                if last_failure and (time.time() - last_failure) < self._QUOTA_COOLDOWN_SECONDS:
+                # 키가 할당량 소진으로 차단(서킷 open)되어 쿨다운 중인지 확인
+                if not self.key_health.is_available(next_key):
                     key_id = self._get_api_key_identifier(next_key)
-                    logger.info(f"API {key_id}는 최근 할당량 소진으로 인해 건너뜁니다 (쿨다운 중).")
+                    logger.info(f"API {key_id}는 할당량 소진으로 차단되어 건너뜁니다 "
+                                f"(쿨다운 {self.key_health.remaining_cooldown(next_key):.0f}초 남음).")
+                    cooling_down_keys += 1
                     continue  # 쿨다운 중인 키는 건너뛰고 다음 키를 시도
                 
                 # Check if a client for this key exists in our pool
@@ -487,6 +734,11 @@ class GeminiClient:
                     key_id = self._get_api_key_identifier(next_key)
                     logger.warning(f"회전 시도 중 API {key_id}에 대한 클라이언트를 풀에서 찾을 수 없습니다.")
             
+            if cooling_down_keys:
+                # 쿨다운 중인 키만 남은 경우 클라이언트는 유지 (쿨다운 후 확인 요청으로 복구)
+                logger.error("유효한 다음 API 키로 회전하지 못했습니다. 남은 키는 모두 할당량 쿨다운 중입니다.")
+                self.current_api_key_index = original_index
+                return False
             logger.error("유효한 다음 API 키로 회전하지 못했습니다. 모든 풀의 클라이언트가 유효하지 않을 수 있습니다.")
             self.client = None # No valid client found after trying all pooled keys
             logger.debug("API 키 회전: 락 해제.")
@@ -597,13 +849,17 @@ class GeminiClient:
         max_retries: int = 5,
         initial_backoff: float = 2.0,
         max_backoff: float = 60.0,
-        stream: bool = False
+        stream: bool = False,
+        stream_monitor: Optional[Callable[[str], Optional[str]]] = None,
+        stream_monitor_factory: Optional[Callable[[], Callable[[str], Optional[str]]]] = None
     ) -> Optional[Union[str, Any]]:
         """
         비동기 텍스트 생성 메서드 (generate_text의 비동기 버전)
         
         Timeout은 GeminiClient 초기화 시 http_options에 설정되며, 모든 API 호출에 자동 적용됩니다.
         (기본값: _TIMEOUT_SECONDS = 500초)
+        응답 시간 표본이 충분히 쌓이면 시도마다 관측 분포 기반 데드라인(p99 × 배수)이 더 짧게 적용되고,
+        request_time_budget() 안에서 호출되면 남은 청크 시간 예산을 넘지 않습니다.
         
         Args:
             prompt: 프롬프트 (문자열 또는 Content 리스트)
@@ -616,12 +872,17 @@ class GeminiClient:
             initial_backoff: 초기 백오프 시간(초)
             max_backoff: 최대 백오프 시간(초)
             stream: 스트리밍 여부
+            stream_monitor: 스트리밍 시 받은 조각마다 호출, 중단 사유 문자열을 반환하면 스트림을 즉시 중단
+            stream_monitor_factory: 헤지 요청 스트림용 독립 monitor 생성 함수
+                (stream_monitor만 있고 이것이 없으면 상태 공유를 피하려고 헤지하지 않음)
             
         Returns:
             생성된 텍스트 또는 구조화된 출력
             
         Raises:
             asyncio.CancelledError: 작업이 취소된 경우
+            GeminiStreamAbortedException: stream_monitor가 출력 이상으로 중단한 경우
+            GeminiDeadlineExceededException: 청크 시간 예산이 소진된 경우
             GeminiApiException: API 관련 오류
         """
         try:
@@ -629,7 +890,7 @@ class GeminiClient:
                 prompt, model_name, generation_config_dict,
                 safety_settings_list_of_dicts, thinking_budget,
                 system_instruction_text, max_retries,
-                initial_backoff, max_backoff, stream
+                initial_backoff, max_backoff, stream, stream_monitor, stream_monitor_factory
             )
         except asyncio.CancelledError:
             logger.info(f"API 호출이 취소됨: {model_name}")
@@ -646,7 +907,9 @@ class GeminiClient:
         max_retries: int,
         initial_backoff: float,
         max_backoff: float,
-        stream: bool
+        stream: bool,
+        stream_monitor: Optional[Callable[[str], Optional[str]]] = None,
+        stream_monitor_factory: Optional[Callable[[], Callable[[str], Optional[str]]]] = None
     ) -> Optional[Union[str, Any]]:
         """generate_text의 실제 비동기 구현 (client.aio 사용)"""
         if not self.client:
@@ -663,6 +926,11 @@ class GeminiClient:
             final_sdk_contents = prompt
         else:
             raise ValueError("프롬프트는 문자열 또는 Content 객체의 리스트여야 합니다.")
+        # 응답 시간 분포의 크기 구간 산정용 입력 글자 수
+        input_chars = sum(
+            len(part.text) for content in final_sdk_contents
+            for part in (getattr(content, 'parts', None) or []) if isinstance(getattr(part, 'text', None), str)
+        )
 
         total_keys = len(self.api_keys_list) if self.auth_mode == "API_KEY" and self.api_keys_list else 1
         attempted_keys_count = 0
@@ -684,12 +952,29 @@ class GeminiClient:
                 else:
                     raise GeminiApiException("클라이언트가 유효하지 않으며 복구할 수 없습니다 (Vertex).")
             
-            while current_retry_for_this_key <= max_retries:
+            # 차단된 키는 요청 없이 건너뛰고, 쿨다운이 끝난 키(half-open)는 확인 요청 1건만 보냄
+            key_max_retries = max_retries
+            probe_key: Optional[str] = None
+            if self.auth_mode == "API_KEY" and self.current_api_key:
+                if not self.key_health.allow_request(self.current_api_key):
+                    logger.info(f"API {key_id}는 할당량 소진으로 차단 중이어서 요청 없이 건너뜁니다 "
+                                f"(쿨다운 {self.key_health.remaining_cooldown(self.current_api_key):.0f}초 남음).")
+                    attempted_keys_count += 1
+                    if attempted_keys_count < total_keys and await self._rotate_api_key_and_reconfigure():
+                        continue
+                    break
+                if self.key_health.is_probing(self.current_api_key):
+                    key_max_retries = 0
+                    probe_key = self.current_api_key
+
+            while current_retry_for_this_key <= key_max_retries:
+                attempt_timeout: Optional[float] = None
                 try:
                     # RPM 속도 제한 적용 (비동기 버전)
                     await self._apply_rpm_delay()
+                    attempt_timeout = self._attempt_timeout(effective_model_name, input_chars, current_retry_for_this_key)
                     
-                    logger.info(f"모델 '{effective_model_name}'에 텍스트 생성 요청 (시도: {current_retry_for_this_key + 1}/{max_retries + 1})")
+                    logger.info(f"모델 '{effective_model_name}'에 텍스트 생성 요청 (시도: {current_retry_for_this_key + 1}/{key_max_retries + 1})")
                     
                     final_generation_config_params = generation_config_dict.copy() if generation_config_dict else {}
                     if 'http_options' not in final_generation_config_params:
@@ -745,25 +1030,34 @@ class GeminiClient:
                     sdk_generation_config = genai_types.GenerateContentConfig(**final_generation_config_params) if final_generation_config_params else None
                     
                     text_content_from_api: Optional[str] = None
-                    if stream:
-                        response_stream = await self.client.aio.models.generate_content_stream(
+
+                    async def make_call(client: Any, is_hedge: bool,
+                                        config: Any = sdk_generation_config) -> Any:
+                        if stream:
+                            monitor = (stream_monitor_factory() if stream_monitor_factory is not None else None) \
+                                if is_hedge else stream_monitor
+                            return await self._generate_stream_text(
+                                client, effective_model_name, final_sdk_contents, config, monitor)
+                        return await client.aio.models.generate_content(
                             model=effective_model_name,
                             contents=final_sdk_contents,
-                            config=sdk_generation_config
+                            config=config,
                         )
-                        aggregated_parts = []
-                        async for chunk_response in response_stream:
-                            if hasattr(chunk_response, 'text') and chunk_response.text:
-                                aggregated_parts.append(chunk_response.text)
-                            if self._is_content_safety_error(response=chunk_response):
-                                raise GeminiContentSafetyException("콘텐츠 안전 문제로 스트림 응답 차단")
-                        text_content_from_api = "".join(aggregated_parts)
+
+                    result, winner = await self._request_with_hedge(
+                        make_call, effective_model_name, input_chars, attempt_timeout,
+                        hedge_allowed=not (stream and stream_monitor is not None and stream_monitor_factory is None)
+                    )
+                    if stream:
+                        text_content_from_api = result
                     else:
-                        response = await self.client.aio.models.generate_content(
-                            model=effective_model_name,
-                            contents=final_sdk_contents,
-                            config=sdk_generation_config,
-                        )
+                        response = result
+                    # 응답 시간과 성공은 실제로 응답한 요청(헤지일 수 있음)의 키와 시작 시각 기준
+                    if self.latency_tracker is not None:
+                        self.latency_tracker.record(effective_model_name, input_chars, time.monotonic() - winner.started)
+                    if winner.api_key:
+                        self.key_health.record_success(winner.api_key)
+                    if not stream:
                         
                         if sdk_generation_config and sdk_generation_config.response_schema and \
                            sdk_generation_config.response_mime_type == "application/json" and \
@@ -802,13 +1096,16 @@ class GeminiClient:
                     
                     raise GeminiApiException("모델로부터 유효한 텍스트 응답을 받지 못했습니다.")
                 
-                except GeminiContentSafetyException:
+                except (GeminiContentSafetyException, GeminiStreamAbortedException, GeminiDeadlineExceededException):
                     raise
                 except asyncio.CancelledError:
                     logger.info(f"비동기 API 호출이 취소됨: {effective_model_name}")
                     raise
                 except Exception as e:
                     error_message = str(e)
+                    if isinstance(e, asyncio.TimeoutError):
+                        # wait_for 데드라인 초과는 메시지가 비어 있으므로 타임아웃으로 명시
+                        error_message = f"요청 데드라인 {attempt_timeout:.1f}초 초과 (timeout)"
                     logger.warning(f"API 관련 오류 발생: {type(e).__name__} - {error_message}")
                     
                     if self._is_invalid_request_error(e):
@@ -819,9 +1116,9 @@ class GeminiClient:
                     elif self._is_rate_limit_error(e):
                         if self._is_quota_exhausted_error(e):
                             if self.current_api_key:
-                                self.key_quota_failure_times[self.current_api_key] = time.time()
+                                self.key_health.record_quota_failure(self.current_api_key)
                             break
-                        if current_retry_for_this_key < max_retries:
+                        if current_retry_for_this_key < key_max_retries:
                             await asyncio.sleep(current_backoff + random.uniform(0,1))
                             current_retry_for_this_key += 1
                             current_backoff = min(current_backoff * 2, max_backoff)
@@ -829,7 +1126,7 @@ class GeminiClient:
                         else:
                             break
                     elif "timeout" in error_message.lower() or "timed out" in error_message.lower():
-                        if current_retry_for_this_key < max_retries:
+                        if current_retry_for_this_key < key_max_retries:
                             await asyncio.sleep(current_backoff + random.uniform(0,1))
                             current_retry_for_this_key += 1
                             current_backoff = min(current_backoff * 2, max_backoff)
@@ -837,13 +1134,18 @@ class GeminiClient:
                         else:
                             break
                     else:
-                        if current_retry_for_this_key < max_retries:
+                        if current_retry_for_this_key < key_max_retries:
                             await asyncio.sleep(current_backoff + random.uniform(0,1))
                             current_retry_for_this_key += 1
                             current_backoff = min(current_backoff * 2, max_backoff)
                             continue
                         else:
                             break
+                finally:
+                    # 확인 요청(재시도 없음)이 어떤 이유로든 끝나면 다음 확인 요청을 허용
+                    # (성공/할당량 소진은 이미 상태를 전이했으므로 영향 없음)
+                    if probe_key:
+                        self.key_health.release_probe(probe_key)
             
             attempted_keys_count += 1
             if attempted_keys_count < total_keys and self.auth_mode == "API_KEY":
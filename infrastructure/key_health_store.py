@@ -0,0 +1,208 @@
+# key_health_store.py
+"""
+API 키별 서킷 브레이커와 상태 저장소
+
+- 키마다 closed(정상) / open(차단, 쿨다운 중) / half_open(쿨다운 종료, 요청 1건으로 확인 중) 상태를 둡니다.
+- 할당량 소진으로 차단될 때마다 쿨다운이 2배로 늘고(상한 있음), 할당량 날짜가 바뀌면 확인 요청을 허용합니다.
+- 상태와 일일 요청/실패 수를 작은 JSON 파일에 저장해, 새 실행에서도 이미 소진된 키를 요청 없이 건너뜁니다.
+  파일에는 키 원문 대신 해시 지문만 기록합니다.
+"""
+import hashlib
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+try:
+    from .logger_config import setup_logger
+    from .file_handler import read_json_file, write_json_file
+except ImportError:
+    from infrastructure.logger_config import setup_logger
+    from infrastructure.file_handler import read_json_file, write_json_file
+
+logger = setup_logger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+DEFAULT_BASE_COOLDOWN_SECONDS = 100.0
+DEFAULT_MAX_COOLDOWN_SECONDS = 3600.0
+# 요청 수만 바뀐 경우 파일 저장 최소 간격 (상태 변경은 즉시 저장)
+COUNTER_SAVE_INTERVAL_SECONDS = 30.0
+# Gemini 일일 할당량은 태평양 시간 자정에 초기화됨 (서머타임은 무시)
+QUOTA_DAY_TIMEZONE = timezone(timedelta(hours=-8))
+STORE_VERSION = 1
+
+
+def key_fingerprint(api_key: str) -> str:
+    """저장용 키 지문 (원문 키는 파일에 남기지 않음)"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def quota_day(now: Optional[float] = None) -> str:
+    """할당량 기준 날짜 (YYYY-MM-DD)"""
+    return datetime.fromtimestamp(time.time() if now is None else now, QUOTA_DAY_TIMEZONE).strftime("%Y-%m-%d")
+
+
+@dataclass
+class KeyCircuitState:
+    """키 하나의 서킷 상태와 일일 카운터"""
+    state: str = CIRCUIT_CLOSED
+    opened_at: float = 0.0
+    cooldown: float = 0.0
+    trips: int = 0
+    day: str = ""
+    requests: int = 0
+    quota_failures: int = 0
+
+
+class KeyHealthStore:
+    """
+    API 키별 서킷 브레이커 모음.
+    path가 없으면 메모리에서만 유지합니다 (테스트/일회성 클라이언트).
+    """
+
+    def __init__(self,
+                 path: Optional[Union[str, Path]] = None,
+                 base_cooldown: float = DEFAULT_BASE_COOLDOWN_SECONDS,
+                 max_cooldown: float = DEFAULT_MAX_COOLDOWN_SECONDS,
+                 clock=time.time):
+        self.path = Path(path) if path else None
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self._clock = clock
+        self._states: Dict[str, KeyCircuitState] = {}
+        self._probing: set = set()
+        self._last_saved = 0.0
+        self._dirty = False
+        self._load()
+
+    # ------------------------------------------------------------------
+    # 저장/불러오기
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = read_json_file(self.path)
+        except Exception as e:
+            logger.warning(f"⚠️ API 키 상태 파일을 읽지 못해 새로 시작합니다 ({self.path}): {e}")
+            return
+        for fingerprint, record in (data.get("keys") or {}).items():
+            try:
+                self._states[fingerprint] = KeyCircuitState(**record)
+            except TypeError:
+                logger.debug(f"알 수 없는 키 상태 항목 무시: {fingerprint}")
+
+    def save(self) -> None:
+        """현재 상태를 파일에 기록 (path가 없으면 무시)"""
+        if self.path is None:
+            return
+        try:
+            write_json_file(self.path, {
+                "version": STORE_VERSION,
+                "keys": {fp: asdict(state) for fp, state in self._states.items()},
+            }, indent=2)
+            self._last_saved = self._clock()
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"⚠️ API 키 상태 저장 실패 ({self.path}): {e}")
+
+    def _maybe_save(self, state_changed: bool) -> None:
+        self._dirty = True
+        if state_changed or self._clock() - self._last_saved >= COUNTER_SAVE_INTERVAL_SECONDS:
+            self.save()
+
+    def flush(self) -> None:
+        """저장하지 않은 카운터 변경분 기록"""
+        if self._dirty:
+            self.save()
+
+    # ------------------------------------------------------------------
+    # 상태 조회/전이
+    # ------------------------------------------------------------------
+    def _state_for(self, api_key: str) -> KeyCircuitState:
+        fingerprint = key_fingerprint(api_key)
+        state = self._states.setdefault(fingerprint, KeyCircuitState())
+        today = quota_day(self._clock())
+        if state.day != today:
+            # 날짜가 바뀌면 일일 카운터 초기화 (차단된 키는 확인 요청 허용 대상이 됨)
+            state.day = today
+            state.requests = 0
+            state.quota_failures = 0
+            state.trips = 0
+            if state.state == CIRCUIT_OPEN:
+                state.cooldown = 0.0
+        return state
+
+    def state(self, api_key: str) -> str:
+        """현재 상태 (쿨다운이 끝난 open은 half_open으로 보고)"""
+        state = self._state_for(api_key)
+        if state.state == CIRCUIT_OPEN and self._clock() >= state.opened_at + state.cooldown:
+            return CIRCUIT_HALF_OPEN
+        return state.state
+
+    def remaining_cooldown(self, api_key: str) -> float:
+        state = self._state_for(api_key)
+        if state.state != CIRCUIT_OPEN:
+            return 0.0
+        return max(0.0, state.opened_at + state.cooldown - self._clock())
+
+    def is_available(self, api_key: str) -> bool:
+        """요청을 보낼 수 있는 키인지 (확인 요청이 진행 중인 half_open 키는 제외, 상태는 바꾸지 않음)"""
+        current = self.state(api_key)
+        if current == CIRCUIT_CLOSED:
+            return True
+        return current == CIRCUIT_HALF_OPEN and key_fingerprint(api_key) not in self._probing
+
+    def allow_request(self, api_key: str) -> bool:
+        """
+        요청 허용 여부. 쿨다운이 끝난 키는 half_open으로 전이하고 확인 요청 1건만 허용합니다.
+        """
+        if not self.is_available(api_key):
+            return False
+        state = self._state_for(api_key)
+        if self.state(api_key) == CIRCUIT_HALF_OPEN:
+            if state.state != CIRCUIT_HALF_OPEN:
+                state.state = CIRCUIT_HALF_OPEN
+                logger.info(f"🔌 API 키 {key_fingerprint(api_key)[:8]} 쿨다운 종료, 확인 요청 1건 허용 (half-open)")
+                self._maybe_save(state_changed=True)
+            self._probing.add(key_fingerprint(api_key))
+        return True
+
+    def is_probing(self, api_key: str) -> bool:
+        return key_fingerprint(api_key) in self._probing
+
+    def record_request(self, api_key: str) -> None:
+        state = self._state_for(api_key)
+        state.requests += 1
+        self._maybe_save(state_changed=False)
+
+    def record_success(self, api_key: str) -> None:
+        state = self._state_for(api_key)
+        self._probing.discard(key_fingerprint(api_key))
+        if state.state != CIRCUIT_CLOSED:
+            logger.info(f"🔌 API 키 {key_fingerprint(api_key)[:8]} 확인 요청 성공, 정상 상태로 복귀 (closed)")
+            state.state = CIRCUIT_CLOSED
+            state.cooldown = 0.0
+            state.trips = 0
+            self._maybe_save(state_changed=True)
+
+    def record_quota_failure(self, api_key: str) -> None:
+        """할당량 소진: 차단(open)하고 쿨다운을 직전의 2배로 (상한 max_cooldown)"""
+        state = self._state_for(api_key)
+        self._probing.discard(key_fingerprint(api_key))
+        state.trips += 1
+        state.quota_failures += 1
+        state.state = CIRCUIT_OPEN
+        state.opened_at = self._clock()
+        state.cooldown = min(self.max_cooldown, self.base_cooldown * (2 ** (state.trips - 1)))
+        logger.warning(f"🔌 API 키 {key_fingerprint(api_key)[:8]} 할당량 소진으로 차단 (open, "
+                       f"{state.cooldown:.0f}초 쿨다운, 오늘 {state.trips}회째)")
+        self._maybe_save(state_changed=True)
+
+    def release_probe(self, api_key: str) -> None:
+        """확인 요청이 할당량과 무관한 이유로 끝난 경우 다음 확인 요청을 허용"""
+        self._probing.discard(key_fingerprint(api_key))
@@ -0,0 +1,120 @@
+# latency_tracker.py
+"""
+API 응답 지연 분포 추적과 요청별 데드라인 계산
+
+- 모델 × 입력 크기 구간별로 최근 응답 시간을 모아 분위수(p99 등)를 구하고,
+  요청마다 `p99 × 배수`(하한/상한 적용)를 데드라인으로 씁니다.
+  고정 타임아웃(api_timeout)은 가장 느린 경우에 맞춰져 있어서,
+  멈춘 요청을 알아차리기까지 대부분의 시간을 헛되이 기다리게 됩니다.
+- 청크 단위 시간 예산: `request_time_budget()` 블록 안의 모든 요청(재시도, 콘텐츠 안전 분할로
+  생긴 하위 요청 포함)이 하나의 종료 시각을 나눠 씁니다. 종료 시각은 contextvar에 있으므로
+  블록 안에서 만든 asyncio Task에도 그대로 전달됩니다.
+"""
+import bisect
+import contextvars
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+# 분포를 유지할 최근 표본 수 (모델 × 크기 구간별)
+LATENCY_WINDOW = 200
+# 이보다 표본이 적으면 분포를 믿지 않고 고정 타임아웃 사용
+MIN_LATENCY_SAMPLES = 20
+DEFAULT_DEADLINE_QUANTILE = 0.99
+DEFAULT_DEADLINE_FACTOR = 3.0
+DEFAULT_MIN_DEADLINE_SECONDS = 60.0
+# 입력 크기 구간: 1,000자 미만 / 1~2천 / 2~4천 / ... / 32,000자 이상 (2배 간격)
+SIZE_BUCKET_BASE_CHARS = 1000
+MAX_SIZE_BUCKET = 6
+
+_request_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "btg_request_deadline", default=None
+)
+
+
+def size_bucket(input_chars: int) -> int:
+    """입력 글자 수를 2배 간격의 크기 구간 번호로 변환"""
+    if input_chars < SIZE_BUCKET_BASE_CHARS:
+        return 0
+    return min(MAX_SIZE_BUCKET, int(math.log2(input_chars / SIZE_BUCKET_BASE_CHARS)) + 1)
+
+
+class LatencyTracker:
+    """모델 × 입력 크기 구간별 응답 시간 분포 (최근 window개 표본, 정렬 상태 유지)"""
+
+    def __init__(self,
+                 factor: float = DEFAULT_DEADLINE_FACTOR,
+                 min_deadline: float = DEFAULT_MIN_DEADLINE_SECONDS,
+                 max_deadline: Optional[float] = None,
+                 quantile: float = DEFAULT_DEADLINE_QUANTILE,
+                 window: int = LATENCY_WINDOW,
+                 min_samples: int = MIN_LATENCY_SAMPLES):
+        self.factor = factor
+        self.min_deadline = min_deadline
+        self.max_deadline = max_deadline
+        self.quantile_level = quantile
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[Tuple[str, int], Deque[float]] = {}
+        self._sorted: Dict[Tuple[str, int], List[float]] = {}
+
+    def record(self, model: str, input_chars: int, seconds: float) -> None:
+        """성공한 요청의 응답 시간 기록 (가장 오래된 표본은 밀려남)"""
+        key = (model, size_bucket(input_chars))
+        samples = self._samples.setdefault(key, deque())
+        ordered = self._sorted.setdefault(key, [])
+        if len(samples) >= self.window:
+            evicted = samples.popleft()
+            del ordered[bisect.bisect_left(ordered, evicted)]
+        samples.append(seconds)
+        bisect.insort(ordered, seconds)
+
+    def sample_count(self, model: str, input_chars: int) -> int:
+        return len(self._samples.get((model, size_bucket(input_chars)), ()))
+
+    def quantile(self, model: str, input_chars: int, q: Optional[float] = None) -> Optional[float]:
+        """해당 구간의 q 분위 응답 시간 (표본 부족 시 None)"""
+        ordered = self._sorted.get((model, size_bucket(input_chars)))
+        if not ordered or len(ordered) < self.min_samples:
+            return None
+        level = self.quantile_level if q is None else q
+        index = min(len(ordered) - 1, max(0, math.ceil(level * len(ordered)) - 1))
+        return ordered[index]
+
+    def deadline(self, model: str, input_chars: int) -> Optional[float]:
+        """분위수 × 배수를 [min_deadline, max_deadline]으로 제한한 요청 데드라인 (표본 부족 시 None)"""
+        observed = self.quantile(model, input_chars)
+        if observed is None:
+            return None
+        deadline = max(self.min_deadline, observed * self.factor)
+        if self.max_deadline is not None:
+            deadline = min(deadline, self.max_deadline)
+        return deadline
+
+
+@contextmanager
+def request_time_budget(seconds: Optional[float]) -> Iterator[None]:
+    """
+    블록 안의 모든 API 요청이 나눠 쓰는 시간 예산 설정.
+    중첩되면 더 이른 종료 시각이 적용되며, 0 이하/None이면 아무 것도 하지 않습니다.
+    """
+    if not seconds or seconds <= 0:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _request_deadline.get()
+    token = _request_deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+def remaining_request_budget() -> Optional[float]:
+    """현재 시간 예산의 남은 초 (예산이 없으면 None, 소진되면 0 이하)"""
+    deadline = _request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
@@ -74,12 +74,12 @@ Tqdm = tqdm
 
 try:
     from app.app_service import AppService
-    from core.dtos import TranslationJobProgressDTO, GlossaryExtractionProgressDTO
+    from core.dtos import TranslationJobProgressDTO, GlossaryExtractionProgressDTO, BatchTranslationProgressDTO
     from core.exceptions import BtgException
     from infrastructure.logger_config import setup_logger
     from infrastructure.file_handler import (
         read_text_file, get_metadata_file_path, load_metadata,
-        _hash_config_for_metadata, delete_file
+        _hash_config_for_metadata, metadata_has_content_hashes, delete_file
     )
 except ImportError as e:
     print(f"오류: 필요한 모듈을 임포트할 수 없습니다. PYTHONPATH를 확인하거나 "
@@ -124,6 +124,37 @@ def cli_translation_progress_callback(dto: TranslationJobProgressDTO):
             tqdm_instance.close()
             if task_id in tqdm_instances: del tqdm_instances[task_id]
 
+def cli_batch_translation_progress_callback(dto: BatchTranslationProgressDTO):
+    """작업 큐(--job-queue) 전체 진행률 표시. 파일이 청킹될 때마다 전체 청크 수가 늘어납니다."""
+    global tqdm_instances
+    task_id = "batch_translation"
+
+    with tqdm_lock:
+        if dto.total_chunks <= 0:
+            return
+        tqdm_instance = tqdm_instances.get(task_id)
+        if tqdm_instance is not None and dto.processed_chunks < tqdm_instance.n:
+            # --watch: 새 작업 묶음은 처리 수가 0부터 다시 시작하므로 진행 표시줄도 새로 만듦
+            tqdm_instance.close()
+            tqdm_instance = None
+        if tqdm_instance is None:
+            tqdm_instance = Tqdm(total=dto.total_chunks, desc="작업 큐 번역", unit="청크", leave=False, file=sys.stdout, smoothing=0.1)
+            tqdm_instances[task_id] = tqdm_instance
+        elif tqdm_instance.total != dto.total_chunks:
+            tqdm_instance.total = dto.total_chunks
+            if hasattr(tqdm_instance, "refresh"):
+                tqdm_instance.refresh()
+
+        if dto.processed_chunks > tqdm_instance.n:
+            tqdm_instance.update(dto.processed_chunks - tqdm_instance.n)
+
+        postfix_info = {
+            "파일": f"{dto.completed_files + dto.failed_files}/{dto.total_files}",
+            "진행중": dto.active_files,
+        }
+        if dto.failed_chunks > 0: postfix_info["실패"] = dto.failed_chunks
+        tqdm_instance.set_postfix(postfix_info, refresh=True)
+
 def cli_translation_status_callback(message: str):
     Tqdm.write(f"번역 상태: {message}", file=sys.stdout)
 
@@ -185,6 +216,11 @@ def parse_arguments():
     resume_group.add_argument("--resume", action="store_true", help="이전 번역 작업을 이어받아 계속합니다.")
     resume_group.add_argument("--force-new", action="store_true", help="기존 작업 내역을 무시하고 강제로 새로 번역을 시작합니다.")
 
+    parser.add_argument("--job-queue", action="store_true", help="여러 입력 파일을 하나의 작업 큐로 동시에 번역합니다 (청크가 동시성/RPM 제한을 공유).")
+    parser.add_argument("--max-concurrent-files", type=int, default=None, help="--job-queue 사용 시 동시에 진행할 파일 수 (기본값: 설정의 max_concurrent_files)")
+    parser.add_argument("--watch", action="store_true", help="입력 파일/디렉토리를 감시하며 추가·변경된 구간만 번역하고 최종 출력을 증분 갱신합니다 (Ctrl+C로 종료).")
+    parser.add_argument("--watch-interval", type=float, default=None, help="--watch 사용 시 확인 주기(초) (기본값: 설정의 watch_poll_interval)")
+
     parser.add_argument("--log_level", choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'], default='INFO', help="로그 레벨 설정 (기본값: INFO)")
     parser.add_argument("--log_file", type=Path, default=None, help="로그를 저장할 파일 경로 (기본값: btg_cli.log)")
 
@@ -204,6 +240,78 @@ def parse_arguments():
     config_override_group.add_argument("--user-override-glossary-prompt", type=str, help="용어집 추출 시 사용할 사용자 정의 프롬프트를 설정합니다.")
     return parser.parse_args()
 
+def prepare_translation_output(args: argparse.Namespace, app_service: AppService, input_file: Path) -> Path:
+    """
+    입력 파일의 출력 경로를 결정하고 이어하기/새로 시작 여부를 판단합니다.
+    새로 시작하는 경우 기존 메타데이터와 출력 파일을 삭제합니다.
+    """
+    output_file = args.output_file
+    if output_file and args.job_queue and len(args.input_files) > 1:
+        # 동시에 진행되는 파일들이 하나의 출력 파일을 덮어쓰지 않도록 파일별 경로 사용
+        cli_logger.warning("--job-queue로 여러 파일을 번역할 때는 -o 옵션을 무시하고 파일별 출력 경로를 사용합니다.")
+        output_file = None
+    if not output_file: # 출력 파일이 지정되지 않은 경우, 각 입력 파일에 맞춰 자동 생성
+        output_file = input_file.parent / f"{input_file.stem}_translated{input_file.suffix}"
+    
+    cli_logger.info(f"출력 파일: {output_file}")
+
+    metadata_file_path = get_metadata_file_path(input_file)
+    loaded_metadata = load_metadata(metadata_file_path)
+    current_config_hash = _hash_config_for_metadata(app_service.config)
+    previous_config_hash = loaded_metadata.get("config_hash")
+    # 콘텐츠 해시가 기록된 작업은 청크 크기가 바뀌어도 내용이 같은 청크를 재사용할 수 있음
+    can_reuse_by_content = metadata_has_content_hashes(loaded_metadata)
+
+    should_start_new = False
+
+    if args.force_new:
+        cli_logger.info("--force-new 옵션으로 강제 새로 번역을 시작합니다.")
+        should_start_new = True
+    elif args.resume:
+        if previous_config_hash and previous_config_hash == current_config_hash:
+            cli_logger.info("--resume 옵션 및 설정 일치로 이어하기를 시도합니다.")
+        elif previous_config_hash and can_reuse_by_content:
+            cli_logger.info("설정이 이전 작업과 다릅니다. 콘텐츠 해시가 같은 청크의 번역을 재사용하여 이어갑니다.")
+        elif previous_config_hash:
+            cli_logger.warning("설정이 이전 작업과 다릅니다. --resume 옵션이 무시되고 새로 번역을 시작합니다.")
+            should_start_new = True
+        else:
+            cli_logger.info("이전 작업 내역이 없습니다. 새로 번역을 시작합니다. (--resume 옵션 무시)")
+            should_start_new = True
+    else:
+        if previous_config_hash and (previous_config_hash == current_config_hash or can_reuse_by_content):
+            Tqdm.write(
+                f"'{input_file.name}'에 대한 이전 번역 작업 내역이 있습니다.\n"
+                f"  이어하려면: --resume\n"
+                f"  새로 시작하려면: --force-new\n"
+                "옵션 없이 실행하면 새로 번역을 시작합니다 (기존 내역 삭제). 계속하시겠습니까? [y/N]: ",
+                file=sys.stdout
+            )
+            try:
+                answer = input().lower()
+                if answer != 'y':
+                    cli_logger.info("사용자 취소.")
+                    sys.exit(0)
+                cli_logger.info("사용자 동의 하에 새로 번역을 시작합니다.")
+                should_start_new = True
+            except Exception:
+                cli_logger.info("입력 오류 또는 시간 초과로 프로그램을 종료합니다. 옵션을 명시하여 다시 실행해주세요.")
+                sys.exit(0)
+        elif previous_config_hash and previous_config_hash != current_config_hash:
+            cli_logger.info("설정이 이전 작업과 다릅니다. 새로 번역을 시작합니다.")
+            should_start_new = True
+        else:
+            cli_logger.info("이전 작업 내역이 없습니다. 새로 번역을 시작합니다.")
+            should_start_new = True
+
+    if should_start_new:
+        cli_logger.info("새로 번역을 위해 기존 메타데이터 및 출력 파일을 삭제합니다.")
+        if metadata_file_path.exists(): delete_file(metadata_file_path)
+        if output_file.exists(): delete_file(output_file)
+
+    return output_file
+
+
 def main():
     args = parse_arguments()
 
@@ -217,6 +325,7 @@ def main():
     if args.force_new: cli_logger.info("새로 시작 옵션 (--force-new) 활성화됨.")
 
 
+    app_service: Optional[AppService] = None
     try:
         app_service = AppService(config_file_path=args.config)
         
@@ -336,80 +445,69 @@ def main():
             total_files = len(args.input_files)
             cli_logger.info(f"총 {total_files}개의 파일에 대한 번역을 시작합니다.")
 
-            for i, input_file in enumerate(args.input_files):
-                cli_logger.info(f"--- 파일 {i+1}/{total_files} 처리 시작: {input_file} ---")
-
-                if not input_file.exists():
-                    cli_logger.error(f"입력 파일을 찾을 수 없습니다: {input_file}. 이 파일을 건너뜁니다.")
-                    continue
-
-                output_file = args.output_file
-                if not output_file: # 출력 파일이 지정되지 않은 경우, 각 입력 파일에 맞춰 자동 생성
-                    output_file = input_file.parent / f"{input_file.stem}_translated{input_file.suffix}"
-                
-                cli_logger.info(f"출력 파일: {output_file}")
-
-                metadata_file_path = get_metadata_file_path(input_file)
-                loaded_metadata = load_metadata(metadata_file_path)
-                current_config_hash = _hash_config_for_metadata(app_service.config)
-                previous_config_hash = loaded_metadata.get("config_hash")
-
-                should_start_new = False
-
-                if args.force_new:
-                    cli_logger.info("--force-new 옵션으로 강제 새로 번역을 시작합니다.")
-                    should_start_new = True
-                elif args.resume:
-                    if previous_config_hash and previous_config_hash == current_config_hash:
-                        cli_logger.info("--resume 옵션 및 설정 일치로 이어하기를 시도합니다.")
-                    elif previous_config_hash:
-                        cli_logger.warning("설정이 이전 작업과 다릅니다. --resume 옵션이 무시되고 새로 번역을 시작합니다.")
-                        should_start_new = True
-                    else:
-                        cli_logger.info("이전 작업 내역이 없습니다. 새로 번역을 시작합니다. (--resume 옵션 무시)")
-                        should_start_new = True
-                else:
-                    if previous_config_hash and previous_config_hash == current_config_hash:
-                        Tqdm.write(
-                            f"'{input_file.name}'에 대한 이전 번역 작업 내역이 있습니다.\n"
-                            f"  이어하려면: --resume\n"
-                            f"  새로 시작하려면: --force-new\n"
-                            "옵션 없이 실행하면 새로 번역을 시작합니다 (기존 내역 삭제). 계속하시겠습니까? [y/N]: ",
-                            file=sys.stdout
+            if args.watch:
+                # 감시 모드는 항상 이어하기로 동작 (콘텐츠 해시가 같은 청크는 재사용)
+                output_file = args.output_file if len(args.input_files) == 1 else None
+                if args.output_file and output_file is None:
+                    cli_logger.warning("여러 경로를 감시할 때는 -o 옵션을 무시하고 파일별 출력 경로를 사용합니다.")
+                cli_logger.info(f"감시 모드: {', '.join(str(p) for p in args.input_files)}")
+                try:
+                    asyncio.run(
+                        app_service.watch_translation_async(
+                            args.input_files,
+                            output_file_path=output_file,
+                            poll_interval=args.watch_interval,
+                            progress_callback=cli_batch_translation_progress_callback,
+                            status_callback=cli_translation_status_callback
                         )
-                        try:
-                            answer = input().lower()
-                            if answer != 'y':
-                                cli_logger.info("사용자 취소.")
-                                sys.exit(0)
-                            cli_logger.info("사용자 동의 하에 새로 번역을 시작합니다.")
-                            should_start_new = True
-                        except Exception:
-                            cli_logger.info("입력 오류 또는 시간 초과로 프로그램을 종료합니다. 옵션을 명시하여 다시 실행해주세요.")
-                            sys.exit(0)
-                    elif previous_config_hash and previous_config_hash != current_config_hash:
-                        cli_logger.info("설정이 이전 작업과 다릅니다. 새로 번역을 시작합니다.")
-                        should_start_new = True
-                    else:
-                        cli_logger.info("이전 작업 내역이 없습니다. 새로 번역을 시작합니다.")
-                        should_start_new = True
-
-                if should_start_new:
-                    cli_logger.info("새로 번역을 위해 기존 메타데이터 및 출력 파일을 삭제합니다.")
-                    if metadata_file_path.exists(): delete_file(metadata_file_path)
-                    if output_file.exists(): delete_file(output_file)
-
-                # 비동기 번역을 동기 방식으로 래핑 (CLI 호환성)
-                asyncio.run(
-                    app_service.start_translation_async(
-                        input_file,
-                        output_file,
-                        progress_callback=cli_translation_progress_callback,
-                        status_callback=cli_translation_status_callback,
-                        tqdm_file_stream=sys.stdout
+                    )
+                except KeyboardInterrupt:
+                    cli_logger.info("사용자 요청으로 감시 모드를 종료합니다.")
+            elif args.job_queue:
+                file_pairs = []
+                for input_file in args.input_files:
+                    if not input_file.exists():
+                        cli_logger.error(f"입력 파일을 찾을 수 없습니다: {input_file}. 이 파일을 건너뜁니다.")
+                        continue
+                    file_pairs.append((input_file, prepare_translation_output(args, app_service, input_file)))
+
+                cli_logger.info(f"작업 큐 모드: {len(file_pairs)}개 파일을 하나의 이벤트 루프에서 번역합니다.")
+                jobs = asyncio.run(
+                    app_service.start_batch_translation_async(
+                        file_pairs,
+                        max_concurrent_files=args.max_concurrent_files,
+                        progress_callback=cli_batch_translation_progress_callback,
+                        status_callback=cli_translation_status_callback
                     )
                 )
-                cli_logger.info(f"--- 파일 {i+1}/{total_files} 처리 완료: {input_file} ---")
+                for job in jobs:
+                    if job.status == "completed":
+                        Tqdm.write(f"  ✅ {job.input_file_path.name} → {job.output_file_path}", file=sys.stdout)
+                    else:
+                        Tqdm.write(f"  ❌ {job.input_file_path.name}: {job.status} {job.error_message or ''}", file=sys.stdout)
+                if any(job.status != "completed" for job in jobs):
+                    cli_logger.warning("작업 큐에서 일부 파일이 완료되지 않았습니다.")
+            else:
+                for i, input_file in enumerate(args.input_files):
+                    cli_logger.info(f"--- 파일 {i+1}/{total_files} 처리 시작: {input_file} ---")
+
+                    if not input_file.exists():
+                        cli_logger.error(f"입력 파일을 찾을 수 없습니다: {input_file}. 이 파일을 건너뜁니다.")
+                        continue
+
+                    output_file = prepare_translation_output(args, app_service, input_file)
+
+                    # 비동기 번역을 동기 방식으로 래핑 (CLI 호환성)
+                    asyncio.run(
+                        app_service.start_translation_async(
+                            input_file,
+                            output_file,
+                            progress_callback=cli_translation_progress_callback,
+                            status_callback=cli_translation_status_callback,
+                            tqdm_file_stream=sys.stdout
+                        )
+                    )
+                    cli_logger.info(f"--- 파일 {i+1}/{total_files} 처리 완료: {input_file} ---")
             
             Tqdm.write(f"\n모든 번역 작업 완료.", file=sys.stdout)
 
@@ -427,6 +525,8 @@ def main():
                 if tqdm_instances[task_id]:
                     tqdm_instances[task_id].close() # type: ignore
                 del tqdm_instances[task_id] # type: ignore
+        if app_service is not None:
+            app_service.shutdown()
         cli_logger.info("BTG CLI 종료.")
 
 
@@ -0,0 +1,104 @@
+"""
+청크 분할 성능 벤치마크
+
+기존 구현(splitlines 목록 + current_chunk += line)과 오프셋 기반 iter_chunk_spans를
+같은 합성 원문으로 비교하고, 청크 경계가 완전히 같은지 확인합니다.
+시간은 tracemalloc 없이 재고, 최대 추가 메모리는 tracemalloc을 켠 별도 실행에서 측정합니다.
+
+사용법:
+    python test/benchmark_chunking.py --size-mb 100 --chunk-size 10000
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.chunk_service import ChunkService  # noqa: E402
+
+LINES = [
+    "他沉默了很久，终于开口说道：「我不会再回来了。」",
+    "窗外的雨越下越大，街道上已经看不到行人。",
+    "The wind carried the smell of rain across the empty square.",
+    "「……」",
+    "",
+]
+
+
+def legacy_split(text_content: str, max_chunk_size: int):
+    """변경 전 ChunkService.split_text_into_chunks"""
+    chunks = []
+    current_chunk = ""
+    for line in text_content.splitlines(keepends=True):
+        if len(current_chunk) + len(line) <= max_chunk_size:
+            current_chunk += line
+        else:
+            if current_chunk:
+                chunks.append(current_chunk)
+            if len(line) > max_chunk_size:
+                for i in range(0, len(line), max_chunk_size):
+                    chunks.append(line[i:i + max_chunk_size])
+                current_chunk = ""
+            else:
+                current_chunk = line
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
+def make_text(size_mb: float, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    block = "".join(rng.choice(LINES) + "\n" for _ in range(20000))
+    return (block * (target // len(block) + 1))[:target]
+
+
+def measure(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc은 할당마다 비용이 들어 시간 측정과 분리
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<34} {elapsed:8.2f} s   최대 추가 메모리 {peak / 1024 / 1024:8.1f} MB")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="청크 분할 벤치마크")
+    parser.add_argument("--size-mb", type=float, default=100)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    service = ChunkService()
+    text = make_text(args.size_mb)
+    print(f"원문 {len(text):,}자 ({args.size_mb} MB 기준), chunk_size={args.chunk_size}\n")
+
+    legacy, t_legacy = measure("기존 (splitlines + +=)", lambda: legacy_split(text, args.chunk_size))
+    spans, t_spans = measure("iter_chunk_spans (오프셋만)", lambda: list(service.iter_chunk_spans(text, args.chunk_size)))
+    chunks, t_chunks = measure("split_text_into_chunks (문자열)", lambda: service.split_text_into_chunks(text, args.chunk_size))
+
+    lazy_count = 0
+    start = time.perf_counter()
+    for _ in service.iter_chunks(text, args.chunk_size):
+        lazy_count += 1
+    t_lazy = time.perf_counter() - start
+    print(f"{'iter_chunks (지연, 하나씩)':<34} {t_lazy:8.2f} s")
+
+    assert chunks == legacy, "청크 경계가 기존 구현과 다릅니다"
+    assert [text[s:e] for s, e in spans] == legacy
+    assert lazy_count == len(legacy)
+    print(f"\n청크 {len(legacy):,}개 경계 일치 확인 완료")
+    print(f"속도: 오프셋 x{t_legacy / t_spans:.2f}, 문자열 x{t_legacy / t_chunks:.2f}")
+
+
+if __name__ == "__main__":
+    main()
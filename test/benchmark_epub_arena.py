@@ -0,0 +1,82 @@
+"""
+EPUB 챕터 파싱/재조립 벤치마크
+
+기존 경로(BeautifulSoup → 노드마다 EpubNode → reconstruct_chapter)와
+노드 아레나(원문 범위 배열 → reconstruct_arena 범위 치환)의 시간과 최대 추가 메모리를 비교합니다.
+
+사용법:
+    python test/benchmark_epub_arena.py --paragraphs 20000
+"""
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.dtos import NodeType  # noqa: E402
+from utils.epub_processor import EpubProcessor  # noqa: E402
+
+PARAGRAPHS = [
+    '<p class="txt">他沉默了很久，终于开口说道：<span class="em">「我不会再回来了。」</span></p>',
+    '<p class="txt"><ruby>窗<rt>まど</rt></ruby>外的雨越下越大，街道上已经看不到行人。</p>',
+    '<div class="box"><p>「……」</p><br/><p>她轻轻地叹了口气。</p></div>',
+    '<p class="img"><img src="../Images/p1.jpg" alt=""/></p>',
+]
+
+
+def make_chapter(paragraphs: int) -> bytes:
+    body = "\n".join(PARAGRAPHS[i % len(PARAGRAPHS)] for i in range(paragraphs))
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n<!DOCTYPE html>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><head><title>第一章</title></head>\n'
+        f'<body>\n{body}\n</body></html>'
+    ).encode("utf-8")
+
+
+def legacy(processor, content):
+    chapter = processor.process_chapter(content, "ch.xhtml")
+    translated = {n.id: "번역" for n in chapter.nodes if n.type == NodeType.TEXT}
+    return processor.reconstruct_chapter(chapter, translated).encode("utf-8"), len(translated)
+
+
+def arena(processor, content):
+    chapter = processor.parse_chapter(content, "ch.xhtml")
+    translated = {chapter.node_id(i): "번역" for i in chapter.text_indices()}
+    return processor.reconstruct_arena(chapter, translated), len(translated)
+
+
+def measure(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<32} {elapsed:8.2f} s   최대 추가 메모리 {peak / 1024 / 1024:8.1f} MB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EPUB 노드 아레나 벤치마크")
+    parser.add_argument("--paragraphs", type=int, default=20000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    warnings.filterwarnings("ignore")
+    processor = EpubProcessor()
+    content = make_chapter(args.paragraphs)
+    print(f"챕터 {len(content) / 1024 / 1024:.1f} MB, 문단 {args.paragraphs:,}개\n")
+
+    _, legacy_count = measure("EpubNode + reconstruct_chapter", lambda: legacy(processor, content))
+    _, arena_count = measure("노드 아레나 + 범위 치환", lambda: arena(processor, content))
+    assert legacy_count == arena_count, (legacy_count, arena_count)
+    print(f"\n번역 대상 노드 {arena_count:,}개 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+EPUB 출력 조립 성능 벤치마크
+
+이미지가 많은 합성 EPUB에서 모든 챕터를 교체한 출력 파일을 만들 때,
+기존 방식(모든 항목 압축 해제 후 ZIP_DEFLATED로 순차 재압축)과 EpubAssembler
+(바뀌지 않은 항목은 압축 데이터 그대로 복사, 바뀐 챕터는 스레드 풀에서 압축)를 비교하고
+두 결과의 내용이 같은지 확인합니다.
+시간은 tracemalloc 없이 재고, 최대 추가 메모리는 tracemalloc을 켠 별도 실행에서 측정합니다.
+
+사용법:
+    python test/benchmark_epub_assembler.py --images 300 --image-kb 400 --chapters 80
+"""
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.epub_assembler import EpubAssembler  # noqa: E402
+
+PARAGRAPH = "<p>他沉默了很久，终于开口说道：「我不会再回来了。」窗外的雨越下越大。</p>\n"
+
+
+def make_epub(path: Path, images: int, image_kb: int, chapters: int, seed: int = 7):
+    rng = random.Random(seed)
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        z.writestr("OEBPS/content.opf", "<package/>", compress_type=zipfile.ZIP_DEFLATED)
+        for i in range(chapters):
+            body = PARAGRAPH * rng.randint(200, 400)
+            z.writestr(f"OEBPS/ch{i:03d}.xhtml", f"<html><body>{body}</body></html>", compress_type=zipfile.ZIP_DEFLATED)
+        for i in range(images):
+            # JPEG처럼 거의 압축되지 않는 데이터 (일부 반복 구간 포함)
+            noise = rng.randbytes(image_kb * 1024 * 3 // 4)
+            z.writestr(f"OEBPS/images/{i:04d}.jpg", noise + noise[:image_kb * 256], compress_type=zipfile.ZIP_DEFLATED)
+
+
+def translated_chapters(path: Path):
+    with zipfile.ZipFile(path) as z:
+        return {
+            name: z.read(name).replace(b"<p>", b"<p>KO ")
+            for name in z.namelist() if name.endswith(".xhtml")
+        }
+
+
+def legacy_assemble(source: Path, output: Path, replacements):
+    """변경 전 translate_epub의 출력 단계"""
+    with zipfile.ZipFile(source, "r") as zin, zipfile.ZipFile(output, "w") as zout:
+        zout.writestr("mimetype", zin.read("mimetype"), compress_type=zipfile.ZIP_STORED)
+        for item in zin.infolist():
+            if item.filename == "mimetype":
+                continue
+            content = replacements.get(item.filename)
+            if content is None:
+                content = zin.read(item.filename)
+            zout.writestr(item, content, compress_type=zipfile.ZIP_DEFLATED)
+
+
+def measure(label, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc은 할당마다 비용이 들어 시간 측정과 분리
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<34} {elapsed:8.2f} s   최대 추가 메모리 {peak / 1024 / 1024:8.1f} MB")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EPUB 출력 조립 벤치마크")
+    parser.add_argument("--images", type=int, default=300)
+    parser.add_argument("--image-kb", type=int, default=400)
+    parser.add_argument("--chapters", type=int, default=80)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        source = tmp_dir / "book.epub"
+        make_epub(source, args.images, args.image_kb, args.chapters)
+        replacements = translated_chapters(source)
+        print(f"원본 {source.stat().st_size / 1024 / 1024:.1f} MB, 이미지 {args.images}개, 챕터 {args.chapters}개 (모두 교체)\n")
+
+        legacy_out = tmp_dir / "legacy.epub"
+        new_out = tmp_dir / "assembled.epub"
+        t_legacy = measure("기존 (전체 재압축, 순차)", lambda: legacy_assemble(source, legacy_out, replacements))
+        t_new = measure("EpubAssembler (원본 복사 + 병렬)", lambda: EpubAssembler(source).assemble(new_out, replacements))
+
+        with zipfile.ZipFile(legacy_out) as a, zipfile.ZipFile(new_out) as b:
+            assert b.testzip() is None
+            assert a.namelist() == b.namelist()
+            assert b.infolist()[0].filename == "mimetype" and b.infolist()[0].compress_type == zipfile.ZIP_STORED
+            for name in a.namelist():
+                assert a.read(name) == b.read(name), name
+        print(f"\n항목 {len(replacements)}개 교체 결과 일치 확인 완료")
+        print(f"속도: x{t_legacy / t_new:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+무결성 모드 전송 형식 오버헤드 벤치마크
+
+같은 합성 원문(대화가 많은 소설, EPUB 노드 id)을 JSON 객체 배열과 간결한 ⟦n⟧ 형식으로
+직렬화하여 요청/응답 페이로드 크기를 비교합니다. 실제 토크나이저 없이 측정하므로
+문자 수와 UTF-8 바이트 수, 그리고 "본문 외 오버헤드"(페이로드 - 순수 텍스트)를 기준으로 봅니다.
+
+사용법:
+    python test/benchmark_integrity_wire_format.py --units 200
+"""
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.dtos import TranslationUnit  # noqa: E402
+from utils.integrity_wire_format import encode_compact_units, parse_compact_response  # noqa: E402
+
+LINES = [
+    "「你要去哪里？」",
+    "「回家。」",
+    "他沉默了很久，终于开口说道：「我不会再回来了。」",
+    "窗外的雨越下越大，街道上已经看不到行人。",
+    "「……」",
+    "她轻轻地叹了口气，把手中的信折好放进口袋里。",
+]
+TRANSLATED = [
+    "\"어디 가?\"",
+    "\"집에.\"",
+    "그는 한참을 침묵하다가 마침내 입을 열었다. \"다시는 돌아오지 않을 거야.\"",
+    "창밖의 비는 점점 거세졌고, 거리에는 이미 행인이 보이지 않았다.",
+    "\"…….\"",
+    "그녀는 가볍게 한숨을 쉬고 손에 든 편지를 접어 주머니에 넣었다.",
+]
+
+
+def make_units(count: int, id_style: str, seed: int = 42):
+    rng = random.Random(seed)
+    units, translations = [], {}
+    for i in range(count):
+        k = rng.randrange(len(LINES))
+        unit_id = str(i) if id_style == "line" else f"OEBPS/Text/chapter0001.xhtml_{i}"
+        units.append(TranslationUnit(id=unit_id, text=LINES[k]))
+        translations[unit_id] = TRANSLATED[k]
+    return units, translations
+
+
+def measure(units, translations):
+    text_chars = sum(len(u.text) for u in units)
+    out_chars = sum(len(t) for t in translations.values())
+
+    json_request = json.dumps([u.model_dump() for u in units], ensure_ascii=False)
+    json_response = json.dumps(
+        [{"id": u.id, "translated_text": translations[u.id]} for u in units], ensure_ascii=False
+    )
+    compact_request = encode_compact_units(units)
+    compact_response = encode_compact_units(
+        [TranslationUnit(id=u.id, text=translations[u.id]) for u in units]
+    )
+    assert parse_compact_response(compact_response, units) == translations
+
+    rows = []
+    for label, request, response in (
+        ("JSON 객체 배열", json_request, json_response),
+        ("간결한 ⟦n⟧ 형식", compact_request, compact_response),
+    ):
+        rows.append((
+            label,
+            len(request), len(request.encode("utf-8")), len(request) - text_chars,
+            len(response), len(response.encode("utf-8")), len(response) - out_chars,
+        ))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="무결성 전송 형식 벤치마크")
+    parser.add_argument("--units", type=int, default=200)
+    args = parser.parse_args()
+
+    for id_style, title in (("line", "텍스트 무결성 모드 (id=줄 번호)"), ("epub", "EPUB 모드 (id=파일명_인덱스)")):
+        units, translations = make_units(args.units, id_style)
+        rows = measure(units, translations)
+        print(f"\n[{title}] 단위 {len(units)}개")
+        print(f"{'형식':<16}{'요청 문자':>10}{'요청 바이트':>12}{'요청 오버헤드':>14}"
+              f"{'응답 문자':>10}{'응답 바이트':>12}{'응답 오버헤드':>14}")
+        for label, *values in rows:
+            print(f"{label:<16}" + "".join(f"{v:>12,}" for v in values))
+        (_, jreq, _, jreq_over, jres, _, jres_over), (_, creq, _, creq_over, cres, _, cres_over) = rows
+        print(f"요청 크기 {creq / jreq * 100:.0f}%, 응답 크기 {cres / jres * 100:.0f}% "
+              f"(오버헤드 {jreq_over + jres_over:,} → {creq_over + cres_over:,}자)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+무결성 줄 저장소 벤치마크
+
+검토 탭/무결성 모드의 기존 경로(splitlines → 줄마다 TranslationUnit → split_nodes_into_chunks → 청크 원문 조립)와
+LineStore(원문 + 오프셋 배열 → 줄 길이로 청크 범위 → 청크 원문 조립)의 시간과 최대 추가 메모리를 비교합니다.
+
+사용법:
+    python test/benchmark_line_store.py --lines 200000
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.dtos import TranslationUnit  # noqa: E402
+from utils.chunk_service import ChunkService  # noqa: E402
+from utils.line_store import LineStore  # noqa: E402
+
+LINES = [
+    "他沉默了很久，终于开口说道：「我不会再回来了。」",
+    "窗外的雨越下越大，街道上已经看不到行人。",
+    "「……」",
+    "",
+]
+
+
+def make_text(line_count: int, seed: int = 39) -> str:
+    rng = random.Random(seed)
+    return "\n".join(rng.choice(LINES) for _ in range(line_count))
+
+
+def unit_path(text, service):
+    units = [TranslationUnit(id=str(i), text=line) for i, line in enumerate(text.splitlines())]
+    chunks = service.split_nodes_into_chunks(units, 6000, 200)
+    return [("\n".join(u.text for u in chunk), chunk[0].id) for chunk in chunks]
+
+
+def store_path(text):
+    store = LineStore.from_text(text)
+    return [("\n".join(store.lines(a, b)), str(a)) for a, b in store.chunk_ranges(6000, 200)]
+
+
+def measure(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<30} {elapsed:8.3f} s   최대 추가 메모리 {peak / 1024 / 1024:8.1f} MB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="무결성 줄 저장소 벤치마크")
+    parser.add_argument("--lines", type=int, default=200000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    service = ChunkService()
+    text = make_text(args.lines)
+    print(f"원문 {args.lines:,}줄 / {len(text):,}자\n")
+
+    expected = measure("TranslationUnit 목록 (기존)", lambda: unit_path(text, service))
+    actual = measure("LineStore (오프셋 배열)", lambda: store_path(text))
+    assert expected == actual
+    store = LineStore.from_text(text)
+    print(f"\n청크 {len(actual):,}개 일치, LineStore 오프셋 배열 "
+          f"{(store.starts.buffer_info()[1] + store.ends.buffer_info()[1]) * store.starts.itemsize / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+후처리 성능 벤치마크
+
+기존 구현(규칙마다 re.sub)과 미리 컴파일된 단일 스캔 엔진, 프로세스 풀 병렬 처리,
+스트리밍 파일 저장을 같은 합성 데이터로 비교합니다. 결과가 모두 같은지도 확인합니다.
+
+사용법:
+    python test/benchmark_post_processing.py --chunks 3000 --chunk-chars 3000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from test.post_processing_reference import legacy_clean_translated_content  # noqa: E402
+from utils.output_assembler import OutputAssembler  # noqa: E402
+from utils.post_processing_service import PostProcessingService  # noqa: E402
+
+SENTENCES = [
+    "그는 천천히 고개를 들어 하늘을 바라보았다.",
+    "\"정말 그렇게 생각하나?\" 그녀가 물었다.",
+    "바람이 불어와 나뭇잎이 흩날렸다.",
+    "<상태창> 레벨 12 / 체력 340",
+    "검은 그림자가 성벽 위를 스쳐 지나갔다.",
+]
+NOISE = [
+    "번역 결과:",
+    "본 전자책은 네트워크에서 무료로 다운로드 받을 수 있습니다.",
+    "(www.example.com)",
+    "<p>",
+    "<thinking>문맥 확인</thinking>",
+]
+
+
+def make_chunks(count: int, chunk_chars: int, noise_ratio: float, seed: int = 42):
+    rng = random.Random(seed)
+    chunks = {}
+    for idx in range(count):
+        lines = []
+        size = 0
+        while size < chunk_chars:
+            line = rng.choice(NOISE) if rng.random() < noise_ratio else rng.choice(SENTENCES)
+            lines.append(line)
+            size += len(line) + 1
+            if rng.random() < 0.1:
+                lines.append("")
+        chunks[idx] = "\n".join(lines)
+    return chunks
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:10.1f} ms")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="후처리 벤치마크")
+    parser.add_argument("--chunks", type=int, default=3000)
+    parser.add_argument("--chunk-chars", type=int, default=3000)
+    parser.add_argument("--noise-ratio", type=float, default=0.01, help="광고/헤더 줄 비율")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    service = PostProcessingService()
+    chunks = make_chunks(args.chunks, args.chunk_chars, args.noise_ratio)
+    total_chars = sum(len(c) for c in chunks.values())
+    print(f"청크 {len(chunks)}개, 총 {total_chars:,}자, 프로세스 {args.workers}개\n")
+
+    serial_config = {"post_processing_parallel_min_chunks": 0}
+    pool_config = {"post_processing_parallel_min_chunks": 1, "post_processing_workers": args.workers}
+
+    legacy, t_legacy = timed(
+        "기존 (규칙별 re.sub)",
+        lambda: {i: legacy_clean_translated_content(service, c, serial_config) for i, c in chunks.items()}
+    )
+    compiled, t_compiled = timed(
+        "컴파일 엔진 (단일 프로세스)",
+        lambda: service.post_process_merged_chunks(chunks, serial_config)
+    )
+    pooled, t_pooled = timed(
+        "컴파일 엔진 (프로세스 풀)",
+        lambda: service.post_process_merged_chunks(chunks, pool_config)
+    )
+    merged, _ = timed(
+        "병합 텍스트 생성 (메모리)",
+        lambda: service.post_process_and_clean_chunks(chunks, serial_config)
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = Path(tmp) / "streamed.txt"
+        timed("스트리밍 파일 저장", lambda: OutputAssembler(out_path, service, serial_config).assemble(chunks))
+        streamed = out_path.read_text(encoding="utf-8")
+
+    assert legacy == compiled == pooled, "후처리 결과가 기존 구현과 다릅니다"
+    assert streamed == merged, "스트리밍 저장 결과가 병합 텍스트와 다릅니다"
+    print(f"\n속도 향상: 컴파일 엔진 x{t_legacy / t_compiled:.2f}, 프로세스 풀 x{t_legacy / t_pooled:.2f}")
+    print("결과 일치 확인 완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+품질 검사 성능 벤치마크
+
+합성 메타데이터(청크 N개, 누락/환각 섞음)로 다음을 비교합니다.
+- 기존 구현: 순수 Python OLS 전체 재계산 (검토 탭 로드마다)
+- 강건 회귀 전체 분석: 순수 Python / numpy 엔진
+- 온라인 추적: 번역 중 청크마다 record_chunk_completion (청크당 평균 비용)
+- 추적기가 있을 때 검토 탭 로드 (바뀐 청크만 반영)
+그리고 심어 둔 이상치를 각 방식이 몇 개 찾는지 출력합니다.
+시간은 tracemalloc 없이 재고, 최대 추가 메모리는 tracemalloc을 켠 별도 실행에서 측정합니다.
+
+사용법:
+    python test/benchmark_quality_check.py --chunks 50000
+"""
+import argparse
+import logging
+import math
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.quality_check_service import QualityCheckService, collect_data_points, np  # noqa: E402
+
+
+def legacy_analyze(metadata):
+    """변경 전 analyze_translation_quality (OLS + 표준편차 z-score)"""
+    points = collect_data_points(metadata)
+    n = len(points)
+    sum_x = sum(p[1] for p in points)
+    sum_y = sum(p[2] for p in points)
+    sum_xy = sum(p[1] * p[2] for p in points)
+    sum_x2 = sum(p[1] ** 2 for p in points)
+    a = ((n * sum_xy) - (sum_x * sum_y)) / ((n * sum_x2) - (sum_x ** 2))
+    b = (sum_y - (a * sum_x)) / n
+    residuals = [y - (a * x + b) for _, x, y in points]
+    std_dev = math.sqrt(sum(r * r for r in residuals) / n)
+    return [idx for (idx, _, _), r in zip(points, residuals) if abs(r / std_dev) > 2.0]
+
+
+def make_metadata(chunks: int, seed: int = 11):
+    rng = random.Random(seed)
+    planted = set(rng.sample(range(chunks), max(2, chunks // 200)))
+    translated = {}
+    for i in range(chunks):
+        x = rng.randint(1500, 6000)
+        y = (1.15 * x + 40) * rng.uniform(0.94, 1.06)
+        if i in planted:
+            y *= rng.choice((0.2, 0.6, 1.5, 4.0))
+        translated[str(i)] = {"source_length": x, "translated_length": int(y)}
+    return {"input_file": "bench_novel.txt", "language_pair": "ja->ko", "translated_chunks": translated}, planted
+
+
+def measure(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc은 할당마다 비용이 들어 시간 측정과 분리
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<36} {elapsed * 1000:10.1f} ms   최대 추가 메모리 {peak / 1024 / 1024:7.1f} MB")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="품질 검사 벤치마크")
+    parser.add_argument("--chunks", type=int, default=50000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    metadata, planted = make_metadata(args.chunks)
+    points = collect_data_points(metadata)
+    print(f"청크 {args.chunks:,}개, 심어 둔 이상치 {len(planted)}개, numpy {'사용 가능' if np is not None else '없음'}\n")
+
+    legacy, _ = measure("기존 OLS (전체 재계산)", lambda: legacy_analyze(metadata))
+    anonymous = dict(metadata, input_file=None)
+    pure, _ = measure("강건 회귀 (순수 Python)", lambda: QualityCheckService(use_numpy=False).analyze_translation_quality(anonymous))
+    if np is not None:
+        measure("강건 회귀 (numpy)", lambda: QualityCheckService(use_numpy=True).analyze_translation_quality(anonymous))
+
+    live = QualityCheckService()
+    start = time.perf_counter()
+    for chunk_index, src, trans in points:
+        live.record_chunk_completion("bench_novel.txt", chunk_index, src, trans, language_pair="ja->ko")
+    per_chunk = (time.perf_counter() - start) / len(points)
+    print(f"{'온라인 추적 (청크당 평균)':<36} {per_chunk * 1e6:10.1f} µs")
+    measure("추적기 공유 시 검토 탭 로드", lambda: live.analyze_translation_quality(metadata))
+
+    def recall(found):
+        return len(planted & set(found))
+
+    print(f"\n찾은 이상치: 기존 {recall(legacy)}/{len(planted)} (전체 보고 {len(legacy)}), "
+          f"강건 {recall(item['chunk_index'] for item in pure)}/{len(planted)} (전체 보고 {len(pure)}), "
+          f"온라인 {recall(item['chunk_index'] for item in live.live_suspicious_chunks('bench_novel.txt'))}/{len(planted)}")
+
+
+if __name__ == "__main__":
+    main()
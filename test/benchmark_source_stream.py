@@ -0,0 +1,89 @@
+"""
+원문 스트리밍 읽기 메모리 벤치마크
+
+기존 무결성 모드 전처리(read_text_file → splitlines → 줄마다 TranslationUnit → 청크 목록)와
+mmap 줄 스트림(iter_text_file_lines → iter_node_chunks, 청크를 하나씩 소비)의
+최대 추가 메모리와 시간을 비교합니다.
+
+사용법:
+    python test/benchmark_source_stream.py --size-mb 100
+"""
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.dtos import TranslationUnit  # noqa: E402
+from infrastructure.file_handler import iter_text_file_lines, read_text_file  # noqa: E402
+from utils.chunk_service import ChunkService  # noqa: E402
+
+LINES = [
+    "他沉默了很久，终于开口说道：「我不会再回来了。」",
+    "窗外的雨越下越大，街道上已经看不到行人。",
+    "「……」",
+    "",
+]
+
+
+def write_source(path: Path, size_mb: float, seed: int = 38) -> None:
+    rng = random.Random(seed)
+    block = "".join(rng.choice(LINES) + "\r\n" for _ in range(20000)).encode("utf-8")
+    target = int(size_mb * 1024 * 1024)
+    with open(path, "wb") as f:
+        for _ in range(target // len(block) + 1):
+            f.write(block)
+
+
+def full_read(path, service):
+    lines = read_text_file(path).splitlines()
+    units = [TranslationUnit(id=str(i), text=line) for i, line in enumerate(lines)]
+    chunks = service.split_nodes_into_chunks(units, 6000, 200)
+    return len(chunks), len(units)
+
+
+def streamed(path, service):
+    units = (TranslationUnit(id=str(i), text=line) for i, line in enumerate(iter_text_file_lines(path)))
+    chunk_count = unit_count = 0
+    for chunk in service.iter_node_chunks(units, 6000, 200):
+        chunk_count += 1
+        unit_count += len(chunk)
+    return chunk_count, unit_count
+
+
+def measure(label, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed:8.2f} s   최대 추가 메모리 {peak / 1024 / 1024:8.1f} MB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원문 스트리밍 읽기 벤치마크")
+    parser.add_argument("--size-mb", type=float, default=100)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    service = ChunkService()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "source.txt"
+        write_source(path, args.size_mb)
+        print(f"원문 {path.stat().st_size / 1024 / 1024:.1f} MB (CRLF)\n")
+        expected = measure("전체 읽기 + 단위 목록", lambda: full_read(path, service))
+        actual = measure("mmap 줄 스트림 (지연)", lambda: streamed(path, service))
+        assert expected == actual, (expected, actual)
+        print(f"\n청크 {actual[0]:,}개 / 단위 {actual[1]:,}개 일치")
+
+
+if __name__ == "__main__":
+    main()
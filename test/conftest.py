@@ -0,0 +1,45 @@
+"""
+테스트 공용 픽스처 (Gemini SDK 모의 객체)
+
+- gemini_response: 텍스트만 담은 SDK 응답 모의 객체를 만드는 함수
+- sdk: genai.Client를 패치하고 하나의 모의 클라이언트를 반환
+- sdk_clients: genai.Client를 패치하고 API 키별 모의 클라이언트 딕셔너리를 반환
+  (기본 응답은 "ok from <키>", 테스트에서 generate_content를 바꿔 끼움)
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+def _gemini_response(text):
+    response = MagicMock()
+    response.text = text
+    response.prompt_feedback = None
+    response.candidates = []
+    return response
+
+
+@pytest.fixture
+def gemini_response():
+    return _gemini_response
+
+
+@pytest.fixture
+def sdk():
+    with patch("infrastructure.gemini_client.genai.Client") as mock_genai:
+        instance = MagicMock()
+        mock_genai.return_value = instance
+        yield instance
+
+
+@pytest.fixture
+def sdk_clients():
+    clients = {}
+
+    def make_client(api_key=None, **kwargs):
+        clients[api_key] = MagicMock()
+        clients[api_key].aio.models.generate_content = AsyncMock(return_value=_gemini_response(f"ok from {api_key}"))
+        return clients[api_key]
+
+    with patch("infrastructure.gemini_client.genai.Client", side_effect=make_client):
+        yield clients
@@ -0,0 +1,21 @@
+"""
+후처리 기준 구현 (테스트/벤치마크 공용)
+
+규칙마다 re.sub를 차례로 적용하던 기존 clean_translated_content입니다.
+미리 컴파일된 엔진의 결과가 이 구현과 같은지 검증하는 데 사용합니다.
+"""
+import re
+
+
+def legacy_clean_translated_content(service, content: str, config) -> str:
+    """규칙을 하나씩 re.sub로 적용하는 기존 구현"""
+    if not content:
+        return content
+    cleaned = content.strip()
+    cleaned = re.sub(r'<thinking>[\s\S]*?</thinking>', '', cleaned, flags=re.IGNORECASE)
+    for pattern in service.removal_patterns:
+        cleaned = re.sub(pattern, '', cleaned, flags=re.MULTILINE | re.IGNORECASE)
+    if config.get("clean_html_tags", True):
+        cleaned = re.sub(r'<[a-zA-Z0-9/\s"=\'-]+>', '', cleaned)
+    cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+    return cleaned.strip()
@@ -0,0 +1,116 @@
+"""
+적응형 요청 데드라인 / 청크 시간 예산 테스트
+
+- 모델 × 입력 크기 구간별 응답 시간 분포와 p99 × 배수 데드라인(하한/상한)
+- 시간 예산은 중첩 시 더 이른 쪽을 쓰고, 블록 안에서 만든 Task에도 전달되는지
+- 관측 분포보다 훨씬 오래 걸리는 요청은 고정 타임아웃 전에 끊고 재시도하는지
+- 예산이 소진되면 재시도 없이 바로 중단하는지
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from infrastructure.gemini_client import GeminiClient, GeminiDeadlineExceededException
+from infrastructure.latency_tracker import (
+    LatencyTracker, remaining_request_budget, request_time_budget, size_bucket,
+)
+
+
+def test_size_buckets_double():
+    assert [size_bucket(n) for n in (0, 999, 1000, 1999, 2000, 4000, 10**6)] == [0, 0, 1, 1, 2, 3, 6]
+
+
+def test_deadline_from_quantile_with_bounds():
+    tracker = LatencyTracker(factor=3.0, min_deadline=5.0, max_deadline=100.0, min_samples=20)
+    for i in range(19):
+        tracker.record("flash", 3000, 1.0 + i * 0.1)
+    assert tracker.deadline("flash", 3000) is None  # 표본 부족
+    tracker.record("flash", 3000, 10.0)
+    assert tracker.quantile("flash", 3000) == 10.0
+    assert tracker.deadline("flash", 3000) == 30.0
+    # 다른 모델/크기 구간은 따로 집계
+    assert tracker.deadline("pro", 3000) is None
+    assert tracker.deadline("flash", 500) is None
+
+    fast = LatencyTracker(factor=3.0, min_deadline=5.0, max_deadline=100.0, min_samples=1)
+    fast.record("flash", 100, 0.1)
+    assert fast.deadline("flash", 100) == 5.0
+    fast.record("flash", 100, 90.0)
+    assert fast.deadline("flash", 100) == 100.0
+
+
+def test_window_evicts_old_samples():
+    tracker = LatencyTracker(window=10, min_samples=10)
+    for _ in range(10):
+        tracker.record("flash", 100, 50.0)
+    for _ in range(10):
+        tracker.record("flash", 100, 1.0)
+    assert tracker.sample_count("flash", 100) == 10
+    assert tracker.quantile("flash", 100) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_budget_nests_and_propagates_to_tasks():
+    assert remaining_request_budget() is None
+    with request_time_budget(100):
+        with request_time_budget(5):
+            remaining = await asyncio.create_task(_remaining())
+            assert 4 < remaining <= 5
+        with request_time_budget(1000):
+            assert 99 < remaining_request_budget() <= 100
+    with request_time_budget(0):
+        assert remaining_request_budget() is None
+
+
+async def _remaining():
+    return remaining_request_budget()
+
+
+def _client(**kwargs):
+    client = GeminiClient(auth_credentials="fake_api_key", api_timeout=30.0, **kwargs)
+    client.delay_between_requests = 0
+    return client
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_cut_at_adaptive_deadline(sdk, gemini_response):
+    client = _client(adaptive_timeout_factor=3.0, adaptive_timeout_min=0.05)
+    for _ in range(30):
+        client.latency_tracker.record("gemini-test", len("prompt"), 0.02)
+
+    calls = {"n": 0}
+
+    async def generate(**kwargs):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            await asyncio.sleep(30)  # 멈춘 요청
+        return gemini_response("ok")
+
+    sdk.aio.models.generate_content = AsyncMock(side_effect=generate)
+    started = time.monotonic()
+    result = await client.generate_text_async("prompt", "gemini-test", max_retries=2,
+                                              initial_backoff=0.0, max_backoff=0.0)
+    assert result == "ok"
+    assert calls["n"] == 2
+    assert time.monotonic() - started < 5
+    # 성공한 요청의 응답 시간도 분포에 기록됨
+    assert client.latency_tracker.sample_count("gemini-test", len("prompt")) == 31
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_stops_retries(sdk):
+    client = _client()
+
+    async def hang(**kwargs):
+        await asyncio.sleep(30)
+
+    sdk.aio.models.generate_content = AsyncMock(side_effect=hang)
+    started = time.monotonic()
+    with request_time_budget(0.3):
+        with pytest.raises(GeminiDeadlineExceededException):
+            await client.generate_text_async("prompt", "gemini-test", max_retries=5,
+                                             initial_backoff=0.0, max_backoff=0.0)
+    assert time.monotonic() - started < 5
+    assert sdk.aio.models.generate_content.await_count == 1
@@ -0,0 +1,52 @@
+"""
+오프셋 기반 청크 분할 테스트
+
+- iter_chunk_spans/split_text_into_chunks/iter_chunks의 경계가 기존 구현(splitlines + 누적)과 같은지
+- 특수 줄바꿈(CR, CRLF, 폼 피드 등)이 섞인 경우에도 같은지
+"""
+import random
+
+import pytest
+
+from utils.chunk_service import ChunkService
+
+
+def _legacy_split(text_content, max_chunk_size):
+    chunks = []
+    current_chunk = ""
+    for line in text_content.splitlines(keepends=True):
+        if len(current_chunk) + len(line) <= max_chunk_size:
+            current_chunk += line
+        else:
+            if current_chunk:
+                chunks.append(current_chunk)
+            if len(line) > max_chunk_size:
+                for i in range(0, len(line), max_chunk_size):
+                    chunks.append(line[i:i + max_chunk_size])
+                current_chunk = ""
+            else:
+                current_chunk = line
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+
+@pytest.mark.parametrize("alphabet", [
+    ["a", "bb", "\n", "\n", "x" * 30, "가나다"],
+    ["a", "bb", "\n", "\r\n", "\r", " ", "\x0c", "x" * 30, "가나다"],
+])
+def test_chunk_boundaries_match_legacy(alphabet):
+    service = ChunkService()
+    rng = random.Random(37)
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        max_size = rng.randint(1, 40)
+        expected = _legacy_split(text, max_size)
+        assert service.split_text_into_chunks(text, max_size) == expected
+        assert list(service.iter_chunks(text, max_size)) == expected
+        assert [text[s:e] for s, e in ChunkService.iter_chunk_spans(text, max_size)] == expected
+
+
+def test_iter_chunk_spans_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        list(ChunkService.iter_chunk_spans("abc", 0))
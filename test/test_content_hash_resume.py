@@ -0,0 +1,117 @@
+"""
+콘텐츠 해시 기반 이어하기 테스트
+
+- 청크 크기 변경 / 원문 수정 후에도 내용이 같은 청크는 재번역하지 않는지
+- 앵커 분할이 앵커가 없을 때 기존 분할과 같은 경계를 만드는지
+"""
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from app.app_service import AppService
+from infrastructure.file_handler import load_metadata, load_chunks_from_file
+from utils.chunk_service import ChunkService, chunk_content_hashes
+
+
+def _make_text(line_count: int) -> str:
+    return "".join(f"Line {i:03d} of the source novel text.\n" for i in range(line_count))
+
+
+@pytest.fixture
+def app_service():
+    service = AppService()
+    service.gemini_client = MagicMock()
+    service.translation_service = MagicMock()
+    service.translation_service.translate_chunk_async = AsyncMock(side_effect=lambda text: f"[KO]{text}")
+    service.config.update({
+        "translation_mode": "standard",
+        "chunk_size": 200,
+        "max_workers": 2,
+        "requests_per_minute": 0,
+        "enable_post_processing": False,
+    })
+    return service
+
+
+async def _translate(service, input_file, output_file):
+    service.translation_service.translate_chunk_async.reset_mock()
+    await service.start_translation_async(str(input_file), str(output_file))
+    return [call.args[0] for call in service.translation_service.translate_chunk_async.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_chunk_size_change_reuses_translations(app_service, tmp_path):
+    input_file = tmp_path / "novel.txt"
+    output_file = tmp_path / "novel_translated.txt"
+    input_file.write_text(_make_text(30), encoding="utf-8")
+
+    first_calls = await _translate(app_service, input_file, output_file)
+    assert len(first_calls) > 1
+
+    app_service.config["chunk_size"] = 500
+    second_calls = await _translate(app_service, input_file, output_file)
+
+    assert second_calls == []
+    metadata = load_metadata(input_file)
+    assert metadata["status"] == "completed"
+    assert len(metadata["translated_chunks"]) == metadata["total_chunks"] == len(first_calls)
+    assert "chunk_offsets" in metadata
+    assert output_file.read_text(encoding="utf-8").count("[KO]") == len(first_calls)
+
+
+@pytest.mark.asyncio
+async def test_local_edit_translates_only_changed_chunk(app_service, tmp_path):
+    input_file = tmp_path / "novel.txt"
+    output_file = tmp_path / "novel_translated.txt"
+    text = _make_text(30)
+    input_file.write_text(text, encoding="utf-8")
+    await _translate(app_service, input_file, output_file)
+
+    edited = text.replace("Line 012 of the source", "Line 012 (revised) of the source")
+    input_file.write_text(edited, encoding="utf-8")
+    calls = await _translate(app_service, input_file, output_file)
+
+    assert len(calls) == 1
+    assert "revised" in calls[0]
+    chunked = load_chunks_from_file(tmp_path / "novel_translated_chunked.txt")
+    assert "".join(chunked[i][len("[KO]"):] for i in sorted(chunked)) == edited
+
+
+@pytest.mark.asyncio
+async def test_appended_text_translates_only_new_chunks(app_service, tmp_path):
+    input_file = tmp_path / "novel.txt"
+    output_file = tmp_path / "novel_translated.txt"
+    text = _make_text(30)
+    input_file.write_text(text, encoding="utf-8")
+    first_calls = await _translate(app_service, input_file, output_file)
+
+    appended = "".join(f"New chapter line {i}.\n" for i in range(10))
+    input_file.write_text(text + appended, encoding="utf-8")
+    calls = await _translate(app_service, input_file, output_file)
+
+    assert calls
+    assert "".join(calls) == appended
+    assert load_metadata(input_file)["total_chunks"] == len(first_calls) + len(calls)
+
+
+def test_split_with_anchors_matches_default_split_without_anchors():
+    service = ChunkService()
+    text = _make_text(50) + "x" * 450 + "\n" + _make_text(5)
+    for size in (60, 200, 1000):
+        assert service.split_text_with_anchors(text, size, {}) == service.split_text_into_chunks(text, size)
+
+
+def test_split_with_anchors_preserves_previous_chunks():
+    service = ChunkService()
+    text = _make_text(40)
+    old_chunks = service.split_text_into_chunks(text, 300)
+    anchors = {}
+    for chunk in old_chunks:
+        hashes = chunk_content_hashes(chunk)
+        anchors.setdefault(hashes["source_anchor_hash"], []).append((len(chunk), hashes["source_hash"]))
+
+    new_chunks = service.split_text_with_anchors(text, 1000, anchors)
+    assert new_chunks == old_chunks
+
+    offsets = service.chunk_end_offsets(new_chunks)
+    assert service.create_chunks_from_file_content(text, 1000, chunk_offsets=offsets) == old_chunks
+    assert service.split_text_by_offsets(text, offsets[:-1]) is None
@@ -0,0 +1,95 @@
+"""
+콘텐츠 안전 차단 구간 격리 테스트
+
+- 차단 문장 하나를 O(log n)회의 추가 호출로 격리하고 나머지는 번역하는지
+- 같은 청크를 다시 번역할 때 성공한 하위 구간을 캐시에서 재사용하는지
+- 동시에 번역되는 청크마다 차단 구간이 따로 모여 메타데이터에 기록되는지
+"""
+import asyncio
+import math
+import pytest
+from unittest.mock import MagicMock
+
+from core.exceptions import BtgTranslationException
+from domain.content_safety_isolator import collect_blocked_spans, find_bisect_offset
+from domain.translation_service import TranslationService
+from infrastructure.file_handler import (
+    create_new_metadata, load_metadata, save_metadata, update_metadata_for_chunk_completion,
+)
+from utils.quality_check_service import collect_output_issues
+
+
+def _make_service():
+    service = TranslationService(gemini_client=MagicMock(), config={"max_workers": 4})
+    calls = []
+
+    async def fake_translate(text, stream=False):
+        calls.append(text)
+        if "BAD" in text:
+            raise BtgTranslationException("콘텐츠 안전 문제로 번역할 수 없습니다.")
+        return text.replace("line", "줄")
+
+    service.translate_text_async = fake_translate
+    return service, calls
+
+
+def test_bisect_prefers_line_breaks_then_sentences():
+    assert find_bisect_offset("aaa\nbbb\nccc\nddd") == 8
+    assert find_bisect_offset("First. Second. Third.") == 7
+    assert find_bisect_offset("한 문장뿐") is None
+    assert find_bisect_offset("\n\n본문") is None
+
+
+@pytest.mark.asyncio
+async def test_single_blocked_sentence_costs_logarithmic_calls():
+    service, calls = _make_service()
+    lines = [f"line {i:03d}." for i in range(256)]
+    lines[137] = "line BAD."
+    chunk = "\n".join(lines)
+
+    with collect_blocked_spans() as blocked_spans:
+        result = await service.translate_text_with_content_safety_retry_async(chunk)
+
+    assert [span.text for span in blocked_spans] == ["line BAD."]
+    assert chunk[blocked_spans[0].start:blocked_spans[0].end] == "line BAD."
+    assert len(calls) <= 1 + 2 * math.ceil(math.log2(len(lines)))
+    assert "줄 136." in result and "줄 138." in result and "수동 번역 필요: line BAD." in result
+    assert result.count("\n") == chunk.count("\n")
+
+    # 다시 번역하면 성공했던 형제 구간은 캐시에서 재사용되고 차단 경로만 다시 확인
+    calls.clear()
+    assert await service.translate_text_with_content_safety_retry_async(chunk) == result
+    assert calls and all("BAD" in text for text in calls)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_chunks_collect_their_own_blocked_spans(tmp_path):
+    service, _ = _make_service()
+    chunks = {
+        0: "line 000.\nline BAD one.\nline 002.",
+        1: "line 100.\nline 101.\nline BAD two.",
+    }
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("".join(chunks.values()), encoding="utf-8")
+    save_metadata(input_file, create_new_metadata(input_file, len(chunks), {}))
+
+    async def translate_chunk(idx):
+        with collect_blocked_spans() as blocked_spans:
+            await asyncio.sleep(0)
+            translated = await service.translate_text_with_content_safety_retry_async(chunks[idx])
+        update_metadata_for_chunk_completion(
+            input_file, idx, source_length=len(chunks[idx]), translated_length=len(translated),
+            blocked_spans=[span.to_metadata() for span in blocked_spans] or None,
+        )
+
+    await asyncio.gather(translate_chunk(0), translate_chunk(1))
+
+    recorded = load_metadata(input_file)["translated_chunks"]
+    assert [span["text"] for span in recorded["0"]["blocked_spans"]] == ["line BAD one."]
+    assert [span["text"] for span in recorded["1"]["blocked_spans"]] == ["line BAD two."]
+    span = recorded["1"]["blocked_spans"][0]
+    assert chunks[1][span["start"]:span["end"]] == "line BAD two."
+
+    issues = collect_output_issues(load_metadata(input_file))
+    assert issues[0]["issues"] == ["content_safety_blocked"]
+    assert issues[1]["blocked_spans"] == recorded["1"]["blocked_spans"]
@@ -0,0 +1,56 @@
+"""
+EPUB 노드 아레나 테스트
+
+- parse_chapter가 process_chapter와 같은 노드 id/종류/번역 대상 텍스트를 만드는지
+- reconstruct_arena가 번역 범위 밖의 원문(선언, 속성, 주석)을 그대로 유지하는지
+"""
+from utils.epub_processor import EpubProcessor
+
+CHAPTER = """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>第一章</title><link rel="stylesheet" href="s.css"/></head>
+<body class="b">
+<h1 class="t">第一章</h1>
+<p>他说：<span class="x">「你好」</span></p>
+<p><ruby>漢<rt>かん</rt></ruby>字 &lt;注&gt;</p>
+<div class="c"><p>段落一</p><br/><img src="a.png"/><p>  </p>
+  裸文本
+</div>
+<ul><li>甲</li><li>乙</li></ul>
+</body></html>""".encode("utf-8")
+
+
+def test_arena_nodes_match_legacy_chapter():
+    processor = EpubProcessor()
+    legacy = processor.process_chapter(CHAPTER, "ch.xhtml")
+    arena = processor.parse_chapter(CHAPTER, "ch.xhtml")
+
+    assert [(n.id, n.type, n.tag, n.content) for n in legacy.nodes] == [
+        (arena.node_id(i), arena.node_type(i), arena.tag(i), arena.contents[i]) for i in range(len(arena))
+    ]
+    assert [u.text for u in arena.translation_units()] == [
+        "第一章", "第一章", "他说：「你好」", "漢字 <注>", "段落一", "裸文本", "甲", "乙"
+    ]
+
+
+def test_reconstruct_splices_only_translated_ranges():
+    processor = EpubProcessor()
+    source = CHAPTER.replace(b"<body", b"<!-- keep -->\n<body")
+    arena = processor.parse_chapter(source, "ch.xhtml")
+    translated = {
+        "ch.xhtml_title": "제1장",
+        arena.node_id(arena.text_indices()[3]): "한자 <주>",
+        arena.node_id(arena.text_indices()[5]): "맨 텍스트",
+    }
+
+    output = processor.reconstruct_arena(arena, translated).decode("utf-8")
+
+    assert output == source.decode("utf-8").replace(
+        "<title>第一章</title>", "<title>제1장</title>"
+    ).replace(
+        "<p><ruby>漢<rt>かん</rt></ruby>字 &lt;注&gt;</p>", "<p>한자 &lt;주&gt;</p>"
+    ).replace("  裸文本\n", "  맨 텍스트\n")
+    # 번역이 없으면 바이트 단위로 동일 (BOM, 잘못된 바이트 포함)
+    raw = b"\xef\xbb\xbf" + CHAPTER.replace("段落一".encode("utf-8"), b"\xff\xfe")
+    assert processor.reconstruct_arena(processor.parse_chapter(raw, "x.xhtml"), {}) == raw
@@ -0,0 +1,171 @@
+"""
+EPUB 출력 조립기 테스트
+
+- mimetype이 첫 항목·무압축으로 기록되는지
+- 바뀌지 않은 항목은 원본 압축 데이터가 바이트 단위로 그대로 복사되는지
+- 교체 항목(바이트/파일/다른 ZIP 항목)이 원래 순서대로 들어가는지
+- 자체 ZIP 작성기가 zipfile로 읽을 수 있는 헤더(UTF-8 이름, 속성, 시각)를 쓰고 ZIP64가 필요하면 거부하는지
+- 암호화된 항목은 암호 없이도 암호화된 그대로 복사되어 같은 암호로 풀리는지
+"""
+import io
+import zipfile
+import zlib
+
+import pytest
+
+from utils.epub_assembler import EpubAssembler, RawZipWriter, ZipEntryRef
+
+
+def _raw_bytes(path, name):
+    """항목의 압축된 데이터 (로컬 헤더 제외)"""
+    with zipfile.ZipFile(path) as z:
+        info = z.getinfo(name)
+        with open(path, "rb") as fp:
+            fp.seek(info.header_offset + 26)
+            name_len = int.from_bytes(fp.read(2), "little")
+            extra_len = int.from_bytes(fp.read(2), "little")
+            fp.seek(info.header_offset + 30 + name_len + extra_len)
+            return fp.read(info.compress_size)
+
+
+def _make_source(path):
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("OEBPS/ch1.xhtml", "<p>一</p>" * 50, compress_type=zipfile.ZIP_DEFLATED)
+        # mimetype이 첫 항목이 아니고 압축된 잘못된 원본도 바로잡아야 함
+        z.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_DEFLATED)
+        z.writestr("OEBPS/cover.jpg", bytes(range(256)) * 40, compress_type=zipfile.ZIP_STORED)
+        z.writestr("OEBPS/ch2.xhtml", "<p>二</p>" * 50, compress_type=zipfile.ZIP_DEFLATED)
+        z.writestr("OEBPS/content.opf", "<package/>", compress_type=zipfile.ZIP_DEFLATED)
+
+
+def test_assemble_copies_unchanged_entries_raw(tmp_path):
+    source = tmp_path / "book.epub"
+    _make_source(source)
+    chapter_file = tmp_path / "ch1.xhtml"
+    chapter_file.write_bytes("<p>하나</p>".encode("utf-8"))
+    other = tmp_path / "other.epub"
+    with zipfile.ZipFile(other, "w") as z:
+        z.writestr("OEBPS/ch2.xhtml", "<p>둘</p>", compress_type=zipfile.ZIP_DEFLATED)
+
+    output = tmp_path / "out.epub"
+    report = EpubAssembler(source, max_workers=2).assemble(output, {
+        "OEBPS/ch1.xhtml": chapter_file,
+        "OEBPS/ch2.xhtml": ZipEntryRef(other, "OEBPS/ch2.xhtml"),
+        "OEBPS/content.opf": b"<package dir='ltr'/>",
+        "OEBPS/missing.xhtml": b"ignored",
+    })
+
+    with zipfile.ZipFile(output) as z:
+        assert z.testzip() is None
+        infos = z.infolist()
+        assert [i.filename for i in infos] == [
+            "mimetype", "OEBPS/ch1.xhtml", "OEBPS/cover.jpg", "OEBPS/ch2.xhtml", "OEBPS/content.opf"]
+        assert infos[0].compress_type == zipfile.ZIP_STORED
+        assert z.read("mimetype") == b"application/epub+zip"
+        assert z.read("OEBPS/ch1.xhtml").decode("utf-8") == "<p>하나</p>"
+        assert z.read("OEBPS/ch2.xhtml").decode("utf-8") == "<p>둘</p>"
+        assert z.read("OEBPS/content.opf") == b"<package dir='ltr'/>"
+        assert z.read("OEBPS/cover.jpg") == bytes(range(256)) * 40
+
+    assert _raw_bytes(output, "OEBPS/cover.jpg") == _raw_bytes(source, "OEBPS/cover.jpg")
+    assert _raw_bytes(output, "OEBPS/ch2.xhtml") == _raw_bytes(other, "OEBPS/ch2.xhtml")
+    assert (report.copied_raw, report.compressed) == (2, 2)
+
+
+def test_assemble_without_replacements_round_trips(tmp_path):
+    source = tmp_path / "book.epub"
+    _make_source(source)
+    output = tmp_path / "copy.epub"
+    EpubAssembler(source).assemble(output)
+
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(output) as out:
+        assert out.testzip() is None
+        assert out.namelist()[0] == "mimetype"
+        assert sorted(out.namelist()) == sorted(src.namelist())
+        for name in src.namelist():
+            assert out.read(name) == src.read(name)
+
+
+def test_raw_writer_headers_readable_by_zipfile():
+    buffer = io.BytesIO()
+    writer = RawZipWriter(buffer)
+    data = "본문 ".encode("utf-8") * 100
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    info = zipfile.ZipInfo("OEBPS/장 1.xhtml", date_time=(2024, 5, 17, 13, 45, 30))
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    info.CRC, info.file_size, info.compress_size = zlib.crc32(data), len(data), len(compressed)
+    writer.write(info, io.BytesIO(compressed), len(compressed))
+    writer.close()
+
+    with zipfile.ZipFile(buffer) as z:
+        assert z.testzip() is None
+        read_info = z.getinfo("OEBPS/장 1.xhtml")
+        assert read_info.date_time == (2024, 5, 17, 13, 45, 30)
+        assert read_info.external_attr == 0o644 << 16
+        assert z.read("OEBPS/장 1.xhtml") == data
+
+
+def test_raw_writer_rejects_zip64_entries():
+    info = zipfile.ZipInfo("huge.bin")
+    info.file_size = 1 << 32
+    with pytest.raises(zipfile.LargeZipFile):
+        RawZipWriter(io.BytesIO()).write(info, b"")
+
+
+def _zipcrypto_encrypt(data, password, check_byte):
+    """전통 PKWARE 암호화 (zipfile은 복호화만 지원하므로 테스트용으로 직접 구현)"""
+    mask = 0xFFFFFFFF
+
+    def crc_update(crc, byte):
+        return zlib.crc32(bytes([byte]), crc ^ mask) ^ mask
+
+    keys = [0x12345678, 0x23456789, 0x34567890]
+
+    def update(byte):
+        keys[0] = crc_update(keys[0], byte)
+        keys[1] = ((keys[1] + (keys[0] & 0xFF)) * 134775813 + 1) & mask
+        keys[2] = crc_update(keys[2], keys[1] >> 24)
+
+    for byte in password:
+        update(byte)
+    out = bytearray()
+    for byte in bytes(11) + bytes([check_byte]) + data:
+        temp = (keys[2] | 2) & 0xFFFF
+        out.append(byte ^ (((temp * (temp ^ 1)) >> 8) & 0xFF))
+        update(byte)
+    return bytes(out)
+
+
+def test_encrypted_entry_is_copied_without_password(tmp_path):
+    data = "<p>비밀</p>".encode("utf-8") * 20
+    date_time = (2024, 5, 17, 13, 45, 30)
+    dos_time = 13 << 11 | 45 << 5 | 30 // 2
+    # 데이터 디스크립터 플래그가 있으면 검증 바이트는 CRC가 아니라 수정 시각의 상위 바이트
+    encrypted = _zipcrypto_encrypt(data, b"pw", dos_time >> 8)
+
+    source = tmp_path / "locked.epub"
+    with open(source, "wb") as fp:
+        writer = RawZipWriter(fp)
+        mimetype = zipfile.ZipInfo("mimetype", date_time=date_time)
+        mimetype.CRC, mimetype.file_size, mimetype.compress_size = zlib.crc32(b"application/epub+zip"), 20, 20
+        writer.write(mimetype, b"application/epub+zip")
+        locked = zipfile.ZipInfo("OEBPS/secret.xhtml", date_time=date_time)
+        locked.flag_bits = 0x01 | 0x08
+        locked.CRC, locked.file_size, locked.compress_size = zlib.crc32(data), len(data), len(encrypted)
+        writer.write(locked, encrypted)
+        writer.close()
+    with zipfile.ZipFile(source) as z:
+        assert z.read("OEBPS/secret.xhtml", pwd=b"pw") == data
+
+    output = tmp_path / "out.epub"
+    report = EpubAssembler(source).assemble(output)
+
+    assert report.copied_raw == 1
+    assert _raw_bytes(output, "OEBPS/secret.xhtml") == _raw_bytes(source, "OEBPS/secret.xhtml")
+    with zipfile.ZipFile(output) as z:
+        assert z.getinfo("OEBPS/secret.xhtml").flag_bits & 0x01
+        with pytest.raises(RuntimeError):
+            z.read("OEBPS/secret.xhtml")
+        assert z.read("OEBPS/secret.xhtml", pwd=b"pw") == data
@@ -0,0 +1,79 @@
+"""
+EPUB 챕터 간 텍스트 노드 중복 제거 테스트
+
+- 여러 챕터에 반복되는 텍스트는 한 번만 번역 요청되고 모든 등장에 적용되는지
+- 번역 실패(원문 그대로 반환)한 텍스트는 색인되지 않아 다음 등장 때 다시 요청되는지
+- 번역이 필요 없어 로컬에서 확정된 노드는 번역 요청 수가 아닌 로컬 처리 수로 보고되는지
+"""
+import asyncio
+import zipfile
+from unittest.mock import MagicMock
+
+from core.dtos import TranslationUnit
+from domain.translation_service import TranslationService
+from utils.chunk_service import ChunkService
+from utils.epub_processor import TextNodeIndex
+
+HEADER = "<p>シリーズ名</p>"
+FOOTER = "<p>目次へ戻る</p>"
+
+
+def _chapter(body):
+    return f"<html><head><title>本</title></head><body>{HEADER}{body}{FOOTER}</body></html>"
+
+
+def test_index_translates_each_text_once():
+    index = TextNodeIndex()
+    first = [TranslationUnit(id="a_0", text="甲"), TranslationUnit(id="a_1", text="乙"), TranslationUnit(id="a_2", text="甲")]
+    assert [u.id for u in index.pending_units(first)] == ["a_0", "a_1"]
+    # 乙은 번역 실패로 원문이 돌아옴
+    assert index.resolve(first, {"a_0": "갑", "a_1": "乙"}) == {"a_0": "갑", "a_1": "乙", "a_2": "갑"}
+
+    second = [TranslationUnit(id="b_0", text="甲"), TranslationUnit(id="b_1", text="乙")]
+    assert [u.id for u in index.pending_units(second)] == ["b_1"]
+    assert index.resolve(second, {"b_1": "을"}) == {"b_0": "갑", "b_1": "을"}
+    assert index.report.to_dict() == {
+        "total_nodes": 5, "translated_nodes": 3, "local_nodes": 0, "reused_nodes": 2, "dedup_ratio": 0.4
+    }
+
+
+def test_translate_epub_reuses_repeated_nodes(tmp_path):
+    source = tmp_path / "book.epub"
+    with zipfile.ZipFile(source, "w") as z:
+        z.writestr("mimetype", "application/epub+zip")
+        for i, body in enumerate(["<p>一</p><p>***</p>", "<p>二</p><p>***</p>", "<p>三</p><p>***</p>"]):
+            z.writestr(f"OEBPS/ch{i}.xhtml", _chapter(body))
+
+    sent = []
+
+    async def fake_translate(chunk, depth=0):
+        sent.extend(unit.text for unit in chunk)
+        return {unit.id: f"KO{unit.text}" for unit in chunk}
+
+    service = TranslationService.__new__(TranslationService)
+    service.config = {"chunk_size": 6000, "integrity_max_items": 100}
+    service.chunk_service = ChunkService()
+    service.stop_check_callback = None
+    service._request_integrity_translation = fake_translate
+    output = tmp_path / "book_translated.epub"
+    asyncio.run(service.translate_epub(source, output))
+
+    assert sorted(sent) == sorted(["本", "シリーズ名", "目次へ戻る", "一", "二", "三"])
+    with zipfile.ZipFile(output) as z:
+        chapter = z.read("OEBPS/ch2.xhtml").decode("utf-8")
+    assert "<title>KO本</title>" in chapter and "<p>KOシリーズ名</p>" in chapter and "<p>KO三</p>" in chapter
+    assert "<p>KO目次へ戻る</p>" in chapter
+    report = service.last_epub_dedup_report
+    # 구분선(***)은 챕터마다 로컬 처리되어 번역 요청 수에 들어가지 않음
+    assert (report.total_nodes, report.translated_nodes, report.local_nodes, report.reused_nodes) == (15, 6, 3, 6)
+
+
+def test_non_translatable_units_are_reported_as_local():
+    index = TextNodeIndex()
+    units = [TranslationUnit(id="a_0", text="甲"), TranslationUnit(id="a_1", text="***"), TranslationUnit(id="a_2", text="12")]
+    assert [u.id for u in index.pending_units(units)] == ["a_0", "a_1", "a_2"]
+    assert (index.report.translated_nodes, index.report.local_nodes, index.report.reused_nodes) == (1, 2, 0)
+
+    sent_all = TextNodeIndex()
+    sent_all.pending_units(units, skip_non_translatable=False)
+    assert (sent_all.report.translated_nodes, sent_all.report.local_nodes) == (3, 0)
@@ -0,0 +1,76 @@
+"""
+검토 탭 EPUB 파싱 캐시 테스트
+
+- 한 번 파싱한 EPUB은 _epub_temp의 캐시에서 다시 로드되는지 (챕터 재파싱 없음)
+- 최종 파일 생성 시 수정된 챕터만 다시 파싱하고 나머지는 번역본에서 복사하는지
+"""
+import zipfile
+from unittest.mock import MagicMock
+
+from domain.review_providers.epub_provider import EpubReviewProvider
+from utils.epub_processor import EpubProcessor
+
+CHAPTERS = {
+    "OEBPS/ch1.xhtml": "<html><head><title>一</title></head><body><p>甲</p><p>乙</p></body></html>",
+    "OEBPS/ch2.xhtml": "<html><head><title>二</title></head><body><p>丙</p></body></html>",
+}
+
+
+def _write_epub(path, chapters):
+    with zipfile.ZipFile(path, "w") as z:
+        z.writestr("mimetype", "application/epub+zip")
+        for name, html in chapters.items():
+            z.writestr(name, html.encode("utf-8") if isinstance(html, str) else html)
+
+
+def _provider(parse_calls):
+    app_service = MagicMock()
+    app_service.config = {"chunk_size": 6000, "integrity_max_items": 100}
+    provider = EpubReviewProvider(app_service)
+    original = provider.processor.parse_chapter
+
+    def counting_parse(content, file_name):
+        parse_calls.append(file_name)
+        return original(content, file_name)
+
+    provider.processor.parse_chapter = counting_parse
+    return provider
+
+
+def test_parse_cache_and_partial_final_rebuild(tmp_path):
+    source = tmp_path / "book.epub"
+    _write_epub(source, CHAPTERS)
+    processor = EpubProcessor()
+    translated_chapters = {}
+    for name, html in CHAPTERS.items():
+        arena = processor.parse_chapter(html.encode("utf-8"), name)
+        translated_chapters[name] = processor.reconstruct_arena(
+            arena, {arena.node_id(i): f"KO{arena.contents[i]}" for i in arena.text_indices()})
+    _write_epub(tmp_path / "book_translated.epub", translated_chapters)
+
+    calls = []
+    first = _provider(calls)
+    source_chunks = first.load_source_chunks(str(source))
+    assert source_chunks == {0: "一\n甲\n乙", 1: "二\n丙"}
+    first.load_metadata(str(source))
+    first.load_translated_chunks(str(source))
+    assert (tmp_path / "book_epub_temp" / "parse_cache_book.json").exists()
+    assert (tmp_path / "book_epub_temp" / "parse_cache_book_translated.json").exists()
+    # 원본/번역본 각각 한 번씩만 파싱 (같은 provider 안에서는 메모리 캐시)
+    assert sorted(calls) == sorted(list(CHAPTERS) * 2)
+
+    # 새 provider(검토 탭 재오픈)는 캐시만 읽음
+    calls.clear()
+    second = _provider(calls)
+    assert second.load_source_chunks(str(source)) == source_chunks
+    translated = second.load_translated_chunks(str(source))
+    assert translated == {0: "KO一\nKO甲\nKO乙", 1: "KO二\nKO丙"}
+    assert calls == []
+
+    # 두 번째 챕터만 수정 → 그 챕터만 다시 파싱
+    translated[1] = "KO二\n수정됨"
+    final_path = second.generate_final_file(str(source), translated)
+    assert calls == ["OEBPS/ch2.xhtml"]
+    with zipfile.ZipFile(final_path) as z:
+        assert z.read("OEBPS/ch1.xhtml") == translated_chapters["OEBPS/ch1.xhtml"]
+        assert "수정됨" in z.read("OEBPS/ch2.xhtml").decode("utf-8")
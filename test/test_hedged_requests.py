@@ -0,0 +1,160 @@
+"""
+헤지 요청 테스트
+
+- 응답이 관측 분포의 분위를 넘기면 다른 키로 같은 요청을 보내고, 먼저 온 결과를 채택하며 원 요청은 취소되는지
+- 헤지 예산(전체 요청 대비 비율)을 넘으면 헤지하지 않는지
+- 스트리밍 헤지는 factory로 만든 독립 감시기를 쓰는지 (없으면 헤지하지 않음)
+- 성공/응답 시간은 실제로 응답한 키 기준으로, 진 헤지의 할당량 소진은 헤지 키에 기록되는지
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.gemini_client import GeminiClient
+from infrastructure.key_health_store import CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN
+
+KEYS = ["key-primary-0001", "key-hedge-00002"]
+
+
+def _client(budget_ratio=1.0):
+    client = GeminiClient(auth_credentials=KEYS, api_timeout=30.0,
+                          hedge_quantile=0.5, hedge_budget_ratio=budget_ratio)
+    client.delay_between_requests = 0
+    for _ in range(30):
+        client.latency_tracker.record("gemini-test", len("prompt"), 0.05)
+    return client
+
+
+def _slow_primary(sdk_clients, gemini_response, primary_delay):
+    state = {"primary_cancelled": False}
+
+    async def primary(**kwargs):
+        try:
+            await asyncio.sleep(primary_delay)
+        except asyncio.CancelledError:
+            state["primary_cancelled"] = True
+            raise
+        return gemini_response("primary")
+
+    async def hedge(**kwargs):
+        return gemini_response("hedge")
+
+    sdk_clients[KEYS[0]].aio.models.generate_content = primary
+    sdk_clients[KEYS[1]].aio.models.generate_content = MagicMock(side_effect=hedge)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins_and_cancels_primary(sdk_clients, gemini_response):
+    client = _client()
+    state = _slow_primary(sdk_clients, gemini_response, primary_delay=30)
+
+    result = await client.generate_text_async("prompt", "gemini-test", max_retries=0)
+
+    assert result == "hedge"
+    assert state["primary_cancelled"]
+    assert client._hedge_request_count == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_outcome_recorded_against_winning_key(sdk_clients, gemini_response):
+    client = _client()
+    _slow_primary(sdk_clients, gemini_response, primary_delay=30)
+    # 원 요청 키가 쿨다운을 마친 확인 요청 상태여도 헤지 성공으로 복구되지 않아야 함
+    clock = {"now": 1_760_000_000.0}
+    client.key_health._clock = lambda: clock["now"]
+    client.key_health.record_quota_failure(KEYS[0])
+    clock["now"] += client.key_health.base_cooldown
+
+    await client.generate_text_async("prompt", "gemini-test", max_retries=0)
+
+    assert client.key_health.state(KEYS[0]) == CIRCUIT_HALF_OPEN
+    assert client.key_health.state(KEYS[1]) == CIRCUIT_CLOSED
+    # 응답 시간은 헤지 요청의 시작부터 (원 요청 시작부터면 헤지 지연만큼 길어짐)
+    assert client.latency_tracker.sample_count("gemini-test", len("prompt")) == 31
+    assert client.latency_tracker.quantile("gemini-test", len("prompt"), q=1.0) == 0.05
+
+
+@pytest.mark.asyncio
+async def test_losing_hedge_quota_failure_opens_hedge_key(sdk_clients, gemini_response):
+    client = _client()
+
+    async def primary(**kwargs):
+        await asyncio.sleep(0.3)
+        return gemini_response("primary")
+
+    async def hedge(**kwargs):
+        raise Exception("429 RESOURCE_EXHAUSTED: Quota exceeded for requests per day")
+
+    sdk_clients[KEYS[0]].aio.models.generate_content = primary
+    sdk_clients[KEYS[1]].aio.models.generate_content = hedge
+
+    result = await client.generate_text_async("prompt", "gemini-test", max_retries=0)
+
+    assert result == "primary"
+    assert client.key_health.state(KEYS[0]) == CIRCUIT_CLOSED
+    assert client.key_health.state(KEYS[1]) == CIRCUIT_OPEN
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_limits_duplicates(sdk_clients, gemini_response):
+    client = _client(budget_ratio=0.0)
+    _slow_primary(sdk_clients, gemini_response, primary_delay=0.3)
+
+    result = await client.generate_text_async("prompt", "gemini-test", max_retries=0)
+
+    assert result == "primary"
+    sdk_clients[KEYS[1]].aio.models.generate_content.assert_not_called()
+
+
+class _Stream:
+    def __init__(self, pieces, delay=0.0):
+        self.pieces = list(pieces)
+        self.delay = delay
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(self.delay)
+        if not self.pieces:
+            raise StopAsyncIteration
+        return SimpleNamespace(text=self.pieces.pop(0), prompt_feedback=None, candidates=[])
+
+
+@pytest.mark.asyncio
+async def test_stream_hedge_uses_independent_monitor(sdk_clients):
+    client = _client()
+
+    async def slow_stream(**kwargs):
+        return _Stream(["느린 ", "원 요청"], delay=30)
+
+    async def fast_stream(**kwargs):
+        return _Stream(["빠른 ", "헤지"])
+
+    sdk_clients[KEYS[0]].aio.models.generate_content_stream = slow_stream
+    sdk_clients[KEYS[1]].aio.models.generate_content_stream = fast_stream
+    primary_seen, hedge_seen = [], []
+
+    def factory():
+        return lambda delta: hedge_seen.append(delta)
+
+    result = await client.generate_text_async(
+        "prompt", "gemini-test", max_retries=0, stream=True,
+        stream_monitor=primary_seen.append, stream_monitor_factory=factory
+    )
+    assert result == "빠른 헤지"
+    assert hedge_seen == ["빠른 ", "헤지"] and primary_seen == []
+
+    # factory 없이 monitor만 있으면 헤지하지 않음
+    async def short_stream(**kwargs):
+        return _Stream(["원 요청"], delay=0.2)
+
+    sdk_clients[KEYS[0]].aio.models.generate_content_stream = short_stream
+    result = await client.generate_text_async(
+        "prompt", "gemini-test", max_retries=0, stream=True, stream_monitor=primary_seen.append
+    )
+    assert result == "원 요청" and primary_seen == ["원 요청"]
+    assert client._hedge_request_count == 1
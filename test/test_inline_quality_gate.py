@@ -0,0 +1,141 @@
+"""
+인라인 품질 게이트 테스트
+
+- 번역 직후 누락 의심 청크가 같은 작업 안에서 강제 분할로 재번역되고, 최종 파일에 새 번역이 들어가는지
+- 재번역 예산이 0이면 재번역하지 않고 기존 번역을 유지하는지
+- 값싼 검사(빈 번역/부분 실패 표시/극단적 비율)
+- 분할 번역이 남기는 모든 부분 실패 표시(서브 청크 실패 포함)를 값싼 검사가 잡는지
+- 강제 분할 재번역이 서브 청크 API 요청마다 RPM 제한기를 거치는지 (캐시 적중은 제외)
+"""
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from app.app_service import AppService
+from app.translation_job_queue import SharedChunkRateLimiter
+from core.exceptions import BtgTranslationException
+from domain.translation_service import TranslationService
+from utils.quality_check_service import find_cheap_quality_issue
+
+OMITTED_LINE = "Source line number 06."
+
+
+def _service(tmp_path, budget):
+    service = AppService()
+    service.gemini_client = MagicMock()
+    service.translation_service = MagicMock()
+    service.config.update({
+        "translation_mode": "standard",
+        "chunk_size": 40,
+        "max_workers": 1,
+        "requests_per_minute": 0,
+        "enable_post_processing": True,
+        "inline_quality_gate_enabled": True,
+        "inline_quality_retry_budget": budget,
+    })
+
+    async def fake_translate(text):
+        # 6번 청크만 대부분 누락된 번역
+        return "번역" if text.strip() == OMITTED_LINE else f"번역: {text.strip()}"
+
+    service.translation_service.translate_chunk_async = AsyncMock(side_effect=fake_translate)
+    service.translation_service.translate_text_force_split_async = AsyncMock(
+        side_effect=lambda text, *args, **kwargs: f"번역: {text.strip()}")
+    input_file = tmp_path / "novel.txt"
+    input_file.write_text("".join(f"Source line number {i:02d}.\n" for i in range(10)), encoding="utf-8")
+    return service, input_file, tmp_path / "novel_translated.txt"
+
+
+@pytest.mark.asyncio
+async def test_suspect_chunk_is_retranslated_within_job(tmp_path):
+    service, input_file, output_file = _service(tmp_path, budget=3)
+    await service.start_translation_async(str(input_file), str(output_file))
+
+    force_split = service.translation_service.translate_text_force_split_async
+    assert force_split.await_count == 1
+    assert force_split.await_args.args[0].strip() == OMITTED_LINE
+    final = output_file.read_text(encoding="utf-8")
+    assert final.count("번역:") == 10
+    assert f"번역: {OMITTED_LINE}" in final
+    # 재번역 결과는 원래 위치(6번)에 들어감
+    assert final.index("번역: Source line number 05.") < final.index(f"번역: {OMITTED_LINE}") < final.index("번역: Source line number 07.")
+
+
+@pytest.mark.asyncio
+async def test_zero_budget_keeps_original_translation(tmp_path):
+    service, input_file, output_file = _service(tmp_path, budget=0)
+    await service.start_translation_async(str(input_file), str(output_file))
+
+    service.translation_service.translate_text_force_split_async.assert_not_awaited()
+    final = output_file.read_text(encoding="utf-8")
+    assert final.count("번역:") == 9
+    assert f"번역: {OMITTED_LINE}" not in final
+
+
+def test_cheap_quality_checks():
+    source = "가" * 600
+    assert find_cheap_quality_issue(source, "  \n") == "empty"
+    assert find_cheap_quality_issue(source, "번역 [번역 오류로 인한 실패: 가가가...] 번역" * 20) == "partial_failure"
+    assert find_cheap_quality_issue(source, "나" * 50) == "extreme_ratio"
+    assert find_cheap_quality_issue(source, "나" * 700) is None
+    assert find_cheap_quality_issue("짧은 원문", "x") is None
+
+
+@pytest.mark.asyncio
+async def test_sub_chunk_failure_marker_is_partial_failure():
+    service = TranslationService(gemini_client=MagicMock(), config={"max_workers": 4})
+
+    async def fake_translate(text, stream=False):
+        if "BAD" in text:
+            raise BtgTranslationException("API 오류로 번역할 수 없습니다.")
+        return text.replace("line", "줄")
+
+    service.translate_text_async = fake_translate
+    source = "\n".join(f"line {i:03d}." for i in range(60)) + "\nline BAD.\n" + "\n".join(f"line {i:03d}." for i in range(60))
+
+    translated = await service.translate_text_force_split_async(source, max_split_attempts=2, min_chunk_size=10)
+
+    assert "[서브 청크 2 번역 실패" in translated
+    assert find_cheap_quality_issue(source, translated) == "partial_failure"
+    assert find_cheap_quality_issue(source, translated.replace("번역 실패: API 오류로 번역할 수 없습니다.", "번역 오류")) == "partial_failure"
+    assert find_cheap_quality_issue(source, "[분할 불가능한 오류 발생 콘텐츠: line...]") == "partial_failure"
+
+
+@pytest.mark.asyncio
+async def test_retranslation_charges_rate_limiter_per_sub_request(tmp_path, monkeypatch):
+    service, input_file, output_file = _service(tmp_path, budget=3)
+    slot_waits = []
+    original_wait = SharedChunkRateLimiter.wait_for_slot
+
+    async def counting_wait(self):
+        slot_waits.append(1)
+        await original_wait(self)
+
+    monkeypatch.setattr(SharedChunkRateLimiter, "wait_for_slot", counting_wait)
+
+    async def fake_force_split(text, *args, request_gate=None, **kwargs):
+        # 두 서브 청크 요청
+        await request_gate()
+        await request_gate()
+        return f"번역: {text.strip()}"
+
+    service.translation_service.translate_text_force_split_async = AsyncMock(side_effect=fake_force_split)
+    await service.start_translation_async(str(input_file), str(output_file))
+
+    # 첫 번역 10회 + 재번역 서브 청크 2회
+    assert len(slot_waits) == 12
+    assert f"번역: {OMITTED_LINE}" in output_file.read_text(encoding="utf-8")
+
+
+@pytest.mark.asyncio
+async def test_force_split_awaits_request_gate_for_each_uncached_sub_request():
+    service = TranslationService(gemini_client=MagicMock(), config={"max_workers": 4})
+    service.translate_text_async = AsyncMock(side_effect=lambda text, stream=False: text.replace("line", "줄"))
+    gate = AsyncMock()
+    source = "\n".join(f"line {i:03d}." for i in range(40))
+
+    await service.translate_text_force_split_async(source, min_chunk_size=10, request_gate=gate)
+    assert gate.await_count == service.translate_text_async.await_count == 2
+
+    # 같은 구간 재요청은 캐시에서 처리되어 RPM을 차감하지 않음
+    await service.translate_text_force_split_async(source, min_chunk_size=10, request_gate=gate)
+    assert gate.await_count == 2
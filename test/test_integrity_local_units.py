@@ -0,0 +1,51 @@
+"""
+무결성 모드 로컬 단위 처리 테스트
+
+빈 줄, 구분선, 숫자/구두점만 있는 줄은 API 요청에서 빠지고 원문 그대로 조립되는지 확인합니다.
+"""
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from core.dtos import TranslationUnit
+from domain.translation_service import TranslationService
+from utils.chunk_service import is_translatable_unit_text, partition_translatable_units
+
+
+def test_classifier_keeps_only_script_content():
+    for text in ["", "   ", "***", "＊＊＊", "123", "——", "……", "「」", "1.", "♥♥"]:
+        assert not is_translatable_unit_text(text), text
+    for text in ["「好」", "A", "第1章", "はい", "네.", "Chapter 3"]:
+        assert is_translatable_unit_text(text), text
+
+    units = [TranslationUnit(id=str(i), text=t) for i, t in enumerate(["你好", "", "***", "再见"])]
+    remote, local = partition_translatable_units(units)
+    assert [u.id for u in remote] == ["0", "3"]
+    assert local == {"1": "", "2": "***"}
+
+
+@pytest.mark.asyncio
+async def test_integrity_sends_only_translatable_units():
+    payloads = []
+
+    async def fake_generate(prompt, **kwargs):
+        text = prompt[-1].parts[0].text
+        items = json.loads(text[text.index("["):text.rindex("]") + 1])
+        payloads.append(items)
+        return [{"id": item["id"], "translated_text": f"KO:{item['text']}"} for item in items]
+
+    client = MagicMock()
+    client.generate_text_async = AsyncMock(side_effect=fake_generate)
+    service = TranslationService(gemini_client=client, config={"chunk_size": 6000, "integrity_max_items": 200})
+    service._construct_prompt = lambda chunk_text: chunk_text
+
+    text = "第一章\n\n***\n「你好」\n123\n……\n再见"
+    result = await service.translate_text_integrity(text)
+
+    assert [item["id"] for item in payloads[0]] == ["0", "3", "6"]
+    assert result == "KO:第一章\n\n***\nKO:「你好」\n123\n……\nKO:再见"
+
+    # 번역할 단위가 하나도 없으면 API를 호출하지 않음
+    client.generate_text_async.reset_mock()
+    assert await service.translate_text_integrity("***\n\n---") == "***\n\n---"
+    client.generate_text_async.assert_not_called()
@@ -0,0 +1,125 @@
+"""
+무결성 모드 간결한 전송 형식(⟦n⟧ 줄 표식) 테스트
+
+- 직렬화/해석 왕복과 여러 줄 단위 처리
+- 잘리거나 잡음이 섞인 응답에서 완성된 줄만 복구하는지
+- 누락된 id만 다시 요청하는지
+- 기본 JSON 형식에서도 깨진 응답의 온전한 객체를 살리고, Binary Split 절반을 동시에 요청하는지
+"""
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from core.dtos import TranslationUnit
+from domain.translation_service import TranslationService
+from utils.integrity_wire_format import (
+    CompactResponseParser, encode_compact_units, parse_compact_response, salvage_json_objects
+)
+
+
+def _units(*texts):
+    return [TranslationUnit(id=f"ch1.xhtml_{i}", text=t) for i, t in enumerate(texts)]
+
+
+def test_round_trip_with_multiline_unit():
+    units = _units("第一章", "他说：\n「走吧」", "完")
+    encoded = encode_compact_units(units)
+    assert encoded == "⟦1⟧ 第一章\n⟦2⟧ 他说：\n「走吧」\n⟦3⟧ 完"
+    assert parse_compact_response(encoded, units) == {u.id: u.text for u in units}
+
+
+def test_parser_recovers_partial_and_noisy_responses():
+    units = _units("a", "b", "c")
+    # 코드 펜스, 머리말, 알 수 없는 표식은 무시
+    noisy = "Here you go:\n```\n⟦1⟧ 가\n\n⟦9⟧ 엉뚱함\n⟦3⟧ 다\n```"
+    assert parse_compact_response(noisy, units) == {"ch1.xhtml_0": "가", "ch1.xhtml_2": "다"}
+
+    # 스트리밍 조각이 줄 중간에서 끊겨도 같은 결과, 잘린 마지막 줄은 버림
+    parser = CompactResponseParser(units)
+    for piece in ["⟦1⟧ ", "가\n⟦2", "⟧ 나\n⟦3⟧ 다", "(잘림"]:
+        parser.feed(piece)
+    assert parser.close() == {"ch1.xhtml_0": "가", "ch1.xhtml_1": "나", "ch1.xhtml_2": "다(잘림"}
+
+    truncated = "⟦1⟧ 가\n⟦2⟧ 나(잘"
+    assert parse_compact_response(truncated, units) == {"ch1.xhtml_0": "가"}
+
+
+@pytest.mark.asyncio
+async def test_compact_format_retries_only_missing_ids():
+    requests = []
+
+    async def fake_generate(prompt, **kwargs):
+        body = prompt[-1].parts[0].text
+        requests.append((body, kwargs["generation_config_dict"]))
+        if len(requests) == 1:
+            return "⟦1⟧ 하나\n⟦3⟧ 셋"  # 2번 누락
+        return "⟦1⟧ 둘"
+
+    client = MagicMock()
+    client.generate_text_async = AsyncMock(side_effect=fake_generate)
+    service = TranslationService(gemini_client=client, config={"integrity_wire_format": "compact"})
+    service._construct_prompt = lambda chunk_text: chunk_text
+
+    result = await service._translate_integrity_chunk_with_retry(_units("one", "two", "three"))
+
+    assert result == {"ch1.xhtml_0": "하나", "ch1.xhtml_1": "둘", "ch1.xhtml_2": "셋"}
+    assert "response_mime_type" not in requests[0][1]
+    assert requests[1][0].startswith("⟦1⟧ two")
+    assert "three" not in requests[1][0]
+
+
+def test_salvage_extracts_well_formed_objects_from_broken_json():
+    broken = (
+        '```json\n[{"id": "0", "translated_text": "하나 {괄호}"}, '
+        '{"id": "1", "translated_text": "둘" "깨짐"}, '
+        '{"id": "2", "translated_text": "셋"}, {"id": "3", "translated_te'
+    )
+    items = salvage_json_objects(broken)
+    assert [item["id"] for item in items] == ["0", "2"]
+    assert items[0]["translated_text"] == "하나 {괄호}"
+    assert salvage_json_objects({"items": [{"id": "0", "translated_text": "a"}]}) == [{"id": "0", "translated_text": "a"}]
+    assert salvage_json_objects("not json at all") == []
+
+
+@pytest.mark.asyncio
+async def test_broken_json_retries_only_missing_ids_and_splits_concurrently():
+    requests = []
+
+    async def fake_generate(prompt, **kwargs):
+        body = prompt[-1].parts[0].text
+        requests.append(body)
+        if len(requests) == 1:
+            return '[{"id": "0", "translated_text": "하나"}, {"id": "1", "translated_text": "둘"}, {"id": "2", "tr'
+        return '[{"id": "2", "translated_text": "셋"}]'
+
+    client = MagicMock()
+    client.generate_text_async = AsyncMock(side_effect=fake_generate)
+    service = TranslationService(gemini_client=client, config={})
+    service._construct_prompt = lambda chunk_text: chunk_text
+
+    units = [TranslationUnit(id=str(i), text=t) for i, t in enumerate(["one", "two", "three"])]
+    result = await service._translate_integrity_chunk_with_retry(units)
+
+    assert result == {"0": "하나", "1": "둘", "2": "셋"}
+    assert len(requests) == 2 and '"three"' in requests[1] and '"one"' not in requests[1]
+
+    # 살릴 객체가 없으면 두 절반을 동시에 요청
+    in_flight = []
+    peak = []
+
+    async def slow_generate(prompt, **kwargs):
+        in_flight.append(1)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        if len(peak) == 1:
+            return "garbage"
+        body = prompt[-1].parts[0].text
+        return [{"id": item["id"], "translated_text": "번역"} for item in json.loads(body[body.index("["):body.rindex("]") + 1])]
+
+    client.generate_text_async = AsyncMock(side_effect=slow_generate)
+    result = await service._translate_integrity_chunk_with_retry(units)
+    assert set(result) == {"0", "1", "2"}
+    assert max(peak) == 2
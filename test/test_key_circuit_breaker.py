@@ -0,0 +1,168 @@
+"""
+API 키 서킷 브레이커 테스트
+
+- closed → open(쿨다운 2배씩 증가) → half_open(확인 요청 1건) → closed 전이
+- 상태가 파일에 저장되어 새 인스턴스(새 실행)에서도 유지되고, 파일에 키 원문이 남지 않는지
+- 할당량 날짜가 바뀌면 차단된 키도 확인 요청을 허용하는지
+- 클라이언트가 차단된 키를 요청 없이 건너뛰고, 쿨다운이 끝난 키는 재시도 없이 1건만 보내는지
+- 확인 요청이 할당량과 무관한 이유(타임아웃 등)로 실패하면 다음 확인 요청을 다시 허용하는지
+- 종료 시 저장하지 않은 카운터를 기록하고, 상태 파일 상대 경로는 설정 파일 폴더 기준인지
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.config.config_manager import ConfigManager
+from infrastructure.gemini_client import GeminiAllApiKeysExhaustedException, GeminiClient
+from infrastructure.key_health_store import (
+    CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN, KeyHealthStore, key_fingerprint,
+)
+
+KEYS = ["key-exhausted-0001", "key-healthy-00002"]
+QUOTA_ERROR = Exception("429 RESOURCE_EXHAUSTED: Quota exceeded for requests per day")
+
+
+class Clock:
+    def __init__(self, now=1_760_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_transitions_and_backoff():
+    clock = Clock()
+    store = KeyHealthStore(base_cooldown=100, max_cooldown=300, clock=clock)
+    assert store.allow_request(KEYS[0]) and store.state(KEYS[0]) == CIRCUIT_CLOSED
+
+    store.record_quota_failure(KEYS[0])
+    assert store.state(KEYS[0]) == CIRCUIT_OPEN and not store.allow_request(KEYS[0])
+    clock.now += 100
+    assert store.state(KEYS[0]) == CIRCUIT_HALF_OPEN
+    assert store.allow_request(KEYS[0]) and store.is_probing(KEYS[0])
+    assert not store.allow_request(KEYS[0])  # 확인 요청은 1건만
+
+    store.record_quota_failure(KEYS[0])
+    assert store.remaining_cooldown(KEYS[0]) == 200
+    clock.now += 200
+    store.allow_request(KEYS[0])
+    store.record_quota_failure(KEYS[0])
+    assert store.remaining_cooldown(KEYS[0]) == 300  # 상한
+
+    clock.now += 300
+    assert store.allow_request(KEYS[0])
+    store.record_success(KEYS[0])
+    assert store.state(KEYS[0]) == CIRCUIT_CLOSED and not store.is_probing(KEYS[0])
+
+
+def test_state_persists_across_runs_without_raw_keys(tmp_path):
+    path = tmp_path / "key_health.json"
+    clock = Clock()
+    first_run = KeyHealthStore(path, clock=clock)
+    first_run.record_request(KEYS[0])
+    first_run.record_quota_failure(KEYS[0])
+
+    assert KEYS[0] not in path.read_text(encoding="utf-8")
+    records = json.loads(path.read_text(encoding="utf-8"))["keys"]
+    assert [record["requests"] for record in records.values()] == [1]
+
+    second_run = KeyHealthStore(path, clock=clock)
+    assert not second_run.is_available(KEYS[0])
+    assert second_run.is_available(KEYS[1])
+
+    # 할당량 날짜가 바뀌면 확인 요청 허용, 일일 카운터 초기화
+    clock.now += 86400
+    assert second_run.state(KEYS[0]) == CIRCUIT_HALF_OPEN
+    second_run.record_quota_failure(KEYS[0])
+    assert second_run.remaining_cooldown(KEYS[0]) == second_run.base_cooldown
+
+
+@pytest.mark.asyncio
+async def test_client_skips_known_dead_key_at_startup(tmp_path, sdk_clients):
+    path = tmp_path / "key_health.json"
+    KeyHealthStore(path).record_quota_failure(KEYS[0])
+
+    client = GeminiClient(auth_credentials=KEYS, key_health_path=path)
+    client.delay_between_requests = 0
+    assert client.current_api_key == KEYS[1]
+
+    result = await client.generate_text_async("prompt", "gemini-test", max_retries=3)
+    assert result == f"ok from {KEYS[1]}"
+    sdk_clients[KEYS[0]].aio.models.generate_content.assert_not_awaited()
+    assert KeyHealthStore(path).is_available(KEYS[1])
+
+
+@pytest.mark.asyncio
+async def test_cooled_down_key_gets_single_probe(tmp_path, sdk_clients):
+    path = tmp_path / "key_health.json"
+    store = KeyHealthStore(path)
+    store.record_quota_failure(KEYS[0])
+    state = next(iter(store._states.values()))
+    state.opened_at -= state.cooldown  # 쿨다운 종료
+    store.save()
+
+    client = GeminiClient(auth_credentials=KEYS[0], key_health_path=path)
+    client.delay_between_requests = 0
+    sdk = sdk_clients[KEYS[0]]
+    sdk.aio.models.generate_content = AsyncMock(side_effect=QUOTA_ERROR)
+
+    with pytest.raises(GeminiAllApiKeysExhaustedException):
+        await client.generate_text_async("prompt", "gemini-test", max_retries=5, initial_backoff=0.0)
+    assert sdk.aio.models.generate_content.await_count == 1
+    assert KeyHealthStore(path).state(KEYS[0]) == CIRCUIT_OPEN
+
+    # 차단 중에는 요청 없이 바로 실패
+    with pytest.raises(GeminiAllApiKeysExhaustedException):
+        await client.generate_text_async("prompt", "gemini-test", max_retries=5, initial_backoff=0.0)
+    assert sdk.aio.models.generate_content.await_count == 1
+    assert client.client is not None
+
+
+@pytest.mark.asyncio
+async def test_probe_failing_with_timeout_allows_next_probe(tmp_path, sdk_clients, gemini_response):
+    path = tmp_path / "key_health.json"
+    store = KeyHealthStore(path)
+    store.record_quota_failure(KEYS[0])
+    state = next(iter(store._states.values()))
+    state.opened_at -= state.cooldown
+    store.save()
+
+    client = GeminiClient(auth_credentials=KEYS[0], api_timeout=0.05, key_health_path=path)
+    client.delay_between_requests = 0
+    sdk = sdk_clients[KEYS[0]]
+
+    async def hang(**kwargs):
+        await asyncio.sleep(30)
+
+    sdk.aio.models.generate_content = AsyncMock(side_effect=hang)
+    with pytest.raises(GeminiAllApiKeysExhaustedException):
+        await client.generate_text_async("prompt", "gemini-test", max_retries=5, initial_backoff=0.0)
+    assert sdk.aio.models.generate_content.await_count == 1
+    assert not client.key_health.is_probing(KEYS[0])
+    assert client.key_health.state(KEYS[0]) == CIRCUIT_HALF_OPEN
+
+    # 다음 요청에서 다시 확인 요청을 보내고, 성공하면 정상 복귀
+    sdk.aio.models.generate_content = AsyncMock(return_value=gemini_response("ok"))
+    assert await client.generate_text_async("prompt", "gemini-test", max_retries=5) == "ok"
+    assert client.key_health.state(KEYS[0]) == CIRCUIT_CLOSED
+
+
+def test_close_flushes_pending_counters(tmp_path, sdk_clients):
+    path = tmp_path / "key_health.json"
+    client = GeminiClient(auth_credentials=KEYS, key_health_path=path)
+    client.key_health.record_request(KEYS[0])
+    client.key_health.record_request(KEYS[0])  # 저장 간격 안이라 아직 파일에 없음
+
+    client.close()
+
+    records = json.loads(path.read_text(encoding="utf-8"))["keys"]
+    assert records[key_fingerprint(KEYS[0])]["requests"] == 2
+
+
+def test_relative_store_path_resolves_next_to_config(tmp_path):
+    config_path = tmp_path / "profiles" / "config.json"
+    manager = ConfigManager(config_path)
+    assert manager.resolve_relative_path("key_health.json") == config_path.resolve().parent / "key_health.json"
+    assert manager.resolve_relative_path(tmp_path / "abs.json") == tmp_path / "abs.json"
@@ -0,0 +1,53 @@
+"""
+무결성 줄 저장소 테스트
+
+- LineStore 줄 구분이 str.splitlines와 같은지
+- 줄 길이만으로 계산한 청크 범위가 split_nodes_into_chunks(TranslationUnit 목록)와 같은지
+- 파일에서 만든 저장소가 번역 파이프라인의 줄 리더와 같은 줄을 보는지 (BOM, CRLF)
+"""
+import random
+
+from core.dtos import TranslationUnit
+from infrastructure.file_handler import iter_text_file_lines
+from utils.chunk_service import ChunkService
+from utils.line_store import LineStore, iter_line_chunks, load_line_store
+
+
+def test_line_store_matches_unit_chunking():
+    rng = random.Random(39)
+    service = ChunkService()
+    for alphabet in (["a", "bb", "\n", "가나다"], ["a", "\n", "\r\n", "\r", "\x0c", " ", "가나다"]):
+        for _ in range(500):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            store = LineStore.from_text(text)
+            assert store.lines() == text.splitlines()
+            assert len(store) == len(text.splitlines())
+
+            max_size, max_items = rng.randint(1, 15), rng.randint(1, 5)
+            units = [TranslationUnit(id=str(i), text=line) for i, line in enumerate(text.splitlines())]
+            expected = [[u.id for u in chunk] for chunk in service.split_nodes_into_chunks(units, max_size, max_items)]
+            ranges = store.chunk_ranges(max_size, max_items)
+            assert [[u.id for u in store.to_units(a, b)] for a, b in ranges] == expected
+            streamed = list(iter_line_chunks(store.iter_lines(), max_size, max_items))
+            assert [(start, len(lines)) for start, lines in streamed] == [(a, b - a) for a, b in ranges]
+
+
+def test_load_line_store_reuses_until_file_changes(tmp_path):
+    path = tmp_path / "novel.txt"
+    path.write_text("첫 줄\n둘째 줄", encoding="utf-8")
+    store = load_line_store(path)
+    assert load_line_store(path) is store
+
+    path.write_text("첫 줄\n둘째 줄\n셋째 줄", encoding="utf-8")
+    assert load_line_store(path).lines() == ["첫 줄", "둘째 줄", "셋째 줄"]
+
+
+def test_file_store_matches_pipeline_reader_with_bom_and_crlf(tmp_path):
+    path = tmp_path / "novel.txt"
+    path.write_bytes("\ufeffabc\r\n둘째 줄\r\n\r\n넷째\r마지막".encode("utf-8"))
+
+    store = LineStore.from_file(path)
+
+    assert store.line(0) == "abc"
+    assert store.lines() == list(iter_text_file_lines(path)) == ["abc", "둘째 줄", "", "넷째", "마지막"]
+    assert list(store.lengths()) == [3, 4, 0, 2, 3]
@@ -0,0 +1,119 @@
+"""
+번역 출력 검증 테스트 (미번역 원문 잔존 / 반복 루프)
+
+- 문자 체계 히스토그램과 잔존 구간 길이
+- 꼬리 반복(Z-배열)과 연속 반복 줄 감지, 원문에 이미 있는 반복은 통과
+- 스트리밍용 증분 감지기
+- 메타데이터에 기록된 출력 문제가 품질 분석 결과에 합쳐지는지, 번역 작업이 실제로 기록하는지
+"""
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from app.app_service import AppService
+from infrastructure.file_handler import get_metadata_file_path, read_json_file
+from utils.output_validation import (
+    RepetitionLoopDetector, find_tail_repetition, longest_repeated_line_run, longest_script_run,
+    script_histogram, validate_translation_output,
+)
+from utils.quality_check_service import QualityCheckService, find_cheap_quality_issue
+
+JA_SOURCE = "".join(f"彼女は{i}回目に窓の外を眺めた。雨はまだ止みそうにない。\n" for i in range(20))
+KO_TRANSLATION = "".join(f"그녀는 {i}번째로 창밖을 바라보았다. 비는 아직 그칠 것 같지 않았다.\n" for i in range(20))
+
+
+def test_script_histogram_and_residue_run():
+    histogram = script_histogram("한국어 漢字 かな カナ abc")
+    assert histogram == {"hangul": 3, "han": 2, "kana": 4, "latin": 3}
+    # 문장부호/공백은 구간을 끊지 않음
+    assert longest_script_run("번역 雨はまだ、止みそうにない。 끝", ("han", "kana")) == 11
+
+
+def test_residue_detected_only_when_source_has_that_script():
+    residue = KO_TRANSLATION[:300] + JA_SOURCE[:120] + KO_TRANSLATION[300:]
+    report = validate_translation_output(JA_SOURCE, residue, "ko")
+    assert report.issues == ["untranslated_residue"]
+    assert report.longest_residue_run >= 20
+    assert report.to_metadata()["issues"] == ["untranslated_residue"]
+
+    # 한자 병기 정도는 통과, 정상 번역은 문제 없음
+    assert validate_translation_output(JA_SOURCE, "漢字(한자) " + KO_TRANSLATION, "ko").issues == []
+    assert validate_translation_output(JA_SOURCE, KO_TRANSLATION, "ko").issues == []
+    # 원문에 없던 문자 체계는 잔존이 아님
+    assert validate_translation_output("plain english " * 50, JA_SOURCE, "ko").issues == []
+
+
+def test_tail_repetition_finds_basic_unit():
+    looped = KO_TRANSLATION[:400] + "그는 같은 말을 되풀이했다. " * 30
+    loop = find_tail_repetition(looped)
+    assert loop is not None and loop.period == len("그는 같은 말을 되풀이했다. ")
+    assert loop.repeats >= 29
+    assert find_tail_repetition(KO_TRANSLATION[:-1] + "끝.") is None
+    # 짧은 반복(웃음 등)은 길이 하한 때문에 통과
+    assert find_tail_repetition(KO_TRANSLATION + "ㅋ" * 30) is None
+
+
+def test_repetition_loop_compared_with_source():
+    looped = KO_TRANSLATION + "같은 문장이 반복된다.\n" * 40
+    assert validate_translation_output(JA_SOURCE, looped).issues == ["repetition_loop"]
+    # 반복되는 줄 (끝이 아니어도 연속 줄로 감지)
+    lines = "정상 문장.\n" + "후렴입니다\n" * 8 + KO_TRANSLATION
+    assert longest_repeated_line_run(lines) == 8
+    assert validate_translation_output(JA_SOURCE, lines).issues == ["repetition_loop"]
+    # 원문도 같은 만큼 반복하면 통과
+    assert validate_translation_output("リフレインです\n" * 8 + JA_SOURCE, lines).issues == []
+
+
+def test_stream_detector_reports_loop_early():
+    detector = RepetitionLoopDetector(check_interval=128)
+    assert detector.feed(KO_TRANSLATION) is None
+    loop = None
+    for _ in range(100):
+        loop = detector.feed("반복되는 문장입니다. ")
+        if loop:
+            break
+    assert loop is not None and loop.period == len("반복되는 문장입니다. ")
+    assert detector.total_chars < len(KO_TRANSLATION) + 600
+
+
+def test_cheap_check_and_analysis_include_output_issues():
+    residue = KO_TRANSLATION + JA_SOURCE[:200]
+    assert find_cheap_quality_issue(JA_SOURCE, residue) == "untranslated_residue"
+    assert find_cheap_quality_issue(JA_SOURCE, KO_TRANSLATION) is None
+
+    chunks = {str(i): {"source_length": 1000 + i * 50, "translated_length": 1200 + i * 60} for i in range(10)}
+    chunks["3"]["output_issues"] = {"issues": ["repetition_loop"], "loop_period": 12, "loop_span": 480}
+    result = QualityCheckService().analyze_translation_quality({"translated_chunks": chunks})
+    assert [(item["chunk_index"], item["issue_type"]) for item in result] == [(3, "repetition_loop")]
+    assert abs(result[0]["z_score"]) < 2.0
+
+
+@pytest.mark.asyncio
+async def test_translation_job_records_output_issues(tmp_path):
+    service = AppService()
+    service.gemini_client = MagicMock()
+    service.translation_service = MagicMock()
+    service.config.update({
+        "translation_mode": "standard",
+        "chunk_size": 40,
+        "max_workers": 1,
+        "requests_per_minute": 0,
+        "enable_post_processing": True,
+        "inline_quality_gate_enabled": True,
+        "inline_quality_retry_budget": 0,
+        "target_translation_language": "ko",
+    })
+
+    async def fake_translate(text):
+        # 3장이 든 청크만 원문 일부가 그대로 남음
+        if "第03" in text:
+            return "번역 " + "彼女は静かに窓の外を眺めていた" * 2
+        return "번역된 문장입니다."
+
+    service.translation_service.translate_chunk_async = AsyncMock(side_effect=fake_translate)
+    input_file = tmp_path / "novel.txt"
+    input_file.write_text("".join(f"第{i:02d}章の本文です。\n" for i in range(6)), encoding="utf-8")
+    await service.start_translation_async(str(input_file), str(tmp_path / "novel_translated.txt"))
+
+    chunks = read_json_file(get_metadata_file_path(input_file))["translated_chunks"]
+    flagged = [info["output_issues"]["issues"] for info in chunks.values() if "output_issues" in info]
+    assert flagged == [["untranslated_residue"]]
@@ -0,0 +1,92 @@
+"""
+미리 컴파일된 후처리 엔진 테스트
+
+- 트리거 기반 규칙 선택 결과가 규칙을 차례로 모두 적용하는 기존 구현(공용 기준 구현)과 같은지
+- 프로세스 풀 / 스트리밍 조립 결과가 단일 프로세스 / 메모리 병합 결과와 같은지
+"""
+import random
+from unittest.mock import patch
+
+from test.post_processing_reference import legacy_clean_translated_content
+from utils.output_assembler import OutputAssembler
+from utils.post_processing_service import PostProcessingService
+
+FRAGMENTS = [
+    "번역", "결과", ":", "Translation", "TRANſLATION", "KOREAN", "Korean", "한국어",
+    "전자책", "은", "네트워크", "업로드", "txt", "무료", "다운로드", "네티즌", "(", ")",
+    "www.", "WWW.", "베이커", "최고의", "소설", "사이트", "독자들의", "보물창고", "천국",
+    "가장", "간단하고", "직접적인", "읽기", "주소는", "입니다.", "를", "지원합니다!",
+    "```", "`", "<thinking>", "</thinking>", "<THINKING>", "<", "b>", "</p>", "<상태창>",
+    " ", "\n", "\n\n\n", "##", "가나다",
+]
+
+
+def test_compiled_engine_matches_sequential_rules():
+    service = PostProcessingService()
+    rng = random.Random(7)
+    for _ in range(3000):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 30)))
+        for config in ({}, {"clean_html_tags": False}):
+            assert service.clean_translated_content(text, config) == legacy_clean_translated_content(service, text, config), repr(text)
+
+
+def test_unicode_case_folding_still_triggers_rules():
+    service = PostProcessingService()
+    # 켈빈 기호(K)는 re.IGNORECASE에서 k와 일치하므로 헤더 규칙이 실행되어야 함
+    text = "\u212aorean 번역문\n\n본문입니다."
+    cleaned = service.clean_translated_content(text, {})
+    assert cleaned == legacy_clean_translated_content(service, text, {})
+    assert "orean" not in cleaned
+
+
+def test_process_pool_and_streaming_match_in_memory_merge(tmp_path):
+    service = PostProcessingService()
+    chunks = {i: f"번역 결과:\n{i}번째 문단 <p>텍스트</p>\n\n\n\n(www.ad.com) 끝" for i in range(40)}
+    serial = service.post_process_merged_chunks(chunks, {"post_processing_parallel_min_chunks": 0})
+    pooled = service.post_process_merged_chunks(
+        chunks, {"post_processing_parallel_min_chunks": 1, "post_processing_workers": 2}
+    )
+    assert pooled == serial
+
+    output = tmp_path / "final.txt"
+    OutputAssembler(output, service, {}).assemble(chunks)
+    assert output.read_text(encoding="utf-8") == service.post_process_and_clean_chunks(chunks, {})
+
+    # 작업 경로의 조립기도 청크가 많으면 프로세스 풀로 정리하며 결과는 같음
+    pooled_output = tmp_path / "final_pooled.txt"
+    pool_config = {"post_processing_parallel_min_chunks": 1, "post_processing_workers": 2}
+    with patch("utils.output_assembler.OutputAssembler.render_chunk", side_effect=AssertionError("직렬 정리")):
+        OutputAssembler(pooled_output, service, pool_config).assemble(chunks)
+    assert pooled_output.read_bytes() == output.read_bytes()
+
+
+def test_open_keeps_matching_prefix_and_rewrites_from_first_change(tmp_path):
+    service = PostProcessingService()
+    output = tmp_path / "final.txt"
+    chunks = {i: f"{i}번째 문단" for i in range(6)}
+    state = OutputAssembler(output, service, {}).assemble(chunks)
+
+    chunks[3] = "바뀐 문단"
+    assembler = OutputAssembler(output, service, {}, previous_state=state)
+    assert assembler.open(chunks) == 6
+    new_state = assembler.finish()
+    assert assembler._kept_pieces == 3
+    assert new_state["piece_ends"][:3] == state["piece_ends"][:3]
+    assert output.read_text(encoding="utf-8") == "\n\n".join(chunks[i] for i in range(6))
+
+
+def test_review_final_file_matches_translation_output(tmp_path):
+    from types import SimpleNamespace
+    from domain.review_providers.standard_provider import StandardReviewProvider
+
+    chunks = {i: f"##CHUNK_INDEX: {i}##\n번역 결과:\n{i}번째 문단\n\n\n\n끝" for i in range(5)}
+    for enable in (True, False):
+        config = {"enable_post_processing": enable}
+        app_service = SimpleNamespace(config=config, post_processing_service=PostProcessingService())
+        provider = StandardReviewProvider(app_service)
+        final_path = provider.generate_final_file(str(tmp_path / "novel.txt"), chunks)
+
+        expected = tmp_path / f"expected_{enable}.txt"
+        OutputAssembler(expected, app_service.post_processing_service, config).assemble(chunks)
+        assert open(final_path, encoding="utf-8").read() == expected.read_text(encoding="utf-8")
+        assert "CHUNK_INDEX" not in expected.read_text(encoding="utf-8")
@@ -1,5 +1,18 @@
+import random
 import unittest
-from utils.quality_check_service import QualityCheckService
+from utils.quality_check_service import QualityCheckService, QualityCheckTracker, collect_data_points, fit_robust_line, np
+
+
+def _noisy_metadata(n=60, outliers=None, seed=5):
+    """y ≈ 1.2x + 30 (±3%) 데이터에 지정한 청크만 (배율) 적용"""
+    rng = random.Random(seed)
+    outliers = outliers or {}
+    chunks = {}
+    for i in range(n):
+        x = rng.randint(800, 3000)
+        y = int((1.2 * x + 30) * rng.uniform(0.97, 1.03) * outliers.get(i, 1.0))
+        chunks[str(i)] = {"source_length": x, "translated_length": y}
+    return {"translated_chunks": chunks}
 
 class TestQualityCheckService(unittest.TestCase):
     def setUp(self):
@@ -91,5 +104,60 @@ class TestQualityCheckService(unittest.TestCase):
         result = self.service.analyze_translation_quality(metadata)
         self.assertEqual(result, [])
 
+    def test_outliers_do_not_mask_each_other(self):
+        """여러 환각/누락 청크가 있어도 강건 회귀는 모두 찾아야 함 (OLS는 표준편차가 부풀어 일부를 놓침)"""
+        outliers = {3: 4.0, 17: 3.5, 29: 4.5, 41: 0.1, 52: 0.15}
+        result = self.service.analyze_translation_quality(_noisy_metadata(outliers=outliers))
+        found = {item["chunk_index"]: item["issue_type"] for item in result}
+        self.assertEqual(found, {3: "hallucination", 17: "hallucination", 29: "hallucination", 41: "omission", 52: "omission"})
+
+    @unittest.skipIf(np is None, "numpy가 설치되어 있지 않음")
+    def test_numpy_and_pure_engines_agree(self):
+        points = collect_data_points(_noisy_metadata(n=200, outliers={5: 3.0, 80: 0.2}))
+        xs = [p[1] for p in points]
+        ys = [p[2] for p in points]
+        pure = fit_robust_line(xs, ys, use_numpy=False)
+        vectorized = fit_robust_line(xs, ys, use_numpy=True)
+        self.assertAlmostEqual(pure.slope, vectorized.slope, places=6)
+        self.assertAlmostEqual(pure.intercept, vectorized.intercept, places=3)
+        self.assertAlmostEqual(pure.scale, vectorized.scale, places=3)
+
+    def test_online_tracker_matches_full_analysis(self):
+        """청크 완료마다 갱신한 결과가 전체 분석과 같아야 하고, 이상 청크는 기록 즉시 보고되어야 함"""
+        metadata = _noisy_metadata(n=120, outliers={70: 5.0, 90: 0.1})
+        metadata["input_file"] = "novel.txt"
+        live = QualityCheckService()
+        reported = []
+        for chunk_index, src, trans in collect_data_points(metadata):
+            if live.record_chunk_completion("novel.txt", chunk_index, src, trans):
+                reported.append(chunk_index)
+        self.assertIn(70, reported)
+        self.assertIn(90, reported)
+
+        expected = QualityCheckService().analyze_translation_quality(dict(metadata, input_file=None))
+        self.assertEqual(
+            [item["chunk_index"] for item in live.analyze_translation_quality(metadata)],
+            [item["chunk_index"] for item in expected])
+        self.assertEqual(live.live_suspicious_chunks("novel.txt"), live.analyze_translation_quality(metadata))
+
+    def test_language_pair_baseline_for_new_job(self):
+        """같은 언어쌍의 이전 적합을 기준선으로 써서 청크가 적을 때도 판정해야 함"""
+        first = _noisy_metadata(n=40)
+        first["language_pair"] = "ja->ko"
+        self.service.analyze_translation_quality(first)
+
+        tracker_issue = self.service.record_chunk_completion("next.txt", 0, 1000, 100, language_pair="ja->ko")
+        self.assertEqual(tracker_issue["issue_type"], "omission")
+        self.assertIsNone(self.service.record_chunk_completion("other.txt", 0, 1000, 100, language_pair="zh->ko"))
+
+    def test_tracker_sync_reloads_when_chunks_disappear(self):
+        tracker = QualityCheckTracker(use_numpy=False)
+        points = collect_data_points(_noisy_metadata(n=20, outliers={4: 5.0}))
+        tracker.load(points)
+        self.assertEqual([item["chunk_index"] for item in tracker.suspicious_chunks()], [4])
+        tracker.sync([p for p in points if p[0] != 4])
+        self.assertEqual(len(tracker), 19)
+        self.assertEqual(tracker.suspicious_chunks(), [])
+
 if __name__ == '__main__':
     unittest.main()
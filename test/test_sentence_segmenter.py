@@ -0,0 +1,56 @@
+"""
+다국어 문장 분할기 테스트
+
+- 구간을 이어 붙이면 원문과 같은지 (구두점/줄바꿈 보존)
+- 「」 등 따옴표 안의 문장 부호에서는 나누지 않는지
+- ChunkService의 문장/이진 분할이 원문을 잃지 않는지
+- 이진 분할할 경계가 없으면 단어/문장 중간을 자르지 않고 원문 하나를 돌려주는지
+"""
+import random
+
+from utils.chunk_service import ChunkService
+from utils.sentence_segmenter import find_balanced_cut, segment_sentence_spans
+
+
+def _pieces(text):
+    return [text[start:end] for start, end, _ in segment_sentence_spans(text)]
+
+
+def test_spans_cover_text_and_respect_quotes():
+    text = "他说：「你好。我走了！」然后离开。『好吧？』\n\nHe said \"wait.\" Pi is 3.14! Done"
+    assert _pieces(text) == [
+        "他说：「你好。我走了！」", "然后离开。", "『好吧？』\n\n",
+        "He said \"wait.\" ", "Pi is 3.14! ", "Done",
+    ]
+
+    rng = random.Random(3)
+    alphabet = list("가나다abc 。！？.!?「」『』“”()\n…,")
+    for _ in range(500):
+        sample = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        assert "".join(_pieces(sample)) == sample
+
+
+def test_balanced_cut_prefers_lines_then_sentences():
+    assert find_balanced_cut("첫 줄.\n둘째 줄.\n셋째 줄.\n넷째 줄.") == 11
+    assert find_balanced_cut("一句。二句。三句。四句。") == 6
+    assert find_balanced_cut("「一句。二句。三句。」") is None
+    assert find_balanced_cut("\n\n본문만 있음") is None
+
+
+def test_chunk_service_splits_are_lossless():
+    service = ChunkService()
+    text = "「你好。」他说。\n\n她笑了！然后离开了。\nThe end. Really."
+    by_sentence = service.split_chunk_by_sentences(text, max_sentences_per_chunk=2)
+    assert "".join(by_sentence) == text
+    assert by_sentence[0] == "「你好。」他说。\n\n"
+
+    halves = service.split_chunk_into_two_halves(text)
+    assert len(halves) == 2 and "".join(halves) == text
+
+
+def test_two_halves_without_boundary_returns_whole_chunk():
+    service = ChunkService()
+    long_line = "가" * 1000
+    assert service.split_chunk_into_two_halves(long_line, target_size=400) == [long_line]
+    quoted = "「一句。二句。三句。」"
+    assert service.split_chunk_into_two_halves(quoted) == [quoted]
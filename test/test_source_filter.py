@@ -0,0 +1,73 @@
+"""
+번역 전 원문 필터 테스트
+
+- 다국어 광고/사이트 홍보 줄만 제거되고 본문은 유지되는지
+- mask 모드에서 번역 결과의 마스크 토큰이 원래 줄로 복원되는지
+- 표준 번역 파이프라인에서 필터된 원문만 번역 요청으로 전달되는지
+"""
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from app.app_service import AppService
+from infrastructure.file_handler import load_metadata
+from utils.source_filter import SourceFilter, filter_source_for_metadata
+
+SOURCE = (
+    "第一章 风起\n"
+    "本电子书由网友上传至本站，仅供交流。\n"
+    "少年抬头望向天空，网友们都说他疯了。\n"
+    "天才一秒记住本站地址：www.example.com\n"
+    "(www.xbiquge.la)\n"
+    "Download more ebooks at freebooks.example\n"
+    "無断転載禁止\n"
+    "他转身离去。\n"
+)
+
+
+def test_filter_removes_only_boilerplate_lines():
+    result = SourceFilter(mode="remove").apply(SOURCE)
+    assert result.text == "第一章 风起\n少年抬头望向天空，网友们都说他疯了。\n他转身离去。\n"
+    assert result.filtered_lines == 5
+    assert result.rule_hits["zh_ebook_notice"] == 1
+    assert result.rule_hits["ja_reprint_notice"] == 1
+    assert sum(result.rule_hits.values()) == 5
+
+    # 비활성 / 최대 길이 초과 줄은 그대로 유지
+    assert SourceFilter(enabled=False).apply(SOURCE).text == SOURCE
+    long_line = "本电子书由网友上传" + "。" * 300 + "\n"
+    assert SourceFilter().apply(long_line).text == long_line
+
+
+def test_mask_mode_restores_lines_after_translation():
+    result = SourceFilter(mode="mask").apply(SOURCE)
+    assert "⟦MASK:0⟧" in result.text and "www.example.com" not in result.text
+    translated = result.text.replace("第一章 风起", "제1장 바람")
+    assert result.restore(translated) == SOURCE.replace("第一章 风起", "제1장 바람")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_sends_filtered_source_and_records_stats(tmp_path):
+    service = AppService()
+    service.gemini_client = MagicMock()
+    service.translation_service = MagicMock()
+    service.translation_service.translate_chunk_async = AsyncMock(side_effect=lambda text: text)
+    service.config.update({
+        "translation_mode": "standard",
+        "chunk_size": 10000,
+        "max_workers": 1,
+        "requests_per_minute": 0,
+        "enable_post_processing": False,
+        "source_filter_enabled": True,
+        "source_filter_mode": "remove",
+    })
+    input_file = tmp_path / "novel.txt"
+    input_file.write_text(SOURCE, encoding="utf-8")
+
+    await service.start_translation_async(str(input_file), str(tmp_path / "novel_translated.txt"))
+
+    sent = "".join(c.args[0] for c in service.translation_service.translate_chunk_async.call_args_list)
+    assert "www" not in sent and "他转身离去" in sent
+    metadata = load_metadata(input_file)
+    assert metadata["source_filter"]["filtered_lines"] == 5
+    # 검토 탭 등은 메타데이터 기록으로 같은 원문을 재현
+    assert filter_source_for_metadata(SOURCE, metadata).text == sent
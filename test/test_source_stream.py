@@ -0,0 +1,60 @@
+"""
+대용량 원문 스트리밍 읽기 테스트
+
+- mmap 블록 디코딩이 read_text_file + splitlines와 같은 줄을 만드는지 (BOM/CRLF/블록 경계)
+- 줄 스트림 청크가 split_text_into_chunks와 같은지
+- translate_file_integrity가 출력 파일에 바로 조립하는지
+"""
+import json
+import random
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from domain.translation_service import TranslationService
+from infrastructure.file_handler import iter_text_file_blocks, iter_text_file_lines, read_text_file
+from utils.chunk_service import ChunkService
+
+
+def test_stream_matches_full_read(tmp_path):
+    rng = random.Random(38)
+    alphabet = ["a", "가", "\r\n", "\n", "\r", "\x0c", " ", "😀"]
+    path = tmp_path / "source.txt"
+    for case in range(300):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 50)))
+        path.write_bytes(("﻿" if case % 4 == 0 else "").encode("utf-8") + text.encode("utf-8"))
+        expected = read_text_file(path).lstrip("﻿")
+        block_size = rng.randint(1, 8)  # 멀티바이트 문자와 \r\n이 블록 경계에서 잘리도록
+
+        assert "".join(iter_text_file_blocks(path, block_size)) == expected
+        assert list(iter_text_file_lines(path, block_size=block_size)) == expected.splitlines()
+        lines = list(iter_text_file_lines(path, keepends=True, block_size=block_size))
+        assert lines == expected.splitlines(True)
+        max_size = rng.randint(1, 20)
+        assert list(ChunkService.iter_chunks_from_lines(lines, max_size)) == \
+            ChunkService().split_text_into_chunks(expected, max_size)
+
+
+@pytest.mark.asyncio
+async def test_translate_file_integrity_streams_to_output(tmp_path):
+    async def fake_generate(prompt, **kwargs):
+        text = prompt[-1].parts[0].text
+        items = json.loads(text[text.index("["):text.rindex("]") + 1])
+        return [{"id": item["id"], "translated_text": f"KO:{item['text']}"} for item in items]
+
+    client = MagicMock()
+    client.generate_text_async = AsyncMock(side_effect=fake_generate)
+    service = TranslationService(gemini_client=client, config={"chunk_size": 6000, "integrity_max_items": 2})
+    service._construct_prompt = lambda chunk_text: chunk_text
+
+    source = tmp_path / "novel.txt"
+    source.write_bytes("﻿第一章\r\n\r\n「你好」\r\n再见\r\n".encode("utf-8"))
+    output = tmp_path / "novel_translated.txt"
+
+    written = await service.translate_file_integrity(source, output)
+
+    expected = "KO:第一章\n\nKO:「你好」\nKO:再见"
+    assert written == 4
+    assert output.read_text(encoding="utf-8") == expected
+    assert not (tmp_path / "novel_translated.txt.part").exists()
+    assert await service.translate_text_integrity("第一章\n\n「你好」\n再见") == expected
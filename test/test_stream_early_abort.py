@@ -0,0 +1,130 @@
+"""
+스트리밍 생성 조기 중단 테스트
+
+- 반복 루프/예상 길이 초과가 보이면 나머지 스트림을 읽지 않고 즉시 닫고 예외를 올리는지
+- 안전 계열 종료 사유(PROHIBITED_CONTENT 등)는 콘텐츠 안전 예외로 바로 중단되는지
+- 조기 중단은 같은 요청을 재시도하지 않고, 번역 서비스가 곧바로 분할 재시도하는지
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from domain.translation_service import TranslationService
+from infrastructure.gemini_client import (
+    FinishReason, GeminiClient, GeminiContentSafetyException, GeminiStreamAbortedException,
+)
+from utils.output_validation import StreamingOutputGuard
+
+SOURCE = "".join(f"{i}번째 문장의 원문입니다.\n" for i in range(40))
+
+
+class FakeStream:
+    """중단하지 않으면 조각을 계속 내보내는 스트림 (몇 개를 읽었는지, 닫혔는지 기록)"""
+    LIMIT = 10000
+
+    def __init__(self, pieces, finish_reason=None):
+        self.pieces = pieces
+        self.finish_reason = finish_reason
+        self.read = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed or self.read >= self.LIMIT:
+            raise StopAsyncIteration
+        piece = self.pieces(self.read)
+        self.read += 1
+        return SimpleNamespace(text=piece, prompt_feedback=None,
+                               candidates=[SimpleNamespace(finish_reason=self.finish_reason)])
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _bare_client():
+    return GeminiClient.__new__(GeminiClient)
+
+
+@pytest.mark.asyncio
+async def test_loop_aborts_stream_early():
+    stream = FakeStream(lambda i: SOURCE[:200] if i == 0 else "같은 말을 또 되풀이합니다. ")
+    guard = StreamingOutputGuard(SOURCE)
+    with pytest.raises(GeminiStreamAbortedException) as excinfo:
+        await _bare_client()._consume_stream(stream, guard.feed)
+    assert excinfo.value.reason == "repetition_loop"
+    assert stream.closed and stream.read < 100
+    assert guard.loop.period == len("같은 말을 또 되풀이합니다. ")
+
+
+@pytest.mark.asyncio
+async def test_length_overflow_aborts_stream():
+    stream = FakeStream(lambda i: f"{i}번째로 길어지는 출력. ")
+    guard = StreamingOutputGuard("짧은 원문", max_length_ratio=4.0, min_length=500)
+    with pytest.raises(GeminiStreamAbortedException) as excinfo:
+        await _bare_client()._consume_stream(stream, guard.feed)
+    assert excinfo.value.reason == "length_overflow"
+    assert 500 < excinfo.value.partial_length < 600
+
+
+@pytest.mark.asyncio
+async def test_safety_finish_reason_aborts_stream():
+    stream = FakeStream(lambda i: "일부 번역", finish_reason=FinishReason.PROHIBITED_CONTENT)
+    with pytest.raises(GeminiContentSafetyException):
+        await _bare_client()._consume_stream(stream)
+    assert stream.read == 1 and stream.closed
+
+
+@pytest.mark.asyncio
+async def test_normal_stream_is_collected():
+    pieces = [SOURCE[i:i + 50] for i in range(0, len(SOURCE), 50)]
+
+    async def finite():
+        for piece in pieces:
+            yield SimpleNamespace(text=piece, prompt_feedback=None, candidates=[])
+
+    assert await _bare_client()._consume_stream(finite(), StreamingOutputGuard(SOURCE).feed) == SOURCE
+
+
+@pytest.mark.asyncio
+async def test_abort_is_not_retried_by_client():
+    with patch("infrastructure.gemini_client.genai.Client") as mock_genai:
+        sdk = MagicMock()
+        mock_genai.return_value = sdk
+        stream = FakeStream(lambda i: "반복되는 출력입니다. ")
+        sdk.aio.models.generate_content_stream = AsyncMock(return_value=stream)
+        client = GeminiClient(auth_credentials="fake_api_key", api_timeout=5.0)
+        client.requests_per_minute = 0
+
+        with pytest.raises(GeminiStreamAbortedException):
+            await client.generate_text_async(
+                "prompt", "gemini-2.0-flash", max_retries=3, stream=True,
+                stream_monitor=StreamingOutputGuard(SOURCE).feed
+            )
+    assert sdk.aio.models.generate_content_stream.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_translation_service_splits_after_abort():
+    async def fake_generate(prompt, **kwargs):
+        text = prompt[-1].parts[0].text
+        assert kwargs["stream"] is True
+        if len(text) > len(SOURCE) // 2 + 50:
+            # 전체 청크는 반복 루프에 빠짐
+            monitor = kwargs["stream_monitor"]
+            while not (reason := monitor("끝나지 않는 반복입니다. ")):
+                pass
+            raise GeminiStreamAbortedException("aborted", reason=reason)
+        return f"KO[{text.strip()}]"
+
+    client = MagicMock()
+    client.generate_text_async = AsyncMock(side_effect=fake_generate)
+    service = TranslationService(gemini_client=client, config={"max_workers": 2, "content_safety_isolation": True})
+    service._construct_prompt = lambda chunk_text: chunk_text
+
+    result = await service.translate_chunk_async(SOURCE)
+
+    assert client.generate_text_async.await_count == 3
+    assert result.count("KO[") == 2 and "0번째" in result and "39번째" in result
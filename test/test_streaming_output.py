@@ -0,0 +1,86 @@
+"""
+스트리밍 최종 출력(워터마크) 테스트
+
+- 순서가 뒤섞여 완료된 청크가 0번부터 연속된 구간만 파일에 반영되는지
+- 번역 도중에도 최종 파일에서 앞부분을 읽을 수 있는지
+- 우선순위 세마포어가 인덱스가 작은 청크부터 슬롯을 주는지
+"""
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from app.app_service import AppService
+from app.translation_job_queue import PrioritySemaphore
+from utils.output_assembler import OutputAssembler
+from utils.post_processing_service import PostProcessingService
+
+
+def test_watermark_appends_only_contiguous_prefix(tmp_path):
+    output = tmp_path / "out.txt"
+    service = PostProcessingService()
+    config = {"enable_post_processing": True}
+    assembler = OutputAssembler(output, service, config)
+    assert assembler.open({}) == 0
+
+    assert assembler.add_chunk(1, "둘째") == 0
+    assert not output.exists() or output.read_text(encoding="utf-8") == ""
+    assert assembler.add_chunk(0, "첫째") == 2
+    assert output.read_text(encoding="utf-8") == "첫째\n\n둘째"
+    assert assembler.add_chunk(2, None) == 3  # 빈 원문 청크는 건너뜀
+    assembler.add_chunk(4, "다섯째")  # 3번이 실패로 비어 있어도 종료 시 덧붙임
+    state = assembler.finish()
+
+    expected = service.post_process_and_clean_chunks({0: "첫째", 1: "둘째", 4: "다섯째"}, config)
+    assert output.read_text(encoding="utf-8") == expected
+    assert len(state["piece_hashes"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_final_output_is_readable_before_job_finishes(tmp_path):
+    service = AppService()
+    service.gemini_client = MagicMock()
+    service.translation_service = MagicMock()
+    service.config.update({
+        "translation_mode": "standard",
+        "chunk_size": 40,
+        "max_workers": 1,
+        "requests_per_minute": 0,
+        "enable_post_processing": True,
+    })
+    input_file = tmp_path / "novel.txt"
+    output_file = tmp_path / "novel_translated.txt"
+    input_file.write_text("".join(f"Source line number {i:02d}.\n" for i in range(6)), encoding="utf-8")
+
+    snapshots = []
+
+    async def fake_translate(text):
+        snapshots.append(output_file.read_text(encoding="utf-8") if output_file.exists() else "")
+        return f"번역: {text.strip()}"
+
+    service.translation_service.translate_chunk_async = AsyncMock(side_effect=fake_translate)
+    await service.start_translation_async(str(input_file), str(output_file))
+
+    assert len(snapshots) == 6
+    assert snapshots[0] == ""
+    assert snapshots[-1].count("번역:") == 5
+    final = output_file.read_text(encoding="utf-8")
+    assert final.startswith(snapshots[-1])
+    assert final.count("번역:") == 6
+
+
+@pytest.mark.asyncio
+async def test_priority_semaphore_grants_lowest_index_first():
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire(0)
+    order = []
+
+    async def worker(priority):
+        await semaphore.acquire(priority)
+        order.append(priority)
+        semaphore.release()
+
+    tasks = [asyncio.create_task(worker(p)) for p in (5, 1, 3)]
+    await asyncio.sleep(0)
+    semaphore.release()
+    await asyncio.gather(*tasks)
+    assert order == [1, 3, 5]
@@ -0,0 +1,110 @@
+"""
+다중 파일 작업 큐(TranslationJobQueue) 테스트
+
+- 여러 파일의 청크가 하나의 공유 제한기 아래에서 교차 실행되는지
+- 파일별 메타데이터/출력이 유지되는지
+- 한 파일의 실패가 다른 파일에 영향을 주지 않는지
+"""
+import asyncio
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from app.app_service import AppService
+from app.translation_job_queue import SharedChunkRateLimiter
+from core.dtos import BatchTranslationProgressDTO
+from infrastructure.file_handler import load_metadata
+
+
+@pytest.fixture
+def app_service():
+    service = AppService()
+    service.gemini_client = MagicMock()
+    service.translation_service = MagicMock()
+    service.config.update({
+        "translation_mode": "standard",
+        "chunk_size": 20,
+        "max_workers": 3,
+        "requests_per_minute": 0,
+        "enable_post_processing": False,
+    })
+    return service
+
+
+def _write_inputs(tmp_path, count, lines_per_file=4):
+    pairs = []
+    for i in range(count):
+        input_file = tmp_path / f"novel_{i}.txt"
+        input_file.write_text("".join(f"file{i} line {n}\n" for n in range(lines_per_file)), encoding="utf-8")
+        pairs.append((input_file, tmp_path / f"novel_{i}_translated.txt"))
+    return pairs
+
+
+@pytest.mark.asyncio
+async def test_job_queue_interleaves_chunks_across_files(app_service, tmp_path):
+    """파일 경계에서 슬롯이 비지 않고 다음 파일의 청크가 함께 진행되어야 한다"""
+    pairs = _write_inputs(tmp_path, 3)
+    active_files = {}
+    max_distinct_files = 0
+
+    async def fake_translate(chunk_text):
+        nonlocal max_distinct_files
+        file_tag = chunk_text.split()[0]
+        active_files[file_tag] = active_files.get(file_tag, 0) + 1
+        max_distinct_files = max(max_distinct_files, sum(1 for v in active_files.values() if v > 0))
+        await asyncio.sleep(0.01)
+        active_files[file_tag] -= 1
+        return f"[KO] {chunk_text}"
+
+    app_service.translation_service.translate_chunk_async = AsyncMock(side_effect=fake_translate)
+
+    progress_calls = []
+    jobs = await app_service.start_batch_translation_async(
+        pairs, max_concurrent_files=2, progress_callback=progress_calls.append
+    )
+
+    assert [job.status for job in jobs] == ["completed"] * 3
+    assert max_distinct_files == 2
+    for (input_file, output_file), job in zip(pairs, jobs):
+        assert output_file.exists()
+        assert "[KO]" in output_file.read_text(encoding="utf-8")
+        metadata = load_metadata(input_file)
+        assert metadata["status"] == "completed"
+        assert len(metadata["translated_chunks"]) == job.total_chunks == job.successful_chunks
+
+    final = progress_calls[-1]
+    assert isinstance(final, BatchTranslationProgressDTO)
+    assert final.completed_files == 3
+    assert final.processed_chunks == final.total_chunks == sum(job.total_chunks for job in jobs)
+    assert app_service.processed_chunks_count == final.processed_chunks
+    assert app_service.current_translation_task is None
+
+
+@pytest.mark.asyncio
+async def test_job_queue_isolates_file_failures(app_service, tmp_path):
+    """한 파일이 실패해도 나머지 파일은 완료되어야 한다"""
+    pairs = _write_inputs(tmp_path, 2)
+    pairs.insert(1, (tmp_path / "missing.txt", tmp_path / "missing_translated.txt"))
+    app_service.translation_service.translate_chunk_async = AsyncMock(side_effect=lambda text: f"[KO] {text}")
+
+    jobs = await app_service.start_batch_translation_async(pairs, max_concurrent_files=3)
+
+    assert [job.status for job in jobs] == ["completed", "failed", "completed"]
+    assert jobs[1].error_message
+
+
+@pytest.mark.asyncio
+async def test_shared_rate_limiter_spaces_requests():
+    """RPM 슬롯 예약은 동시 요청을 요청 간격만큼 벌려야 한다"""
+    limiter = SharedChunkRateLimiter(max_workers=4, requests_per_minute=1200)  # 0.05초 간격
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    times = []
+
+    async def request():
+        await limiter.wait_for_slot()
+        times.append(loop.time() - start)
+
+    await asyncio.gather(*(request() for _ in range(4)))
+    times.sort()
+    assert times[-1] >= 0.14
+    assert all(b - a >= 0.04 for a, b in zip(times, times[1:]))
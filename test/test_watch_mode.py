@@ -0,0 +1,129 @@
+"""
+감시 모드 및 최종 출력 증분 조립 테스트
+
+- OutputAssembler가 달라진 조각부터만 다시 쓰고, 전체 재작성과 같은 결과를 만드는지
+- TranslationWatcher가 추가된 구간만 번역하고 기존 출력 뒤에 덧붙이는지
+"""
+import os
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from app.app_service import AppService
+from app.translation_watcher import TranslationWatcher
+from infrastructure.file_handler import load_metadata
+from utils.output_assembler import OutputAssembler
+from utils.post_processing_service import PostProcessingService
+
+
+def _make_text(prefix: str, line_count: int) -> str:
+    return "".join(f"{prefix} line {i:03d} of the source novel text.\n" for i in range(line_count))
+
+
+@pytest.fixture
+def app_service():
+    service = AppService()
+    service.gemini_client = MagicMock()
+    service.translation_service = MagicMock()
+    service.translation_service.translate_chunk_async = AsyncMock(side_effect=lambda text: f"[KO]{text}")
+    service.config.update({
+        "translation_mode": "standard",
+        "chunk_size": 200,
+        "max_workers": 2,
+        "requests_per_minute": 0,
+        "enable_post_processing": False,
+    })
+    return service
+
+
+def test_assembler_matches_batch_post_processing(tmp_path):
+    service = PostProcessingService()
+    config = {"enable_post_processing": True}
+    chunks = {0: "번역 결과:\n첫 문단", 1: "<p>둘째</p>\n\n\n\n문단", 2: "```", 3: "##END_CHUNK##\n마지막"}
+    output = tmp_path / "out.txt"
+
+    OutputAssembler(output, service, config).assemble(chunks)
+
+    assert output.read_text(encoding="utf-8") == service.post_process_and_clean_chunks(chunks, config)
+
+
+def test_assembler_rewrites_only_from_first_changed_piece(tmp_path):
+    output = tmp_path / "out.txt"
+    config = {"enable_post_processing": False}
+    first = OutputAssembler(output, None, config).assemble({0: "A", 1: "B", 2: "C"})
+    assert output.read_text(encoding="utf-8") == "A\nB\nC"
+
+    appended = OutputAssembler(output, None, config, previous_state=first).assemble({0: "A", 1: "B2", 2: "C", 3: "D"})
+    assert output.read_text(encoding="utf-8") == "A\nB2\nC\nD"
+    assert appended["piece_ends"][0] == first["piece_ends"][0]
+
+    fresh = tmp_path / "fresh.txt"
+    OutputAssembler(fresh, None, config).assemble({0: "A", 1: "B2", 2: "C", 3: "D"})
+    assert fresh.read_bytes() == output.read_bytes()
+
+
+def test_assembler_full_rewrite_when_output_modified_externally(tmp_path):
+    output = tmp_path / "out.txt"
+    config = {"enable_post_processing": False}
+    state = OutputAssembler(output, None, config).assemble({0: "A", 1: "B"})
+    output.write_text("edited by hand", encoding="utf-8")
+    os.utime(output, ns=(state["output_mtime_ns"] + 10**9, state["output_mtime_ns"] + 10**9))
+
+    OutputAssembler(output, None, config, previous_state=state).assemble({0: "A", 1: "B", 2: "C"})
+    assert output.read_text(encoding="utf-8") == "A\nB\nC"
+
+
+@pytest.mark.asyncio
+async def test_watcher_translates_only_appended_text(app_service, tmp_path):
+    input_file = tmp_path / "serial.txt"
+    output_file = tmp_path / "serial_translated.txt"
+    text = _make_text("Chapter1", 20)
+    input_file.write_text(text, encoding="utf-8")
+
+    watcher = TranslationWatcher(app_service, [tmp_path], poll_interval=0)
+    await watcher.run(max_cycles=2)  # 첫 폴링은 관측, 두 번째 폴링에서 처리
+    first_output = output_file.read_text(encoding="utf-8")
+    assert first_output.count("[KO]") == app_service.translation_service.translate_chunk_async.call_count
+    assert "output_assembly" in load_metadata(input_file)
+
+    app_service.translation_service.translate_chunk_async.reset_mock()
+    appended = _make_text("Chapter2", 5)
+    input_file.write_text(text + appended, encoding="utf-8")
+    await watcher.run(max_cycles=watcher.cycles + 2)
+
+    calls = [c.args[0] for c in app_service.translation_service.translate_chunk_async.call_args_list]
+    assert "".join(calls) == appended
+    new_output = output_file.read_text(encoding="utf-8")
+    assert new_output.startswith(first_output)
+    assert "Chapter2 line 004" in new_output
+
+    # 변경이 없으면 다시 번역하지 않음 (생성된 _translated 파일도 감시 대상이 아님)
+    app_service.translation_service.translate_chunk_async.reset_mock()
+    await watcher.run(max_cycles=watcher.cycles + 2)
+    app_service.translation_service.translate_chunk_async.assert_not_called()
+
+
+def test_cli_batch_progress_bar_restarts_for_next_watch_cycle():
+    import main_cli
+    from core.dtos import BatchTranslationProgressDTO
+
+    def dto(processed, total):
+        return BatchTranslationProgressDTO(
+            total_files=1, completed_files=0, failed_files=0, active_files=1,
+            total_chunks=total, processed_chunks=processed, successful_chunks=processed,
+            failed_chunks=0, current_status_message="",
+        )
+
+    main_cli.tqdm_instances.pop("batch_translation", None)
+    try:
+        main_cli.cli_batch_translation_progress_callback(dto(10, 10))
+        first_bar = main_cli.tqdm_instances["batch_translation"]
+        # 다음 감시 주기의 새 작업 묶음 (처리 수 0부터 다시 시작)
+        main_cli.cli_batch_translation_progress_callback(dto(0, 4))
+        main_cli.cli_batch_translation_progress_callback(dto(3, 4))
+        bar = main_cli.tqdm_instances["batch_translation"]
+        assert bar is not first_bar
+        assert (bar.n, bar.total) == (3, 4)
+    finally:
+        bar = main_cli.tqdm_instances.pop("batch_translation", None)
+        if bar is not None:
+            bar.close()
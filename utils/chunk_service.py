@@ -1,20 +1,86 @@
 # chunk_service.py
-from typing import List, Union, Optional
+import hashlib
+import re
+from typing import Dict, Iterable, Iterator, List, Union, Optional, Sequence, Tuple
 from pathlib import Path
 
 try:
     from infrastructure.logger_config import setup_logger
     from core.exceptions import BtgChunkingException
     from core.dtos import TranslationUnit, EpubNode
+    from utils.sentence_segmenter import segment_sentence_spans, find_balanced_cut, group_spans
 except ImportError:
     from infrastructure.logging.logger_config import setup_logger # type: ignore
     from core.exceptions import BtgChunkingException # type: ignore
     from core.dtos import TranslationUnit, EpubNode # type: ignore
+    from utils.sentence_segmenter import segment_sentence_spans, find_balanced_cut, group_spans # type: ignore
 
 logger = setup_logger(__name__)
 
 DEFAULT_MAX_CHUNK_SIZE = 6000
 DEFAULT_MAX_ITEMS_PER_CHUNK = 50
+# 콘텐츠 해시 기반 이어하기에서 청크 시작 위치를 찾을 때 사용하는 앞부분 길이
+CHUNK_ANCHOR_LENGTH = 64
+
+
+def compute_chunk_hash(text: str) -> str:
+    """청크 원문의 콘텐츠 해시 (이어하기 시 인덱스 대신 사용하는 키)"""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def compute_chunk_anchor_hash(text: str) -> str:
+    """청크 앞부분(CHUNK_ANCHOR_LENGTH자)의 해시. 새 원문에서 청크 시작 위치 후보를 찾는 데 사용합니다."""
+    return compute_chunk_hash(text[:CHUNK_ANCHOR_LENGTH])
+
+
+def chunk_content_hashes(text: str) -> Dict[str, str]:
+    """메타데이터의 translated_chunks 항목에 기록할 콘텐츠 해시 필드"""
+    return {
+        "source_hash": compute_chunk_hash(text),
+        "source_anchor_hash": compute_chunk_anchor_hash(text),
+    }
+
+
+# str.splitlines()와 같은 줄 경계 (\r\n은 한 줄바꿈)
+_LINE_BREAK_PATTERN = re.compile('\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+_SPECIAL_LINE_BREAKS = "\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+def iter_line_ends(text: str) -> Iterator[int]:
+    """text.splitlines(keepends=True)의 각 줄 끝 오프셋을 줄 문자열을 만들지 않고 차례로 반환합니다."""
+    last = 0
+    for match in _LINE_BREAK_PATTERN.finditer(text):
+        last = match.end()
+        yield last
+    if last < len(text):
+        yield len(text)
+
+
+# 문자(Letter) 한 글자라도 있으면 번역 대상 (숫자/구두점/기호/공백만 있는 줄은 그대로 복사)
+_TRANSLATABLE_SCRIPT_PATTERN = re.compile(r'[^\W\d_]')
+
+
+def is_translatable_unit_text(text: Optional[str]) -> bool:
+    """빈 줄, '***' 같은 구분선, 숫자만 있는 줄, 구두점만 있는 줄은 번역할 필요가 없습니다."""
+    return bool(text) and _TRANSLATABLE_SCRIPT_PATTERN.search(text) is not None
+
+
+def partition_translatable_units(
+    units: Sequence[TranslationUnit]
+) -> Tuple[List[TranslationUnit], Dict[str, str]]:
+    """
+    번역 단위를 (API로 보낼 단위, 로컬에서 확정된 id → 원문) 으로 나눕니다.
+    로컬 단위도 결과 맵에 원래 id로 포함되므로 조립/검토 화면의 id 매핑은 그대로 유지됩니다.
+    """
+    remote: List[TranslationUnit] = []
+    local: Dict[str, str] = {}
+    for unit in units:
+        if is_translatable_unit_text(unit.text):
+            remote.append(unit)
+        else:
+            local[unit.id] = unit.text
+    return remote, local
+
 
 class ChunkService:
     """
@@ -25,6 +91,7 @@ class ChunkService:
         """
         주어진 텍스트 내용을 지정된 최대 크기의 청크 리스트로 분할합니다.
         분할은 주로 줄바꿈 문자를 기준으로 이루어지며, 각 청크는 max_chunk_size를 초과하지 않도록 합니다.
+        경계 계산은 iter_chunk_spans가 담당하며, 여기서는 구간을 문자열로 잘라낼 뿐입니다.
 
         Args:
             text_content (str): 분할할 전체 텍스트 내용.
@@ -38,42 +105,90 @@ class ChunkService:
             ValueError: max_chunk_size가 0 이하인 경우.
             # BtgChunkingException: 청킹 중 예상치 못한 오류 발생 시 (현재는 ValueError만 발생)
         """
+        chunks = [text_content[start:end] for start, end in self.iter_chunk_spans(text_content, max_chunk_size)]
+        logger.info(f"텍스트가 {len(chunks)}개의 청크로 분할되었습니다 (최대 크기: {max_chunk_size}).")
+        return chunks
+
+    def iter_chunks(self, text_content: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> Iterator[str]:
+        """split_text_into_chunks의 지연 버전. 청크 문자열을 필요할 때 하나씩 만듭니다."""
+        for start, end in self.iter_chunk_spans(text_content, max_chunk_size):
+            yield text_content[start:end]
+
+    @staticmethod
+    def iter_chunk_spans(text_content: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> Iterator[Tuple[int, int]]:
+        """
+        청크 경계를 (start, end) 오프셋으로 차례로 반환합니다 (문자열 복사 없음, 전체 O(n)).
+
+        줄 목록을 만들거나 청크 문자열을 줄마다 이어 붙이지 않고 줄 끝 위치만 찾으며,
+        경계는 기존 규칙(splitlines 줄 단위 누적, max_chunk_size를 넘는 줄은 강제 분할)과
+        완전히 같습니다. 이어하기 메타데이터의 청크 해시가 그대로 유지됩니다.
+        """
         if max_chunk_size <= 0:
             logger.error(f"max_chunk_size는 0보다 커야 합니다: {max_chunk_size}")
             raise ValueError("max_chunk_size는 0보다 커야 합니다.")
 
-        chunks: List[str] = []
-        current_chunk = ""
-        
-        # 텍스트 내용을 줄 단위로 분리 (개행 문자 유지)
-        lines = text_content.splitlines(keepends=True)
-
-        for line in lines:
-            if len(current_chunk) + len(line) <= max_chunk_size:
-                current_chunk += line
+        if any(ch in text_content for ch in _SPECIAL_LINE_BREAKS):
+            yield from ChunkService._iter_chunk_spans_by_lines(text_content, max_chunk_size)
+            return
+
+        # 줄바꿈이 '\n'뿐인 일반적인 경우 (read_text_file은 \r\n을 \n으로 변환):
+        # 청크 끝 = 시작 + max_chunk_size 이내의 마지막 줄 끝이므로 청크마다 find/rfind 두 번이면 충분
+        text_length = len(text_content)
+        pos = 0
+        while pos < text_length:
+            newline = text_content.find("\n", pos)
+            first_line_end = newline + 1 if newline != -1 else text_length
+            if first_line_end - pos > max_chunk_size:
+                logger.warning(f"단일 라인이 max_chunk_size({max_chunk_size})를 초과합니다. 강제 분할합니다. 라인 길이: {first_line_end - pos}")
+                for i in range(pos, first_line_end, max_chunk_size):
+                    yield i, min(i + max_chunk_size, first_line_end)
+                pos = first_line_end
+                continue
+            if text_length - pos <= max_chunk_size:
+                yield pos, text_length
+                return
+            end = text_content.rfind("\n", pos, pos + max_chunk_size) + 1
+            yield pos, end
+            pos = end
+
+    @staticmethod
+    def _iter_chunk_spans_by_lines(text_content: str, max_chunk_size: int) -> Iterator[Tuple[int, int]]:
+        """iter_chunk_spans의 일반 경로: splitlines의 모든 줄바꿈 문자(\r, \u2028 등)를 줄 단위로 따라감"""
+        current_start = 0
+        current_len = 0
+        line_start = 0
+        for line_end in iter_line_ends(text_content):
+            line_len = line_end - line_start
+            if current_len + line_len <= max_chunk_size:
+                if not current_len:
+                    current_start = line_start
+                current_len += line_len
             else:
-                # 현재 청크가 내용이 있으면 추가
-                if current_chunk:
-                    chunks.append(current_chunk)
-                
-                # 새 줄이 max_chunk_size보다 큰 경우 처리
-                if len(line) > max_chunk_size:
-                    logger.warning(f"단일 라인이 max_chunk_size({max_chunk_size})를 초과합니다. 강제 분할합니다. 라인 길이: {len(line)}")
-                    # 긴 라인을 max_chunk_size에 맞춰 강제로 분할
-                    for i in range(0, len(line), max_chunk_size):
-                        chunks.append(line[i:i+max_chunk_size])
-                    current_chunk = "" # 강제 분할 후 현재 청크는 비움
+                # 현재 청크가 내용이 있으면 반환
+                if current_len:
+                    yield current_start, current_start + current_len
+                    current_len = 0
+
+                # 새 줄이 max_chunk_size보다 큰 경우 강제 분할
+                if line_len > max_chunk_size:
+                    logger.warning(f"단일 라인이 max_chunk_size({max_chunk_size})를 초과합니다. 강제 분할합니다. 라인 길이: {line_len}")
+                    for i in range(line_start, line_end, max_chunk_size):
+                        yield i, min(i + max_chunk_size, line_end)
                 else:
-                    current_chunk = line
-        
-        # 마지막 남은 청크 추가
-        if current_chunk:
-            chunks.append(current_chunk)
-        
-        logger.info(f"텍스트가 {len(chunks)}개의 청크로 분할되었습니다 (최대 크기: {max_chunk_size}).")
-        return chunks
+                    current_start = line_start
+                    current_len = line_len
+            line_start = line_end
 
-    def create_chunks_from_file_content(self, file_content: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> List[str]:
+        # 마지막 남은 청크
+        if current_len:
+            yield current_start, current_start + current_len
+
+    def create_chunks_from_file_content(
+        self,
+        file_content: str,
+        max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
+        chunk_offsets: Optional[Sequence[int]] = None
+    ) -> List[str]:
         """
         파일에서 읽은 전체 텍스트 내용을 청크로 분할합니다.
         split_text_into_chunks 메소드의 래퍼 함수입니다.
@@ -81,13 +196,144 @@ class ChunkService:
         Args:
             file_content (str): 파일에서 읽은 전체 텍스트 내용.
             max_chunk_size (int, optional): 각 청크의 최대 문자 수.
+            chunk_offsets (Sequence[int], optional): 메타데이터에 저장된 청크 끝 오프셋 목록.
+                콘텐츠 해시 재사용으로 청크 경계가 기본 분할과 달라진 작업에서 같은 경계를 재현합니다.
+                원문 길이와 맞지 않으면 무시하고 기본 분할을 사용합니다.
 
         Returns:
             List[str]: 분할된 텍스트 청크의 리스트.
         """
         logger.debug(f"파일 내용으로부터 청크 생성 시작 (최대 크기: {max_chunk_size}). 내용 길이: {len(file_content)}")
+        if chunk_offsets:
+            chunks = self.split_text_by_offsets(file_content, chunk_offsets)
+            if chunks is not None:
+                return chunks
+            logger.warning("저장된 청크 경계가 현재 원문과 맞지 않아 기본 분할을 사용합니다.")
         return self.split_text_into_chunks(file_content, max_chunk_size)
-    
+
+    @staticmethod
+    def split_text_by_offsets(text_content: str, chunk_offsets: Sequence[int]) -> Optional[List[str]]:
+        """
+        청크 끝 오프셋 목록으로 텍스트를 자릅니다.
+        오프셋이 증가하지 않거나 마지막 값이 텍스트 길이와 다르면 None을 반환합니다.
+        """
+        chunks: List[str] = []
+        start = 0
+        for end in chunk_offsets:
+            if not isinstance(end, int) or end <= start:
+                return None
+            chunks.append(text_content[start:end])
+            start = end
+        if start != len(text_content):
+            return None
+        return chunks
+
+    @staticmethod
+    def chunk_end_offsets(chunks: Sequence[str]) -> List[int]:
+        """청크 목록의 누적 끝 오프셋 (create_chunks_from_file_content의 chunk_offsets 형식)"""
+        offsets: List[int] = []
+        total = 0
+        for chunk in chunks:
+            total += len(chunk)
+            offsets.append(total)
+        return offsets
+
+    def split_text_with_anchors(
+        self,
+        text_content: str,
+        max_chunk_size: int,
+        anchors: Dict[str, List[Tuple[int, str]]]
+    ) -> List[str]:
+        """
+        이전 작업에서 번역이 끝난 청크를 그대로 보존하면서 텍스트를 분할합니다.
+
+        각 줄 시작(및 보존된 청크 직후) 위치에서 앞부분 해시로 이전 청크 후보를 찾고,
+        전체 해시가 일치하면 그 구간을 하나의 청크로 고정합니다. 나머지 구간은
+        split_text_into_chunks와 같은 규칙(줄 단위 누적, 초과 라인 강제 분할)으로 나눕니다.
+        따라서 chunk_size가 바뀌거나 원문 일부가 수정되어도 변경되지 않은 청크는
+        같은 텍스트로 다시 만들어져 번역을 재사용할 수 있습니다.
+
+        Args:
+            text_content: 분할할 전체 텍스트
+            max_chunk_size: 새로 만드는 청크의 최대 문자 수
+            anchors: 앞부분 해시 → [(청크 길이, 청크 전체 해시), ...]
+
+        Returns:
+            List[str]: 분할된 텍스트 청크의 리스트 (이어 붙이면 원문과 동일)
+        """
+        if max_chunk_size <= 0:
+            raise ValueError("max_chunk_size는 0보다 커야 합니다.")
+
+        text_length = len(text_content)
+
+        # 앞부분 해시보다 짧은 청크는 앞부분 키로 찾을 수 없으므로 길이별 전체 해시로 비교
+        short_chunks: Dict[int, set] = {}
+        for candidates in anchors.values():
+            for length, full_hash in candidates:
+                if 0 < length < CHUNK_ANCHOR_LENGTH:
+                    short_chunks.setdefault(length, set()).add(full_hash)
+        short_lengths = sorted(short_chunks, reverse=True)
+
+        def match_anchor(pos: int) -> int:
+            candidates = anchors.get(compute_chunk_hash(text_content[pos:pos + CHUNK_ANCHOR_LENGTH]))
+            for length, full_hash in candidates or ():
+                if length >= CHUNK_ANCHOR_LENGTH and pos + length <= text_length and \
+                   compute_chunk_hash(text_content[pos:pos + length]) == full_hash:
+                    return length
+            for length in short_lengths:
+                if pos + length <= text_length and \
+                   compute_chunk_hash(text_content[pos:pos + length]) in short_chunks[length]:
+                    return length
+            return 0
+
+        # 줄 끝 오프셋 (splitlines와 동일한 줄 경계)
+        line_ends: List[int] = list(iter_line_ends(text_content))
+
+        chunks: List[str] = []
+        current_start = 0
+        current_len = 0
+        pos = 0
+        line_idx = 0
+        reused = 0
+
+        while pos < text_length:
+            while line_ends[line_idx] <= pos:
+                line_idx += 1
+
+            anchor_len = match_anchor(pos) if anchors else 0
+            if anchor_len:
+                if current_len:
+                    chunks.append(text_content[current_start:current_start + current_len])
+                    current_len = 0
+                chunks.append(text_content[pos:pos + anchor_len])
+                reused += 1
+                pos += anchor_len
+                continue
+
+            line_end = line_ends[line_idx]
+            line_len = line_end - pos
+            if current_len + line_len <= max_chunk_size:
+                if not current_len:
+                    current_start = pos
+                current_len += line_len
+            else:
+                if current_len:
+                    chunks.append(text_content[current_start:current_start + current_len])
+                    current_len = 0
+                if line_len > max_chunk_size:
+                    for i in range(pos, line_end, max_chunk_size):
+                        chunks.append(text_content[i:min(i + max_chunk_size, line_end)])
+                else:
+                    current_start = pos
+                    current_len = line_len
+            pos = line_end
+
+        if current_len:
+            chunks.append(text_content[current_start:current_start + current_len])
+
+        logger.info(f"텍스트가 {len(chunks)}개의 청크로 분할되었습니다 (보존된 이전 청크: {reused}개, 최대 크기: {max_chunk_size}).")
+        return chunks
+
     def split_chunk_recursively(
     self, 
     chunk_text: str, 
@@ -149,13 +395,14 @@ class ChunkService:
     ) -> List[str]:
         """
         텍스트를 정확히 2개의 청크로 분할합니다 (strict 이진 분할).
-        마지막 청크가 너무 작으면 이전 청크와 병합하여 2개를 유지합니다.
+
+        문장 분할기의 구간 경계 중 target_size에 가장 가까운 줄 경계(없으면 문장 경계)에서 자르며,
+        양쪽 모두 target_size * min_chunk_ratio자 이상이 되도록 합니다. 이어 붙이면 원문과 같습니다.
         
         Args:
             chunk_text: 분할할 텍스트
             target_size: 목표 청크 크기 (None이면 현재 크기의 절반)
-            min_chunk_ratio: 마지막 청크의 최소 비율 (기본 30%)
-                           이보다 작으면 이전 청크와 병합
+            min_chunk_ratio: 각 청크의 최소 비율 (기본 30%)
         
         Returns:
             정확히 2개의 청크 리스트 (분할 불가능하면 1개)
@@ -170,77 +417,35 @@ class ChunkService:
         min_chunk_size = int(target_size * min_chunk_ratio)
         
         logger.info(f"이진 분할 시도: 전체 {text_length}자 → 목표 {target_size}자 (최소 {min_chunk_size}자)")
-        
-        # 기존 split_text_into_chunks로 분할 시도
-        initial_chunks = self.split_text_into_chunks(chunk_text, target_size)
-        
-        # 분할 안됨
-        if len(initial_chunks) <= 1:
+
+        spans = segment_sentence_spans(chunk_text)
+        cut = find_balanced_cut(chunk_text, target_size, min_chunk_size, spans=spans)
+        if cut is None:
+            # 최소 크기 조건을 만족하는 경계가 없으면 조건 없이 가장 가까운 경계 사용
+            cut = find_balanced_cut(chunk_text, target_size, 0, spans=spans)
+        if cut is None:
+            # 경계가 없으면 단어/문장 중간을 자르지 않고 그대로 반환 (호출자가 문장 단위 분할로 대체)
             logger.warning("이진 분할 실패: 청크를 나눌 수 없음")
-            return initial_chunks
-        
-        # 정확히 2개면 OK
-        if len(initial_chunks) == 2:
-            logger.info(f"✓ 이진 분할 성공: 2개 청크 ({len(initial_chunks[0])}자, {len(initial_chunks[1])}자)")
-            return initial_chunks
-        
-        # 3개 이상: 마지막 청크가 작으면 병합
-        if len(initial_chunks) >= 3:
-            last_chunk_size = len(initial_chunks[-1])
-            
-            # 마지막 청크가 충분히 큰 경우: 앞의 청크들을 병합
-            if last_chunk_size >= min_chunk_size:
-                first_half = "".join(initial_chunks[:-1])
-                second_half = initial_chunks[-1]
-                logger.info(f"✓ 이진 분할 조정: {len(initial_chunks)}개 → 2개 (앞 병합: {len(first_half)}자, 마지막: {len(second_half)}자)")
-                return [first_half, second_half]
-            
-            # 마지막 청크가 작은 경우: 마지막 2개를 병합
-            else:
-                if len(initial_chunks) == 2:
-                    # 이미 2개인데 둘째가 작으면 그냥 반환 (분할 의미 없음)
-                    logger.warning(f"⚠ 둘째 청크가 작음 ({last_chunk_size}자 < {min_chunk_size}자). 그대로 반환")
-                    return initial_chunks
-                else:
-                    # 3개 이상: 마지막 2개 병합
-                    first_half = "".join(initial_chunks[:-2])
-                    second_half = "".join(initial_chunks[-2:])
-                    logger.info(f"✓ 이진 분할 조정: {len(initial_chunks)}개 → 2개 (마지막 2개 병합: {len(first_half)}자, {len(second_half)}자)")
-                    return [first_half, second_half]
-        
-        # 안전 장치
-        return initial_chunks
+            return [chunk_text]
+
+        logger.info(f"✓ 이진 분할 성공: 2개 청크 ({cut}자, {text_length - cut}자)")
+        return [chunk_text[:cut], chunk_text[cut:]]
 
     def split_chunk_by_sentences(self, chunk_text: str, max_sentences_per_chunk: int = 2) -> List[str]:
         """
         문장 단위로 청크를 분할합니다.
+
+        CJK/라틴 문장 부호와 괄호/따옴표(「」『』“” 등)를 고려하는 단일 순회 분할기
+        (utils.sentence_segmenter)를 사용하며, 구두점·줄바꿈을 포함한 원문 그대로 잘라내므로
+        결과를 이어 붙이면 원문과 같습니다.
         """
-        import re
-        
-        # 문장 분할 (한국어/영어 문장 부호 기준)
-        sentence_patterns = [
-            r'[.!?]+\s+',  # 영어 문장 종료
-            r'[。！？]+\s*',  # 한국어 문장 종료
-            r'[\n\r]+',  # 줄바꿈
-        ]
-        
-        sentences = chunk_text
-        for pattern in sentence_patterns:
-            sentences = re.split(pattern, sentences)
-        
-        # 빈 문장 제거
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        if len(sentences) <= 1:
+        if max_sentences_per_chunk <= 0:
+            raise ValueError("max_sentences_per_chunk는 0보다 커야 합니다.")
+
+        groups = group_spans(segment_sentence_spans(chunk_text), chunk_text, max_sentences_per_chunk)
+        if len(groups) <= 1:
             return [chunk_text]
-        
-        # 지정된 문장 수로 청크 생성
-        chunks = []
-        for i in range(0, len(sentences), max_sentences_per_chunk):
-            chunk_sentences = sentences[i:i + max_sentences_per_chunk]
-            chunks.append(' '.join(chunk_sentences))
-        
-        return chunks
+        return [chunk_text[start:end] for start, end in groups]
 
     def split_nodes_into_chunks(
         self, 
@@ -259,10 +464,23 @@ class ChunkService:
         Returns:
             분할된 노드 리스트의 리스트.
         """
+        chunks = list(self.iter_node_chunks(nodes, max_chunk_size, max_items_per_chunk))
+        logger.info(f"노드 리스트가 {len(chunks)}개의 청크로 분할되었습니다.")
+        return chunks
+
+    def iter_node_chunks(
+        self,
+        nodes: Iterable[Union[TranslationUnit, EpubNode]],
+        max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
+        max_items_per_chunk: int = DEFAULT_MAX_ITEMS_PER_CHUNK
+    ) -> Iterator[List[Union[TranslationUnit, EpubNode]]]:
+        """
+        split_nodes_into_chunks의 지연 버전. nodes는 제너레이터여도 되며,
+        완성된 청크를 하나씩 반환하므로 메모리에는 현재 청크의 노드만 남습니다.
+        """
         if max_chunk_size <= 0 or max_items_per_chunk <= 0:
             raise ValueError("max_chunk_size와 max_items_per_chunk는 0보다 커야 합니다.")
 
-        chunks: List[List[Union[TranslationUnit, EpubNode]]] = []
         current_chunk: List[Union[TranslationUnit, EpubNode]] = []
         current_chunk_size = 0
 
@@ -283,7 +501,7 @@ class ChunkService:
                 current_chunk_size += node_len
             else:
                 if current_chunk:
-                    chunks.append(current_chunk)
+                    yield current_chunk
                 
                 # 단일 노드가 이미 제한을 초과하는 경우 (강제로 하나의 청크로 만듦)
                 if node_len > max_chunk_size:
@@ -293,11 +511,36 @@ class ChunkService:
                 current_chunk_size = node_len
 
         if current_chunk:
-            chunks.append(current_chunk)
+            yield current_chunk
 
-        logger.info(f"노드 리스트가 {len(chunks)}개의 청크로 분할되었습니다.")
-        return chunks
+    @staticmethod
+    def iter_chunks_from_lines(lines: Iterable[str], max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> Iterator[str]:
+        """
+        줄바꿈을 포함한 줄 스트림(예: iter_text_file_lines(path, keepends=True))에서 청크를 하나씩 만듭니다.
+        경계는 같은 텍스트에 대한 split_text_into_chunks와 같습니다.
+        """
+        if max_chunk_size <= 0:
+            raise ValueError("max_chunk_size는 0보다 커야 합니다.")
 
+        current_parts: List[str] = []
+        current_len = 0
+        for line in lines:
+            line_len = len(line)
+            if current_len + line_len <= max_chunk_size:
+                current_parts.append(line)
+                current_len += line_len
+                continue
+            if current_parts:
+                yield "".join(current_parts)
+            if line_len > max_chunk_size:
+                logger.warning(f"단일 라인이 max_chunk_size({max_chunk_size})를 초과합니다. 강제 분할합니다. 라인 길이: {line_len}")
+                for i in range(0, line_len, max_chunk_size):
+                    yield line[i:i + max_chunk_size]
+                current_parts, current_len = [], 0
+            else:
+                current_parts, current_len = [line], line_len
+        if current_parts:
+            yield "".join(current_parts)
 
 if __name__ == '__main__':
     # ChunkService 테스트를 위한 간단한 예제 코드
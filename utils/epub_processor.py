@@ -1,9 +1,15 @@
 # utils/epub_processor.py
 import copy
-from typing import List, Dict, Optional, Set, Tuple
+import codecs
+from array import array
+from dataclasses import dataclass
+from html import escape, unescape
+from html.parser import HTMLParser
+from typing import List, Dict, Optional, Set, Tuple, Union
 from bs4 import BeautifulSoup, Tag, NavigableString
-from core.dtos import EpubNode, EpubChapter, NodeType
+from core.dtos import EpubNode, EpubChapter, NodeType, TranslationUnit
 from infrastructure.logger_config import setup_logger
+from utils.chunk_service import is_translatable_unit_text
 
 logger = setup_logger(__name__)
 
@@ -19,6 +25,297 @@ COMPLEX_TAGS = STRUCTURAL_TAGS | {
     'p', 'div', 'section', 'article', 'aside', 
     'header', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'
 }
+# 하위에 하나라도 있으면 컨테이너로 보고 안으로 들어가는 태그
+CONTAINER_MARKER_TAGS = COMPLEX_TAGS | IMAGE_TAGS | ATOMIC_TAGS
+# 닫는 태그가 없는 HTML 빈 요소
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+}
+# 번역하지 않는 원시 텍스트 요소
+RAW_TEXT_TAGS = {'script', 'style'}
+RUBY_TEXT_TAGS = {'rt', 'rp'}
+
+# EpubNodeArena.kinds 값 (NodeType 순서와 대응)
+ARENA_TEXT = 0
+ARENA_IMAGE = 1
+ARENA_IGNORED = 2
+_ARENA_NODE_TYPES = (NodeType.TEXT, NodeType.IMAGE, NodeType.IGNORED)
+
+
+class _Element:
+    """XHTML 파싱 중에만 쓰는 경량 요소 (원문 오프셋만 보관)"""
+    __slots__ = ("tag", "attrs", "start", "open_end", "close_start", "end", "children", "has_container_marker")
+
+    def __init__(self, tag: str, attrs, start: int, open_end: int):
+        self.tag = tag
+        self.attrs = attrs
+        self.start = start
+        self.open_end = open_end
+        self.close_start = open_end
+        self.end = open_end
+        # _Element 또는 텍스트 구간 (start, end)
+        self.children: List[Union["_Element", Tuple[int, int]]] = []
+        self.has_container_marker = False
+
+
+class _XhtmlTreeBuilder(HTMLParser):
+    """
+    HTMLParser 이벤트 위치(getpos)로 태그/주석/선언의 원문 범위를 기록하며 경량 트리를 만듭니다.
+    마크업 사이의 구간은 모두 텍스트 구간입니다.
+    """
+
+    def __init__(self, source: str):
+        super().__init__(convert_charrefs=True)
+        self.source = source
+        self.root = _Element("", [], 0, 0)
+        self.stack: List[_Element] = [self.root]
+        self.cursor = 0
+        line_starts = [0]
+        find = source.find
+        pos = find("\n")
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = find("\n", pos + 1)
+        self.line_starts = line_starts
+
+    def build(self) -> _Element:
+        self.feed(self.source)
+        self.close()
+        self._text_until(len(self.source))
+        while len(self.stack) > 1:
+            self._pop(len(self.source), len(self.source))
+        self.root.end = len(self.source)
+        return self.root
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self.line_starts[line - 1] + column
+
+    def _text_until(self, position: int) -> None:
+        if position > self.cursor:
+            self.stack[-1].children.append((self.cursor, position))
+        self.cursor = max(self.cursor, position)
+
+    def _markup(self, end_marker: str) -> None:
+        start = self._offset()
+        self._text_until(start)
+        end = self.source.find(end_marker, start + 1)
+        self.cursor = len(self.source) if end == -1 else end + len(end_marker)
+
+    def _close_element(self, element: _Element) -> None:
+        parent = self.stack[-1]
+        parent.children.append(element)
+        if element.tag in CONTAINER_MARKER_TAGS or element.has_container_marker:
+            parent.has_container_marker = True
+
+    def _pop(self, close_start: int, end: int) -> None:
+        element = self.stack.pop()
+        element.close_start = close_start
+        element.end = end
+        self._close_element(element)
+
+    def handle_starttag(self, tag, attrs):
+        start = self._offset()
+        self._text_until(start)
+        open_end = start + len(self.get_starttag_text())
+        self.cursor = open_end
+        element = _Element(tag, attrs, start, open_end)
+        if tag in VOID_TAGS:
+            self._close_element(element)
+        else:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        start = self._offset()
+        self._text_until(start)
+        open_end = start + len(self.get_starttag_text())
+        self.cursor = open_end
+        self._close_element(_Element(tag, attrs, start, open_end))
+
+    def handle_endtag(self, tag):
+        start = self._offset()
+        self._text_until(start)
+        end = self.source.find(">", start)
+        end = len(self.source) if end == -1 else end + 1
+        self.cursor = end
+        if not any(element.tag == tag for element in self.stack[1:]):
+            return  # 짝이 없는 닫는 태그는 마크업으로만 취급
+        # 닫히지 않은 하위 요소는 이 위치에서 암묵적으로 닫음
+        while self.stack[-1].tag != tag:
+            self._pop(start, start)
+        self._pop(start, end)
+
+    def handle_comment(self, data):
+        start = self._offset()
+        self._markup("-->" if self.source.startswith("<!--", start) else ">")
+
+    def handle_decl(self, decl):
+        self._markup(">")
+
+    def handle_pi(self, data):
+        self._markup(">")
+
+    def unknown_decl(self, data):
+        self._markup("]]>" if data.startswith("CDATA[") else ">")
+
+
+class EpubNodeArena:
+    """
+    챕터 노드를 병렬 배열로 보관하는 압축 모델 (EpubNode 객체를 노드마다 만들지 않음)
+
+    - kinds: ARENA_TEXT / ARENA_IMAGE / ARENA_IGNORED
+    - tag_ids: tag_names 인덱스
+    - starts/ends: 디코딩된 원문 XHTML에서의 범위.
+      TEXT는 번역문으로 바꿀 범위(요소 내부 또는 공백을 뺀 텍스트), 나머지는 해당 마크업 범위입니다.
+    - contents: TEXT 노드의 번역 대상 텍스트 (나머지는 None)
+
+    노드 id는 기존 EpubChapter와 같은 규칙(파일명_인덱스, 제목은 파일명_title)으로 계산합니다.
+    """
+
+    __slots__ = ("file_name", "source", "encoding", "prefix", "has_title",
+                 "kinds", "tag_ids", "starts", "ends", "contents", "tag_names", "_tag_lookup")
+
+    def __init__(self, file_name: str, source: str, encoding: str = "utf-8", prefix: bytes = b""):
+        self.file_name = file_name
+        self.source = source
+        self.encoding = encoding
+        self.prefix = prefix
+        self.has_title = False
+        self.kinds = array("b")
+        self.tag_ids = array("H")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.contents: List[Optional[str]] = []
+        self.tag_names: List[str] = []
+        self._tag_lookup: Dict[str, int] = {}
+
+    def append(self, kind: int, tag: str, start: int, end: int, content: Optional[str] = None) -> None:
+        tag_id = self._tag_lookup.get(tag)
+        if tag_id is None:
+            tag_id = self._tag_lookup[tag] = len(self.tag_names)
+            self.tag_names.append(tag)
+        self.kinds.append(kind)
+        self.tag_ids.append(tag_id)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.contents.append(content)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def node_id(self, index: int) -> str:
+        if self.has_title:
+            if index == 0:
+                return f"{self.file_name}_title"
+            index -= 1
+        return f"{self.file_name}_{index}"
+
+    def node_type(self, index: int) -> NodeType:
+        return _ARENA_NODE_TYPES[self.kinds[index]]
+
+    def tag(self, index: int) -> str:
+        return self.tag_names[self.tag_ids[index]]
+
+    def node_html(self, index: int) -> str:
+        return self.source[self.starts[index]:self.ends[index]]
+
+    def text_indices(self) -> List[int]:
+        return [i for i, kind in enumerate(self.kinds) if kind == ARENA_TEXT]
+
+    def translation_units(self) -> List[TranslationUnit]:
+        """API 경계에서만 사용: TEXT 노드를 TranslationUnit(id=노드 id)으로 변환"""
+        return [TranslationUnit(id=self.node_id(i), text=self.contents[i] or "") for i in self.text_indices()]
+
+
+@dataclass
+class EpubDedupReport:
+    """
+    책 전체 텍스트 노드 중복 제거 결과 (이번 실행에서 처리한 챕터 기준)
+
+    translated_nodes는 실제로 API 번역 요청에 들어간 노드 수이고, 숫자/구두점만 있는 등
+    번역할 필요가 없어 원문 그대로 확정된 노드는 local_nodes로 따로 셉니다.
+    """
+    total_nodes: int = 0
+    translated_nodes: int = 0
+    local_nodes: int = 0
+
+    @property
+    def reused_nodes(self) -> int:
+        return self.total_nodes - self.translated_nodes - self.local_nodes
+
+    @property
+    def dedup_ratio(self) -> float:
+        return self.reused_nodes / self.total_nodes if self.total_nodes else 0.0
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        return {
+            "total_nodes": self.total_nodes,
+            "translated_nodes": self.translated_nodes,
+            "local_nodes": self.local_nodes,
+            "reused_nodes": self.reused_nodes,
+            "dedup_ratio": round(self.dedup_ratio, 4),
+        }
+
+
+class TextNodeIndex:
+    """
+    책 전체 텍스트 노드의 내용 색인 (텍스트 → 번역문)
+
+    노드 id는 파일 단위(파일명_인덱스)라 챕터마다 반복되는 머리글, "目次へ戻る" 링크,
+    저작권 표기 등이 매번 다시 번역되었습니다. 같은 텍스트는 처음 한 번만 번역 요청에 넣고
+    이후 등장(다른 챕터 포함)에는 색인된 번역문을 적용합니다.
+    번역에 실패해 원문이 그대로 돌아온 텍스트는 색인하지 않으므로 다음 등장 때 다시 요청됩니다.
+    """
+
+    def __init__(self):
+        self._translations: Dict[str, str] = {}
+        self.report = EpubDedupReport()
+
+    def __len__(self) -> int:
+        return len(self._translations)
+
+    def pending_units(self, units: List[TranslationUnit], skip_non_translatable: bool = True) -> List[TranslationUnit]:
+        """
+        색인에 없는 텍스트의 첫 등장 단위만 반환 (같은 챕터 안의 중복도 제거)
+
+        skip_non_translatable이 켜져 있으면 번역이 필요 없는 단위는 청크 번역에서 로컬로 확정되므로
+        (integrity_skip_non_translatable) 보고서에는 번역 요청이 아닌 로컬 처리로 셉니다.
+        """
+        pending: List[TranslationUnit] = []
+        seen: Set[str] = set()
+        local_count = 0
+        for unit in units:
+            if unit.text in self._translations or unit.text in seen:
+                continue
+            seen.add(unit.text)
+            pending.append(unit)
+            if skip_non_translatable and not is_translatable_unit_text(unit.text):
+                local_count += 1
+        self.report.total_nodes += len(units)
+        self.report.translated_nodes += len(pending) - local_count
+        self.report.local_nodes += local_count
+        return pending
+
+    def resolve(self, units: List[TranslationUnit], translated_map: Dict[str, str]) -> Dict[str, str]:
+        """대표 단위의 번역을 색인에 기록하고, 챕터의 모든 단위 id에 대한 번역 맵을 반환"""
+        fresh: Dict[str, str] = {}
+        for unit in units:
+            if unit.id in translated_map and unit.text not in fresh:
+                fresh[unit.text] = translated_map[unit.id]
+        for text, translated in fresh.items():
+            if translated != text:
+                self._translations[text] = translated
+
+        resolved: Dict[str, str] = {}
+        for unit in units:
+            translated = fresh.get(unit.text)
+            if translated is None:
+                translated = self._translations.get(unit.text)
+            if translated is not None:
+                resolved[unit.id] = translated
+        return resolved
+
 
 class EpubProcessor:
     def __init__(self):
@@ -28,6 +325,7 @@ class EpubProcessor:
     def process_chapter(self, html_content: bytes, file_name: str) -> EpubChapter:
         """
         HTML 콘텐츠를 파싱하여 EpubNode 리스트로 변환합니다.
+        번역/검토 파이프라인은 노드 객체를 만들지 않는 parse_chapter(EpubNodeArena)를 사용합니다.
         """
         self.node_index = 0
         self.current_file_name = file_name
@@ -174,6 +472,116 @@ class EpubProcessor:
         attr_str = " " + " ".join(attrs) if attrs else ""
         return f"<{element.name}{attr_str}>"
 
+    # --- 노드 아레나 (원문 범위 기반) ---
+
+    @staticmethod
+    def _decode_xhtml(html_content: bytes) -> Tuple[str, str, bytes]:
+        """(원문 문자열, 인코딩, BOM). 잘못된 바이트는 surrogateescape로 보존되어 재인코딩 시 그대로 돌아갑니다."""
+        if html_content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return html_content.decode("utf-16"), "utf-16", b""
+        if html_content.startswith(codecs.BOM_UTF8):
+            return html_content[len(codecs.BOM_UTF8):].decode("utf-8", "surrogateescape"), "utf-8", codecs.BOM_UTF8
+        return html_content.decode("utf-8", "surrogateescape"), "utf-8", b""
+
+    def parse_chapter(self, html_content: bytes, file_name: str) -> EpubNodeArena:
+        """
+        XHTML을 EpubNodeArena로 변환합니다. 노드 구분/id/번역 대상 텍스트는 process_chapter와 같은 규칙이지만,
+        노드마다 pydantic 객체와 HTML 문자열 사본을 만들지 않고 원문 범위만 기록합니다.
+        """
+        source, encoding, prefix = self._decode_xhtml(html_content)
+        arena = EpubNodeArena(file_name, source, encoding, prefix)
+        root = _XhtmlTreeBuilder(source).build()
+
+        head = self._find_element(root, "head")
+        if head is not None:
+            title = self._find_element(head, "title")
+            if title is not None:
+                arena.has_title = True
+                arena.append(ARENA_TEXT, "title", title.open_end, title.close_start,
+                             self._element_text(source, title, skip_ruby=False))
+
+        body = self._find_element(root, "body")
+        if body is not None:
+            self._traverse_arena(source, body, arena)
+        return arena
+
+    @staticmethod
+    def _find_element(element: _Element, tag: str) -> Optional[_Element]:
+        """문서 순서상 첫 번째 하위 요소 (전위 순회)"""
+        pending = [c for c in reversed(element.children) if isinstance(c, _Element)]
+        while pending:
+            current = pending.pop()
+            if current.tag == tag:
+                return current
+            pending.extend(c for c in reversed(current.children) if isinstance(c, _Element))
+        return None
+
+    @staticmethod
+    def _element_text(source: str, element: _Element, skip_ruby: bool = True) -> str:
+        """get_text()와 같은 순서로 하위 텍스트를 모읍니다 (루비 주석/스크립트 제외)."""
+        parts: List[str] = []
+        pending: List[Union[_Element, Tuple[int, int]]] = [element]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, _Element):
+                if node is not element and (node.tag in RAW_TEXT_TAGS or (skip_ruby and node.tag in RUBY_TEXT_TAGS)):
+                    continue
+                pending.extend(reversed(node.children))
+            else:
+                parts.append(source[node[0]:node[1]])
+        return unescape("".join(parts))
+
+    def _traverse_arena(self, source: str, element: _Element, arena: EpubNodeArena) -> None:
+        """_traverse와 같은 규칙으로 평탄화하되 원문 범위만 기록합니다."""
+        for child in element.children:
+            if not isinstance(child, _Element):
+                raw = source[child[0]:child[1]]
+                stripped = raw.strip()
+                text = unescape(stripped).strip()
+                if text:
+                    start = child[0] + (len(raw) - len(raw.lstrip()))
+                    arena.append(ARENA_TEXT, "", start, start + len(stripped), text)
+                continue
+
+            tag_name = child.tag
+            if tag_name in IMAGE_TAGS:
+                arena.append(ARENA_IMAGE, tag_name, child.start, child.end)
+                continue
+            if tag_name in ATOMIC_TAGS or tag_name in RAW_TEXT_TAGS:
+                arena.append(ARENA_IGNORED, tag_name, child.start, child.end)
+                continue
+
+            if tag_name in STRUCTURAL_TAGS or child.has_container_marker:
+                arena.append(ARENA_IGNORED, tag_name, child.start, child.open_end)
+                self._traverse_arena(source, child, arena)
+                arena.append(ARENA_IGNORED, tag_name, child.close_start, child.end)
+                continue
+
+            pure_text = self._element_text(source, child).strip()
+            if pure_text:
+                arena.append(ARENA_TEXT, tag_name, child.open_end, child.close_start, pure_text)
+            else:
+                arena.append(ARENA_IGNORED, tag_name, child.start, child.end)
+
+    def reconstruct_arena(self, arena: EpubNodeArena, translated_map: Dict[str, str]) -> bytes:
+        """
+        번역문을 원문 XHTML의 해당 범위에만 끼워 넣어 바이트로 반환합니다.
+        선언/DOCTYPE/속성/주석 등 나머지 원문은 그대로 유지되며, 번역이 없거나 원문과 같은 노드는 건드리지 않습니다.
+        """
+        source = arena.source
+        parts: List[str] = []
+        cursor = 0
+        for index in arena.text_indices():
+            translated = translated_map.get(arena.node_id(index))
+            if translated is None or translated == arena.contents[index]:
+                continue
+            parts.append(source[cursor:arena.starts[index]])
+            parts.append(escape(translated, quote=False))
+            cursor = arena.ends[index]
+        parts.append(source[cursor:])
+        errors = "surrogateescape" if arena.encoding == "utf-8" else "strict"
+        return arena.prefix + "".join(parts).encode(arena.encoding, errors)
+
     def reconstruct_chapter(self, chapter: EpubChapter, translated_map: Dict[str, str]) -> str:
         """
         번역된 텍스트 맵을 사용하여 EpubChapter를 다시 HTML 문자열로 조립합니다.
@@ -0,0 +1,152 @@
+# integrity_wire_format.py
+"""
+무결성/EPUB 모드의 간결한 줄 번호 전송 형식
+
+JSON 객체 배열([{"id": ..., "text": ...}, ...])은 줄마다 키 이름과 따옴표/이스케이프가 붙어
+입력·출력 토큰이 늘고, 응답 JSON이 한 군데만 깨져도 청크 전체가 Binary Split으로 넘어갑니다.
+이 형식은 요청 안에서의 순번을 표식으로 사용합니다.
+
+    ⟦1⟧ 第一章
+    ⟦2⟧ 「你好」
+    ⟦3⟧ 여러 줄 단위의 첫 줄
+    표식 없는 줄은 직전 단위의 다음 줄
+
+응답도 같은 형식으로 받으며, CompactResponseParser는 줄 단위로 복구하므로
+일부만 온 응답(출력 길이 제한 등)에서도 완성된 줄은 살리고 누락된 id만 다시 요청할 수 있습니다.
+
+기본 JSON 형식도 salvage_json_objects()로 깨진 응답에서 온전한 객체를 골라내어 같은 방식으로 복구합니다.
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.dtos import TranslationUnit
+
+WIRE_FORMAT_JSON = "json"
+WIRE_FORMAT_COMPACT = "compact"
+
+COMPACT_FORMAT_INSTRUCTION = (
+    "You are a professional translator. Each input line starts with a marker like ⟦3⟧. "
+    "Translate the text after each marker and output one line per marker in the same order, "
+    "starting with the same marker (e.g. ⟦3⟧ translated text). "
+    "Do not merge, split, drop or renumber markers. Output nothing else."
+)
+COMPACT_PROMPT_SUFFIX = "\n\nTranslate each ⟦n⟧ line below. Keep every marker exactly as given."
+
+_MARKER_LINE_PATTERN = re.compile(r'^\s*⟦(\d+)⟧ ?(.*)$')
+_CODE_FENCE_PATTERN = re.compile(r'^\s*```')
+
+
+def encode_compact_units(units: Sequence[TranslationUnit]) -> str:
+    """번역 단위를 요청 내 순번(1부터) 표식이 붙은 줄로 직렬화합니다."""
+    lines: List[str] = []
+    for position, unit in enumerate(units, start=1):
+        text_lines = (unit.text or "").split("\n")
+        lines.append(f"⟦{position}⟧ {text_lines[0]}")
+        lines.extend(text_lines[1:])
+    return "\n".join(lines)
+
+
+class CompactResponseParser:
+    """
+    간결한 형식 응답을 조각 단위로 받아 줄 단위로 해석하는 파서
+
+    - feed(): 스트리밍 조각을 누적하며 완성된 줄만 해석
+    - close(): 남은 줄을 해석하고 {unit_id: 번역문} 반환
+    - 알 수 없는 표식, 코드 펜스, 첫 표식 이전의 머리말은 무시
+    - 같은 표식이 다시 오면 나중 값을 사용
+    - 응답이 줄바꿈 없이 끝났고 마지막 표식이 요청의 마지막 단위가 아니면
+      잘린 줄일 수 있으므로 버리고 재요청 대상으로 남김
+    """
+
+    def __init__(self, units: Sequence[TranslationUnit]):
+        self._ids = [unit.id for unit in units]
+        self._buffer = ""
+        self._current: Optional[int] = None
+        self._lines: Dict[int, List[str]] = {}
+        self._ended_with_newline = True
+
+    def feed(self, piece: str) -> None:
+        if not piece:
+            return
+        self._buffer += piece
+        *complete, self._buffer = self._buffer.split("\n")
+        for line in complete:
+            self._consume_line(line)
+        self._ended_with_newline = self._buffer == ""
+
+    def _consume_line(self, line: str) -> None:
+        line = line.rstrip("\r")
+        if _CODE_FENCE_PATTERN.match(line):
+            return
+        match = _MARKER_LINE_PATTERN.match(line)
+        if match:
+            position = int(match.group(1))
+            if 1 <= position <= len(self._ids):
+                self._current = position
+                self._lines[position] = [match.group(2)]
+            else:
+                self._current = None
+            return
+        if self._current is not None:
+            self._lines[self._current].append(line)
+
+    def close(self) -> Dict[str, str]:
+        if self._buffer:
+            self._consume_line(self._buffer)
+            self._buffer = ""
+        if (not self._ended_with_newline and self._current is not None
+                and self._current != len(self._ids)):
+            self._lines.pop(self._current, None)
+
+        result: Dict[str, str] = {}
+        for position, parts in self._lines.items():
+            # 단위 사이의 빈 줄은 모델이 끼워 넣은 것이므로 제거
+            while len(parts) > 1 and not parts[-1].strip():
+                parts.pop()
+            result[self._ids[position - 1]] = "\n".join(parts)
+        return result
+
+
+def parse_compact_response(text: str, units: Sequence[TranslationUnit]) -> Dict[str, str]:
+    """간결한 형식의 전체 응답 문자열을 해석합니다."""
+    parser = CompactResponseParser(units)
+    parser.feed(text or "")
+    return parser.close()
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def salvage_json_objects(raw_response: Any) -> List[Dict[str, Any]]:
+    """
+    깨지거나 잘린 JSON 응답에서 형식이 온전한 {"id", "translated_text"} 객체를 모두 추출합니다.
+
+    - 이미 파싱된 리스트/딕셔너리("items" 등으로 감싼 경우 포함)는 그대로 사용
+    - 문자열이면 '{' 위치마다 raw_decode를 시도하여 완성된 객체만 수집하고 깨진 객체는 건너뜀
+    """
+    if isinstance(raw_response, list):
+        return [item for item in raw_response if isinstance(item, dict) and "id" in item]
+    if isinstance(raw_response, dict):
+        for value in raw_response.values():
+            if isinstance(value, list):
+                return salvage_json_objects(value)
+        return [raw_response] if "id" in raw_response else []
+    if not isinstance(raw_response, str):
+        return []
+
+    objects: List[Dict[str, Any]] = []
+    text = raw_response
+    position = text.find("{")
+    while position != -1:
+        try:
+            value, end = _JSON_DECODER.raw_decode(text, position)
+        except json.JSONDecodeError:
+            position = text.find("{", position + 1)
+            continue
+        if isinstance(value, dict) and "id" in value and "translated_text" in value:
+            objects.append(value)
+            position = text.find("{", end)
+        else:
+            position = text.find("{", position + 1)
+    return objects
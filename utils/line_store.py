@@ -0,0 +1,179 @@
+# line_store.py
+"""
+무결성 모드 줄 저장소 (열 기반)
+
+무결성 모드는 원문 한 줄마다 pydantic TranslationUnit(id=str(i))을 만들고, 검토 탭은 로드할 때마다
+전체 단위를 다시 만들어 왔습니다. 20만 줄 소설이면 수십만 번의 검증과 객체가 생깁니다.
+
+LineStore는 원문 문자열 하나와 줄 시작/끝 오프셋 배열(array('q'))만 보관하고 줄 번호는 정수로 다룹니다.
+청크 경계는 줄 길이만으로 계산하며(ChunkService.split_nodes_into_chunks와 같은 규칙),
+TranslationUnit은 API로 보내는 청크에 대해서만 to_units()로 만듭니다.
+"""
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from infrastructure.logger_config import setup_logger
+    from infrastructure.file_handler import iter_text_file_blocks
+    from core.dtos import TranslationUnit
+    from utils.chunk_service import iter_line_ends
+except ImportError:
+    from infrastructure.logging.logger_config import setup_logger # type: ignore
+    from infrastructure.file_handler import iter_text_file_blocks # type: ignore
+    from core.dtos import TranslationUnit # type: ignore
+    from utils.chunk_service import iter_line_ends # type: ignore
+
+logger = setup_logger(__name__)
+
+# str.splitlines가 줄 경계로 보는 문자 ('\r\n'은 두 글자 경계)
+_LINE_BREAK_CHARS = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
+_STORE_CACHE_SIZE = 4
+
+
+def iter_chunk_ranges(
+    lengths: Iterable[int],
+    max_chunk_size: int,
+    max_items_per_chunk: int
+) -> Iterator[Tuple[int, int]]:
+    """
+    줄 길이 스트림을 (시작 줄, 끝 줄) 범위로 묶습니다.
+    규칙은 ChunkService.split_nodes_into_chunks와 같아 무결성 임시 청크 파일(chunk_{i}.json)과 호환됩니다.
+    """
+    if max_chunk_size <= 0 or max_items_per_chunk <= 0:
+        raise ValueError("max_chunk_size와 max_items_per_chunk는 0보다 커야 합니다.")
+
+    start = 0
+    count = 0
+    size = 0
+    for index, length in enumerate(lengths):
+        if size + length <= max_chunk_size and count < max_items_per_chunk:
+            count += 1
+            size += length
+            continue
+        if count:
+            yield start, index
+        if length > max_chunk_size:
+            logger.warning(f"단일 노드(ID: {index})의 텍스트가 max_chunk_size({max_chunk_size})를 초과합니다. 강제 포함합니다.")
+        start, count, size = index, 1, length
+    if count:
+        yield start, start + count
+
+
+def iter_line_chunks(
+    lines: Iterable[str],
+    max_chunk_size: int,
+    max_items_per_chunk: int
+) -> Iterator[Tuple[int, List[str]]]:
+    """줄 스트림을 (시작 줄 번호, 줄 목록) 청크로 지연 분할합니다. 메모리에는 현재 청크의 줄만 남습니다."""
+    buffer: List[str] = []
+
+    def lengths() -> Iterator[int]:
+        for line in lines:
+            buffer.append(line)
+            yield len(line)
+
+    # 범위가 반환될 때는 다음 청크의 첫 줄까지 읽힌 상태이므로 앞부분만 잘라 넘김
+    for start, stop in iter_chunk_ranges(lengths(), max_chunk_size, max_items_per_chunk):
+        size = stop - start
+        yield start, buffer[:size]
+        del buffer[:size]
+
+
+class LineStore:
+    """원문 한 개 + 줄 오프셋 배열. 줄 i의 텍스트는 text[starts[i]:ends[i]] (줄바꿈 제외)입니다."""
+
+    __slots__ = ("text", "starts", "ends")
+
+    def __init__(self, text: str, starts: array, ends: array):
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def from_text(cls, text: str) -> "LineStore":
+        """text.splitlines()와 같은 줄 구분으로 저장소를 만듭니다."""
+        starts = array("q")
+        ends = array("q")
+        if not any(ch in text for ch in _LINE_BREAK_CHARS if ch != "\n"):
+            # 일반적인 경우: '\n'만 찾아 오프셋 기록
+            length = len(text)
+            pos = 0
+            while pos < length:
+                newline = text.find("\n", pos)
+                if newline == -1:
+                    newline = length
+                starts.append(pos)
+                ends.append(newline)
+                pos = newline + 1
+            return cls(text, starts, ends)
+
+        start = 0
+        for end in iter_line_ends(text):
+            content_end = end
+            if text[end - 1] in _LINE_BREAK_CHARS:
+                content_end = end - 2 if text.startswith("\r\n", end - 2) else end - 1
+            starts.append(start)
+            ends.append(content_end)
+            start = end
+        return cls(text, starts, ends)
+
+    @classmethod
+    def from_file(cls, file_path: Union[str, Path]) -> "LineStore":
+        """
+        번역 파이프라인(iter_text_file_lines)과 같은 스트리밍 리더로 파일을 읽습니다.
+        (UTF-8 BOM 제거, \r\n/\r → \n 정규화. 검토 탭의 줄/청크 경계가 실제 번역한 청크와 어긋나지 않도록)
+        """
+        return cls.from_text("".join(iter_text_file_blocks(file_path)))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def line(self, index: int) -> str:
+        return self.text[self.starts[index]:self.ends[index]]
+
+    def lines(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        stop = len(self) if stop is None else stop
+        text, starts, ends = self.text, self.starts, self.ends
+        return [text[starts[i]:ends[i]] for i in range(start, stop)]
+
+    def iter_lines(self) -> Iterator[str]:
+        text = self.text
+        for start, end in zip(self.starts, self.ends):
+            yield text[start:end]
+
+    def lengths(self) -> Iterator[int]:
+        return (end - start for start, end in zip(self.starts, self.ends))
+
+    def has_content(self) -> bool:
+        return bool(self.text.strip())
+
+    def chunk_ranges(self, max_chunk_size: int, max_items_per_chunk: int) -> List[Tuple[int, int]]:
+        return list(iter_chunk_ranges(self.lengths(), max_chunk_size, max_items_per_chunk))
+
+    def to_units(self, start: int, stop: int) -> List[TranslationUnit]:
+        """API 경계에서만 사용: [start, stop) 줄을 TranslationUnit(id=줄 번호 문자열)으로 변환"""
+        return [TranslationUnit(id=str(i), text=line) for i, line in enumerate(self.lines(start, stop), start)]
+
+
+_store_cache: "OrderedDict[Tuple[str, int, int], LineStore]" = OrderedDict()
+
+
+def load_line_store(file_path: Union[str, Path]) -> LineStore:
+    """
+    파일의 LineStore를 반환합니다. 경로/수정 시각/크기가 같으면 이전에 만든 저장소를 재사용하므로
+    검토 탭이 원문/번역문 청크를 여러 번 불러와도 파일은 한 번만 읽습니다.
+    """
+    path = Path(file_path)
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    store = _store_cache.get(key)
+    if store is None:
+        store = LineStore.from_file(path)
+        _store_cache[key] = store
+        while len(_store_cache) > _STORE_CACHE_SIZE:
+            _store_cache.popitem(last=False)
+    else:
+        _store_cache.move_to_end(key)
+    return store
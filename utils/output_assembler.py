@@ -0,0 +1,262 @@
+# output_assembler.py
+"""
+최종 출력 파일 증분/스트리밍 조립기
+
+번역된 청크를 청크 단위로 정리(후처리 + 마커 제거)한 조각(piece)을 이어 붙여 최종 파일을
+만듭니다. 조각별 해시와 파일 내 바이트 끝 위치를 메타데이터("output_assembly")에 기록해 두면,
+다음 실행에서는 첫 번째로 달라진 조각 위치에서 파일을 잘라내고 나머지만 이어 씁니다.
+(원문 뒤에 내용이 추가된 경우 기존 출력은 그대로 두고 새 번역만 덧붙임)
+
+번역 중에는 워터마크(0번부터 연속으로 완료된 청크 수)까지의 조각을 즉시 파일에 덧붙이므로,
+작업이 끝나기 전에도 앞부분을 읽을 수 있고 작업 종료 시의 병합은 사실상 할 일이 없습니다.
+
+기록된 상태와 실제 파일(경로/크기/수정 시각)이 다르면 안전하게 전체를 다시 씁니다.
+조각은 정리하는 즉시 해시를 계산해 파일에 쓰므로 병합된 전체 텍스트를 메모리에 만들지 않으며,
+한 번에 정리할 청크가 많으면(post_processing_parallel_min_chunks 이상) 후처리는 프로세스 풀에서 실행됩니다.
+"""
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    from infrastructure.logger_config import setup_logger
+    from utils.post_processing_service import strip_chunk_markers
+except ImportError:
+    from infrastructure.logging.logger_config import setup_logger # type: ignore
+    from utils.post_processing_service import strip_chunk_markers # type: ignore
+
+logger = setup_logger(__name__)
+
+OUTPUT_ASSEMBLY_STATE_VERSION = 1
+
+
+def _hash_piece(piece: str) -> str:
+    return hashlib.sha1(piece.encode("utf-8")).hexdigest()
+
+
+class OutputAssembler:
+    """
+    청크 번역 결과를 최종 출력 파일로 (증분) 조립합니다.
+
+    - 후처리 활성화: 청크마다 clean_translated_content 적용 후 "\\n\\n"으로 연결
+      (PostProcessingService.post_process_and_clean_chunks와 같은 결과)
+    - 후처리 비활성화: 마커만 제거하고 "\\n"으로 연결 (기존 병합 저장 + 인덱스 제거와 같은 결과)
+    """
+
+    def __init__(
+        self,
+        output_path: Union[str, Path],
+        post_processing_service: Any = None,
+        config: Optional[Dict[str, Any]] = None,
+        previous_state: Optional[Dict[str, Any]] = None
+    ):
+        self.output_path = Path(output_path)
+        self.post_processing_service = post_processing_service
+        self.config = config or {}
+        self.enable_post_processing = bool(self.config.get("enable_post_processing", True)) and post_processing_service is not None
+        self.separator = "\n\n" if self.enable_post_processing else "\n"
+        self.previous_state = previous_state
+        self.state: Optional[Dict[str, Any]] = None
+
+        # 스트리밍 상태
+        self.watermark = 0  # 0번부터 연속으로 파일에 반영된 청크 수
+        self._pending: Dict[int, Optional[str]] = {}  # 워터마크 이후에 도착한 청크 (None = 건너뛴 청크)
+        self._piece_hashes: List[str] = []
+        self._piece_ends: List[int] = []
+        self._position = 0  # 파일에 반영된 바이트 길이
+        self._kept_pieces = 0
+        self._handle: Optional[BinaryIO] = None
+
+    def _render_fingerprint(self) -> str:
+        """조각 생성 방식이 바뀌면 이전 조각을 재사용할 수 없으므로 상태에 함께 기록합니다."""
+        return f"v{OUTPUT_ASSEMBLY_STATE_VERSION}|pp={int(self.enable_post_processing)}|html={int(bool(self.config.get('clean_html_tags', True)))}"
+
+    def _finish_piece(self, cleaned_text: str) -> str:
+        """후처리가 끝난 청크에서 마커를 지우고 조각으로 만듭니다 (마커/개행 정리는 strip_chunk_markers와 동일 규칙)."""
+        text = strip_chunk_markers(cleaned_text or "")
+        return text.strip() if self.enable_post_processing else text.strip("\r\n")
+
+    def render_chunk(self, chunk_text: str) -> str:
+        """청크 하나를 최종 파일에 들어갈 조각으로 정리합니다."""
+        text = chunk_text or ""
+        if self.enable_post_processing:
+            try:
+                text = self.post_processing_service.clean_translated_content(text, self.config)
+            except Exception as e:
+                logger.warning(f"청크 후처리 중 오류: {e}. 원본 내용 유지")
+        return self._finish_piece(text)
+
+    def _render_pieces(self, chunks: Sequence[Tuple[int, str]]) -> Iterator[str]:
+        """여러 청크를 순서대로 조각으로 정리해 하나씩 돌려줍니다 (청크가 많으면 후처리 서비스가 프로세스 풀 사용)."""
+        iter_cleaned = getattr(self.post_processing_service, "iter_cleaned_chunks", None)
+        if not self.enable_post_processing or iter_cleaned is None:
+            for _, chunk_text in chunks:
+                yield self.render_chunk(chunk_text)
+            return
+        for _, cleaned_text in iter_cleaned([(idx, text or "") for idx, text in chunks], self.config):
+            yield self._finish_piece(cleaned_text)
+
+    def _reusable_previous(self) -> Tuple[List[str], List[int]]:
+        """재사용할 수 있는 이전 조립 상태의 (조각 해시, 조각 끝 위치). 재사용할 수 없으면 빈 목록"""
+        state = self.previous_state
+        if not isinstance(state, dict) or state.get("fingerprint") != self._render_fingerprint():
+            return [], []
+        if state.get("output_path") != str(self.output_path.resolve()):
+            return [], []
+        try:
+            stat = self.output_path.stat()
+        except OSError:
+            return [], []
+        if stat.st_size != state.get("output_size") or stat.st_mtime_ns != state.get("output_mtime_ns"):
+            logger.info("최종 출력 파일이 마지막 조립 이후 변경되었습니다. 전체를 다시 작성합니다.")
+            return [], []
+
+        previous_hashes = state.get("piece_hashes") or []
+        previous_ends = state.get("piece_ends") or []
+        if len(previous_hashes) != len(previous_ends):
+            return [], []
+        return list(previous_hashes), list(previous_ends)
+
+    def _ensure_handle(self) -> BinaryIO:
+        """처음 쓸 때 파일을 열고 유지할 길이(_position)로 잘라냅니다."""
+        if self._handle is None:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._position > 0:
+                self._handle = open(self.output_path, "r+b")
+                self._handle.truncate(self._position)
+                self._handle.seek(self._position)
+            else:
+                self._handle = open(self.output_path, "wb")
+        return self._handle
+
+    def _write_piece(self, piece: str, piece_hash: Optional[str] = None) -> None:
+        if piece:
+            handle = self._ensure_handle()
+            if self._position > 0:
+                separator = self.separator.encode("utf-8")
+                handle.write(separator)
+                self._position += len(separator)
+            data = piece.encode("utf-8")
+            handle.write(data)
+            self._position += len(data)
+        self._piece_hashes.append(piece_hash or _hash_piece(piece))
+        self._piece_ends.append(self._position)
+
+    def _advance(self) -> bool:
+        """워터마크 위치의 청크가 도착해 있는 동안 조각을 덧붙입니다."""
+        advanced = False
+        while self.watermark in self._pending:
+            chunk_text = self._pending.pop(self.watermark)
+            if chunk_text is not None:
+                self._write_piece(self.render_chunk(chunk_text))
+            self.watermark += 1
+            advanced = True
+        return advanced
+
+    def open(self, completed_chunks: Optional[Dict[int, str]] = None) -> int:
+        """
+        이미 번역된 청크로 스트리밍 조립을 시작하고 워터마크를 반환합니다.
+        0번부터 연속된 구간 중 이전 조립 결과와 같은 조각은 파일에 그대로 두고,
+        첫 번째로 달라진 조각부터 다시 씁니다. 연속되지 않은 청크는 대기열에 둡니다.
+        """
+        completed_chunks = completed_chunks or {}
+        contiguous_count = 0
+        while contiguous_count in completed_chunks:
+            contiguous_count += 1
+
+        # 조각을 정리하는 즉시 해시를 비교해, 이전과 같으면 파일에 그대로 두고 처음 달라진 조각부터 씀
+        previous_hashes, previous_ends = self._reusable_previous()
+        self._piece_hashes, self._piece_ends = [], []
+        self._position = 0
+        keep = 0
+        pieces = self._render_pieces([(idx, completed_chunks[idx]) for idx in range(contiguous_count)])
+        for idx, piece in enumerate(pieces):
+            piece_hash = _hash_piece(piece)
+            if keep == idx and idx < len(previous_hashes) and previous_hashes[idx] == piece_hash:
+                keep += 1
+                self._piece_hashes.append(piece_hash)
+                self._piece_ends.append(previous_ends[idx])
+                self._position = previous_ends[idx]
+            else:
+                self._write_piece(piece, piece_hash)
+        self._kept_pieces = keep
+        self.watermark = contiguous_count
+        self._pending = {idx: text for idx, text in completed_chunks.items() if idx >= self.watermark}
+        if self._handle is not None:
+            self._handle.flush()
+        return self.watermark
+
+    def add_chunk(self, chunk_index: int, chunk_text: Optional[str]) -> int:
+        """
+        번역이 끝난 청크를 전달합니다 (None이면 출력에 포함되지 않는 건너뛴 청크).
+        워터마크까지 연속된 조각을 즉시 파일에 덧붙이고 새 워터마크를 반환합니다.
+        """
+        if chunk_index < self.watermark:
+            return self.watermark
+        self._pending[chunk_index] = chunk_text
+        if self._advance() and self._handle is not None:
+            self._handle.flush()
+            logger.debug(f"🧩 스트리밍 출력 워터마크: {self.watermark} ({self._position} 바이트)")
+        return self.watermark
+
+    def finish(self, translated_chunks: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+        """
+        남은 청크(워터마크 이후, 중간에 빠진 청크가 있으면 건너뛰고 인덱스 순)를 덧붙이고
+        파일을 닫은 뒤 새 조립 상태를 반환합니다. 모든 청크가 스트리밍되었다면 쓰기 작업이 없습니다.
+        반환된 상태는 메타데이터의 "output_assembly"에 저장하여 다음 실행에 전달합니다.
+        """
+        if translated_chunks:
+            for idx, text in translated_chunks.items():
+                if idx >= self.watermark:
+                    self._pending[idx] = text
+        # 워터마크부터 인덱스 순 (연속 구간 먼저, 빠진 청크는 건너뜀). 많으면 한 번에 프로세스 풀로 정리
+        remaining = [(idx, self._pending[idx]) for idx in sorted(self._pending) if self._pending[idx] is not None]
+        for piece in self._render_pieces(remaining):
+            self._write_piece(piece)
+        self._pending = {}
+
+        # 이전 출력이 더 길었거나 파일이 없으면 잘라내기/생성이 필요
+        if self._handle is None:
+            try:
+                needs_write = self.output_path.stat().st_size != self._position
+            except OSError:
+                needs_write = True
+            if needs_write:
+                self._ensure_handle()
+        written = len(self._piece_hashes) - self._kept_pieces
+        if self._handle is not None:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        self.close()
+
+        if self._kept_pieces > 0 and written == 0:
+            logger.info("🧩 최종 출력 변경 없음 (모든 조각이 이전과 동일)")
+        elif self._kept_pieces > 0:
+            logger.info(f"🧩 최종 출력 증분 갱신: {self._kept_pieces}개 조각 유지, {written}개 조각 작성")
+        else:
+            logger.info(f"🧩 최종 출력 전체 작성: {written}개 조각")
+
+        stat = self.output_path.stat()
+        self.state = {
+            "fingerprint": self._render_fingerprint(),
+            "output_path": str(self.output_path.resolve()),
+            "piece_hashes": list(self._piece_hashes),
+            "piece_ends": list(self._piece_ends),
+            "output_size": stat.st_size,
+            "output_mtime_ns": stat.st_mtime_ns,
+        }
+        return self.state
+
+    def close(self) -> None:
+        """열린 파일을 닫습니다 (취소/오류 시에도 호출 가능)."""
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            finally:
+                self._handle = None
+
+    def assemble(self, translated_chunks: Dict[int, str]) -> Dict[str, Any]:
+        """스트리밍 없이 한 번에 조립합니다 (open + finish)."""
+        self.open(translated_chunks)
+        return self.finish()
@@ -0,0 +1,294 @@
+"""
+번역 출력 검증 (미번역 원문 잔존 / 반복 루프 감지)
+
+모델이 한국어 번역 안에 한자·가나 원문을 길게 남기거나, 같은 문장을 끝없이 되풀이하는
+퇴화 출력을 길이 비율 모델보다 먼저, 모델 호출 없이 선형 시간에 찾아냅니다.
+
+- script_histogram(): 문자 체계별 코드포인트 개수 (정규식 한 번씩, O(n))
+- find_tail_repetition(): 뒤집은 꼬리 구간의 Z-배열로 "가장 긴 주기적 접미사"를 찾음 (O(window))
+- longest_repeated_line_run(): 같은 줄이 연속으로 반복된 최대 횟수 (줄 해시 비교, O(n))
+- RepetitionLoopDetector: 스트리밍 응답에 조각을 넣어 가며 일정 간격으로 꼬리만 검사
+- StreamingOutputGuard: 스트리밍 중 반복 루프/예상 길이 초과를 판정해 조기 중단 사유를 알려줌
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# 문자 체계별 코드포인트 범위
+# (가타카나 중점 U+30FB는 한국어 번역에서도 이름 구분에 쓰이므로 가나에서 제외)
+_SCRIPT_CLASSES = {
+    "hangul": "\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f",
+    "han": "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\u3005\u3006",
+    "kana": "\u3040-\u309f\u30a0-\u30fa\u30fc-\u30ff\u31f0-\u31ff\uff66-\uff9d",
+    "latin": "A-Za-z\u00c0-\u024f",
+}
+_SCRIPT_PATTERNS = {name: re.compile(f"[{chars}]") for name, chars in _SCRIPT_CLASSES.items()}
+# 원문 잔존 구간 안에 끼어 있어도 구간을 끊지 않는 문자 (CJK 문장부호/전각 기호/공백)
+_RESIDUE_GLUE = r"\u3000-\u3004\u3007-\u303f\uff01-\uff65\s"
+
+# 출력 검증이 보고하는 문제 유형
+OUTPUT_ISSUE_TYPES = ("untranslated_residue", "repetition_loop")
+
+# 번역 대상 언어별로 "원문이 남은 것"으로 보는 문자 체계 (목록에 없는 언어는 _DEFAULT_RESIDUE_SCRIPTS)
+RESIDUE_SCRIPTS = {
+    "ko": ("han", "kana"),
+    "ja": ("hangul",),
+    "zh": ("hangul", "kana"),
+}
+_DEFAULT_RESIDUE_SCRIPTS = ("hangul", "han", "kana")
+
+# 잔존 문자가 이 개수 이상이고, 비율이 RESIDUE_RATIO_THRESHOLD 이상이거나 한 구간이 RESIDUE_RUN_THRESHOLD자 이상이면 미번역
+# (한국어 번역의 한자 병기 "漢字(한자)" 정도는 통과)
+MIN_RESIDUE_CHARS = 20
+RESIDUE_RATIO_THRESHOLD = 0.05
+RESIDUE_RUN_THRESHOLD = 20
+
+# 꼬리 반복 루프: 같은 단위가 MIN_LOOP_REPEATS번 이상, 합계 MIN_LOOP_SPAN자 이상 되풀이되면 루프
+# ("ㅋㅋㅋ", "……" 같은 짧은 반복은 길이 하한으로 걸러짐)
+MIN_LOOP_REPEATS = 4
+MIN_LOOP_SPAN = 200
+# 꼬리 검사 구간 (루프는 출력 끝에서 계속 자라므로 끝부분만 보면 충분)
+LOOP_TAIL_WINDOW = 8192
+# 같은 줄이 이만큼 연속되면 루프 (원문에도 같은 반복이 있으면 그 2배 초과부터)
+MIN_REPEATED_LINE_RUN = 6
+# 스트리밍 검사 간격 (글자 수). 검사 비용은 LOOP_TAIL_WINDOW / 간격 만큼 글자당 상수
+STREAM_CHECK_INTERVAL = 512
+# 스트리밍 조기 중단은 되돌릴 수 없으므로 완료 후 검사보다 보수적으로 판정
+STREAM_ABORT_MIN_LOOP_REPEATS = 8
+STREAM_ABORT_MIN_LOOP_SPAN = 600
+# 출력이 원문 길이 x 이 비율을 넘으면 중단 (짧은 원문은 STREAM_ABORT_MIN_LENGTH자까지 허용)
+STREAM_ABORT_MAX_LENGTH_RATIO = 4.0
+STREAM_ABORT_MIN_LENGTH = 2000
+
+
+@dataclass
+class RepetitionLoop:
+    """텍스트 끝의 주기적 구간: period자 단위가 repeats번(소수 포함) 반복되어 span자를 차지"""
+    period: int
+    span: int
+    unit: str
+
+    @property
+    def repeats(self) -> float:
+        return self.span / self.period
+
+
+@dataclass
+class OutputValidationReport:
+    """번역 출력 하나의 검증 결과 (issues가 비어 있으면 정상)"""
+    letter_chars: int = 0
+    residue_chars: int = 0
+    longest_residue_run: int = 0
+    loop: Optional[RepetitionLoop] = None
+    repeated_line_run: int = 0
+    issues: List[str] = field(default_factory=list)
+
+    @property
+    def residue_ratio(self) -> float:
+        return self.residue_chars / self.letter_chars if self.letter_chars else 0.0
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """청크 메타데이터에 남길 간단한 요약"""
+        data: Dict[str, Any] = {"issues": list(self.issues)}
+        if "untranslated_residue" in self.issues:
+            data["residue_ratio"] = round(self.residue_ratio, 4)
+            data["longest_residue_run"] = self.longest_residue_run
+        if "repetition_loop" in self.issues:
+            if self.loop is not None:
+                data["loop_period"] = self.loop.period
+                data["loop_span"] = self.loop.span
+            data["repeated_line_run"] = self.repeated_line_run
+        return data
+
+
+def script_histogram(text: str) -> Dict[str, int]:
+    """문자 체계별 글자 수 (hangul/han/kana/latin)"""
+    return {name: len(text) - len(pattern.sub("", text)) for name, pattern in _SCRIPT_PATTERNS.items()}
+
+
+def residue_scripts_for(target_language: Optional[str]) -> Tuple[str, ...]:
+    return RESIDUE_SCRIPTS.get((target_language or "ko").lower(), _DEFAULT_RESIDUE_SCRIPTS)
+
+
+def longest_script_run(text: str, scripts: Tuple[str, ...]) -> int:
+    """주어진 문자 체계 글자가 (문장부호/공백만 사이에 두고) 이어진 가장 긴 구간의 글자 수"""
+    chars = "".join(_SCRIPT_CLASSES[name] for name in scripts)
+    letter = re.compile(f"[{chars}]")
+    best = 0
+    for match in re.finditer(f"[{chars}][{chars}{_RESIDUE_GLUE}]*", text):
+        run = match.group()
+        # 지금까지의 최댓값보다 긴 구간만 글자 수를 다시 셈 (부호/공백 제외)
+        count = len(run) - len(letter.sub("", run)) if len(run) > best else 0
+        best = max(best, count)
+    return best
+
+
+def _z_array(s: str) -> List[int]:
+    """z[i] = s와 s[i:]의 최장 공통 접두사 길이 (Z 알고리즘, O(n))"""
+    n = len(s)
+    z = [0] * n
+    if n:
+        z[0] = n
+    left = right = 0
+    for i in range(1, n):
+        if i < right:
+            z[i] = min(right - i, z[i - left])
+        while i + z[i] < n and s[z[i]] == s[i + z[i]]:
+            z[i] += 1
+        if i + z[i] > right:
+            left, right = i, i + z[i]
+    return z
+
+
+def find_tail_repetition(
+    text: str,
+    min_repeats: int = MIN_LOOP_REPEATS,
+    min_span: int = MIN_LOOP_SPAN,
+    window: int = LOOP_TAIL_WINDOW
+) -> Optional[RepetitionLoop]:
+    """
+    텍스트 끝(공백 제외)이 같은 단위의 반복이면 그 구간을 반환합니다.
+    뒤집은 꼬리 r에서 z[p]는 "주기 p로 이어지는 길이 - p"이므로 접미사의 주기 구간 길이는 p + z[p]입니다.
+    가장 긴 구간을 고르고, 길이가 같으면 가장 짧은 주기(기본 단위)를 택합니다.
+    """
+    tail = text.rstrip()[-window:]
+    n = len(tail)
+    if n < min_span:
+        return None
+    reversed_tail = tail[::-1]
+    z = _z_array(reversed_tail)
+    best_period = best_span = 0
+    for period in range(1, n // min_repeats + 1):
+        span = period + z[period]
+        if span > best_span and span >= period * min_repeats:
+            best_period, best_span = period, span
+    if best_span < min_span:
+        return None
+    return RepetitionLoop(period=best_period, span=best_span, unit=tail[n - best_period:])
+
+
+def longest_repeated_line_run(text: str) -> int:
+    """내용이 같은 비어 있지 않은 줄이 연속으로 반복된 최대 횟수 (빈 줄은 건너뜀)"""
+    best = run = 0
+    previous = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        run = run + 1 if line == previous else 1
+        previous = line
+        best = max(best, run)
+    return best
+
+
+def _loop_span(loop: Optional[RepetitionLoop]) -> int:
+    return loop.span if loop is not None else 0
+
+
+def validate_translation_output(
+    source_text: str,
+    translated_text: str,
+    target_language: Optional[str] = "ko"
+) -> OutputValidationReport:
+    """
+    번역 결과에서 미번역 원문 잔존("untranslated_residue")과 반복 루프("repetition_loop")를 찾습니다.
+    원문에 이미 있는 반복(후렴, 효과음 등)이나 원문에 없던 문자 체계는 문제로 보지 않도록 원문과 비교합니다.
+    """
+    report = OutputValidationReport()
+    scripts = residue_scripts_for(target_language)
+    histogram = script_histogram(translated_text)
+    report.letter_chars = sum(histogram.values())
+    report.residue_chars = sum(histogram[name] for name in scripts)
+
+    if report.residue_chars >= MIN_RESIDUE_CHARS:
+        source_histogram = script_histogram(source_text)
+        if any(source_histogram[name] for name in scripts):
+            report.longest_residue_run = longest_script_run(translated_text, scripts)
+            if (report.residue_ratio >= RESIDUE_RATIO_THRESHOLD
+                    or report.longest_residue_run >= RESIDUE_RUN_THRESHOLD):
+                report.issues.append("untranslated_residue")
+
+    report.loop = find_tail_repetition(translated_text)
+    report.repeated_line_run = longest_repeated_line_run(translated_text)
+    loop_suspected = report.loop is not None or report.repeated_line_run >= MIN_REPEATED_LINE_RUN
+    if loop_suspected:
+        source_loop_span = _loop_span(find_tail_repetition(source_text))
+        source_line_run = longest_repeated_line_run(source_text)
+        if (_loop_span(report.loop) > 2 * source_loop_span
+                or report.repeated_line_run > max(MIN_REPEATED_LINE_RUN - 1, 2 * source_line_run)):
+            report.issues.append("repetition_loop")
+    return report
+
+
+class RepetitionLoopDetector:
+    """
+    스트리밍 출력용 증분 반복 감지기.
+
+    feed()로 받은 조각을 꼬리 버퍼(window자)에 붙이고, check_interval자가 쌓일 때마다 꼬리만 검사합니다.
+    전체 비용은 출력 길이에 선형이며, 루프가 보이면 RepetitionLoop를 반환합니다 (없으면 None).
+    """
+
+    def __init__(
+        self,
+        min_repeats: int = MIN_LOOP_REPEATS,
+        min_span: int = MIN_LOOP_SPAN,
+        window: int = LOOP_TAIL_WINDOW,
+        check_interval: int = STREAM_CHECK_INTERVAL
+    ):
+        self.min_repeats = min_repeats
+        self.min_span = min_span
+        self.window = window
+        self.check_interval = check_interval
+        self.total_chars = 0
+        self._tail = ""
+        self._unchecked = 0
+
+    def feed(self, delta: str) -> Optional[RepetitionLoop]:
+        if not delta:
+            return None
+        self.total_chars += len(delta)
+        self._tail = (self._tail + delta)[-self.window:]
+        self._unchecked += len(delta)
+        if self._unchecked < self.check_interval:
+            return None
+        self._unchecked = 0
+        return find_tail_repetition(self._tail, self.min_repeats, self.min_span, self.window)
+
+
+class StreamingOutputGuard:
+    """
+    스트리밍 번역 응답의 조기 중단 판정기.
+
+    feed()에 조각을 넣을 때마다 누적 길이가 원문 대비 max_length_ratio배를 넘는지("length_overflow"),
+    꼬리가 반복 루프인지("repetition_loop")를 확인해 중단 사유를 반환합니다 (계속해도 되면 None).
+    원문 끝에 이미 있는 반복은 그 2배를 넘을 때만 루프로 봅니다.
+    """
+
+    def __init__(
+        self,
+        source_text: str,
+        max_length_ratio: float = STREAM_ABORT_MAX_LENGTH_RATIO,
+        min_length: int = STREAM_ABORT_MIN_LENGTH
+    ):
+        self.max_length = max(int(len(source_text) * max_length_ratio), min_length)
+        self.detector = RepetitionLoopDetector(
+            min_repeats=STREAM_ABORT_MIN_LOOP_REPEATS,
+            min_span=max(STREAM_ABORT_MIN_LOOP_SPAN, 2 * _loop_span(find_tail_repetition(source_text)) + 1)
+        )
+        self.loop: Optional[RepetitionLoop] = None
+        self.detail = ""
+
+    @property
+    def total_chars(self) -> int:
+        return self.detector.total_chars
+
+    def feed(self, delta: str) -> Optional[str]:
+        loop = self.detector.feed(delta)
+        if loop is not None:
+            self.loop = loop
+            self.detail = f"{loop.period}자 단위 {loop.repeats:.1f}회 반복 ({self.total_chars}자 시점)"
+            return "repetition_loop"
+        if self.total_chars > self.max_length:
+            self.detail = f"출력 {self.total_chars}자 > 허용 {self.max_length}자"
+            return "length_overflow"
+        return None
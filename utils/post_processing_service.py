@@ -1,6 +1,8 @@
 # post_processing_service.py
+import os
 import re
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple
 from pathlib import Path
 
 try:
@@ -10,40 +12,150 @@ except ImportError:
 
 logger = setup_logger(__name__)
 
+# 이 청크 수 이상이면 청크 단위 후처리를 프로세스 풀에서 병렬 실행 (설정: post_processing_parallel_min_chunks)
+DEFAULT_PARALLEL_MIN_CHUNKS = 2000
+
+# LLM이 출력에 포함했을 수 있는 청크 인덱스 마커 (최종 출력 조립기와 리뷰 탭 출력이 함께 사용)
+CHUNK_MARKER_PATTERNS = [
+    re.compile(r'##CHUNK_INDEX:\s*\d+##\r?\n{0,2}', re.MULTILINE),
+    re.compile(r'##END_CHUNK##\r?\n{0,2}', re.MULTILINE),
+]
+EXCESS_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+
+
+def strip_chunk_markers(text: str) -> str:
+    """잔여 청크 인덱스 마커를 제거하고 3개 이상 연속 개행을 2개로 줄입니다 (앞뒤 공백은 유지)."""
+    for pattern in CHUNK_MARKER_PATTERNS:
+        text = pattern.sub('', text)
+    return EXCESS_NEWLINES_PATTERN.sub('\n\n', text)
+
+
+class CompiledCleaningEngine:
+    """
+    clean_translated_content의 정규식 규칙을 미리 컴파일해 둔 실행기
+
+    각 규칙에는 매칭에 반드시 필요한 트리거 문자열이 있습니다. 청크를 소문자로 한 번 변환한 뒤
+    트리거 포함 여부(부분 문자열 검사)만으로 실행할 규칙을 고르고, 해당 규칙만 원래 순서대로
+    실행합니다. 규칙이 텍스트를 바꾸면 남은 규칙을 위해 다시 확인하므로 결과는 규칙을 차례로
+    모두 적용한 것과 같습니다. (대부분의 청크에는 광고/헤더가 없어 정규식 실행 자체가 생략됨)
+    """
+
+    # re.IGNORECASE에서 ASCII 문자와 일치하지만 str.lower()로는 ASCII가 되지 않는 문자
+    # (İ, ı → i, ſ → s, K(켈빈) → k). 이 문자가 있으면 ASCII 트리거는 있다고 간주합니다.
+    _CASE_FOLD_SPECIALS = ("\u0130", "\u0131", "\u017f", "\u212a")
+
+    def __init__(self, rules: Sequence[Tuple[str, str, int, Optional[Sequence[str]]]]):
+        """
+        Args:
+            rules: (이름, 패턴, re 플래그, 트리거 목록) 목록. 트리거가 None이면 항상 실행.
+        """
+        self.rule_names: List[str] = []
+        self._compiled: List[Pattern] = []
+        self._rule_triggers: List[Optional[Tuple[str, ...]]] = []
+        for name, pattern, flags, rule_triggers in rules:
+            self.rule_names.append(name)
+            self._compiled.append(re.compile(pattern, flags))
+            self._rule_triggers.append(
+                tuple(t.lower() for t in rule_triggers) if rule_triggers is not None else None
+            )
+        self._ascii_letter_triggers = {
+            t for triggers in self._rule_triggers if triggers
+            for t in triggers if any("a" <= ch <= "z" for ch in t)
+        }
+
+    def _triggers_present(self, text: str) -> set:
+        lowered = text.lower()
+        present = {
+            t for triggers in self._rule_triggers if triggers
+            for t in triggers if t in lowered
+        }
+        if any(ch in text for ch in self._CASE_FOLD_SPECIALS):
+            present |= self._ascii_letter_triggers
+        return present
+
+    def apply(self, text: str, skip: Iterable[str] = ()) -> str:
+        """규칙을 순서대로 적용합니다. skip에 있는 이름의 규칙은 건너뜁니다."""
+        skip = set(skip)
+        present = self._triggers_present(text)
+        for name, compiled, rule_triggers in zip(self.rule_names, self._compiled, self._rule_triggers):
+            if name in skip:
+                continue
+            if rule_triggers is not None and not any(t in present for t in rule_triggers):
+                continue
+            replaced = compiled.sub('', text)
+            if replaced != text:
+                text = replaced
+                present = self._triggers_present(text)
+        return text
+
+
+_WORKER_SERVICE = None  # 프로세스 풀 워커별 PostProcessingService (규칙 컴파일은 프로세스당 한 번)
+
+
+def _clean_chunk_worker(args: Tuple[int, str, Dict[str, any]]) -> Tuple[int, str]:
+    """프로세스 풀 작업 함수"""
+    global _WORKER_SERVICE
+    chunk_index, content, config = args
+    if _WORKER_SERVICE is None:
+        _WORKER_SERVICE = PostProcessingService()
+    try:
+        return chunk_index, _WORKER_SERVICE.clean_translated_content(content, config)
+    except Exception:
+        return chunk_index, content
+
+
 class PostProcessingService:
     """번역 결과 후처리를 담당하는 서비스"""
     
     def __init__(self):
-        # 제거할 패턴들 정의
+        # 제거할 패턴들 정의 (패턴, 매칭에 반드시 필요한 트리거 문자열)
         # ⚠️ 주의: 소설 원문에 등장할 수 있는 일반 단어(보물창고, 창고 등)를 오삭제하지 않도록
         #         반드시 광고/스팸 문맥과 결합된 복합 조건으로만 매칭해야 합니다.
-        self.removal_patterns = [
+        # ⚠️ 패턴을 수정하면 트리거도 함께 확인하세요. 트리거가 없으면 규칙이 실행되지 않습니다.
+        self.removal_rules: List[Tuple[str, Tuple[str, ...]]] = [
             # 번역 헤더들 - OR 조건 최적화 및 공통 패턴 추출
-            r'^(?:##\s*)?(?:번역\s*결과\s*:?\s*|(?:Translation|Korean|korean)(?:\s*:?\s*.*)?|한국어\s*:?\s*)$',
+            (r'^(?:##\s*)?(?:번역\s*결과\s*:?\s*|(?:Translation|Korean|korean)(?:\s*:?\s*.*)?|한국어\s*:?\s*)$',
+             ("번역", "translation", "korean", "한국어")),
             
             # 전자책 광고 패턴 - 반드시 전자책 + 광고성 키워드가 같은 줄에 있어야 삭제
             # (소설 내에서 "전자책"이 단독으로 언급되는 경우는 삭제하지 않음)
-            r'^.*(?:본\s*)?전자책(?:은)?.*(?:네트워크|업로드|공유|다운로드|txt|무료|완결본).*$',
+            (r'^.*(?:본\s*)?전자책(?:은)?.*(?:네트워크|업로드|공유|다운로드|txt|무료|완결본).*$',
+             ("전자책",)),
             
             # 네티즌 업로드 광고 패턴 - 줄 단위 매칭
-            r'^.*네티즌이?\s*업로드.*$',
+            (r'^.*네티즌이?\s*업로드.*$', ("네티즌",)),
             
             # URL/사이트 패턴들 통합 - 문자 클래스 최적화
-            r'\((?:www\.\s*[^)]*|[^)]*www\.[^)]*|베이커\([^)]*|\s*\)\s*무료.*?다운로드.*?)\)',
+            (r'\((?:www\.\s*[^)]*|[^)]*www\.[^)]*|베이커\([^)]*|\s*\)\s*무료.*?다운로드.*?)\)',
+             ("www.", "베이커", "무료")),
             
             # 광고성 문구 - "보물창고"는 반드시 전자책/사이트/플랫폼 등 광고 맥락과 결합된 경우만 삭제
             # (소설 내 "보물창고"는 삭제하지 않음)
-            r'^.*(?:(?:최고|최대|최신)의?\s*(?:전자책|소설)\s*(?:사이트|플랫폼)|독자들?의?\s*(?:보물창고|천국)|가장\s*간단하고\s*직접적인.*?읽기).*$',
+            (r'^.*(?:(?:최고|최대|최신)의?\s*(?:전자책|소설)\s*(?:사이트|플랫폼)|독자들?의?\s*(?:보물창고|천국)|가장\s*간단하고\s*직접적인.*?읽기).*$',
+             ("사이트", "플랫폼", "보물창고", "천국", "간단하고")),
             
             # 네트워크 사이트 정보 - 줄 단위 매칭
-            r'^.*네트워크\s*\(www\..*?\).*$',
+            (r'^.*네트워크\s*\(www\..*?\).*$', ("네트워크",)),
             
             # 잔여 정리 패턴
-            r'(?:주소는\s+입니다\.?|를\s*지원합니다[!\.]*)',
+            (r'(?:주소는\s+입니다\.?|를\s*지원합니다[!\.]*)', ("주소는", "지원합니다")),
             
             # 기타 정리 패턴들 - Non-capturing groups 적용
-            r'(?:```)',
+            (r'(?:```)', ("```",)),
         ]
+        self.removal_patterns = [pattern for pattern, _ in self.removal_rules]
+
+        # 규칙 전체를 미리 컴파일한 단일 스캔 실행기 (clean_translated_content와 같은 순서)
+        self.engine = CompiledCleaningEngine(
+            [("thinking", r'<thinking>[\s\S]*?</thinking>', re.IGNORECASE, ("<thinking>",))]
+            + [
+                (f"removal_{i}", pattern, re.MULTILINE | re.IGNORECASE, triggers)
+                for i, (pattern, triggers) in enumerate(self.removal_rules)
+            ]
+            + [
+                ("html", r'<[a-zA-Z0-9/\s"=\'-]+>', 0, ("<",)),
+            ]
+        )
 
         # [참고] 기존 self.html_cleanup_patterns는 clean_translated_content 내의 새로운 로직으로 대체되었으므로 사용되지 않을 수 있습니다.
         # 하위 호환성을 위해 남겨두거나, 필요 시 삭제하셔도 됩니다.
@@ -59,54 +171,65 @@ class PostProcessingService:
             
         cleaned = content.strip()
 
-        # [수정 1] Thinking Process 블록 우선 제거 (가장 중요)
-        # <thinking> 태그와 그 사이의 모든 내용(줄바꿈 포함)을 가장 먼저 삭제합니다.
-        # [\s\S]*? : 줄바꿈을 포함한 모든 문자를 최단 일치(Non-greedy)로 매칭
-        cleaned = re.sub(r'<thinking>[\s\S]*?</thinking>', '', cleaned, flags=re.IGNORECASE)
-
-        # 기본 패턴 제거 (광고, 불필요한 헤더 등)
-        for pattern in self.removal_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.MULTILINE | re.IGNORECASE)
-        
-        # [수정 2] HTML 태그 정리 로직 변경
-        if config.get("clean_html_tags", True):
-            # 사용자 요청: <> 안에 영어, 숫자, 공백, 특수문자(/ " = ' -)만 있는 경우를 HTML 태그로 간주하여 삭제
-            # 한글이 포함된 태그(<상태창>, <스킬>)는 삭제하지 않음
-            cleaned = re.sub(r'<[a-zA-Z0-9/\s"=\'-]+>', '', cleaned)
+        # Thinking Process 블록 → 광고/헤더 패턴 → HTML 태그 순으로 미리 컴파일된 규칙 적용
+        # (트리거 문자열이 없는 규칙은 건너뜀. 결과는 규칙을 차례로 모두 적용한 것과 동일)
+        # 사용자 요청: <> 안에 영어, 숫자, 공백, 특수문자(/ " = ' -)만 있는 경우를 HTML 태그로 간주하여 삭제
+        # 한글이 포함된 태그(<상태창>, <스킬>)는 삭제하지 않음
+        skip = () if config.get("clean_html_tags", True) else ("html",)
+        cleaned = self.engine.apply(cleaned, skip=skip)
         
         # 연속된 빈 줄 정리 (3개 이상의 연속 개행을 2개로)
-        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        if "\n\n\n" in cleaned:
+            cleaned = EXCESS_NEWLINES_PATTERN.sub('\n\n', cleaned)
         
         # 앞뒤 공백 제거
         cleaned = cleaned.strip()
         
         return cleaned
-    
+
     def post_process_merged_chunks(self, merged_chunks: Dict[int, str], config: Dict[str, any]) -> Dict[int, str]:
-        """병합된 청크들에 대해 후처리 수행 (청크 인덱스는 아직 유지)"""
+        """
+        병합된 청크들에 대해 후처리 수행 (청크 인덱스는 아직 유지)
+        청크 수가 post_processing_parallel_min_chunks 이상이면 프로세스 풀에서 병렬 처리합니다.
+        """
         logger.info(f"청크 내용 후처리 시작: {len(merged_chunks)}개 청크 처리")
-        
-        processed_chunks = {}
-        
-        for chunk_index, chunk_content in merged_chunks.items():
+        processed_chunks = dict(self.iter_cleaned_chunks(list(merged_chunks.items()), config))
+        logger.info(f"청크 내용 후처리 완료: {len(processed_chunks)}개 청크 처리됨")
+        return processed_chunks
+
+    def iter_cleaned_chunks(self, chunks: Sequence[Tuple[int, str]], config: Dict[str, any]) -> Iterator[Tuple[int, str]]:
+        """
+        (청크 인덱스, 내용)을 받은 순서대로 정리하여 하나씩 돌려줍니다 (정리 결과를 한꺼번에 모아 두지 않음).
+        청크 수가 post_processing_parallel_min_chunks 이상이면 프로세스 풀에서 처리하고(GIL 없이 CPU 코어 활용),
+        풀을 사용할 수 없거나 도중에 실패하면 남은 청크를 단일 프로세스로 처리합니다.
+        """
+        done = 0
+        min_chunks = config.get("post_processing_parallel_min_chunks", DEFAULT_PARALLEL_MIN_CHUNKS)
+        workers = config.get("post_processing_workers") or os.cpu_count() or 1
+        if min_chunks and len(chunks) >= min_chunks and workers > 1:
+            worker_config = {"clean_html_tags": config.get("clean_html_tags", True)}
+            batch = max(1, len(chunks) // (workers * 8))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    items = ((idx, content, worker_config) for idx, content in chunks)
+                    for result in pool.map(_clean_chunk_worker, items, chunksize=batch):
+                        yield result
+                        done += 1
+                logger.info(f"프로세스 풀 후처리 완료: {done}개 청크 ({workers}개 프로세스)")
+            except Exception as e:
+                logger.warning(f"프로세스 풀 후처리 실패: {e}. 남은 {len(chunks) - done}개 청크를 단일 프로세스로 처리합니다.")
+
+        for chunk_index, chunk_content in chunks[done:]:
             try:
                 # 개별 청크 정리 (청크 마커는 유지)
                 cleaned_content = self.clean_translated_content(chunk_content, config)
-                processed_chunks[chunk_index] = cleaned_content
-                
-                # 로깅 (디버깅용)
                 if chunk_content != cleaned_content:
                     logger.debug(f"청크 {chunk_index} 내용 후처리 완료 (길이: {len(chunk_content)} -> {len(cleaned_content)})")
-                else:
-                    logger.debug(f"청크 {chunk_index} 변경사항 없음")
-                    
             except Exception as e:
                 logger.warning(f"청크 {chunk_index} 후처리 중 오류: {e}. 원본 내용 유지")
-                processed_chunks[chunk_index] = chunk_content
-        
-        logger.info(f"청크 내용 후처리 완료: {len(processed_chunks)}개 청크 처리됨")
-        return processed_chunks
-    
+                cleaned_content = chunk_content
+            yield chunk_index, cleaned_content
+
     def post_process_and_clean_chunks(self, merged_chunks: Dict[int, str], config: Dict[str, any]) -> str:
         """
         병합된 청크들에 대해 후처리를 수행하고 최종 텍스트로 변환합니다.
@@ -119,20 +242,11 @@ class PostProcessingService:
         sorted_indices = sorted(processed_chunks_dict.keys())
         full_text = "\n\n".join([processed_chunks_dict[idx] for idx in sorted_indices])
         
-        # 3. 혹시 모를 잔여 인덱스 마커 제거 (LLM이 출력에 포함했을 경우 대비)
-        chunk_patterns = [
-            r'##CHUNK_INDEX:\s*\d+##\r?\n{0,2}',
-            r'##END_CHUNK##\r?\n{0,2}',
-        ]
-        for pattern in chunk_patterns:
-            full_text = re.sub(pattern, '', full_text, flags=re.MULTILINE)
-            
-        # 4. 최종 개행 및 공백 정리
-        full_text = re.sub(r'\n{3,}', '\n\n', full_text)
-        full_text = full_text.strip()
+        # 3. 혹시 모를 잔여 인덱스 마커 제거 (LLM이 출력에 포함했을 경우 대비) 및 개행 정리
+        full_text = strip_chunk_markers(full_text).strip()
         
         return full_text
-    
+
     def remove_chunk_indexes_from_final_file(self, file_path: Path) -> bool:
         """
         최종 파일에서 청크 인덱스 마커들을 제거합니다.
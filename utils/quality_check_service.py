@@ -1,7 +1,14 @@
 import math
-from typing import Dict, Any, List, Tuple
+import os
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 import logging
 
+from utils.output_validation import OutputValidationReport, validate_translation_output
+from domain.translation_service import PARTIAL_FAILURE_MARKER_PREFIXES
+
 try:
     from infrastructure.logger_config import setup_logger
 except ImportError:
@@ -10,112 +17,444 @@ except ImportError:
     def setup_logger(name):
         return logging.getLogger(name)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # numpy가 없으면 순수 Python 엔진 사용
+
 logger = setup_logger(__name__)
 
+# 분석에 필요한 최소 청크 수 (이보다 적으면 언어쌍 기준선이 있을 때만 판정)
+MIN_DATA_POINTS = 5
+# |z| 임계값 (잔차가 척도의 2배를 넘으면 이상치)
+Z_SCORE_THRESHOLD = 2.0
+# Huber 가중치 상수 (정규분포에서 OLS 대비 95% 효율)
+HUBER_K = 1.345
+# MAD → 표준편차 환산 계수
+MAD_TO_SIGMA = 1.4826
+# 잔차 척도 하한 (번역 길이 중앙값 대비). 거의 완벽한 선형 데이터에서 사소한 차이를 이상치로 보지 않기 위함
+SCALE_FLOOR_RATIO = 0.05
+MAX_IRLS_ITERATIONS = 30
+# 온라인 추적기는 데이터가 이 비율만큼 늘 때마다 전체 재적합 (그 사이에는 현재 적합으로 새 청크만 판정)
+REFIT_GROWTH = 1.25
+_TRACKER_CACHE_SIZE = 8
+
+# 번역 직후 인라인 검사 (모델 없이도 판정 가능한 값싼 검사)
+# 재귀 분할 번역이 일부 구간을 포기했을 때 남기는 표시 (domain.translation_service에서 정의)
+PARTIAL_FAILURE_MARKERS = PARTIAL_FAILURE_MARKER_PREFIXES
+# 이 길이 이상인 원문에서만 절대 길이 비율을 검사 (짧은 청크는 비율 변동이 큼)
+CHEAP_CHECK_MIN_SOURCE_LENGTH = 500
+CHEAP_CHECK_MIN_RATIO = 0.15
+CHEAP_CHECK_MAX_RATIO = 6.0
+# 콘텐츠 안전 격리로 원문을 그대로 남긴 청크의 문제 유형
+CONTENT_SAFETY_BLOCKED_ISSUE = "content_safety_blocked"
+
+
+@dataclass
+class RobustFit:
+    """번역 길이 = slope * 원문 길이 + intercept, scale은 잔차의 강건 표준편차"""
+    slope: float
+    intercept: float
+    scale: float
+    n: int
+
+    def expected(self, source_length: float) -> float:
+        return self.slope * source_length + self.intercept
+
+    def z_score(self, source_length: float, translated_length: float) -> float:
+        return (translated_length - self.expected(source_length)) / self.scale
+
+
+def _median(values: Sequence[float]) -> float:
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def _weighted_line(xs: Sequence[float], ys: Sequence[float], ws: Sequence[float]) -> Optional[Tuple[float, float]]:
+    sw = sum(ws)
+    swx = sum(w * x for w, x in zip(ws, xs))
+    swy = sum(w * y for w, y in zip(ws, ys))
+    swxx = sum(w * x * x for w, x in zip(ws, xs))
+    swxy = sum(w * x * y for w, x, y in zip(ws, xs, ys))
+    denominator = sw * swxx - swx * swx
+    if sw <= 0 or denominator <= 1e-12 * sw * swxx:
+        return None  # 모든 원문 길이가 같음 (기울기 결정 불가)
+    slope = (sw * swxy - swx * swy) / denominator
+    return slope, (swy - slope * swx) / sw
+
+
+def _fit_pure(xs: Sequence[float], ys: Sequence[float]) -> RobustFit:
+    """Huber IRLS (순수 Python). 시작점은 길이 비율의 중앙값을 기울기로 하는 원점 직선입니다."""
+    slope, intercept = _median([y / x for x, y in zip(xs, ys)]), 0.0
+    floor = SCALE_FLOOR_RATIO * _median(ys)
+    for _ in range(MAX_IRLS_ITERATIONS):
+        residuals = [y - (slope * x + intercept) for x, y in zip(xs, ys)]
+        cutoff = HUBER_K * max(MAD_TO_SIGMA * _median([abs(r) for r in residuals]), floor)
+        weights = [1.0 if abs(r) <= cutoff else cutoff / abs(r) for r in residuals]
+        line = _weighted_line(xs, ys, weights)
+        if line is None:
+            break
+        converged = abs(line[0] - slope) <= 1e-9 * max(1.0, abs(slope)) and abs(line[1] - intercept) <= 1e-6 * max(1.0, abs(intercept))
+        slope, intercept = line
+        if converged:
+            break
+    residuals = [abs(y - (slope * x + intercept)) for x, y in zip(xs, ys)]
+    scale = max(MAD_TO_SIGMA * _median(residuals), floor)
+    return RobustFit(slope, intercept, scale, len(xs))
+
+
+def _fit_numpy(xs: Sequence[float], ys: Sequence[float]) -> RobustFit:
+    """_fit_pure와 같은 Huber IRLS의 numpy 벡터화 버전"""
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    slope, intercept = float(np.median(y / x)), 0.0
+    floor = SCALE_FLOOR_RATIO * float(np.median(y))
+    for _ in range(MAX_IRLS_ITERATIONS):
+        residuals = np.abs(y - (slope * x + intercept))
+        cutoff = HUBER_K * max(MAD_TO_SIGMA * float(np.median(residuals)), floor)
+        weights = np.where(residuals <= cutoff, 1.0, cutoff / np.maximum(residuals, 1e-300))
+        sw, swx, swy = weights.sum(), (weights * x).sum(), (weights * y).sum()
+        swxx, swxy = (weights * x * x).sum(), (weights * x * y).sum()
+        denominator = sw * swxx - swx * swx
+        if sw <= 0 or denominator <= 1e-12 * sw * swxx:
+            break
+        new_slope = float((sw * swxy - swx * swy) / denominator)
+        new_intercept = float((swy - new_slope * swx) / sw)
+        converged = abs(new_slope - slope) <= 1e-9 * max(1.0, abs(slope)) and abs(new_intercept - intercept) <= 1e-6 * max(1.0, abs(intercept))
+        slope, intercept = new_slope, new_intercept
+        if converged:
+            break
+    scale = max(MAD_TO_SIGMA * float(np.median(np.abs(y - (slope * x + intercept)))), floor)
+    return RobustFit(slope, intercept, scale, len(x))
+
+
+def fit_robust_line(xs: Sequence[float], ys: Sequence[float], use_numpy: Optional[bool] = None) -> Optional[RobustFit]:
+    """
+    원문/번역 길이에 강건 회귀(Huber M-추정, 척도는 MAD)를 적합합니다.
+    OLS와 달리 누락/환각 청크 몇 개가 기울기와 표준편차를 끌어당겨 다른 이상치를 가리지 않습니다.
+    """
+    if not xs:
+        return None
+    if use_numpy is None:
+        use_numpy = np is not None
+    return _fit_numpy(xs, ys) if use_numpy and np is not None else _fit_pure(xs, ys)
+
+
+def _issue(chunk_index: int, source_length: float, translated_length: float, fit: RobustFit) -> Optional[Dict[str, Any]]:
+    z_score = fit.z_score(source_length, translated_length)
+    if z_score < -Z_SCORE_THRESHOLD:
+        issue_type = "omission"  # 예상보다 짧음 (누락 의심)
+    elif z_score > Z_SCORE_THRESHOLD:
+        issue_type = "hallucination"  # 예상보다 김 (환각 의심)
+    else:
+        return None
+    return {
+        "chunk_index": chunk_index,
+        "issue_type": issue_type,
+        "source_length": int(source_length),
+        "translated_length": int(translated_length),
+        "expected_length": round(fit.expected(source_length), 2),
+        "ratio": round(translated_length / source_length, 4) if source_length > 0 else 0,
+        "z_score": round(z_score, 2)
+    }
+
+
+def collect_data_points(metadata: Dict[str, Any]) -> List[Tuple[int, int, int]]:
+    """메타데이터의 translated_chunks에서 (청크 인덱스, 원문 길이, 번역 길이)를 모읍니다 (길이가 0인 항목 제외)."""
+    data_points: List[Tuple[int, int, int]] = []
+    for idx_str, info in (metadata.get('translated_chunks') or {}).items():
+        try:
+            if not isinstance(info, dict):
+                continue
+            src_len = info.get('source_length', 0)
+            trans_len = info.get('translated_length', 0)
+            if src_len > 0 and trans_len > 0:
+                data_points.append((int(idx_str), src_len, trans_len))
+        except (ValueError, TypeError):
+            continue
+    return data_points
+
+
+def find_cheap_quality_issue(
+    source_text: str,
+    translated_text: str,
+    target_language: Optional[str] = "ko",
+    output_report: Optional[OutputValidationReport] = None
+) -> Optional[str]:
+    """
+    번역 결과 하나만 보고 알 수 있는 문제를 반환합니다 (없으면 None).
+    "empty": 빈 번역, "partial_failure": 일부 구간 번역 실패 표시 포함, "extreme_ratio": 언어쌍과 무관하게 비정상적인 길이 비율,
+    "untranslated_residue"/"repetition_loop": 출력 검증(utils.output_validation) 결과 (이미 계산했으면 output_report로 전달)
+    """
+    if not translated_text.strip():
+        return "empty"
+    if any(marker in translated_text and marker not in source_text for marker in PARTIAL_FAILURE_MARKERS):
+        return "partial_failure"
+    source_length = len(source_text.strip())
+    if source_length >= CHEAP_CHECK_MIN_SOURCE_LENGTH:
+        ratio = len(translated_text.strip()) / source_length
+        if ratio < CHEAP_CHECK_MIN_RATIO or ratio > CHEAP_CHECK_MAX_RATIO:
+            return "extreme_ratio"
+    if output_report is None:
+        output_report = validate_translation_output(source_text, translated_text, target_language)
+    return output_report.issues[0] if output_report.issues else None
+
+
+def collect_output_issues(metadata: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """
+    메타데이터 청크 기록의 'output_issues'(출력 검증 결과)를 청크 인덱스별로 모읍니다.
+    콘텐츠 안전 격리로 원문 그대로 남긴 구간('blocked_spans')도 'content_safety_blocked' 문제로 함께 모읍니다.
+    """
+    recorded: Dict[int, Dict[str, Any]] = {}
+    for idx_str, info in (metadata.get('translated_chunks') or {}).items():
+        if not isinstance(info, dict):
+            continue
+        output_issues = info.get('output_issues')
+        output_issues = dict(output_issues) if isinstance(output_issues, dict) else {}
+        blocked_spans = info.get('blocked_spans')
+        if blocked_spans:
+            output_issues['issues'] = list(output_issues.get('issues') or []) + [CONTENT_SAFETY_BLOCKED_ISSUE]
+            output_issues['blocked_spans'] = blocked_spans
+        if not output_issues.get('issues'):
+            continue
+        try:
+            recorded[int(idx_str)] = dict(output_issues, source_length=info.get('source_length', 0), translated_length=info.get('translated_length', 0))
+        except (ValueError, TypeError):
+            continue
+    return recorded
+
+
+class QualityCheckTracker:
+    """
+    번역 작업 하나의 온라인 품질 추적기.
+
+    청크가 완료될 때마다 update()로 길이를 넣으면 현재 적합으로 그 청크만 판정합니다(O(1)).
+    데이터가 REFIT_GROWTH배 늘 때마다 전체를 재적합하고 모든 청크를 다시 판정하므로
+    재적합 비용은 청크당 상수로 분산됩니다. 데이터가 MIN_DATA_POINTS개 미만이면 언어쌍 기준선으로 판정합니다.
+    """
+
+    def __init__(self, baseline: Optional[RobustFit] = None, use_numpy: Optional[bool] = None):
+        self.baseline = baseline
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        self.fit: Optional[RobustFit] = None
+        self.anomalies: Dict[int, Dict[str, Any]] = {}
+        self._positions: Dict[int, int] = {}
+        self._chunk_ids = array("q")
+        self._xs = array("d")
+        self._ys = array("d")
+        self._next_refit = MIN_DATA_POINTS
+
+    def __len__(self) -> int:
+        return len(self._chunk_ids)
+
+    @property
+    def active_fit(self) -> Optional[RobustFit]:
+        return self.fit or self.baseline
+
+    def load(self, data_points: Sequence[Tuple[int, int, int]]) -> None:
+        """전체 데이터로 다시 시작 (한 번만 적합)"""
+        self.fit = None
+        self.anomalies = {}
+        self._positions = {}
+        self._chunk_ids, self._xs, self._ys = array("q"), array("d"), array("d")
+        for chunk_index, source_length, translated_length in data_points:
+            self._store(chunk_index, source_length, translated_length)
+        self._refit()
+
+    def sync(self, data_points: Sequence[Tuple[int, int, int]]) -> None:
+        """메타데이터와 맞춥니다. 사라진 청크가 있으면 전체 재적재, 아니면 바뀐 청크만 update()"""
+        incoming = {chunk_index: (src, trans) for chunk_index, src, trans in data_points}
+        if any(chunk_index not in incoming for chunk_index in self._positions):
+            self.load(data_points)
+            return
+        for chunk_index, (src, trans) in incoming.items():
+            position = self._positions.get(chunk_index)
+            if position is None or self._xs[position] != src or self._ys[position] != trans:
+                self.update(chunk_index, src, trans)
+
+    def update(self, chunk_index: int, source_length: int, translated_length: int) -> Optional[Dict[str, Any]]:
+        """청크 하나를 기록하고 그 청크의 이상치 정보(없으면 None)를 반환합니다."""
+        if source_length <= 0 or translated_length <= 0:
+            return None
+        self._store(chunk_index, source_length, translated_length)
+        if len(self) >= self._next_refit:
+            self._refit()
+        else:
+            self._classify(chunk_index, source_length, translated_length)
+        return self.anomalies.get(chunk_index)
+
+    def suspicious_chunks(self) -> List[Dict[str, Any]]:
+        return [self.anomalies[chunk_index] for chunk_index in sorted(self.anomalies)]
+
+    def _store(self, chunk_index: int, source_length: int, translated_length: int) -> None:
+        position = self._positions.get(chunk_index)
+        if position is None:
+            self._positions[chunk_index] = len(self._chunk_ids)
+            self._chunk_ids.append(chunk_index)
+            self._xs.append(source_length)
+            self._ys.append(translated_length)
+        else:
+            self._xs[position] = source_length
+            self._ys[position] = translated_length
+
+    def _classify(self, chunk_index: int, source_length: float, translated_length: float) -> None:
+        fit = self.active_fit
+        issue = _issue(chunk_index, source_length, translated_length, fit) if fit else None
+        if issue:
+            self.anomalies[chunk_index] = issue
+        else:
+            self.anomalies.pop(chunk_index, None)
+
+    def _refit(self) -> None:
+        n = len(self)
+        self._next_refit = max(MIN_DATA_POINTS, math.ceil(n * REFIT_GROWTH), n + 1)
+        if n >= MIN_DATA_POINTS:
+            self.fit = fit_robust_line(self._xs, self._ys, self.use_numpy)
+        fit = self.active_fit
+        self.anomalies = {}
+        if fit is None:
+            return
+        if self.use_numpy and np is not None:
+            # 잔차 계산은 벡터화하고 이상치만 딕셔너리로 만듦
+            xs = np.frombuffer(self._xs, dtype=np.float64)
+            ys = np.frombuffer(self._ys, dtype=np.float64)
+            z_scores = (ys - (fit.slope * xs + fit.intercept)) / fit.scale
+            positions = np.flatnonzero(np.abs(z_scores) > Z_SCORE_THRESHOLD).tolist()
+        else:
+            positions = range(n)
+        for position in positions:
+            issue = _issue(self._chunk_ids[position], self._xs[position], self._ys[position], fit)
+            if issue:
+                self.anomalies[issue["chunk_index"]] = issue
+
+
 class QualityCheckService:
     """
     번역 품질 이상 감지 서비스.
-    선형 회귀 분석을 통해 번역 누락(Omission) 및 환각(Hallucination) 의심 구간을 탐지합니다.
-    외부 라이브러리(numpy 등) 없이 순수 Python으로 구현되었습니다.
+    강건 회귀(Huber)로 원문/번역 길이 관계를 적합해 번역 누락(Omission) 및 환각(Hallucination) 의심 구간을 탐지합니다.
+    numpy가 있으면 벡터화된 엔진을, 없으면 같은 알고리즘의 순수 Python 엔진을 사용합니다.
+
+    - 입력 파일별 QualityCheckTracker를 보관해 번역 중 record_chunk_completion()으로 청크마다 갱신하고,
+      검토 탭 로드 시에는 바뀐 청크만 반영합니다 (매번 전체 재계산하지 않음).
+    - 언어쌍별로 마지막 적합을 기준선으로 기억해, 청크가 적은 작업 초반에도 판정합니다.
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, use_numpy: Optional[bool] = None):
+        self.use_numpy = use_numpy
+        self._trackers: "OrderedDict[str, QualityCheckTracker]" = OrderedDict()
+        self._baselines: Dict[str, RobustFit] = {}
 
     def analyze_translation_quality(self, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         메타데이터의 번역 통계를 분석하여 이상치 목록을 반환합니다.
-        
+
         Args:
             metadata: 'translated_chunks' 정보를 포함한 메타데이터 딕셔너리
+                      ('input_file'이 있으면 추적기를 재사용, 'language_pair'가 있으면 기준선 사용)
 
         Returns:
-            이상치 정보가 담긴 딕셔너리 리스트
+            이상치 정보가 담긴 딕셔너리 리스트 (청크 인덱스 순)
         """
-        translated_chunks = metadata.get('translated_chunks', {})
-        if not translated_chunks:
+        if not metadata.get('translated_chunks'):
             return []
 
-        # 데이터 포인트 수집 (chunk_index, source_length, translated_length)
-        data_points: List[Tuple[int, int, int]] = []
-        
-        for idx_str, info in translated_chunks.items():
-            try:
-                if not isinstance(info, dict):
-                    continue
-                idx = int(idx_str)
-                src_len = info.get('source_length', 0)
-                trans_len = info.get('translated_length', 0)
-                
-                # 유효한 데이터만 포함 (길이가 0인 경우 제외)
-                if src_len > 0 and trans_len > 0:
-                    data_points.append((idx, src_len, trans_len))
-            except (ValueError, TypeError):
-                continue
+        data_points = collect_data_points(metadata)
+        language_pair = metadata.get("language_pair")
+        tracker = self._get_tracker(metadata.get("input_file"), language_pair, create=True)
+        if len(tracker) == 0:
+            tracker.load(data_points)
+        else:
+            tracker.sync(data_points)
+        self._remember_baseline(language_pair, tracker)
+        return self._merge_output_issues(tracker, tracker.suspicious_chunks(), collect_output_issues(metadata))
 
-        # 데이터가 너무 적으면 분석 신뢰도가 낮으므로 스킵 (최소 5개)
-        n = len(data_points)
-        if n < 5:
-            return []
+    def record_chunk_completion(
+        self,
+        input_file: Any,
+        chunk_index: int,
+        source_length: int,
+        translated_length: int,
+        language_pair: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        번역 중 청크 완료를 추적기에 반영하고, 이 청크가 이상치로 보이면 그 정보를 반환합니다.
+        (update_metadata_for_chunk_completion 직후 호출)
+        """
+        tracker = self._get_tracker(input_file, language_pair, create=True)
+        issue = tracker.update(chunk_index, source_length, translated_length)
+        self._remember_baseline(language_pair, tracker)
+        return issue
 
-        # 1. 선형 회귀 파라미터 계산 (Least Squares Method)
-        # y = ax + b
-        sum_x = sum(p[1] for p in data_points)
-        sum_y = sum(p[2] for p in data_points)
-        sum_xy = sum(p[1] * p[2] for p in data_points)
-        sum_x2 = sum(p[1] ** 2 for p in data_points)
-
-        denominator = (n * sum_x2) - (sum_x ** 2)
-        
-        if denominator == 0:
-            # 모든 x값이 동일한 경우 등 회귀 분석 불가능
-            return []
+    def z_score(self, input_file: Any, source_length: int, translated_length: int) -> Optional[float]:
+        """현재 적합(또는 언어쌍 기준선) 기준 z-score. 기록하지 않으며 판정할 모델이 없으면 None"""
+        tracker = self._get_tracker(input_file, None)
+        fit = tracker.active_fit if tracker else None
+        if fit is None or source_length <= 0:
+            return None
+        return fit.z_score(source_length, translated_length)
 
-        a = ((n * sum_xy) - (sum_x * sum_y)) / denominator
-        b = (sum_y - (a * sum_x)) / n
+    def live_suspicious_chunks(self, input_file: Any) -> List[Dict[str, Any]]:
+        """번역 중인 파일의 현재 이상치 목록 (전체 재계산 없음)"""
+        tracker = self._get_tracker(input_file, None)
+        return tracker.suspicious_chunks() if tracker else []
 
-        # 2. 잔차(Residual) 및 표준편차 계산
-        residuals = []
-        for idx, x, y in data_points:
-            predicted_y = (a * x) + b
-            residual = y - predicted_y
-            residuals.append(residual)
+    @staticmethod
+    def _merge_output_issues(
+        tracker: QualityCheckTracker,
+        suspicious: List[Dict[str, Any]],
+        output_issues: Dict[int, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        길이 이상치 목록에 메타데이터에 기록된 출력 검증 문제(미번역 잔존/반복 루프)를 합칩니다.
+        같은 청크면 더 구체적인 출력 검증 문제를 issue_type으로 쓰고, z-score는 길이 모델 값을 유지합니다.
+        """
+        if not output_issues:
+            return suspicious
+        merged = {item["chunk_index"]: item for item in suspicious}
+        fit = tracker.active_fit
+        for chunk_index, recorded in output_issues.items():
+            item = merged.get(chunk_index)
+            if item is None:
+                source_length = recorded.get("source_length") or 0
+                translated_length = recorded.get("translated_length") or 0
+                item = {
+                    "chunk_index": chunk_index,
+                    "source_length": source_length,
+                    "translated_length": translated_length,
+                    "ratio": round(translated_length / source_length, 4) if source_length > 0 else 0,
+                    "z_score": round(fit.z_score(source_length, translated_length), 2) if fit is not None and source_length > 0 else 0.0,
+                }
+                if fit is not None:
+                    item["expected_length"] = round(fit.expected(source_length), 2)
+            else:
+                item = dict(item, length_issue_type=item["issue_type"])
+            item["issue_type"] = recorded["issues"][0]
+            item["output_issues"] = recorded["issues"]
+            if recorded.get("blocked_spans"):
+                item["blocked_spans"] = recorded["blocked_spans"]
+            merged[chunk_index] = item
+        return [merged[idx] for idx in sorted(merged)]
 
-        mean_residual = sum(residuals) / n # 이론상 0에 가까움
-        variance = sum((r - mean_residual) ** 2 for r in residuals) / n
-        std_dev = math.sqrt(variance)
+    def _new_tracker(self, language_pair: Optional[str]) -> QualityCheckTracker:
+        baseline = self._baselines.get(language_pair) if language_pair else None
+        return QualityCheckTracker(baseline=baseline, use_numpy=self.use_numpy)
 
-        if std_dev == 0:
-            return []
+    def _get_tracker(self, input_file: Any, language_pair: Optional[str], create: bool = False) -> Optional[QualityCheckTracker]:
+        if not input_file:
+            return self._new_tracker(language_pair) if create else None
+        key = os.path.abspath(str(input_file))
+        tracker = self._trackers.get(key)
+        if tracker is None:
+            if not create:
+                return None
+            tracker = self._trackers[key] = self._new_tracker(language_pair)
+            while len(self._trackers) > _TRACKER_CACHE_SIZE:
+                self._trackers.popitem(last=False)
+        else:
+            self._trackers.move_to_end(key)
+        return tracker
 
-        # 3. 이상치 탐지 (Z-Score)
-        suspicious_chunks = []
-        
-        for i, (idx, x, y) in enumerate(data_points):
-            residual = residuals[i]
-            z_score = residual / std_dev
-            
-            issue_type = None
-            
-            # 임계값 설정 (표준편차의 2배)
-            if z_score < -2.0:
-                issue_type = "omission" # 예상보다 짧음 (누락 의심)
-            elif z_score > 2.0:
-                issue_type = "hallucination" # 예상보다 김 (환각 의심)
-            
-            if issue_type:
-                expected_y = (a * x) + b
-                suspicious_chunks.append({
-                    "chunk_index": idx,
-                    "issue_type": issue_type,
-                    "source_length": x,
-                    "translated_length": y,
-                    "expected_length": round(expected_y, 2),
-                    "ratio": round(y / x, 4) if x > 0 else 0,
-                    "z_score": round(z_score, 2)
-                })
-
-        # 인덱스 순으로 정렬하여 반환
-        suspicious_chunks.sort(key=lambda item: item['chunk_index'])
-        
-        return suspicious_chunks
+    def _remember_baseline(self, language_pair: Optional[str], tracker: QualityCheckTracker) -> None:
+        if language_pair and tracker.fit is not None:
+            self._baselines[language_pair] = tracker.fit
@@ -0,0 +1,134 @@
+# sentence_segmenter.py
+"""
+다국어(CJK/라틴) 문장 분할기 - 한 번의 순회로 오프셋 구간을 반환
+
+ChunkService.split_chunk_by_sentences는 구분자를 버리는 re.split을 세 번 연달아 호출한 뒤
+문장을 ' '로 다시 이어 붙여 원래 구두점과 줄바꿈이 사라졌습니다. 이 모듈은 텍스트를 복사하지 않고
+(start, end) 구간만 만들며, 구간을 이어 붙이면 항상 원문과 같습니다.
+
+규칙:
+- 줄바꿈(연속 줄바꿈 포함)은 항상 경계이며, 열린 괄호/따옴표 상태도 초기화합니다.
+- 문장 부호(. ! ? 。 ！ ？ … ‼ ⁉)는 괄호/따옴표(「」『』“”‘’《》〈〉（）() 등) 바깥에서만 경계입니다.
+  「你好。」처럼 따옴표 안에서 끝난 문장은 닫는 따옴표까지 포함한 뒤 경계가 됩니다.
+- 라틴 마침표는 뒤에 공백/줄 끝/닫는 따옴표가 올 때만 경계입니다 (3.14, v1.2 보호).
+- 경계 뒤의 공백은 앞 문장에 붙입니다.
+"""
+from typing import List, Optional, Tuple
+
+SENTENCE_TERMINATORS = frozenset(".!?。！？…‼⁉")
+# 뒤에 공백이 없어도 경계로 보는 전각/CJK 종결 부호
+_CJK_TERMINATORS = frozenset("。！？…‼⁉")
+_OPENING_BRACKETS = {
+    "「": "」", "『": "』", "“": "”", "‘": "’", "《": "》", "〈": "〉",
+    "（": "）", "(": ")", "【": "】", "〔": "〕", "［": "］", "[": "]",
+}
+_CLOSING_BRACKETS = frozenset(_OPENING_BRACKETS.values())
+# 문장 부호 직후에 붙어 문장에 포함되는 닫는 기호 (대칭 따옴표 포함)
+_TRAILING_CLOSERS = _CLOSING_BRACKETS | frozenset("\"'")
+_INLINE_SPACE = frozenset(" \t　 ")
+
+# 구간 종류: 줄바꿈으로 끝난 구간 / 문장 부호로 끝난 구간 / 텍스트 끝
+SPAN_LINE = "line"
+SPAN_SENTENCE = "sentence"
+SPAN_END = "end"
+
+
+def segment_sentence_spans(text: str) -> List[Tuple[int, int, str]]:
+    """
+    text를 문장 구간 [(start, end, 종류), ...]으로 나눕니다. 구간은 빈틈 없이 이어집니다.
+    종류는 SPAN_LINE(줄바꿈으로 끝남), SPAN_SENTENCE(문장 부호로 끝남), SPAN_END(텍스트 끝)입니다.
+    """
+    spans: List[Tuple[int, int, str]] = []
+    length = len(text)
+    start = 0
+    depth = 0
+    i = 0
+    while i < length:
+        ch = text[i]
+        if ch == "\n" or ch == "\r":
+            while i < length and text[i] in "\r\n":
+                i += 1
+            spans.append((start, i, SPAN_LINE))
+            start = i
+            depth = 0
+            continue
+        if ch in _OPENING_BRACKETS:
+            depth += 1
+            i += 1
+            continue
+        if ch in _CLOSING_BRACKETS:
+            depth = max(0, depth - 1)
+            i += 1
+            continue
+        if ch in SENTENCE_TERMINATORS:
+            j = i
+            while j < length and text[j] in SENTENCE_TERMINATORS:
+                j += 1
+            cjk = any(c in _CJK_TERMINATORS for c in text[i:j])
+            terminator_end = j
+            # 문장 부호 직후의 닫는 따옴표/괄호는 문장에 포함 (열린 괄호를 닫으면 depth 감소)
+            closing_depth = depth
+            while j < length and text[j] in _TRAILING_CLOSERS:
+                if text[j] in _CLOSING_BRACKETS:
+                    closing_depth = max(0, closing_depth - 1)
+                j += 1
+            followed_by_space = j >= length or text[j] in _INLINE_SPACE or text[j] in "\r\n"
+            if closing_depth == 0 and (followed_by_space or cjk or j > terminator_end):
+                while j < length and text[j] in _INLINE_SPACE:
+                    j += 1
+                # 줄바꿈이 바로 이어지면 줄 경계에서 함께 끝냄
+                if j < length and text[j] not in "\r\n":
+                    spans.append((start, j, SPAN_SENTENCE))
+                    start = j
+            depth = closing_depth
+            i = j
+            continue
+        i += 1
+    if start < length:
+        spans.append((start, length, SPAN_END))
+    return spans
+
+
+def find_balanced_cut(
+    text: str,
+    target: Optional[int] = None,
+    min_part: int = 0,
+    spans: Optional[List[Tuple[int, int, str]]] = None
+) -> Optional[int]:
+    """
+    text를 두 부분으로 자를 위치를 O(n)에 고릅니다 (자를 수 없으면 None).
+
+    줄 경계 중 target(기본: 가운데)에 가장 가까운 위치를 우선 사용하고, 줄 경계가 없으면
+    문장 경계를 사용합니다. 양쪽 모두 min_part자 이상이고 공백만 남지 않는 위치만 후보입니다.
+    """
+    if spans is None:
+        spans = segment_sentence_spans(text)
+    if target is None:
+        target = len(text) // 2
+    length = len(text)
+
+    # 공백이 아닌 첫/마지막 문자 위치 (양쪽이 공백뿐인 후보 제외)
+    first_content = len(text) - len(text.lstrip())
+    last_content = len(text.rstrip())
+
+    best = {SPAN_LINE: None, SPAN_SENTENCE: None}
+    for _, end, kind in spans:
+        if kind == SPAN_END or end >= length:
+            continue
+        if end <= first_content or end >= last_content:
+            continue
+        if end < min_part or length - end < min_part:
+            continue
+        current = best[kind]
+        if current is None or abs(end - target) < abs(current - target):
+            best[kind] = end
+    return best[SPAN_LINE] if best[SPAN_LINE] is not None else best[SPAN_SENTENCE]
+
+
+def group_spans(spans: List[Tuple[int, int, str]], text: str, per_group: int) -> List[Tuple[int, int]]:
+    """
+    문장 구간을 per_group개씩 묶은 (start, end) 목록. 공백뿐인 구간(빈 줄)은 앞 문장에 붙이고 세지 않습니다.
+    """
+    content_starts = [start for start, end, _ in spans if text[start:end].strip()]
+    bounds = [0] + content_starts[per_group::per_group] + [len(text)]
+    return list(zip(bounds[:-1], bounds[1:]))
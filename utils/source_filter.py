@@ -0,0 +1,210 @@
+# source_filter.py
+"""
+번역 전 원문 광고/보일러플레이트 필터
+
+PostProcessingService의 광고 제거는 번역이 끝난 한국어 결과에만 적용되므로, 원문의
+광고 줄("本电子书由网友上传", 사이트 주소, "请记住本站域名" 등)은 번역 비용을 치른 뒤에야
+지워집니다. 이 필터는 read_text_file과 ChunkService 사이에서 원문 줄 단위로 규칙을 적용하여
+
+- remove: 해당 줄을 원문에서 제거하거나
+- mask: 짧은 마스크 토큰(⟦MASK:n⟧)으로 바꿔 번역 요청에서 빼고, 번역 결과에서 원래 줄로 복원
+
+합니다. 규칙별 적중 횟수를 집계하여 로그와 메타데이터("source_filter")에 남깁니다.
+
+메타데이터에는 필터 설정도 함께 기록되므로, 검토 탭/단일 청크 재번역은
+filter_source_for_metadata()로 번역 당시와 같은 원문(같은 청크 경계)을 재현합니다.
+"""
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple
+
+try:
+    from infrastructure.logger_config import setup_logger
+except ImportError:
+    from infrastructure.logging.logger_config import setup_logger # type: ignore
+
+logger = setup_logger(__name__)
+
+SOURCE_FILTER_MODES = ("remove", "mask")
+MASK_TOKEN_PATTERN = re.compile(r'⟦MASK:(\d+)⟧')
+
+# 이 길이를 넘는 줄은 본문 문단으로 보고 검사하지 않음 (오삭제 방지)
+DEFAULT_MAX_LINE_LENGTH = 200
+
+# (규칙 이름, 패턴) - 줄 안에서 search로 검사하며, 대소문자는 구분하지 않습니다.
+# ⚠️ 본문에 나올 수 있는 단어 단독으로는 매칭하지 않도록 광고 문맥과 결합된 조건만 사용하세요.
+DEFAULT_SOURCE_FILTER_RULES: List[Tuple[str, str]] = [
+    # 중국어: 전자책 배포/업로드 안내
+    ("zh_ebook_notice", r'(?:本|该|該)?(?:电子书|電子書|txt|TXT)(?:\S{0,20})(?:下载|下載|上传|上傳|分享|免费|免費|整理|收集)'),
+    ("zh_netizen_upload", r'(?:网友|網友|书友|書友)(?:上传|上傳|整理|收集)'),
+    # 중국어: 사이트 홍보 ("请记住本站域名", "天才一秒记住", "最新章节" 등)
+    ("zh_remember_site", r'(?:请记住|請記住|一秒记住|一秒記住|记住本站|記住本站).{0,30}(?:网址|網址|域名|本站|地址|书友|書友)'),
+    ("zh_site_promo", r'(?:最新章节|最新章節|最快更新|无弹窗|無彈窗|全文阅读|全文閱讀|手机阅读|手機閱讀|免费阅读|免費閱讀)'
+                      r'.{0,40}(?:网|網|站|www|com|请|請)'),
+    ("zh_vote_request", r'(?:求(?:收藏|推荐|推薦|月票|订阅|訂閱)[!！,，。、\s]*){2,}'),
+    # 일본어: 무단 전재 안내
+    ("ja_reprint_notice", r'無断(?:転載|複製|使用)(?:を)?(?:禁止|禁ず|お断り)'),
+    # 한국어: 사후 처리 규칙과 같은 문맥 (원문이 한국어인 경우)
+    ("ko_ebook_notice", r'전자책(?:은)?.*(?:네트워크|업로드|공유|다운로드|무료|완결본)'),
+    ("ko_netizen_upload", r'네티즌이?\s*업로드'),
+    # 영어: 다운로드 사이트 안내
+    ("en_download_notice", r'(?:download|read)\s+(?:more\s+|free\s+|the\s+latest\s+)?(?:e-?books?|novels?|chapters?)\s+(?:at|on|from)\s+\S+'),
+    # 공통: 주소만 있는 줄 / 괄호 속 사이트 주소
+    ("url_only_line", r'^\s*[\(（【\[]?\s*(?:https?://|www\s*[\.．。])\S+\s*[\)）】\]]?\s*$'),
+    ("bracketed_site", r'[\(（【\[]\s*(?:https?://|www\s*[\.．。])[^\)）】\]]*[\)）】\]]'),
+]
+
+
+@dataclass
+class SourceFilterResult:
+    """원문 필터 결과 (필터된 텍스트, 규칙별 적중 횟수, 마스크 토큰 → 원래 줄)"""
+    text: str
+    rule_hits: Dict[str, int] = field(default_factory=dict)
+    filtered_lines: int = 0
+    filtered_chars: int = 0
+    masked_lines: Dict[str, str] = field(default_factory=dict)
+
+    def restore(self, translated_text: str) -> str:
+        """mask 모드에서 번역 결과의 마스크 토큰을 원래 줄로 복원합니다."""
+        if not self.masked_lines or "⟦MASK:" not in translated_text:
+            return translated_text
+        return MASK_TOKEN_PATTERN.sub(lambda m: self.masked_lines.get(m.group(1), m.group(0)), translated_text)
+
+
+class SourceFilter:
+    """
+    번역 전 원문 줄 단위 광고/보일러플레이트 필터
+
+    설정 키:
+        source_filter_enabled (bool): 필터 사용 여부
+        source_filter_mode (str): "remove" 또는 "mask"
+        source_filter_custom_patterns (list[str]): 추가 정규식 (규칙 이름 custom_0, custom_1, ...)
+        source_filter_disabled_rules (list[str]): 끌 기본 규칙 이름
+        source_filter_max_line_length (int): 이 길이를 넘는 줄은 검사하지 않음
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        mode: str = "remove",
+        custom_patterns: Optional[Sequence[str]] = None,
+        disabled_rules: Optional[Sequence[str]] = None,
+        max_line_length: int = DEFAULT_MAX_LINE_LENGTH
+    ):
+        if mode not in SOURCE_FILTER_MODES:
+            logger.warning(f"알 수 없는 원문 필터 모드 '{mode}' → 'remove' 사용")
+            mode = "remove"
+        self.enabled = enabled
+        self.mode = mode
+        self.custom_patterns = list(custom_patterns or [])
+        self.disabled_rules = sorted(set(disabled_rules or []))
+        self.max_line_length = int(max_line_length or DEFAULT_MAX_LINE_LENGTH)
+
+        rules = [(name, pattern) for name, pattern in DEFAULT_SOURCE_FILTER_RULES if name not in self.disabled_rules]
+        rules += [(f"custom_{i}", pattern) for i, pattern in enumerate(self.custom_patterns)]
+        self.rules: List[Tuple[str, Pattern]] = []
+        for name, pattern in rules:
+            try:
+                self.rules.append((name, re.compile(pattern, re.IGNORECASE)))
+            except re.error as e:
+                logger.warning(f"원문 필터 규칙 '{name}' 정규식 오류 (무시): {e}")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SourceFilter":
+        return cls(
+            enabled=bool(config.get("source_filter_enabled", False)),
+            mode=config.get("source_filter_mode", "remove"),
+            custom_patterns=config.get("source_filter_custom_patterns") or [],
+            disabled_rules=config.get("source_filter_disabled_rules") or [],
+            max_line_length=config.get("source_filter_max_line_length", DEFAULT_MAX_LINE_LENGTH),
+        )
+
+    @classmethod
+    def from_metadata(cls, metadata: Dict[str, Any]) -> "SourceFilter":
+        """메타데이터에 기록된 설정으로 번역 당시의 필터를 재구성합니다 (기록이 없으면 비활성)."""
+        record = (metadata or {}).get("source_filter")
+        if not isinstance(record, dict):
+            return cls(enabled=False)
+        return cls(
+            enabled=True,
+            mode=record.get("mode", "remove"),
+            custom_patterns=record.get("custom_patterns") or [],
+            disabled_rules=record.get("disabled_rules") or [],
+            max_line_length=record.get("max_line_length", DEFAULT_MAX_LINE_LENGTH),
+        )
+
+    def fingerprint(self) -> str:
+        settings = {
+            "mode": self.mode,
+            "custom_patterns": self.custom_patterns,
+            "disabled_rules": self.disabled_rules,
+            "max_line_length": self.max_line_length,
+            "rules": [name for name, _ in self.rules],
+        }
+        return hashlib.md5(json.dumps(settings, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def describe(self, result: Optional[SourceFilterResult] = None) -> Dict[str, Any]:
+        """메타데이터("source_filter")에 기록할 설정과 통계"""
+        record: Dict[str, Any] = {
+            "mode": self.mode,
+            "custom_patterns": self.custom_patterns,
+            "disabled_rules": self.disabled_rules,
+            "max_line_length": self.max_line_length,
+            "fingerprint": self.fingerprint(),
+        }
+        if result is not None:
+            record["rule_hits"] = dict(result.rule_hits)
+            record["filtered_lines"] = result.filtered_lines
+            record["filtered_chars"] = result.filtered_chars
+        return record
+
+    def match_rule(self, line: str) -> Optional[str]:
+        """줄이 광고/보일러플레이트이면 처음 일치한 규칙 이름을 반환합니다."""
+        stripped = line.strip()
+        if not stripped or len(stripped) > self.max_line_length:
+            return None
+        for name, compiled in self.rules:
+            if compiled.search(stripped):
+                return name
+        return None
+
+    def apply(self, text: str) -> SourceFilterResult:
+        """원문에 필터를 적용합니다. 비활성 상태면 원문을 그대로 반환합니다."""
+        if not self.enabled or not self.rules or not text:
+            return SourceFilterResult(text=text)
+
+        result = SourceFilterResult(text=text)
+        output: List[str] = []
+        for line in text.splitlines(keepends=True):
+            rule_name = self.match_rule(line)
+            if rule_name is None:
+                output.append(line)
+                continue
+            result.rule_hits[rule_name] = result.rule_hits.get(rule_name, 0) + 1
+            result.filtered_lines += 1
+            body = line.rstrip("\r\n")
+            result.filtered_chars += len(body)
+            if self.mode == "mask":
+                token_id = str(len(result.masked_lines))
+                result.masked_lines[token_id] = body
+                output.append(f"⟦MASK:{token_id}⟧" + line[len(body):])
+        result.text = "".join(output)
+
+        if result.filtered_lines:
+            hits = ", ".join(f"{name}={count}" for name, count in sorted(result.rule_hits.items(), key=lambda kv: -kv[1]))
+            action = "마스킹" if self.mode == "mask" else "제거"
+            logger.info(
+                f"🧹 원문 필터: {result.filtered_lines}줄 {action} ({result.filtered_chars}자, "
+                f"원문의 {result.filtered_chars / max(1, len(text)) * 100:.1f}%) | 규칙별: {hits}"
+            )
+        return result
+
+
+def filter_source_for_metadata(text: str, metadata: Dict[str, Any]) -> SourceFilterResult:
+    """
+    메타데이터에 기록된 필터 설정으로 원문을 필터링합니다.
+    검토 탭/단일 청크 재번역이 번역 당시와 같은 청크 구성을 재현하는 데 사용합니다.
+    """
+    return SourceFilter.from_metadata(metadata).apply(text)